@@ -31,7 +31,12 @@ try:
         log_error,
         log_security_event,
     )
-    from .monitoring.metrics import RequestTracker, health_checker, metrics_collector
+    from .monitoring.metrics import (
+        RequestTracker,
+        health_checker,
+        metrics_collector,
+        route_template,
+    )
 except ImportError:
     # Fallback for standalone execution
     from monitoring.logger import (
@@ -40,7 +45,12 @@ except ImportError:
         log_error,
         log_security_event,
     )
-    from monitoring.metrics import RequestTracker, health_checker, metrics_collector
+    from monitoring.metrics import (
+        RequestTracker,
+        health_checker,
+        metrics_collector,
+        route_template,
+    )
 
 # Import cache and services
 try:
@@ -190,7 +200,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
             # Record metrics
             metrics_collector.record_rate_limit_violation(
-                client_id, str(request.url.path)
+                client_id, route_template(request)
             )
 
             return JSONResponse(
@@ -275,7 +285,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 # Record metrics
                 metrics_collector.record_request(
                     request.method,
-                    request.url.path,
+                    route_template(request),
                     response.status_code,
                     response_time_ms,
                 )
@@ -295,7 +305,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 # Record error metrics
                 metrics_collector.record_error(
                     error_type=type(e).__name__,
-                    endpoint=request.url.path,
+                    endpoint=route_template(request),
                     details={"method": request.method},
                 )
 
@@ -2,12 +2,21 @@
 
 import asyncio
 import json
+import math
 import time
 from collections import defaultdict, deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+from starlette.requests import Request
+from starlette.routing import Match
+
+from shared.utils.metrics_registry import MetricsRegistry
+
+# Histogram buckets for millisecond latencies
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
 
 @dataclass
 class MetricPoint:
@@ -31,6 +40,161 @@ class HealthCheckResult:
     details: dict[str, Any]
 
 
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error (HDR-style).
+
+    Values are counted in geometric buckets, so recording is O(1), memory is
+    bounded by the logarithm of the value range rather than the number of
+    samples, and percentile queries are O(buckets). Estimates are within
+    ``relative_accuracy`` of the true sample value.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 0.001):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+
+        self.buckets: dict[int, int] = defaultdict(int)
+        self.zero_count = 0  # Values at or below min_value
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float):
+        """Record a single value."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if value <= self.min_value:
+            self.zero_count += 1
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add the counts of another histogram with the same accuracy."""
+        if other.gamma != self.gamma:
+            raise ValueError("cannot merge histograms with different accuracy")
+
+        for key, count in other.buckets.items():
+            self.buckets[key] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, quantile: float) -> float:
+        """Estimate the value at ``quantile`` (0.0-1.0)."""
+        if not self.count:
+            return 0.0
+
+        rank = min(int(self.count * quantile), self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return self.min
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Midpoint of (gamma^(key-1), gamma^key] in relative terms
+                estimate = 2 * self.gamma**key / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class RollingCounter:
+    """Event counter over a sliding time window, kept in a ring of time slots.
+
+    ``add`` is O(1); ``total`` is O(slots). Slots are reset lazily when the
+    ring wraps around to them, so expired counts need no cleanup pass.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3600.0,
+        slots: int = 60,
+        clock=time.monotonic,
+    ):
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self.slot_seconds = window_seconds / slots
+        self._clock = clock
+        self._counts = [0] * slots
+        self._epochs = [-1] * slots
+
+    def add(self, amount: int = 1):
+        """Count ``amount`` events now."""
+        epoch = int(self._clock() // self.slot_seconds)
+        index = epoch % self.slots
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._counts[index] = 0
+        self._counts[index] += amount
+
+    def total(self) -> int:
+        """Events counted within the window."""
+        oldest = int(self._clock() // self.slot_seconds) - self.slots
+        return sum(
+            count
+            for count, epoch in zip(self._counts, self._epochs, strict=True)
+            if epoch > oldest
+        )
+
+
+class WindowedLatencyHistogram:
+    """Latency histogram over a sliding time window.
+
+    Values go into the histogram of the current interval; a ring of
+    ``slots`` interval histograms is kept and merged on read, so old
+    samples age out the same way ``RollingCounter`` counts do.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        slots: int = 10,
+        relative_accuracy: float = 0.01,
+        clock=time.monotonic,
+    ):
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self.slot_seconds = window_seconds / slots
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+        self._histograms = [LatencyHistogram(relative_accuracy) for _ in range(slots)]
+        self._epochs = [-1] * slots
+
+    def record(self, value: float):
+        """Record a value in the current interval."""
+        epoch = int(self._clock() // self.slot_seconds)
+        index = epoch % self.slots
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._histograms[index] = LatencyHistogram(self.relative_accuracy)
+        self._histograms[index].record(value)
+
+    def snapshot(self) -> LatencyHistogram:
+        """Merge the intervals within the window into one histogram."""
+        oldest = int(self._clock() // self.slot_seconds) - self.slots
+        merged = LatencyHistogram(self.relative_accuracy)
+        for histogram, epoch in zip(self._histograms, self._epochs, strict=True):
+            if epoch > oldest:
+                merged.merge(histogram)
+        return merged
+
+
 class MetricsCollector:
     """Metrics collection and aggregation."""
 
@@ -38,15 +202,35 @@ class MetricsCollector:
         self.retention_hours = retention_hours
         self.metrics: dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
         self.request_counts = defaultdict(int)
-        self.response_times: dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        # Latencies over the last five minutes, per endpoint
+        self.response_times: dict[str, WindowedLatencyHistogram] = defaultdict(
+            WindowedLatencyHistogram
+        )
         self.error_counts = defaultdict(int)
         self.health_checks: deque = deque(maxlen=100)
 
+        # Pre-aggregated metric families for Prometheus exposition
+        self.registry = MetricsRegistry()
+        self.registry.histogram(
+            "http_request_duration_ms",
+            "HTTP request duration in milliseconds",
+            buckets=LATENCY_BUCKETS_MS,
+        )
+        self.registry.histogram(
+            "health_check_response_time_ms",
+            "Health check response time in milliseconds",
+            buckets=LATENCY_BUCKETS_MS,
+        )
+
         # Performance tracking
         self.active_requests = 0
         self.total_requests = 0
         self.start_time = datetime.utcnow()
 
+        # Rolling counts for the last hour
+        self.recent_requests = RollingCounter(window_seconds=3600)
+        self.recent_errors = RollingCounter(window_seconds=3600)
+
         # Rate limiting tracking
         self.rate_limit_violations = defaultdict(int)
 
@@ -54,9 +238,18 @@ class MetricsCollector:
         self.security_events = defaultdict(int)
 
     def record_metric(
-        self, name: str, value: float, tags: dict[str, str] = None, unit: str = "count"
+        self,
+        name: str,
+        value: float,
+        tags: dict[str, str] = None,
+        unit: str = "count",
+        metric_type: str = "counter",
     ):
-        """Record a metric point."""
+        """Record a metric point.
+
+        ``metric_type`` is "counter", "gauge" or "histogram" and selects how
+        the value is aggregated for Prometheus exposition.
+        """
         metric = MetricPoint(
             name=name,
             value=value,
@@ -66,7 +259,21 @@ class MetricsCollector:
         )
 
         self.metrics[name].append(metric)
-        self._cleanup_old_metrics()
+        self._cleanup_old_metrics(name)
+
+        if metric_type == "counter":
+            self.registry.counter(name).inc(value, metric.tags)
+        elif metric_type == "gauge":
+            self.registry.gauge(name).set(value, metric.tags)
+        elif metric_type == "histogram":
+            self.registry.histogram(name).observe(value, metric.tags)
+        else:
+            raise ValueError(f"Unsupported metric type: {metric_type}")
+
+        if name == "http_requests_total":
+            self.recent_requests.add()
+        elif "error" in name.lower():
+            self.recent_errors.add()
 
     def record_request(
         self, method: str, path: str, status_code: int, response_time_ms: float
@@ -79,7 +286,7 @@ class MetricsCollector:
         self.request_counts[f"path:{path}"] += 1
 
         # Track response times
-        self.response_times[f"{method}:{path}"].append(response_time_ms)
+        self.response_times[f"{method}:{path}"].record(response_time_ms)
 
         # Count errors
         if status_code >= 400:
@@ -98,6 +305,7 @@ class MetricsCollector:
             response_time_ms,
             {"method": method, "path": path},
             unit="ms",
+            metric_type="histogram",
         )
 
     def record_error(
@@ -111,8 +319,10 @@ class MetricsCollector:
         self.record_metric("errors_total", 1, tags)
 
         if details:
-            self.record_metric(
-                "error_details", 1, {**tags, **{k: str(v) for k, v in details.items()}}
+            # Detail values (messages, IDs) are unbounded, so they stay on the
+            # retained point for inspection rather than becoming series labels
+            self.metrics["errors_total"][-1].tags.update(
+                {k: str(v) for k, v in details.items()}
             )
 
     def record_security_event(
@@ -129,11 +339,7 @@ class MetricsCollector:
     def record_rate_limit_violation(self, client_id: str, endpoint: str):
         """Record rate limiting violations."""
         self.rate_limit_violations[client_id] += 1
-        self.record_metric(
-            "rate_limit_violations_total",
-            1,
-            {"client_id": client_id[:32], "endpoint": endpoint},  # Truncate for privacy
-        )
+        self.record_metric("rate_limit_violations_total", 1, {"endpoint": endpoint})
 
     def record_health_check(self, result: HealthCheckResult):
         """Record health check result."""
@@ -144,12 +350,14 @@ class MetricsCollector:
             result.response_time_ms,
             {"service": result.service, "status": result.status},
             unit="ms",
+            metric_type="histogram",
         )
 
         self.record_metric(
             "health_check_status",
             1 if result.status == "healthy" else 0,
             {"service": result.service},
+            metric_type="gauge",
         )
 
     def get_summary_stats(self) -> dict[str, Any]:
@@ -158,34 +366,17 @@ class MetricsCollector:
         uptime_seconds = (now - self.start_time).total_seconds()
 
         # Calculate percentiles for response times
-        all_response_times = []
-        for times in self.response_times.values():
-            all_response_times.extend(times)
-
-        if all_response_times:
-            sorted_times = sorted(all_response_times)
-            p50 = sorted_times[int(len(sorted_times) * 0.5)]
-            p95 = sorted_times[int(len(sorted_times) * 0.95)]
-            p99 = sorted_times[int(len(sorted_times) * 0.99)]
-        else:
-            p50 = p95 = p99 = 0
+        all_response_times = LatencyHistogram()
+        for window in self.response_times.values():
+            all_response_times.merge(window.snapshot())
 
-        # Recent error rate (last hour)
-        recent_errors = sum(
-            1
-            for metric_list in self.metrics.values()
-            for metric in metric_list
-            if "error" in metric.name.lower()
-            and (now - metric.timestamp) < timedelta(hours=1)
-        )
+        p50 = all_response_times.percentile(0.5)
+        p95 = all_response_times.percentile(0.95)
+        p99 = all_response_times.percentile(0.99)
 
-        recent_requests = sum(
-            1
-            for metric_list in self.metrics.values()
-            for metric in metric_list
-            if metric.name == "http_requests_total"
-            and (now - metric.timestamp) < timedelta(hours=1)
-        )
+        # Recent error rate (last hour)
+        recent_errors = self.recent_errors.total()
+        recent_requests = self.recent_requests.total()
 
         error_rate = (
             (recent_errors / recent_requests * 100) if recent_requests > 0 else 0
@@ -207,6 +398,25 @@ class MetricsCollector:
             "last_updated": now.isoformat(),
         }
 
+    def get_endpoint_stats(self) -> dict[str, dict[str, float]]:
+        """Get recent response time statistics per endpoint."""
+        snapshots = {
+            endpoint: window.snapshot()
+            for endpoint, window in self.response_times.items()
+        }
+        return {
+            endpoint: {
+                "count": histogram.count,
+                "mean_ms": histogram.mean,
+                "p50_ms": histogram.percentile(0.5),
+                "p95_ms": histogram.percentile(0.95),
+                "p99_ms": histogram.percentile(0.99),
+                "max_ms": histogram.max,
+            }
+            for endpoint, histogram in snapshots.items()
+            if histogram.count
+        }
+
     def get_metrics_for_export(self, format: str = "prometheus") -> str:
         """Export metrics in specified format."""
         if format == "prometheus":
@@ -218,34 +428,7 @@ class MetricsCollector:
 
     def _export_prometheus(self) -> str:
         """Export metrics in Prometheus format."""
-        lines = []
-
-        # Group metrics by name
-        metric_groups = defaultdict(list)
-        for metric_list in self.metrics.values():
-            for metric in metric_list:
-                metric_groups[metric.name].append(metric)
-
-        for metric_name, metric_list in metric_groups.items():
-            # Add help and type comments
-            lines.append(
-                f"# HELP {metric_name} {metric_name.replace('_', ' ').title()}"
-            )
-            lines.append(f"# TYPE {metric_name} counter")
-
-            # Group by tags and sum values
-            tag_groups = defaultdict(float)
-            for metric in metric_list:
-                tag_str = ",".join(f'{k}="{v}"' for k, v in sorted(metric.tags.items()))
-                tag_groups[tag_str] += metric.value
-
-            for tags, value in tag_groups.items():
-                if tags:
-                    lines.append(f"{metric_name}{{{tags}}} {value}")
-                else:
-                    lines.append(f"{metric_name} {value}")
-
-        return "\n".join(lines)
+        return self.registry.expose()
 
     def _export_json(self) -> str:
         """Export metrics in JSON format."""
@@ -261,15 +444,39 @@ class MetricsCollector:
 
         return json.dumps(data, default=str, indent=2)
 
-    def _cleanup_old_metrics(self):
-        """Remove metrics older than retention period."""
+    def _cleanup_old_metrics(self, name: str | None = None):
+        """Remove metrics older than retention period.
+
+        With ``name``, only that metric's points are expired, which keeps
+        ``record_metric`` independent of the number of metric names.
+        """
         cutoff = datetime.utcnow() - timedelta(hours=self.retention_hours)
+        names = [name] if name is not None else list(self.metrics)
 
-        for metric_name, metric_list in self.metrics.items():
+        for metric_name in names:
+            metric_list = self.metrics[metric_name]
             while metric_list and metric_list[0].timestamp < cutoff:
                 metric_list.popleft()
 
 
+def route_template(request: Request) -> str:
+    """Return the path template of the route serving ``request``.
+
+    Raw paths embed resource IDs and would create a metric series per
+    resource, so metrics are labelled with the template (``/api/bills/{id}``)
+    instead. Middleware running before routing resolves the route itself;
+    requests that match no route share the ``"unmatched"`` label.
+    """
+    route = request.scope.get("route")
+    if route is None:
+        for candidate in request.app.router.routes:
+            match, _ = candidate.matches(request.scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None) or "unmatched"
+
+
 class RequestTracker:
     """Context manager for tracking request lifecycle."""
 
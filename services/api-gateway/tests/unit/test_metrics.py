@@ -0,0 +1,213 @@
+"""
+Tests for gateway metrics histograms and rolling counters.
+"""
+
+import random
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.monitoring.metrics import (
+    LatencyHistogram,
+    MetricsCollector,
+    RollingCounter,
+    WindowedLatencyHistogram,
+    route_template,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyHistogram:
+    """Test bucketed latency histogram."""
+
+    def test_percentiles_within_relative_accuracy(self):
+        rng = random.Random(0)
+        values = [rng.lognormvariate(3, 1) for _ in range(20000)]
+
+        histogram = LatencyHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+
+        exact = sorted(values)
+        for quantile in (0.5, 0.95, 0.99):
+            expected = exact[int(len(exact) * quantile)]
+            assert histogram.percentile(quantile) == pytest.approx(expected, rel=0.01)
+
+        assert histogram.count == len(values)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_bucket_count_is_bounded(self):
+        histogram = LatencyHistogram(relative_accuracy=0.01)
+        for i in range(100000):
+            histogram.record(1 + i % 1000)
+
+        assert len(histogram.buckets) < 400
+
+    def test_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 51):
+            first.record(value)
+        for value in range(51, 101):
+            second.record(value)
+
+        first.merge(second)
+
+        assert first.count == 100
+        assert first.max == 100
+        assert first.percentile(0.5) == pytest.approx(51, rel=0.01)
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(0.99) == 0.0
+
+
+class TestRollingCounter:
+    """Test sliding window counter."""
+
+    def test_counts_expire_after_window(self):
+        clock = FakeClock()
+        counter = RollingCounter(window_seconds=60, slots=6, clock=clock)
+
+        counter.add(3)
+        clock.now = 30
+        counter.add(2)
+        assert counter.total() == 5
+
+        clock.now = 65
+        assert counter.total() == 2
+
+        clock.now = 200
+        assert counter.total() == 0
+
+
+class TestWindowedLatencyHistogram:
+    """Test latency histogram over a sliding window."""
+
+    def test_old_intervals_age_out(self):
+        clock = FakeClock()
+        window = WindowedLatencyHistogram(window_seconds=60, slots=6, clock=clock)
+
+        for _ in range(100):
+            window.record(1000.0)
+        clock.now = 30
+        for _ in range(10):
+            window.record(10.0)
+
+        snapshot = window.snapshot()
+        assert snapshot.count == 110
+        assert snapshot.percentile(0.5) == pytest.approx(1000, rel=0.01)
+
+        # The slow interval has left the window; only recent latencies remain
+        clock.now = 65
+        snapshot = window.snapshot()
+        assert snapshot.count == 10
+        assert snapshot.percentile(0.99) == pytest.approx(10, rel=0.01)
+
+        clock.now = 200
+        assert window.snapshot().count == 0
+
+
+class TestMetricsCollector:
+    """Test summary statistics."""
+
+    def test_summary_stats(self):
+        collector = MetricsCollector()
+        for i in range(100):
+            collector.record_request("GET", "/api/bills", 200, float(i + 1))
+        collector.record_request("POST", "/api/issues", 500, 250.0)
+        collector.record_error("ValueError", endpoint="/api/issues")
+
+        stats = collector.get_summary_stats()
+
+        assert stats["total_requests"] == 101
+        assert stats["recent_requests"] == 101
+        assert stats["recent_errors"] == 1
+        assert stats["response_time_percentiles"]["p50_ms"] == pytest.approx(
+            51, rel=0.01
+        )
+        assert collector.get_endpoint_stats()["POST:/api/issues"]["count"] == 1
+
+    def test_summary_percentiles_use_recent_window(self):
+        clock = FakeClock()
+        collector = MetricsCollector()
+        collector.response_times.default_factory = lambda: WindowedLatencyHistogram(
+            clock=clock
+        )
+
+        collector.record_request("GET", "/api/bills", 200, 5000.0)
+        clock.now = 600
+        collector.record_request("GET", "/api/bills", 200, 20.0)
+
+        stats = collector.get_summary_stats()
+        assert stats["response_time_percentiles"]["p99_ms"] == pytest.approx(
+            20, rel=0.01
+        )
+        assert collector.get_endpoint_stats()["GET:/api/bills"]["count"] == 1
+
+    def test_prometheus_export_uses_typed_families(self):
+        collector = MetricsCollector()
+        collector.record_request("GET", "/api/bills", 200, 42.0)
+        collector.record_request("GET", "/api/bills", 200, 8.0)
+
+        lines = collector.get_metrics_for_export("prometheus").splitlines()
+
+        assert "# TYPE http_requests_total counter" in lines
+        assert (
+            'http_requests_total{method="GET",path="/api/bills",status="200"} 2.0'
+            in lines
+        )
+        assert "# TYPE http_request_duration_ms histogram" in lines
+        assert (
+            'http_request_duration_ms_count{method="GET",path="/api/bills"} 2' in lines
+        )
+
+    def test_error_details_are_not_labels(self):
+        collector = MetricsCollector()
+        collector.record_error(
+            "ValueError", endpoint="/api/issues", details={"error_message": "id 42"}
+        )
+        collector.record_rate_limit_violation("client-abc", "/api/issues")
+
+        export = collector.get_metrics_for_export("prometheus")
+
+        assert "error_message" not in export
+        assert "client-abc" not in export
+        assert collector.metrics["errors_total"][-1].tags["error_message"] == "id 42"
+
+
+class TestRouteTemplate:
+    """Test metric path labels."""
+
+    def test_labels_use_route_template(self):
+        app = FastAPI()
+        seen = []
+
+        @app.middleware("http")
+        async def record(request, call_next):
+            seen.append(route_template(request))
+            response = await call_next(request)
+            seen.append(route_template(request))
+            return response
+
+        @app.get("/api/bills/{bill_id}")
+        async def get_bill(bill_id: str):
+            return {"id": bill_id}
+
+        client = TestClient(app)
+        client.get("/api/bills/123")
+        client.get("/api/unknown/456")
+
+        assert seen == [
+            "/api/bills/{bill_id}",
+            "/api/bills/{bill_id}",
+            "unmatched",
+            "unmatched",
+        ]
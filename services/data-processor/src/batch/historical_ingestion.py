@@ -97,11 +97,16 @@ class HistoricalDataIngester:
         progress_file: str = "batch_progress.pkl",
         output_dir: str = "batch_output",
         batch_size: int = 50,
+        ndl_cache_dir: str | None = None,
+        use_embedded_speeches: bool = False,
     ):
         self.logger = logging.getLogger(__name__)
         self.progress_file = Path(progress_file)
         self.output_dir = Path(output_dir)
         self.batch_size = batch_size
+        # Replaying a session with a warm NDL cache never hits the API
+        self.ndl_cache_dir = ndl_cache_dir
+        self.use_embedded_speeches = use_embedded_speeches
 
         # Initialize components
         self.ndl_client: NDLAPIClient | None = None
@@ -120,7 +125,7 @@ class HistoricalDataIngester:
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.ndl_client = NDLAPIClient()
+        self.ndl_client = NDLAPIClient(cache_dir=self.ndl_cache_dir)
         await self.ndl_client.__aenter__()
 
         self.airtable_client = AirtableClient()
@@ -187,6 +192,7 @@ class HistoricalDataIngester:
                 diet_session=self.SESSION_NUMBER,
                 start_record=start_record,
                 max_records=batch_size,
+                include_speeches=self.use_embedded_speeches,
             )
 
             if not meetings:
@@ -252,7 +258,7 @@ class HistoricalDataIngester:
 
             # 4. Get all speeches for the meeting
             speeches = await self.ndl_client.get_all_speeches_for_meeting(
-                meeting.meeting_id
+                meeting.meeting_id, meeting=meeting
             )
             stats["speeches_count"] = len(speeches)
 
@@ -7,6 +7,7 @@ from .batch_processor import (
     BatchProcessor,
     BatchTask,
     EmbeddingTaskProcessor,
+    RedisStreamQueue,
     TaskPriority,
     TaskProcessor,
     TaskStatus,
@@ -17,6 +18,7 @@ from .batch_processor import (
 __all__ = [
     "BatchProcessor",
     "BatchTask",
+    "RedisStreamQueue",
     "TaskProcessor",
     "EmbeddingTaskProcessor",
     "TranscriptionTaskProcessor",
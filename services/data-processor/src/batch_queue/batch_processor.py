@@ -10,8 +10,13 @@ Provides asynchronous task processing capabilities for:
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
+import os
+import socket
+import time
 import uuid
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
@@ -152,11 +157,163 @@ class BatchConfig:
     enable_persistence: bool = True
     persistence_backend: str = "file"  # "file", "redis", "pubsub"
     redis_url: str | None = None
+    redis_key_prefix: str = "batch_queue"
+    redis_consumer_group: str = "data-processor"
+    redis_claim_idle_seconds: int = 600  # Reclaim entries pending this long
     pubsub_topic: str | None = None
     batch_size: int = 10
     processing_interval_seconds: float = 1.0
 
 
+PRIORITY_ORDER = [
+    TaskPriority.URGENT,
+    TaskPriority.HIGH,
+    TaskPriority.NORMAL,
+    TaskPriority.LOW,
+]
+
+
+class RedisStreamQueue:
+    """
+    Priority task queue on Redis Streams shared by all processor replicas
+
+    Each priority level is a stream read through one consumer group, so an
+    entry is delivered to a single consumer and stays pending until it is
+    acknowledged. Entries left pending by a consumer that stopped (for
+    example a restarted pod) are claimed by another consumer once they have
+    been idle for ``claim_idle_seconds``, giving at-least-once delivery.
+    """
+
+    def __init__(
+        self,
+        client: "redis.Redis",
+        key_prefix: str = "batch_queue",
+        group: str = "data-processor",
+        consumer: str | None = None,
+        claim_idle_seconds: int = 600,
+    ):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.group = group
+        self.consumer = (
+            consumer or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        )
+        self.claim_idle_ms = claim_idle_seconds * 1000
+        self._groups_ready = False
+
+    def stream_key(self, priority: TaskPriority) -> str:
+        return f"{self.key_prefix}:{priority.value}"
+
+    def task_key(self, task_id: str) -> str:
+        return f"{self.key_prefix}:task:{task_id}"
+
+    async def _ensure_groups(self):
+        """Create the consumer group on every priority stream if missing"""
+        if self._groups_ready:
+            return
+
+        for priority in TaskPriority:
+            try:
+                await self.client.xgroup_create(
+                    self.stream_key(priority), self.group, id="0", mkstream=True
+                )
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        self._groups_ready = True
+
+    async def enqueue(self, task: BatchTask) -> str:
+        """Append a task to its priority stream and return the entry ID"""
+        await self._ensure_groups()
+        return await self.client.xadd(
+            self.stream_key(task.priority), {"task": json.dumps(task.to_dict())}
+        )
+
+    async def read(self, count: int) -> list[tuple[str, BatchTask]]:
+        """
+        Take up to ``count`` entries in priority order
+
+        Stale pending entries are claimed before new entries are read.
+        Returned entries must be passed to ``ack`` or ``requeue``.
+        """
+        await self._ensure_groups()
+        entries: list[tuple[str, BatchTask]] = []
+
+        for priority in PRIORITY_ORDER:
+            stream = self.stream_key(priority)
+
+            if len(entries) < count:
+                claimed = await self.client.xautoclaim(
+                    stream,
+                    self.group,
+                    self.consumer,
+                    min_idle_time=self.claim_idle_ms,
+                    start_id="0-0",
+                    count=count - len(entries),
+                )
+                entries.extend(await self._decode(stream, claimed[1]))
+
+            if len(entries) < count:
+                response = await self.client.xreadgroup(
+                    self.group,
+                    self.consumer,
+                    {stream: ">"},
+                    count=count - len(entries),
+                )
+                for _, messages in response or []:
+                    entries.extend(await self._decode(stream, messages))
+
+        return entries
+
+    async def _decode(self, stream: str, messages) -> list[tuple[str, BatchTask]]:
+        entries = []
+        for entry_id, fields in messages:
+            if not fields:
+                # Entry was deleted while pending; nothing left to deliver
+                await self.client.xack(stream, self.group, entry_id)
+                continue
+
+            raw = fields.get("task") or fields.get(b"task")
+            entries.append((entry_id, BatchTask.from_dict(json.loads(raw))))
+        return entries
+
+    async def ack(self, task: BatchTask, entry_id: str):
+        """Acknowledge and remove an entry once its task is finished"""
+        stream = self.stream_key(task.priority)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.xack(stream, self.group, entry_id)
+            pipe.xdel(stream, entry_id)
+            await pipe.execute()
+
+    async def requeue(self, task: BatchTask, entry_id: str) -> str:
+        """Atomically move a task from its delivered entry to the stream tail"""
+        stream = self.stream_key(task.priority)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.xadd(stream, {"task": json.dumps(task.to_dict())})
+            pipe.xack(stream, self.group, entry_id)
+            pipe.xdel(stream, entry_id)
+            new_entry_id, *_ = await pipe.execute()
+        return new_entry_id
+
+    async def length(self) -> int:
+        """Number of queued or in-flight entries across all priorities"""
+        await self._ensure_groups()
+        total = 0
+        for priority in TaskPriority:
+            total += await self.client.xlen(self.stream_key(priority))
+        return total
+
+    async def save_task(self, task: BatchTask, ttl_seconds: int = 86400):
+        """Store the latest task state so every replica can look it up"""
+        await self.client.set(
+            self.task_key(task.task_id), json.dumps(task.to_dict()), ex=ttl_seconds
+        )
+
+    async def load_task(self, task_id: str) -> BatchTask | None:
+        data = await self.client.get(self.task_key(task_id))
+        return BatchTask.from_dict(json.loads(data)) if data else None
+
+
 class TaskProcessor:
     """Base class for task processors"""
 
@@ -285,9 +442,10 @@ class TranscriptionTaskProcessor(TaskProcessor):
         for i, video_url in enumerate(video_urls):
             try:
                 # Download and transcribe video
-                transcription_result, audio_file = (
-                    self.whisper_client.download_and_transcribe_video(video_url)
-                )
+                (
+                    transcription_result,
+                    audio_file,
+                ) = await self.whisper_client.download_and_transcribe_video(video_url)
 
                 result = {
                     "url": video_url,
@@ -347,10 +505,27 @@ class BatchProcessor:
         self.processing = False
         self._stop_event = asyncio.Event()
 
+        # Dispatcher state: woken on new work, finished tasks and stop
+        self._wakeup = asyncio.Condition()
+        self._running: set[asyncio.Task] = set()
+
+        # Dependency graph: blocked task_id -> (task, unmet parents), and
+        # parent task_id -> dependent task_ids
+        self._blocked: dict[str, tuple[BatchTask, set[str]]] = {}
+        self._dependents: dict[str, set[str]] = defaultdict(set)
+
+        # Delayed retries: (due monotonic time, sequence, task, stream entry ID)
+        self._retry_heap: list[tuple[float, int, BatchTask, str | None]] = []
+        self._retry_sequence = itertools.count()
+
         # Persistence
         self.redis_client: redis.Redis | None = None
         self.pubsub_client: pubsub_v1.PublisherClient | None = None
 
+        # Shared queue; when set it replaces the in-process task_queues
+        self.stream_queue: RedisStreamQueue | None = None
+        self._stream_entries: dict[str, str] = {}  # task_id -> stream entry ID
+
         # Statistics
         self.stats = defaultdict(int)
 
@@ -364,8 +539,16 @@ class BatchProcessor:
 
         if self.config.persistence_backend == "redis" and self.config.redis_url:
             try:
-                self.redis_client = redis.from_url(self.config.redis_url)
-                logger.info("Redis persistence initialized")
+                self.redis_client = redis.from_url(
+                    self.config.redis_url, decode_responses=True
+                )
+                self.stream_queue = RedisStreamQueue(
+                    self.redis_client,
+                    key_prefix=self.config.redis_key_prefix,
+                    group=self.config.redis_consumer_group,
+                    claim_idle_seconds=self.config.redis_claim_idle_seconds,
+                )
+                logger.info("Redis Streams task queue initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize Redis: {e}")
 
@@ -423,23 +606,84 @@ class BatchProcessor:
         )
 
         # Check queue size limit
-        total_queued = sum(len(queue) for queue in self.task_queues.values())
+        if self.stream_queue:
+            total_queued = await self.stream_queue.length()
+        else:
+            total_queued = sum(len(queue) for queue in self.task_queues.values())
+            total_queued += len(self._blocked)
         if total_queued >= self.config.max_queue_size:
             raise ValueError(f"Queue is full (max size: {self.config.max_queue_size})")
 
         # Add to appropriate priority queue
         task.status = TaskStatus.QUEUED
-        self.task_queues[priority].append(task)
+        if self.stream_queue:
+            await self.stream_queue.enqueue(task)
+        else:
+            self._enqueue_local(task)
         self.stats["tasks_queued"] += 1
 
         # Persist if enabled
         await self._persist_task(task)
+        if task.status == TaskStatus.FAILED:
+            await self._fail_dependents(task.task_id)
+
+        async with self._wakeup:
+            self._wakeup.notify()
 
         logger.info(
             f"Added task to queue: {task_id} (type: {task_type}, priority: {priority})"
         )
         return task_id
 
+    def _enqueue_local(self, task: BatchTask):
+        """Queue a task, or park it in the dependency graph until it is ready"""
+        unmet = set()
+        for dep_task_id in task.depends_on:
+            if dep_task_id in self.failed_tasks:
+                task.status = TaskStatus.FAILED
+                task.error_message = f"Dependency {dep_task_id} failed"
+                task.completed_at = datetime.now()
+                self.failed_tasks[task.task_id] = task
+                return
+            if dep_task_id not in self.completed_tasks:
+                unmet.add(dep_task_id)
+
+        if not unmet:
+            self.task_queues[task.priority].append(task)
+            return
+
+        self._blocked[task.task_id] = (task, unmet)
+        for dep_task_id in unmet:
+            self._dependents[dep_task_id].add(task.task_id)
+
+    def _release_dependents(self, task_id: str):
+        """Queue dependents whose last unmet parent was ``task_id``"""
+        for child_id in self._dependents.pop(task_id, ()):
+            if child_id not in self._blocked:
+                continue  # Cancelled or failed while blocked
+            child, unmet = self._blocked[child_id]
+            unmet.discard(task_id)
+            if not unmet:
+                del self._blocked[child_id]
+                self.task_queues[child.priority].append(child)
+
+    async def _fail_dependents(self, task_id: str):
+        """Fail every blocked task that transitively depends on ``task_id``"""
+        pending = [task_id]
+        while pending:
+            parent_id = pending.pop()
+            for child_id in self._dependents.pop(parent_id, ()):
+                if child_id not in self._blocked:
+                    continue
+                child, _ = self._blocked.pop(child_id)
+                child.status = TaskStatus.FAILED
+                child.error_message = f"Dependency {parent_id} failed"
+                child.completed_at = datetime.now()
+                self.failed_tasks[child_id] = child
+                self.stats["tasks_failed"] += 1
+                await self._persist_task(child)
+                pending.append(child_id)
+
     async def _persist_task(self, task: BatchTask):
         """Persist task to configured backend"""
         if not self.config.enable_persistence:
@@ -448,11 +692,9 @@ class BatchProcessor:
         try:
             task_data = task.to_dict()
 
-            if self.redis_client:
-                # Store in Redis
-                key = f"batch_task:{task.task_id}"
-                # 24 hour expiry
-                await self.redis_client.set(key, json.dumps(task_data), ex=86400)
+            if self.stream_queue:
+                # Store in Redis with a 24 hour expiry
+                await self.stream_queue.save_task(task, ttl_seconds=86400)
 
             elif self.config.persistence_backend == "file":
                 # Store in file
@@ -477,9 +719,7 @@ class BatchProcessor:
         logger.info("Starting batch processor")
 
         try:
-            while self.processing and not self._stop_event.is_set():
-                await self._process_batch()
-                await asyncio.sleep(self.config.processing_interval_seconds)
+            await self._dispatch_loop()
 
         except Exception as e:
             logger.error(f"Batch processor error: {e}")
@@ -491,38 +731,64 @@ class BatchProcessor:
         """Stop the batch processing loop"""
         self.processing = False
         self._stop_event.set()
+        async with self._wakeup:
+            self._wakeup.notify_all()
 
         # Wait for active tasks to complete (with timeout)
-        if self.active_tasks:
-            logger.info(
-                f"Waiting for {len(self.active_tasks)} active tasks to complete..."
-            )
-            await asyncio.sleep(5)  # Give tasks time to finish
+        if self._running:
+            logger.info(f"Waiting for {len(self._running)} active tasks to complete...")
+            await asyncio.wait(self._running, timeout=5)
 
-    async def _process_batch(self):
-        """Process a batch of tasks"""
-        # Get next batch of tasks to process
-        tasks_to_process = []
+    async def _dispatch_loop(self):
+        """
+        Keep up to max_concurrent_tasks running, starting a task as soon as a
+        slot frees up rather than waiting for a whole batch to finish
+        """
+        async with self._wakeup:
+            while self.processing and not self._stop_event.is_set():
+                await self._release_due_retries()
+
+                free_slots = self.config.max_concurrent_tasks - len(self._running)
+                started = []
+                if free_slots > 0:
+                    started = await self._take_tasks(free_slots)
+                    for task in started:
+                        self._spawn(task)
+
+                # New work is announced locally, but other replicas only show
+                # up in the shared stream, which has to be polled
+                timeout = None
+                if self.stream_queue and len(self._running) < (
+                    self.config.max_concurrent_tasks
+                ):
+                    if started:
+                        continue
+                    timeout = self.config.processing_interval_seconds
+                if self._retry_heap:
+                    retry_in = max(self._retry_heap[0][0] - time.monotonic(), 0.0)
+                    timeout = retry_in if timeout is None else min(timeout, retry_in)
 
-        # Process in priority order
-        for priority in [
-            TaskPriority.URGENT,
-            TaskPriority.HIGH,
-            TaskPriority.NORMAL,
-            TaskPriority.LOW,
-        ]:
-            queue = self.task_queues[priority]
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except TimeoutError:
+                    pass
 
-            while queue and len(tasks_to_process) < self.config.batch_size:
-                task = queue.popleft()
+    def _spawn(self, task: BatchTask):
+        self._running.add(asyncio.create_task(self._run_task(task)))
 
-                # Check dependencies
-                if await self._dependencies_satisfied(task):
-                    tasks_to_process.append(task)
-                else:
-                    # Put back in queue for later
-                    queue.append(task)
-                    break
+    async def _run_task(self, task: BatchTask):
+        try:
+            await self._process_single_task(task)
+        finally:
+            # Free the slot before waking the dispatcher so it can refill it
+            self._running.discard(asyncio.current_task())
+            async with self._wakeup:
+                self._wakeup.notify()
+
+    async def _process_batch(self):
+        """Process a single batch of ready tasks to completion"""
+        await self._release_due_retries()
+        tasks_to_process = await self._take_tasks(self.config.batch_size)
 
         # Process tasks concurrently
         if tasks_to_process:
@@ -531,16 +797,84 @@ class BatchProcessor:
                 return_exceptions=True,
             )
 
+    async def _take_tasks(self, limit: int) -> list[BatchTask]:
+        """Take up to ``limit`` ready tasks in priority order"""
+        if self.stream_queue:
+            return await self._read_stream_batch(limit)
+
+        tasks = []
+        for priority in PRIORITY_ORDER:
+            queue = self.task_queues[priority]
+            while queue and len(tasks) < limit:
+                tasks.append(queue.popleft())
+        return tasks
+
+    def _schedule_retry(self, task: BatchTask, entry_id: str | None):
+        """Requeue a task after retry_delay_seconds without holding a slot"""
+        due = time.monotonic() + self.config.retry_delay_seconds
+        heapq.heappush(
+            self._retry_heap, (due, next(self._retry_sequence), task, entry_id)
+        )
+
+    async def _release_due_retries(self):
+        """Move retries whose delay has elapsed back onto the queue"""
+        now = time.monotonic()
+        while self._retry_heap and self._retry_heap[0][0] <= now:
+            _, _, task, entry_id = heapq.heappop(self._retry_heap)
+
+            if task.status == TaskStatus.CANCELLED:
+                if entry_id:
+                    await self.stream_queue.ack(task, entry_id)
+            elif entry_id:
+                await self.stream_queue.requeue(task, entry_id)
+            else:
+                self.task_queues[task.priority].append(task)
+
+    async def _read_stream_batch(self, limit: int) -> list[BatchTask]:
+        """Take up to ``limit`` tasks from the shared Redis Streams queue"""
+        tasks_to_process = []
+
+        for entry_id, task in await self.stream_queue.read(limit):
+            stored = await self.stream_queue.load_task(task.task_id)
+            if stored and stored.status == TaskStatus.CANCELLED:
+                await self.stream_queue.ack(task, entry_id)
+                continue
+
+            if stored:
+                task.retry_count = stored.retry_count
+
+            if await self._dependencies_satisfied(task):
+                self._stream_entries[task.task_id] = entry_id
+                tasks_to_process.append(task)
+            elif task.status == TaskStatus.FAILED:
+                await self.stream_queue.ack(task, entry_id)
+                await self._persist_task(task)
+            else:
+                # Dependencies still running; move to the back of the stream
+                await self.stream_queue.requeue(task, entry_id)
+
+        return tasks_to_process
+
     async def _dependencies_satisfied(self, task: BatchTask) -> bool:
         """Check if task dependencies are satisfied"""
         if not task.depends_on:
             return True
 
         for dep_task_id in task.depends_on:
-            # Check if dependency is completed
+            dep_status = None
             if dep_task_id in self.completed_tasks:
-                continue
+                dep_status = TaskStatus.COMPLETED
             elif dep_task_id in self.failed_tasks:
+                dep_status = TaskStatus.FAILED
+            elif self.stream_queue:
+                # The dependency may have been handled by another replica
+                dep_task = await self.stream_queue.load_task(dep_task_id)
+                dep_status = dep_task.status if dep_task else None
+
+            # Check if dependency is completed
+            if dep_status == TaskStatus.COMPLETED:
+                continue
+            elif dep_status in (TaskStatus.FAILED, TaskStatus.CANCELLED):
                 # Dependency failed, mark this task as failed too
                 task.status = TaskStatus.FAILED
                 task.error_message = f"Dependency {dep_task_id} failed"
@@ -583,6 +917,7 @@ class BatchProcessor:
 
                     self.completed_tasks[task.task_id] = task
                     self.stats["tasks_completed"] += 1
+                    self._release_dependents(task.task_id)
 
                     logger.info(f"Task completed: {task.task_id}")
 
@@ -600,9 +935,10 @@ class BatchProcessor:
                     # Retry task
                     task.status = TaskStatus.RETRYING
 
-                    # Add back to queue with delay
-                    await asyncio.sleep(self.config.retry_delay_seconds)
-                    self.task_queues[task.priority].append(task)
+                    # Add back to queue once the retry delay has elapsed
+                    self._schedule_retry(
+                        task, self._stream_entries.pop(task.task_id, None)
+                    )
 
                     logger.warning(
                         f"Task failed, retrying ({task.retry_count}/{task.max_retries}): {task.task_id}"
@@ -616,6 +952,7 @@ class BatchProcessor:
 
                     self.failed_tasks[task.task_id] = task
                     self.stats["tasks_failed"] += 1
+                    await self._fail_dependents(task.task_id)
 
                     logger.error(f"Task failed permanently: {task.task_id} - {e}")
 
@@ -624,6 +961,11 @@ class BatchProcessor:
                 if task.task_id in self.active_tasks:
                     del self.active_tasks[task.task_id]
 
+                # Finished (or permanently failed) stream entries are acked
+                entry_id = self._stream_entries.pop(task.task_id, None)
+                if entry_id:
+                    await self.stream_queue.ack(task, entry_id)
+
                 # Persist updated task
                 await self._persist_task(task)
 
@@ -647,6 +989,13 @@ class BatchProcessor:
                 if task.task_id == task_id:
                     return task.to_dict()
 
+        # Check tasks waiting on dependencies or a retry delay
+        if task_id in self._blocked:
+            return self._blocked[task_id][0].to_dict()
+        for _, _, task, _ in self._retry_heap:
+            if task.task_id == task_id:
+                return task.to_dict()
+
         return None
 
     def get_queue_status(self) -> dict[str, Any]:
@@ -659,6 +1008,8 @@ class BatchProcessor:
             "processing": self.processing,
             "queue_lengths": queue_lengths,
             "total_queued": sum(queue_lengths.values()),
+            "blocked_tasks": len(self._blocked),
+            "scheduled_retries": len(self._retry_heap),
             "active_tasks": len(self.active_tasks),
             "completed_tasks": len(self.completed_tasks),
             "failed_tasks": len(self.failed_tasks),
@@ -680,9 +1031,23 @@ class BatchProcessor:
                     del priority_queue[i]
                     self.failed_tasks[task_id] = task
                     await self._persist_task(task)
+                    await self._fail_dependents(task_id)
                     logger.info(f"Cancelled queued task: {task_id}")
                     return True
 
+        # Check tasks waiting on dependencies or a retry delay
+        waiting = [entry[2] for entry in self._retry_heap]
+        if task_id in self._blocked:
+            waiting.append(self._blocked.pop(task_id)[0])
+        for task in waiting:
+            if task.task_id == task_id:
+                task.status = TaskStatus.CANCELLED
+                self.failed_tasks[task_id] = task
+                await self._persist_task(task)
+                await self._fail_dependents(task_id)
+                logger.info(f"Cancelled waiting task: {task_id}")
+                return True
+
         # Check active tasks (these can't be cancelled immediately)
         if task_id in self.active_tasks:
             task = self.active_tasks[task_id]
@@ -692,6 +1057,16 @@ class BatchProcessor:
             logger.info(f"Marked active task for cancellation: {task_id}")
             return True
 
+        # Tasks in the shared queue are skipped when they are next read
+        if self.stream_queue:
+            task = await self.stream_queue.load_task(task_id)
+            if task and task.status in (TaskStatus.QUEUED, TaskStatus.RETRYING):
+                task.status = TaskStatus.CANCELLED
+                self.failed_tasks[task_id] = task
+                await self._persist_task(task)
+                logger.info(f"Cancelled queued task: {task_id}")
+                return True
+
         return False
 
     def cleanup_completed_tasks(self, max_age_hours: int = 24) -> int:
@@ -182,6 +182,12 @@ async def lifespan(app: FastAPI):
         if vector_client:
             vector_client.close()
 
+        if hr_voting_scraper:
+            hr_voting_scraper.close()
+
+        if limited_scrape_coordinator and limited_scrape_coordinator.hr_voting_scraper:
+            limited_scrape_coordinator.hr_voting_scraper.close()
+
 
 app = FastAPI(
     title="Diet Issue Tracker - Ingest Worker",
@@ -708,7 +714,9 @@ async def _transcribe_task(
 
         if video_url:
             logger.info(f"Transcribing video: {video_url}")
-            result, audio_file = whisper_client.download_and_transcribe_video(video_url)
+            result, audio_file = await whisper_client.download_and_transcribe_video(
+                video_url
+            )
         elif audio_url:
             # For audio URLs, we would need to download first
             # This is a simplified implementation
@@ -1458,8 +1466,8 @@ async def get_hr_processing_status() -> dict[str, Any]:
 
     try:
         # Initialize processor to get current statistics
-        processor = EnhancedHRProcessor()
-        processing_stats = processor.get_processing_statistics()
+        async with EnhancedHRProcessor() as processor:
+            processing_stats = processor.get_processing_statistics()
 
         # Get base scraper statistics
         base_stats = {}
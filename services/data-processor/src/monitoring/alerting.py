@@ -12,14 +12,15 @@ This module provides sophisticated alerting capabilities including:
 
 import asyncio
 import logging
+import math
 import smtplib
 import statistics
 import time
 from collections import defaultdict, deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from email.mime.multipart import MimeMultipart
-from email.mime.text import MimeText
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
 from enum import Enum
 from typing import Any
 
@@ -113,19 +114,78 @@ class NotificationConfig:
             self.config = {}
 
 
+class RunningStats:
+    """Mean and variance of a fixed-size window, maintained with Welford's method.
+
+    Values entering and leaving the window update the mean and the sum of
+    squared deviations in O(1); both are recomputed exactly once per window
+    length so rounding drift stays bounded.
+    """
+
+    def __init__(self, maxlen: int = 100):
+        self.values: deque = deque(maxlen=maxlen)
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._updates_since_resync = 0
+
+    def add(self, value: float):
+        if len(self.values) == self.values.maxlen:
+            self._remove(self.values[0])
+        self.values.append(value)
+
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self._m2 += delta * (value - self.mean)
+
+        self._updates_since_resync += 1
+        if self._updates_since_resync >= self.values.maxlen:
+            self._resync()
+
+    def _remove(self, value: float):
+        n = len(self.values) - 1
+        if n == 0:
+            self.mean = self._m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / n
+        self._m2 = max(self._m2 - delta * (value - self.mean), 0.0)
+
+    def _resync(self):
+        n = len(self.values)
+        self.mean = math.fsum(self.values) / n
+        self._m2 = math.fsum((v - self.mean) ** 2 for v in self.values)
+        self._updates_since_resync = 0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; zero with fewer than two values."""
+        n = len(self.values)
+        return self._m2 / (n - 1) if n > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+
 class AnomalyDetector:
     """Statistical anomaly detection for metrics."""
 
     def __init__(self, window_size: int = 100, sensitivity: float = 2.0):
         self.window_size = window_size
         self.sensitivity = sensitivity  # Standard deviations for outlier detection
-        self.metric_history: dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=window_size)
+        self.metric_history: dict[str, RunningStats] = defaultdict(
+            lambda: RunningStats(maxlen=window_size)
         )
 
     def add_value(self, metric_name: str, value: float):
         """Add a metric value to the history."""
-        self.metric_history[metric_name].append(value)
+        self.metric_history[metric_name].add(value)
 
     def is_anomaly(self, metric_name: str, value: float) -> bool:
         """Check if a value is anomalous based on historical data."""
@@ -134,17 +194,11 @@ class AnomalyDetector:
         if len(history) < 10:  # Need minimum history
             return False
 
-        try:
-            mean = statistics.mean(history)
-            stdev = statistics.stdev(history)
-
-            # Check if value is outside normal range
-            if stdev > 0:
-                z_score = abs(value - mean) / stdev
-                return z_score > self.sensitivity
-
-        except statistics.StatisticsError:
-            pass
+        # Check if value is outside normal range
+        stdev = history.stdev
+        if stdev > 0:
+            z_score = abs(value - history.mean) / stdev
+            return z_score > self.sensitivity
 
         return False
 
@@ -155,17 +209,14 @@ class AnomalyDetector:
         if len(history) < 5:
             return {}
 
-        try:
-            return {
-                "mean": statistics.mean(history),
-                "median": statistics.median(history),
-                "stdev": statistics.stdev(history),
-                "min": min(history),
-                "max": max(history),
-                "count": len(history),
-            }
-        except statistics.StatisticsError:
-            return {}
+        return {
+            "mean": history.mean,
+            "median": statistics.median(history),
+            "stdev": history.stdev,
+            "min": min(history),
+            "max": max(history),
+            "count": len(history),
+        }
 
 
 class AlertManager:
@@ -266,6 +317,12 @@ class AlertManager:
 
     def _setup_evaluation_task(self):
         """Setup background task for rule evaluation."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Imported outside an event loop; rules can still be evaluated
+            # explicitly via evaluate_all_rules()
+            return
         asyncio.create_task(self._evaluation_loop())
 
     async def _evaluation_loop(self):
@@ -390,17 +447,12 @@ class AlertManager:
     def _get_recent_metric_values(
         self, metric_name: str, window_minutes: int
     ) -> list[float]:
-        """Get recent metric values within the time window."""
+        """Get recent metric values within the time window, oldest first."""
         cutoff_time = datetime.utcnow() - timedelta(minutes=window_minutes)
-
-        values = []
-        metric_list = ingest_metrics.metrics.get(metric_name, deque())
-
-        for metric in metric_list:
-            if metric.timestamp >= cutoff_time:
-                values.append(metric.value)
-
-        return sorted(values)  # Sort by time
+        return [
+            metric.value
+            for metric in ingest_metrics.points_since(metric_name, cutoff_time)
+        ]
 
     async def _trigger_alert(self, rule: AlertRule, value: float):
         """Trigger a new alert."""
@@ -541,12 +593,12 @@ Please investigate this issue promptly.
         """
 
         try:
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg["From"] = config["username"]
             msg["To"] = ", ".join(config["to_emails"])
             msg["Subject"] = subject
 
-            msg.attach(MimeText(body, "plain"))
+            msg.attach(MIMEText(body, "plain"))
 
             with smtplib.SMTP(config["smtp_server"], config["smtp_port"]) as server:
                 server.starttls()
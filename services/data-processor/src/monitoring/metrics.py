@@ -11,15 +11,20 @@ This module provides unified metrics collection across all ingest worker operati
 """
 
 import logging
+import math
 import time
+from bisect import bisect_left
 from collections import defaultdict, deque
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 import psutil
 
+from shared.utils.metrics_registry import MetricsRegistry
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,11 +57,53 @@ class ProcessingStats:
     successful: int = 0
     failed: int = 0
     avg_processing_time: float = 0.0
+    ewma_processing_time: float = 0.0
     success_rate: float = 0.0
     error_rate: float = 0.0
     last_processed: datetime | None = None
 
 
+class RollingWindow:
+    """Fixed-size window of recent values with O(1) running mean and EWMA.
+
+    The running sum is adjusted as values enter and leave the window and is
+    recomputed exactly once per window length, so rounding drift stays bounded.
+    """
+
+    def __init__(self, maxlen: int = 1000, alpha: float = 0.1):
+        self.values: deque = deque(maxlen=maxlen)
+        self.alpha = alpha
+        self.sum = 0.0
+        self.ewma: float | None = None
+        self._appends_since_resum = 0
+
+    def append(self, value: float):
+        if len(self.values) == self.values.maxlen:
+            self.sum -= self.values[0]
+        self.values.append(value)
+        self.sum += value
+
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            self.ewma += self.alpha * (value - self.ewma)
+
+        self._appends_since_resum += 1
+        if self._appends_since_resum >= self.values.maxlen:
+            self.sum = math.fsum(self.values)
+            self._appends_since_resum = 0
+
+    @property
+    def mean(self) -> float:
+        return self.sum / len(self.values) if self.values else 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+
 @dataclass
 class SystemMetrics:
     """System resource metrics."""
@@ -73,11 +120,19 @@ class SystemMetrics:
 class IngestWorkerMetrics:
     """Centralized metrics collection for ingest worker operations."""
 
-    def __init__(self, retention_hours: int = 24):
+    def __init__(self, retention_hours: int = 24, sweep_interval_seconds: float = 60.0):
         self.retention_hours = retention_hours
+        self.retention = timedelta(hours=retention_hours)
         self.metrics: dict[str, deque] = defaultdict(lambda: deque(maxlen=10000))
         self.start_time = datetime.utcnow()
 
+        # Idle series are expired by a periodic sweep rather than on every record
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._last_sweep = time.monotonic()
+
+        # Pre-aggregated metric families for Prometheus exposition
+        self.registry = MetricsRegistry()
+
         # Processing pipeline metrics
         self.pdf_processing = ProcessingStats()
         self.stt_processing = ProcessingStats()
@@ -87,9 +142,7 @@ class IngestWorkerMetrics:
 
         # Performance tracking
         self.active_operations = defaultdict(int)
-        self.processing_times: dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=1000)
-        )
+        self.processing_times: dict[str, RollingWindow] = defaultdict(RollingWindow)
         self.error_counts = defaultdict(int)
         self.quality_scores: dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
 
@@ -113,20 +166,55 @@ class IngestWorkerMetrics:
         unit: str = "count",
     ):
         """Record a metric point."""
+        now = datetime.utcnow()
         metric = MetricPoint(
             name=name,
             value=value,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             metric_type=metric_type,
             tags=tags or {},
             unit=unit,
         )
 
-        self.metrics[name].append(metric)
-        self._cleanup_old_metrics()
+        # Expire only this series; others are handled by the periodic sweep
+        metric_list = self.metrics[name]
+        cutoff = now - self.retention
+        while metric_list and metric_list[0].timestamp < cutoff:
+            metric_list.popleft()
+        metric_list.append(metric)
+
+        if time.monotonic() - self._last_sweep >= self.sweep_interval_seconds:
+            self._cleanup_old_metrics()
+
+        self._aggregate(metric)
 
         logger.debug(f"Recorded metric: {name}={value} {unit} {tags}")
 
+    def points_since(self, name: str, since: datetime) -> list[MetricPoint]:
+        """Return the points of a series recorded at or after ``since``.
+
+        Series are appended in timestamp order, so the window start is found
+        by bisection and only the points inside the window are copied.
+        """
+        metric_list = self.metrics.get(name)
+        if not metric_list:
+            return []
+
+        start = bisect_left(metric_list, since, key=lambda m: m.timestamp)
+        recent = list(islice(reversed(metric_list), len(metric_list) - start))
+        recent.reverse()
+        return recent
+
+    def _aggregate(self, metric: MetricPoint):
+        """Fold a metric point into its typed family in the registry."""
+        if metric.metric_type == MetricType.COUNTER:
+            self.registry.counter(metric.name).inc(metric.value, metric.tags)
+        elif metric.metric_type == MetricType.GAUGE:
+            self.registry.gauge(metric.name).set(metric.value, metric.tags)
+        else:
+            # Timers are exposed as histograms of their durations
+            self.registry.histogram(metric.name).observe(metric.value, metric.tags)
+
     def record_processing_operation(
         self,
         operation_type: str,
@@ -170,9 +258,9 @@ class IngestWorkerMetrics:
         # Update derived metrics
         stats.success_rate = stats.successful / stats.total_processed
         stats.error_rate = stats.failed / stats.total_processed
-        stats.avg_processing_time = sum(self.processing_times[operation_type]) / len(
-            self.processing_times[operation_type]
-        )
+        processing_times = self.processing_times[operation_type]
+        stats.avg_processing_time = processing_times.mean
+        stats.ewma_processing_time = processing_times.ewma
 
         # Record quality score if provided
         if quality_score is not None:
@@ -412,45 +500,7 @@ class IngestWorkerMetrics:
         lines.append("# TYPE ingest_worker_info gauge")
         lines.append('ingest_worker_info{version="1.0.0"} 1')
 
-        # Group metrics by name
-        metric_groups = defaultdict(list)
-        for metric_list in self.metrics.values():
-            for metric in metric_list:
-                metric_groups[metric.name].append(metric)
-
-        for metric_name, metric_list in metric_groups.items():
-            # Determine Prometheus type
-            if metric_list:
-                sample_metric = metric_list[0]
-                if sample_metric.metric_type == MetricType.COUNTER:
-                    prom_type = "counter"
-                elif sample_metric.metric_type == MetricType.GAUGE:
-                    prom_type = "gauge"
-                elif sample_metric.metric_type == MetricType.HISTOGRAM:
-                    prom_type = "histogram"
-                else:
-                    prom_type = "gauge"
-            else:
-                prom_type = "gauge"
-
-            lines.append(
-                f"# HELP {metric_name} {metric_name.replace('_', ' ').title()}"
-            )
-            lines.append(f"# TYPE {metric_name} {prom_type}")
-
-            # Group by tags and get latest value
-            tag_groups = {}
-            for metric in metric_list:
-                tag_str = ",".join(f'{k}="{v}"' for k, v in sorted(metric.tags.items()))
-                tag_groups[tag_str] = metric.value  # Latest value wins
-
-            for tags, value in tag_groups.items():
-                if tags:
-                    lines.append(f"{metric_name}{{{tags}}} {value}")
-                else:
-                    lines.append(f"{metric_name} {value}")
-
-        return "\n".join(lines)
+        return "\n".join(lines) + "\n" + self.registry.expose()
 
     def _get_processing_stats(self, operation_type: str) -> ProcessingStats:
         """Get processing stats object for operation type."""
@@ -491,8 +541,9 @@ class IngestWorkerMetrics:
             return "large"
 
     def _cleanup_old_metrics(self):
-        """Remove metrics older than retention period."""
-        cutoff = datetime.utcnow() - timedelta(hours=self.retention_hours)
+        """Remove metrics older than retention period from every series."""
+        cutoff = datetime.utcnow() - self.retention
+        self._last_sweep = time.monotonic()
 
         for metric_name, metric_list in self.metrics.items():
             while metric_list and metric_list[0].timestamp < cutoff:
@@ -618,10 +618,11 @@ async def run_hr_integration_pipeline(
             f"Starting HR integration pipeline (days_back={days_back}, dry_run={dry_run})"
         )
 
-        processor = EnhancedHRProcessor()
-        enhanced_sessions = await processor.process_enhanced_hr_data(
-            days_back=days_back, max_concurrent=max_concurrent
-        )
+        async with EnhancedHRProcessor() as processor:
+            enhanced_sessions = await processor.process_enhanced_hr_data(
+                days_back=days_back, max_concurrent=max_concurrent
+            )
+            processing_stats = processor.get_processing_statistics()
 
         logger.info(f"Processing completed: {len(enhanced_sessions)} sessions")
 
@@ -636,7 +637,7 @@ async def run_hr_integration_pipeline(
         )
 
         pipeline_result["success"] = integration_result.success
-        pipeline_result["processing_results"] = processor.get_processing_statistics()
+        pipeline_result["processing_results"] = processing_stats
         pipeline_result["integration_results"] = integration_result
 
         if integration_result.errors:
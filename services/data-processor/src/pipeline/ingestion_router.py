@@ -444,7 +444,9 @@ class HybridIngestionRouter:
             )
 
             # Get and process speeches
-            speeches = await self.ndl_client.get_all_speeches_for_meeting(meeting_id)
+            speeches = await self.ndl_client.get_all_speeches_for_meeting(
+                meeting_id, meeting=meeting
+            )
 
             if speeches:
                 batch_result = self.data_mapper.batch_map_speeches(
@@ -527,7 +529,10 @@ class HybridIngestionRouter:
             )
 
             # 1. Download and transcribe video
-            transcription, audio_file = whisper_client.download_and_transcribe_video(
+            (
+                transcription,
+                audio_file,
+            ) = await whisper_client.download_and_transcribe_video(
                 meeting_info["video_url"]
             )
 
@@ -3,16 +3,27 @@ Bill data merger for combining data from multiple sources.
 Handles data integration between Sangiin and Shugiin with conflict resolution.
 """
 
+import heapq
+import itertools
 import logging
+import math
 import re
+from collections import Counter, defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from enum import Enum
+from functools import partial
 from typing import Any
 
 from ..scraper.enhanced_diet_scraper import EnhancedBillData
 from ..scraper.shugiin_scraper import ShugiinBillData
 
+BILL_NUMBER_PATTERN = re.compile(r"\d+")
+
+# Weights of the components of the cross-house similarity score
+SIMILARITY_WEIGHTS = {"title": 0.4, "session": 0.3, "number": 0.2, "submitter": 0.1}
+
 
 class ConflictResolutionStrategy(Enum):
     """Strategies for resolving data conflicts"""
@@ -35,6 +46,92 @@ class MergeConflict:
     confidence: float
 
 
+@dataclass
+class BillMatchKey:
+    """Matching features of a bill, computed once per merge"""
+
+    index: int
+    title: str | None
+    session: str | None
+    number: str | None
+    submitter: str | None
+    # Title characters as (char, occurrence) so shared tokens count the
+    # multiset overlap that bounds SequenceMatcher.quick_ratio()
+    title_tokens: tuple[tuple[str, int], ...]
+
+
+TitleIndex = dict[tuple[str, int], list[int]]
+
+
+@dataclass
+class _CandidateBlock:
+    """Bills of one house and diet session indexed for candidate lookup
+
+    Title characters are indexed separately per (has bill number, submitter),
+    since those decide how similar a title has to be for the pair to reach the
+    threshold.
+    """
+
+    members: list[int] = field(default_factory=list)
+    by_number: dict[str, list[int]] = field(default_factory=lambda: defaultdict(list))
+    by_title: dict[tuple[bool, str | None], TitleIndex] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(list))
+    )
+    no_title: list[int] = field(default_factory=list)
+
+    def add(self, key: BillMatchKey):
+        self.members.append(key.index)
+        if key.number:
+            self.by_number[key.number].append(key.index)
+        if not key.title_tokens:
+            self.no_title.append(key.index)
+            return
+
+        title_index = self.by_title[bool(key.number), key.submitter]
+        for token in key.title_tokens:
+            title_index[token].append(key.index)
+
+    def candidates(
+        self,
+        key: BillMatchKey,
+        min_title_similarity: Callable[[bool, str | None], float],
+    ) -> set[int]:
+        """Bills that can reach the threshold when paired with ``key``
+
+        These are bills sharing the bill number, bills without a title, and
+        bills whose titles share enough characters for quick_ratio() to reach
+        ``min_title_similarity(has_number, submitter)``. Those are found by
+        prefix filtering: such a title shares at least one of the rarest
+        ``n - required + 1`` characters of ``key``'s title. Where no title
+        similarity is needed, every bill of that index is a candidate.
+        """
+        if not key.title_tokens:
+            return set(self.members)
+
+        candidates = set(self.by_number.get(key.number, ())) if key.number else set()
+        candidates.update(self.no_title)
+
+        n = len(key.title_tokens)
+        for (has_number, submitter), title_index in self.by_title.items():
+            similarity = min_title_similarity(has_number, submitter)
+            if similarity > 1.0:
+                continue
+            if similarity <= 0.0:
+                # Even a title with no shared character can reach the threshold
+                for indices in title_index.values():
+                    candidates.update(indices)
+                continue
+
+            # quick_ratio >= t needs a multiset overlap of at least t*n / (2 - t)
+            required = math.ceil(similarity * n / (2.0 - similarity))
+            probe = sorted(
+                key.title_tokens, key=lambda token: len(title_index.get(token, ()))
+            )
+            for token in probe[: n - required + 1]:
+                candidates.update(title_index.get(token, ()))
+        return candidates
+
+
 @dataclass
 class MergeResult:
     """Result of data merge operation"""
@@ -132,75 +229,195 @@ class BillDataMerger:
         sangiin_bills: list[EnhancedBillData],
         shugiin_bills: list[ShugiinBillData],
     ) -> dict[str, ShugiinBillData]:
-        """Find matching bills between houses using multiple criteria"""
+        """Find matching bills between houses using multiple criteria
 
-        matches = {}
+        Candidate pairs are blocked by diet session and then looked up by bill
+        number and by title characters, so only pairs that can reach
+        ``similarity_threshold`` are scored. Those that do are then assigned
+        one to one, maximising the total similarity.
+        """
 
-        for sangiin_bill in sangiin_bills:
-            best_match = None
-            best_score = 0.0
+        sangiin_keys = [
+            self._match_key(i, bill) for i, bill in enumerate(sangiin_bills)
+        ]
+        shugiin_keys = [
+            self._match_key(i, bill) for i, bill in enumerate(shugiin_bills)
+        ]
 
-            for shugiin_bill in shugiin_bills:
-                # Calculate similarity score
-                score = self._calculate_similarity_score(sangiin_bill, shugiin_bill)
+        # Bills from different sessions can score at most 1 - session weight,
+        # so other sessions are only searched below that threshold
+        search_other_sessions = self.similarity_threshold <= (
+            1.0 - SIMILARITY_WEIGHTS["session"] + 1e-9
+        )
+        blocks: dict[str | None, _CandidateBlock] = defaultdict(_CandidateBlock)
+        for key in shugiin_keys:
+            blocks[key.session].add(key)
+
+        # One matcher per Shugiin title so its character index is built once
+        title_matchers: dict[int, SequenceMatcher] = {}
+
+        edges: list[tuple[int, int, float]] = []
+        pairs_scored = 0
+
+        for sangiin_key in sangiin_keys:
+            candidates: set[int] = set()
+            for session, block in blocks.items():
+                if not sangiin_key.session or session is None:
+                    session_case = "absent"
+                elif session == sangiin_key.session:
+                    session_case = "equal"
+                elif search_other_sessions:
+                    session_case = "different"
+                else:
+                    continue
 
-                if score > best_score and score >= self.similarity_threshold:
-                    best_score = score
-                    best_match = shugiin_bill
+                candidates.update(
+                    block.candidates(
+                        sangiin_key,
+                        partial(self._min_title_similarity, sangiin_key, session_case),
+                    )
+                )
 
-            if best_match:
-                matches[sangiin_bill.bill_id] = best_match
-                self.logger.debug(
-                    f"Matched {sangiin_bill.bill_id} with {best_match.bill_id} (score: {best_score:.2f})"
+            for shugiin_index in candidates:
+                pairs_scored += 1
+                shugiin_key = shugiin_keys[shugiin_index]
+                matcher = title_matchers.get(shugiin_index)
+                if matcher is None and shugiin_key.title:
+                    matcher = title_matchers[shugiin_index] = SequenceMatcher(
+                        None, "", shugiin_key.title
+                    )
+                score = self._score_match_keys(
+                    sangiin_key,
+                    shugiin_key,
+                    cutoff=self.similarity_threshold,
+                    title_matcher=matcher,
                 )
+                if score >= self.similarity_threshold:
+                    edges.append((sangiin_key.index, shugiin_index, score))
+
+        matches = {}
+        for sangiin_index, shugiin_index, score in _assign_one_to_one(edges):
+            sangiin_bill = sangiin_bills[sangiin_index]
+            shugiin_bill = shugiin_bills[shugiin_index]
+            matches[sangiin_bill.bill_id] = shugiin_bill
+            self.logger.debug(
+                f"Matched {sangiin_bill.bill_id} with {shugiin_bill.bill_id} (score: {score:.2f})"
+            )
 
+        self.logger.debug(
+            f"Scored {pairs_scored} of {len(sangiin_bills) * len(shugiin_bills)} candidate pairs"
+        )
         return matches
 
+    def _match_key(
+        self, index: int, bill: EnhancedBillData | ShugiinBillData
+    ) -> BillMatchKey:
+        """Extract the features used for cross-house matching"""
+        numbers = BILL_NUMBER_PATTERN.findall(bill.bill_id) if bill.bill_id else []
+
+        title_tokens = tuple(
+            (char, occurrence)
+            for char, count in Counter(bill.title or "").items()
+            for occurrence in range(count)
+        )
+
+        return BillMatchKey(
+            index=index,
+            title=bill.title or None,
+            session=bill.diet_session or None,
+            number=numbers[-1] if numbers else None,
+            submitter=bill.submitter or None,
+            title_tokens=title_tokens,
+        )
+
+    def _min_title_similarity(
+        self,
+        key: BillMatchKey,
+        session_case: str,
+        other_has_number: bool,
+        other_submitter: str | None,
+    ) -> float:
+        """Lowest title similarity with which ``key`` can reach the threshold
+
+        The other bill is described by how its session compares ("equal",
+        "different" or "absent"), whether it has a bill number (assumed to
+        differ; equal numbers are looked up directly) and its submitter.
+        """
+        title_weight = SIMILARITY_WEIGHTS["title"]
+        total_weight = title_weight
+        matched_weight = 0.0
+
+        if session_case != "absent":
+            total_weight += SIMILARITY_WEIGHTS["session"]
+            if session_case == "equal":
+                matched_weight += SIMILARITY_WEIGHTS["session"]
+        if key.number and other_has_number:
+            total_weight += SIMILARITY_WEIGHTS["number"]
+        if key.submitter and other_submitter:
+            total_weight += SIMILARITY_WEIGHTS["submitter"]
+            if key.submitter == other_submitter:
+                matched_weight += SIMILARITY_WEIGHTS["submitter"]
+
+        needed = (self.similarity_threshold * total_weight - matched_weight) / (
+            title_weight
+        )
+        # Leave room for rounding in the weighted average
+        return needed - 1e-9
+
     def _calculate_similarity_score(
         self, sangiin_bill: EnhancedBillData, shugiin_bill: ShugiinBillData
     ) -> float:
         """Calculate similarity score between two bills"""
+        return self._score_match_keys(
+            self._match_key(0, sangiin_bill), self._match_key(0, shugiin_bill)
+        )
 
-        scores = []
+    def _score_match_keys(
+        self,
+        sangiin: BillMatchKey,
+        shugiin: BillMatchKey,
+        cutoff: float = 0.0,
+        title_matcher: SequenceMatcher | None = None,
+    ) -> float:
+        """Score two bills' match keys
 
-        # Title similarity (high weight)
-        if sangiin_bill.title and shugiin_bill.title:
-            title_sim = SequenceMatcher(
-                None, sangiin_bill.title, shugiin_bill.title
-            ).ratio()
-            scores.append(("title", title_sim, 0.4))
+        Title similarity is computed last. When even the cheap upper bounds on
+        it cannot lift the score to ``cutoff``, 0.0 is returned instead.
+        ``title_matcher`` may be a reusable matcher whose second sequence is
+        the Shugiin title.
+        """
+
+        scores = []
 
         # Diet session similarity (medium weight)
-        if sangiin_bill.diet_session and shugiin_bill.diet_session:
-            session_sim = (
-                1.0 if sangiin_bill.diet_session == shugiin_bill.diet_session else 0.0
-            )
-            scores.append(("session", session_sim, 0.3))
+        if sangiin.session and shugiin.session:
+            session_sim = 1.0 if sangiin.session == shugiin.session else 0.0
+            scores.append((session_sim, SIMILARITY_WEIGHTS["session"]))
 
         # Bill number similarity (medium weight)
-        if sangiin_bill.bill_id and shugiin_bill.bill_id:
-            # Extract numbers from bill IDs
-            sangiin_num = re.findall(r"\d+", sangiin_bill.bill_id)
-            shugiin_num = re.findall(r"\d+", shugiin_bill.bill_id)
-
-            if sangiin_num and shugiin_num:
-                num_sim = 1.0 if sangiin_num[-1] == shugiin_num[-1] else 0.0
-                scores.append(("number", num_sim, 0.2))
+        if sangiin.number and shugiin.number:
+            num_sim = 1.0 if sangiin.number == shugiin.number else 0.0
+            scores.append((num_sim, SIMILARITY_WEIGHTS["number"]))
 
         # Submitter type similarity (low weight)
-        if sangiin_bill.submitter and shugiin_bill.submitter:
-            submitter_sim = (
-                1.0 if sangiin_bill.submitter == shugiin_bill.submitter else 0.0
-            )
-            scores.append(("submitter", submitter_sim, 0.1))
+        if sangiin.submitter and shugiin.submitter:
+            submitter_sim = 1.0 if sangiin.submitter == shugiin.submitter else 0.0
+            scores.append((submitter_sim, SIMILARITY_WEIGHTS["submitter"]))
+
+        # Title similarity (high weight)
+        if sangiin.title and shugiin.title:
+            title_weight = SIMILARITY_WEIGHTS["title"]
+            if _weighted_average([(1.0, title_weight), *scores]) < cutoff:
+                return 0.0
 
-        # Calculate weighted average
-        if scores:
-            total_weight = sum(weight for _, _, weight in scores)
-            weighted_sum = sum(score * weight for _, score, weight in scores)
-            return weighted_sum / total_weight if total_weight > 0 else 0.0
+            matcher = title_matcher or SequenceMatcher(None, b=shugiin.title)
+            matcher.set_seq1(sangiin.title)
+            for upper_bound in (matcher.real_quick_ratio, matcher.quick_ratio):
+                if _weighted_average([(upper_bound(), title_weight), *scores]) < cutoff:
+                    return 0.0
+            scores.insert(0, (matcher.ratio(), title_weight))
 
-        return 0.0
+        return _weighted_average(scores)
 
     def _merge_bill_pair(
         self, sangiin_bill: EnhancedBillData, shugiin_bill: ShugiinBillData
@@ -526,3 +743,89 @@ class BillDataMerger:
             "source_distribution": source_distribution,
             "avg_quality_score": avg_quality_score,
         }
+
+
+def _weighted_average(scores: list[tuple[float, float]]) -> float:
+    total_weight = sum(weight for _, weight in scores)
+    weighted_sum = sum(score * weight for score, weight in scores)
+    return weighted_sum / total_weight if total_weight > 0 else 0.0
+
+
+def _assign_one_to_one(
+    edges: list[tuple[int, int, float]],
+) -> list[tuple[int, int, float]]:
+    """Pick a one-to-one subset of (left, right, score) edges of maximum total score
+
+    Solved as a min-cost assignment with successive shortest augmenting paths
+    over the sparse edges, where each left node may also stay unmatched at the
+    cost of a zero score. A search only visits nodes reachable from the node
+    being matched, which for bill matching is usually a single pair.
+    """
+    adjacency: dict[int, list[tuple[tuple[str, int], float]]] = defaultdict(list)
+    scores: dict[tuple[int, int], float] = {}
+    for left, right, score in sorted(edges):
+        adjacency[left].append((("right", right), 1.0 - score))
+        scores[left, right] = score
+
+    potential: dict[Any, float] = defaultdict(float)
+    left_of: dict[tuple[str, int], int] = {}
+    right_of: dict[int, tuple[str, int]] = {}
+    cost_of: dict[int, float] = {}
+    tiebreak = itertools.count()
+
+    for source in sorted(adjacency):
+        adjacency[source].append((("unmatched", source), 1.0))
+        dist: dict[Any, float] = {source: 0.0}
+        parent: dict[tuple[str, int], tuple[int, float]] = {}
+        settled = set()
+        heap = [(0.0, next(tiebreak), source)]
+        target = None
+
+        # Dijkstra on reduced costs; right nodes are (kind, index) tuples
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if node in settled:
+                continue
+            settled.add(node)
+
+            if isinstance(node, tuple):
+                if node not in left_of:
+                    target = node
+                    break
+                # Follow the matched edge back to its left node
+                left = left_of[node]
+                candidate = distance - cost_of[left] + potential[node] - potential[left]
+                if candidate < dist.get(left, math.inf):
+                    dist[left] = candidate
+                    heapq.heappush(heap, (candidate, next(tiebreak), left))
+                continue
+
+            for right, cost in adjacency[node]:
+                if right in settled or right == right_of.get(node):
+                    continue
+                candidate = distance + cost + potential[node] - potential[right]
+                if candidate < dist.get(right, math.inf):
+                    dist[right] = candidate
+                    parent[right] = (node, cost)
+                    heapq.heappush(heap, (candidate, next(tiebreak), right))
+
+        # Keep reduced costs non-negative for the next search
+        shortest = dist[target]
+        for node in settled:
+            if dist[node] < shortest:
+                potential[node] += dist[node] - shortest
+
+        node = target
+        while True:
+            left, cost = parent[node]
+            previous = right_of.get(left)
+            left_of[node], right_of[left], cost_of[left] = left, node, cost
+            if left == source:
+                break
+            node = previous
+
+    return sorted(
+        (left, right[1], scores[left, right[1]])
+        for left, right in right_of.items()
+        if right[0] == "right"
+    )
@@ -5,14 +5,61 @@ Validates data completeness, format, and integrity.
 
 import logging
 import re
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import repeat
 from typing import Any
 
 from ..scraper.enhanced_diet_scraper import EnhancedBillData
 from .bill_data_merger import MergeResult
 
+# Text fields checked for Japanese content
+JAPANESE_TEXT_FIELDS = (
+    "title",
+    "bill_outline",
+    "background_context",
+    "expected_effects",
+    "summary",
+)
+
+# Date fields expected in chronological order
+CHRONOLOGICAL_DATE_FIELDS = (
+    "submitted_date",
+    "first_reading_date",
+    "committee_referral_date",
+    "committee_report_date",
+    "final_vote_date",
+    "promulgated_date",
+)
+
+# Stages consistent with each status
+STATUS_STAGE_MAPPING = {
+    "成立": ["成立", "passed"],
+    "可決": ["採決", "voting", "passed"],
+    "否決": ["否決", "rejected"],
+    "審議中": ["審議中", "committee_review", "under_review"],
+}
+
+# Fields counted towards completeness beyond the required ones
+OPTIONAL_FIELDS = (
+    "bill_outline",
+    "background_context",
+    "expected_effects",
+    "key_provisions",
+    "related_laws",
+    "implementation_date",
+    "submitting_members",
+    "supporting_members",
+    "submitting_party",
+    "sponsoring_ministry",
+    "committee_assignments",
+    "voting_results",
+)
+
 
 class ValidationSeverity(Enum):
     """Validation issue severity levels"""
@@ -70,13 +117,60 @@ class ValidationResult:
         ]
 
 
+RuleCheck = Callable[[EnhancedBillData, ValidationResult], None]
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """Named check that appends the issues it finds to a result"""
+
+    name: str
+    check: RuleCheck
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """Rules for one validation level with patterns and messages prebuilt"""
+
+    validation_level: str
+    required_fields: tuple[str, ...]
+    rules: tuple[ValidationRule, ...]
+
+
+def _validate_chunk(
+    validator: "BillDataValidator",
+    bills: list[EnhancedBillData],
+    validation_level: str,
+) -> tuple[list[ValidationResult | Exception], dict[str, dict[str, float]]]:
+    """Validate a chunk of bills in a worker process"""
+    outcomes = validator._validate_each(bills, validation_level)
+    return outcomes, validator.rule_timings
+
+
 class BillDataValidator:
-    """Comprehensive bill data validator"""
+    """Comprehensive bill data validator
 
-    def __init__(self, strict_mode: bool = False, require_japanese: bool = True):
+    Rules are compiled once per validation level into a ValidationPlan.
+    validate_bills() spreads large batches over a process pool when
+    ``max_workers`` is above one, and the time spent in each rule is
+    accumulated in ``rule_timings``.
+    """
+
+    def __init__(
+        self,
+        strict_mode: bool = False,
+        require_japanese: bool = True,
+        max_workers: int = 1,
+        chunk_size: int = 200,
+    ):
         self.strict_mode = strict_mode
         self.require_japanese = require_japanese
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
         self.logger = logging.getLogger(__name__)
+        self._executor: Executor | None = None
+        self._plans: dict[str, ValidationPlan] = {}
+        self.rule_timings: dict[str, dict[str, float]] = {}
 
         # Required fields for different validation levels
         self.required_fields = {
@@ -191,30 +285,89 @@ class BillDataValidator:
             "その他",
         }
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled plans hold closures and the pool cannot be pickled; worker
+        # processes rebuild their own plans and report their own timings
+        state = self.__dict__.copy()
+        state.update(_executor=None, _plans={}, rule_timings={})
+        return state
+
+    def _get_executor(self) -> Executor:
+        """Lazily create the process pool"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_plan(self, validation_level: str = "standard") -> ValidationPlan:
+        """Return the compiled rules for a validation level"""
+        plan = self._plans.get(validation_level)
+        if plan is None:
+            plan = self._plans[validation_level] = self._compile_plan(validation_level)
+        return plan
+
+    def get_rule_timings(self) -> list[dict[str, Any]]:
+        """Per-rule timing statistics, slowest total time first"""
+        return sorted(
+            (
+                {
+                    "rule": name,
+                    **timing,
+                    "avg_ms": timing["total_seconds"] * 1000 / timing["count"],
+                }
+                for name, timing in self.rule_timings.items()
+                if timing["count"]
+            ),
+            key=lambda row: row["total_seconds"],
+            reverse=True,
+        )
+
+    def reset_rule_timings(self) -> None:
+        self.rule_timings.clear()
+
+    def _record_timing(
+        self, rule: str, count: int, total_seconds: float, max_seconds: float
+    ):
+        timing = self.rule_timings.setdefault(
+            rule, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        timing["count"] += count
+        timing["total_seconds"] += total_seconds
+        timing["max_seconds"] = max(timing["max_seconds"], max_seconds)
+
     def validate_bill(
         self, bill_data: EnhancedBillData, validation_level: str = "standard"
     ) -> ValidationResult:
         """Validate a single bill"""
+        plan = self.get_plan(validation_level)
 
         result = ValidationResult(
             bill_id=bill_data.bill_id or "unknown", is_valid=True, quality_score=0.0
         )
 
-        # Validate required fields
-        self._validate_required_fields(bill_data, result, validation_level)
-
-        # Validate field formats
-        self._validate_field_formats(bill_data, result)
-
-        # Validate data consistency
-        self._validate_data_consistency(bill_data, result)
-
-        # Validate Japanese text content
-        if self.require_japanese:
-            self._validate_japanese_content(bill_data, result)
-
-        # Validate logical relationships
-        self._validate_logical_relationships(bill_data, result)
+        rule_timings = self.rule_timings
+        start = time.perf_counter()
+        for rule in plan.rules:
+            rule.check(bill_data, result)
+            now = time.perf_counter()
+            elapsed, start = now - start, now
+
+            timing = rule_timings.get(rule.name)
+            if timing is None:
+                timing = rule_timings[rule.name] = {
+                    "count": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                }
+            timing["count"] += 1
+            timing["total_seconds"] += elapsed
+            if elapsed > timing["max_seconds"]:
+                timing["max_seconds"] = elapsed
 
         # Calculate scores
         result.completeness_score = self._calculate_completeness_score(
@@ -237,14 +390,13 @@ class BillDataValidator:
         """Validate multiple bills"""
         results = []
 
-        for bill in bills:
-            try:
-                result = self.validate_bill(bill, validation_level)
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error validating bill {bill.bill_id}: {e}")
+        for bill, outcome in zip(
+            bills, self._validate_batch(bills, validation_level), strict=True
+        ):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error validating bill {bill.bill_id}: {outcome}")
                 # Create error result
-                error_result = ValidationResult(
+                outcome = ValidationResult(
                     bill_id=bill.bill_id or "unknown",
                     is_valid=False,
                     quality_score=0.0,
@@ -253,12 +405,12 @@ class BillDataValidator:
                             field_name="_validation",
                             issue_type="validation_error",
                             severity=ValidationSeverity.CRITICAL,
-                            message=f"Validation failed: {str(e)}",
-                            current_value=str(e),
+                            message=f"Validation failed: {str(outcome)}",
+                            current_value=str(outcome),
                         )
                     ],
                 )
-                results.append(error_result)
+            results.append(outcome)
 
         return results
 
@@ -268,17 +420,18 @@ class BillDataValidator:
         """Validate merge results"""
         results = []
 
-        for merge_result in merge_results:
+        merged_bills = [merge_result.merged_bill for merge_result in merge_results]
+        outcomes = self._validate_batch(merged_bills, validation_level)
+
+        for merge_result, outcome in zip(merge_results, outcomes, strict=True):
             try:
-                # Validate the merged bill
-                validation_result = self.validate_bill(
-                    merge_result.merged_bill, validation_level
-                )
+                if isinstance(outcome, Exception):
+                    raise outcome
 
                 # Add merge-specific validations
-                self._validate_merge_quality(merge_result, validation_result)
+                self._validate_merge_quality(merge_result, outcome)
 
-                results.append(validation_result)
+                results.append(outcome)
             except Exception as e:
                 self.logger.error(
                     f"Error validating merge result for {merge_result.merged_bill.bill_id}: {e}"
@@ -287,113 +440,183 @@ class BillDataValidator:
 
         return results
 
-    def _validate_required_fields(
-        self,
-        bill_data: EnhancedBillData,
-        result: ValidationResult,
-        validation_level: str,
-    ):
-        """Validate required fields"""
-        required_fields = self.required_fields.get(
-            validation_level, self.required_fields["standard"]
+    def _validate_batch(
+        self, bills: Sequence[EnhancedBillData], validation_level: str
+    ) -> list[ValidationResult | Exception]:
+        """Validate bills in chunks across the process pool when worthwhile"""
+        if self.max_workers <= 1 or len(bills) <= self.chunk_size:
+            return self._validate_each(bills, validation_level)
+
+        chunks = [
+            list(bills[start : start + self.chunk_size])
+            for start in range(0, len(bills), self.chunk_size)
+        ]
+
+        outcomes: list[ValidationResult | Exception] = []
+        for chunk_outcomes, timings in self._get_executor().map(
+            _validate_chunk, repeat(self), chunks, repeat(validation_level)
+        ):
+            outcomes.extend(chunk_outcomes)
+            for rule, timing in timings.items():
+                self._record_timing(rule, **timing)
+        return outcomes
+
+    def _validate_each(
+        self, bills: Sequence[EnhancedBillData], validation_level: str
+    ) -> list[ValidationResult | Exception]:
+        """Validate bills one by one, returning the exception for failed ones"""
+        outcomes: list[ValidationResult | Exception] = []
+        for bill in bills:
+            try:
+                outcomes.append(self.validate_bill(bill, validation_level))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _compile_plan(self, validation_level: str) -> ValidationPlan:
+        """Build the rules for a validation level
+
+        Patterns are compiled and suggestion texts formatted here, once, rather
+        than for every bill.
+        """
+        required_fields = tuple(
+            self.required_fields.get(validation_level, self.required_fields["standard"])
         )
+        rules = [
+            ValidationRule("required_fields", self._required_rule(required_fields))
+        ]
 
-        for field_name in required_fields:
-            value = getattr(bill_data, field_name, None)
+        for field_name, pattern in self.format_patterns.items():
+            rules.append(
+                ValidationRule(
+                    f"format:{field_name}", self._format_rule(field_name, pattern)
+                )
+            )
 
-            if value is None or (isinstance(value, str) and not value.strip()):
-                result.issues.append(
-                    ValidationIssue(
-                        field_name=field_name,
-                        issue_type="missing_required_field",
-                        severity=ValidationSeverity.CRITICAL,
-                        message=f"Required field '{field_name}' is missing or empty",
-                        suggested_fix=f"Provide a value for '{field_name}'",
-                        current_value=value,
+        for field_name, valid_values, label in (
+            ("status", self.valid_statuses, "Status"),
+            ("stage", self.valid_stages, "Stage"),
+            ("category", self.valid_categories, "Category"),
+        ):
+            rules.append(
+                ValidationRule(
+                    f"value:{field_name}",
+                    self._value_rule(field_name, frozenset(valid_values), label),
+                )
+            )
+        rules.append(
+            ValidationRule("range:data_quality_score", self._check_quality_score_range)
+        )
+
+        if self.require_japanese:
+            japanese_text = re.compile(self.japanese_patterns["japanese_text"])
+            for field_name in JAPANESE_TEXT_FIELDS:
+                rules.append(
+                    ValidationRule(
+                        f"japanese:{field_name}",
+                        self._japanese_rule(field_name, japanese_text),
                     )
                 )
 
-    def _validate_field_formats(
-        self, bill_data: EnhancedBillData, result: ValidationResult
-    ):
-        """Validate field formats"""
-        for field_name, pattern in self.format_patterns.items():
+        rules.extend(
+            [
+                ValidationRule("logic:status_stage", self._check_status_stage),
+                ValidationRule("logic:submitter_type", self._check_submitter_type),
+                ValidationRule("logic:date_order", self._check_date_order),
+            ]
+        )
+
+        return ValidationPlan(
+            validation_level=validation_level,
+            required_fields=required_fields,
+            rules=tuple(rules),
+        )
+
+    def _required_rule(self, required_fields: tuple[str, ...]) -> RuleCheck:
+        """Rule validating required fields"""
+
+        def check(bill_data: EnhancedBillData, result: ValidationResult):
+            for field_name in required_fields:
+                value = getattr(bill_data, field_name, None)
+
+                if value is None or (isinstance(value, str) and not value.strip()):
+                    result.issues.append(
+                        ValidationIssue(
+                            field_name=field_name,
+                            issue_type="missing_required_field",
+                            severity=ValidationSeverity.CRITICAL,
+                            message=f"Required field '{field_name}' is missing or empty",
+                            suggested_fix=f"Provide a value for '{field_name}'",
+                            current_value=value,
+                        )
+                    )
+
+        return check
+
+    def _format_rule(self, field_name: str, pattern: str) -> RuleCheck:
+        """Rule validating the format of one field"""
+        match = re.compile(pattern).match
+        message = f"Field '{field_name}' has invalid format"
+        suggested_fix = f"Ensure '{field_name}' matches pattern: {pattern}"
+
+        def check(bill_data: EnhancedBillData, result: ValidationResult):
             value = getattr(bill_data, field_name, None)
 
-            if value is not None:
-                if isinstance(value, str):
-                    if not re.match(pattern, value):
-                        result.issues.append(
-                            ValidationIssue(
-                                field_name=field_name,
-                                issue_type="invalid_format",
-                                severity=ValidationSeverity.WARNING,
-                                message=f"Field '{field_name}' has invalid format",
-                                suggested_fix=f"Ensure '{field_name}' matches pattern: {pattern}",
-                                current_value=value,
-                                expected_format=pattern,
-                            )
+            if isinstance(value, str):
+                if not match(value):
+                    result.issues.append(
+                        ValidationIssue(
+                            field_name=field_name,
+                            issue_type="invalid_format",
+                            severity=ValidationSeverity.WARNING,
+                            message=message,
+                            suggested_fix=suggested_fix,
+                            current_value=value,
+                            expected_format=pattern,
                         )
-                elif isinstance(value, int | float):
-                    # Convert to string for pattern matching
-                    str_value = str(value)
-                    if not re.match(pattern, str_value):
-                        result.issues.append(
-                            ValidationIssue(
-                                field_name=field_name,
-                                issue_type="invalid_format",
-                                severity=ValidationSeverity.WARNING,
-                                message=f"Field '{field_name}' has invalid format",
-                                current_value=value,
-                                expected_format=pattern,
-                            )
+                    )
+            elif isinstance(value, int | float):
+                # Convert to string for pattern matching
+                if not match(str(value)):
+                    result.issues.append(
+                        ValidationIssue(
+                            field_name=field_name,
+                            issue_type="invalid_format",
+                            severity=ValidationSeverity.WARNING,
+                            message=message,
+                            current_value=value,
+                            expected_format=pattern,
                         )
+                    )
 
-    def _validate_data_consistency(
-        self, bill_data: EnhancedBillData, result: ValidationResult
-    ):
-        """Validate data consistency"""
+        return check
 
-        # Check status consistency
-        if bill_data.status and bill_data.status not in self.valid_statuses:
-            result.issues.append(
-                ValidationIssue(
-                    field_name="status",
-                    issue_type="invalid_value",
-                    severity=ValidationSeverity.WARNING,
-                    message=f"Status '{bill_data.status}' is not in valid status list",
-                    suggested_fix=f"Use one of: {', '.join(list(self.valid_statuses)[:5])}...",
-                    current_value=bill_data.status,
-                )
-            )
+    def _value_rule(
+        self, field_name: str, valid_values: frozenset[str], label: str
+    ) -> RuleCheck:
+        """Rule checking that a field holds one of the known values"""
+        suggested_fix = f"Use one of: {', '.join(sorted(valid_values)[:5])}..."
 
-        # Check stage consistency
-        if bill_data.stage and bill_data.stage not in self.valid_stages:
-            result.issues.append(
-                ValidationIssue(
-                    field_name="stage",
-                    issue_type="invalid_value",
-                    severity=ValidationSeverity.WARNING,
-                    message=f"Stage '{bill_data.stage}' is not in valid stage list",
-                    suggested_fix=f"Use one of: {', '.join(list(self.valid_stages)[:5])}...",
-                    current_value=bill_data.stage,
+        def check(bill_data: EnhancedBillData, result: ValidationResult):
+            value = getattr(bill_data, field_name)
+            if value and value not in valid_values:
+                result.issues.append(
+                    ValidationIssue(
+                        field_name=field_name,
+                        issue_type="invalid_value",
+                        severity=ValidationSeverity.WARNING,
+                        message=f"{label} '{value}' is not in valid {field_name} list",
+                        suggested_fix=suggested_fix,
+                        current_value=value,
+                    )
                 )
-            )
 
-        # Check category consistency
-        if bill_data.category and bill_data.category not in self.valid_categories:
-            result.issues.append(
-                ValidationIssue(
-                    field_name="category",
-                    issue_type="invalid_value",
-                    severity=ValidationSeverity.WARNING,
-                    message=f"Category '{bill_data.category}' is not in valid category list",
-                    suggested_fix=f"Use one of: {', '.join(list(self.valid_categories)[:5])}...",
-                    current_value=bill_data.category,
-                )
-            )
+        return check
 
-        # Check data quality score range
+    def _check_quality_score_range(
+        self, bill_data: EnhancedBillData, result: ValidationResult
+    ):
+        """Check data quality score range"""
         if bill_data.data_quality_score is not None:
             if not (0.0 <= bill_data.data_quality_score <= 1.0):
                 result.issues.append(
@@ -407,24 +630,16 @@ class BillDataValidator:
                     )
                 )
 
-    def _validate_japanese_content(
-        self, bill_data: EnhancedBillData, result: ValidationResult
-    ):
-        """Validate Japanese text content"""
-        text_fields = [
-            "title",
-            "bill_outline",
-            "background_context",
-            "expected_effects",
-            "summary",
-        ]
+    def _japanese_rule(self, field_name: str, japanese_text: re.Pattern) -> RuleCheck:
+        """Rule validating the Japanese text content of one field"""
+        search = japanese_text.search
 
-        for field_name in text_fields:
+        def check(bill_data: EnhancedBillData, result: ValidationResult):
             value = getattr(bill_data, field_name, None)
 
             if value and isinstance(value, str):
                 # Check if contains Japanese characters
-                if not re.search(self.japanese_patterns["japanese_text"], value):
+                if not search(value):
                     result.issues.append(
                         ValidationIssue(
                             field_name=field_name,
@@ -451,35 +666,30 @@ class BillDataValidator:
                         )
                     )
 
-    def _validate_logical_relationships(
+        return check
+
+    def _check_status_stage(
         self, bill_data: EnhancedBillData, result: ValidationResult
     ):
-        """Validate logical relationships between fields"""
-
-        # Check status-stage consistency
+        """Check status-stage consistency"""
         if bill_data.status and bill_data.stage:
-            status_stage_mapping = {
-                "成立": ["成立", "passed"],
-                "可決": ["採決", "voting", "passed"],
-                "否決": ["否決", "rejected"],
-                "審議中": ["審議中", "committee_review", "under_review"],
-            }
-
-            if bill_data.status in status_stage_mapping:
-                valid_stages = status_stage_mapping[bill_data.status]
-                if bill_data.stage not in valid_stages:
-                    result.issues.append(
-                        ValidationIssue(
-                            field_name="stage",
-                            issue_type="inconsistent_status_stage",
-                            severity=ValidationSeverity.WARNING,
-                            message=f"Stage '{bill_data.stage}' is inconsistent with status '{bill_data.status}'",
-                            suggested_fix=f"Use stage that matches status: {', '.join(valid_stages)}",
-                            current_value=bill_data.stage,
-                        )
+            valid_stages = STATUS_STAGE_MAPPING.get(bill_data.status)
+            if valid_stages is not None and bill_data.stage not in valid_stages:
+                result.issues.append(
+                    ValidationIssue(
+                        field_name="stage",
+                        issue_type="inconsistent_status_stage",
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Stage '{bill_data.stage}' is inconsistent with status '{bill_data.status}'",
+                        suggested_fix=f"Use stage that matches status: {', '.join(valid_stages)}",
+                        current_value=bill_data.stage,
                     )
+                )
 
-        # Check submitter-submitter_type consistency
+    def _check_submitter_type(
+        self, bill_data: EnhancedBillData, result: ValidationResult
+    ):
+        """Check submitter-submitter_type consistency"""
         if bill_data.submitter and bill_data.submitter_type:
             if bill_data.submitter != bill_data.submitter_type:
                 result.issues.append(
@@ -493,19 +703,12 @@ class BillDataValidator:
                     )
                 )
 
-        # Check date logical order
-        dates = [
-            ("submitted_date", bill_data.submitted_date),
-            ("first_reading_date", bill_data.first_reading_date),
-            ("committee_referral_date", bill_data.committee_referral_date),
-            ("committee_report_date", bill_data.committee_report_date),
-            ("final_vote_date", bill_data.final_vote_date),
-            ("promulgated_date", bill_data.promulgated_date),
-        ]
-
+    def _check_date_order(self, bill_data: EnhancedBillData, result: ValidationResult):
+        """Check date logical order"""
         # Convert string dates to datetime objects for comparison
         parsed_dates = []
-        for field_name, date_value in dates:
+        for field_name in CHRONOLOGICAL_DATE_FIELDS:
+            date_value = getattr(bill_data, field_name, None)
             if date_value:
                 try:
                     if isinstance(date_value, str):
@@ -586,9 +789,7 @@ class BillDataValidator:
         self, bill_data: EnhancedBillData, validation_level: str
     ) -> float:
         """Calculate completeness score"""
-        required_fields = self.required_fields.get(
-            validation_level, self.required_fields["standard"]
-        )
+        required_fields = self.get_plan(validation_level).required_fields
 
         # Count non-empty required fields
         filled_required = 0
@@ -598,23 +799,8 @@ class BillDataValidator:
                 filled_required += 1
 
         # Count filled optional fields
-        optional_fields = [
-            "bill_outline",
-            "background_context",
-            "expected_effects",
-            "key_provisions",
-            "related_laws",
-            "implementation_date",
-            "submitting_members",
-            "supporting_members",
-            "submitting_party",
-            "sponsoring_ministry",
-            "committee_assignments",
-            "voting_results",
-        ]
-
         filled_optional = 0
-        for field_name in optional_fields:
+        for field_name in OPTIONAL_FIELDS:
             value = getattr(bill_data, field_name, None)
             if value is not None:
                 if isinstance(value, str) and value.strip():
@@ -628,9 +814,7 @@ class BillDataValidator:
         required_score = (
             filled_required / len(required_fields) if required_fields else 0.0
         )
-        optional_score = (
-            filled_optional / len(optional_fields) if optional_fields else 0.0
-        )
+        optional_score = filled_optional / len(OPTIONAL_FIELDS)
 
         # Weight required fields more heavily
         return (required_score * 0.8) + (optional_score * 0.2)
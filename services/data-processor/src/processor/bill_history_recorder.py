@@ -6,22 +6,33 @@ Monitors bill data changes and automatically records process history.
 import hashlib
 import json
 import logging
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from difflib import SequenceMatcher
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import create_engine, desc, select
+from sqlalchemy import Row, create_engine, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
-from ...shared.src.shared.models.bill import Bill
-from ...shared.src.shared.models.bill_process_history import (
-    BillProcessHistory,
+from shared.models.bill_change_history import (
+    BillChangeHistoryRecord,
     HistoryChangeType,
     HistoryEventType,
 )
+from shared.models.bill_record import BillRecord
+from shared.models.bill_snapshot import BillSnapshotRecord
+
+
+def count_history_by(session: Session, column: Any, *conditions: Any) -> dict[str, int]:
+    """Count history records per value of ``column`` with a single GROUP BY"""
+    rows = session.execute(
+        select(column, func.count()).where(*conditions).group_by(column)
+    )
+    return {getattr(value, "value", value): count for value, count in rows}
 
 
 class ChangeDetectionMode(Enum):
@@ -82,11 +93,12 @@ class BillSnapshot:
 class HistoryRecordingResult:
     """Result of history recording operation"""
 
-    total_bills_checked: int
-    changes_detected: int
-    history_records_created: int
+    total_bills_checked: int = 0
+    changes_detected: int = 0
+    history_records_created: int = 0
     errors: list[str] = field(default_factory=list)
     processing_time_ms: float = 0.0
+    bills_unchanged: int = 0  # Skipped via unchanged data_hash
 
     # Detailed statistics
     changes_by_type: dict[HistoryChangeType, int] = field(default_factory=dict)
@@ -112,18 +124,18 @@ class BillHistoryRecorder:
             "max_bills_per_batch": 1000,
             "significant_fields": [
                 "status",
-                "stage",
+                "inter_house_status",
                 "final_vote_date",
                 "implementation_date",
                 "committee_assignments",
-                "vote_results",
+                "voting_results",
                 "promulgated_date",
             ],
             "tracked_fields": [
                 "title",
                 "status",
-                "stage",
-                "submitter",
+                "inter_house_status",
+                "submitter_type",
                 "diet_session",
                 "submitted_date",
                 "final_vote_date",
@@ -132,7 +144,7 @@ class BillHistoryRecorder:
                 "background_context",
                 "expected_effects",
                 "committee_assignments",
-                "vote_results",
+                "voting_results",
                 "promulgated_date",
                 "data_quality_score",
             ],
@@ -147,32 +159,36 @@ class BillHistoryRecorder:
         # Field significance mapping
         self.field_significance = {
             "status": ChangeSignificance.CRITICAL,
-            "stage": ChangeSignificance.CRITICAL,
+            "inter_house_status": ChangeSignificance.CRITICAL,
             "final_vote_date": ChangeSignificance.CRITICAL,
             "implementation_date": ChangeSignificance.CRITICAL,
             "promulgated_date": ChangeSignificance.CRITICAL,
-            "vote_results": ChangeSignificance.MAJOR,
+            "voting_results": ChangeSignificance.MAJOR,
             "committee_assignments": ChangeSignificance.MAJOR,
             "bill_outline": ChangeSignificance.MAJOR,
             "background_context": ChangeSignificance.MINOR,
             "expected_effects": ChangeSignificance.MINOR,
             "title": ChangeSignificance.MINOR,
-            "submitter": ChangeSignificance.MINOR,
+            "submitter_type": ChangeSignificance.MINOR,
             "data_quality_score": ChangeSignificance.TRIVIAL,
         }
 
         # Change type detection patterns
         self.change_patterns = {
             HistoryChangeType.STATUS_CHANGE: ["status"],
-            HistoryChangeType.STAGE_TRANSITION: ["stage"],
+            HistoryChangeType.STAGE_TRANSITION: ["inter_house_status"],
             HistoryChangeType.COMMITTEE_ASSIGNMENT: ["committee_assignments"],
-            HistoryChangeType.VOTE_RECORDED: ["vote_results", "final_vote_date"],
+            HistoryChangeType.VOTE_RECORDED: ["voting_results", "final_vote_date"],
             HistoryChangeType.DOCUMENT_UPDATE: [
                 "bill_outline",
                 "background_context",
                 "expected_effects",
             ],
-            HistoryChangeType.METADATA_UPDATE: ["title", "submitter", "diet_session"],
+            HistoryChangeType.METADATA_UPDATE: [
+                "title",
+                "submitter_type",
+                "diet_session",
+            ],
             HistoryChangeType.IMPLEMENTATION: [
                 "implementation_date",
                 "promulgated_date",
@@ -192,20 +208,12 @@ class BillHistoryRecorder:
 
         try:
             with self.SessionLocal() as session:
-                # Get bills to check
-                bills_to_check = self._get_bills_to_check(
-                    session, mode, bill_ids, since_timestamp
-                )
-                result.total_bills_checked = len(bills_to_check)
-
-                if not bills_to_check:
-                    self.logger.info("No bills to check for changes")
-                    return result
-
-                # Process bills in batches
+                # Stream bills in fixed-size batches
                 batch_size = self.config["max_bills_per_batch"]
-                for i in range(0, len(bills_to_check), batch_size):
-                    batch = bills_to_check[i : i + batch_size]
+                for batch in self._iter_bill_batches(
+                    session, mode, bill_ids, since_timestamp, batch_size
+                ):
+                    result.total_bills_checked += len(batch)
                     batch_result = self._process_bill_batch(session, batch)
 
                     # Accumulate results
@@ -214,6 +222,7 @@ class BillHistoryRecorder:
                         batch_result.history_records_created
                     )
                     result.errors.extend(batch_result.errors)
+                    result.bills_unchanged += batch_result.bills_unchanged
 
                     # Merge statistics
                     for change_type, count in batch_result.changes_by_type.items():
@@ -231,6 +240,10 @@ class BillHistoryRecorder:
 
                     result.bills_with_changes.update(batch_result.bills_with_changes)
 
+                if not result.total_bills_checked:
+                    self.logger.info("No bills to check for changes")
+                    return result
+
                 # Calculate processing time
                 result.processing_time_ms = (
                     datetime.now() - start_time
@@ -252,61 +265,119 @@ class BillHistoryRecorder:
             ).total_seconds() * 1000
             return result
 
-    def _get_bills_to_check(
+    def _iter_bill_batches(
         self,
         session: Session,
         mode: ChangeDetectionMode,
         bill_ids: list[str] | None = None,
         since_timestamp: datetime | None = None,
-    ) -> list[Bill]:
-        """Get list of bills to check for changes"""
-        query = select(Bill)
+        batch_size: int | None = None,
+    ) -> Iterator[Sequence[Row]]:
+        """Stream bills to check for changes in batches of ``batch_size``
+
+        Only the bill number (as ``bill_id``) and the tracked columns are
+        selected, and pages are fetched by keyset on the unique bill_number
+        index so each page is a short indexed query and batches can be
+        committed between pages without holding a cursor open.
+        """
+        batch_size = batch_size or self.config["max_bills_per_batch"]
+        query = select(*self._bill_columns())
 
         if mode == ChangeDetectionMode.TARGETED and bill_ids:
-            query = query.where(Bill.bill_id.in_(bill_ids))
+            query = query.where(BillRecord.bill_number.in_(bill_ids))
 
         elif mode == ChangeDetectionMode.INCREMENTAL:
             # Check bills updated in the last 24 hours by default
             if since_timestamp is None:
                 since_timestamp = datetime.now(UTC) - timedelta(hours=24)
-            query = query.where(Bill.updated_at >= since_timestamp)
+            query = query.where(BillRecord.updated_at >= since_timestamp)
 
         # For FULL_SCAN mode, check all bills (no additional filters)
 
-        # Order by most recently updated first
-        query = query.order_by(desc(Bill.updated_at))
+        last_bill_id = None
+        while True:
+            page = query
+            if last_bill_id is not None:
+                page = page.where(BillRecord.bill_number > last_bill_id)
+
+            rows = session.execute(
+                page.order_by(BillRecord.bill_number).limit(batch_size)
+            ).all()
+            if not rows:
+                return
 
-        return session.execute(query).scalars().all()
+            yield rows
+
+            if len(rows) < batch_size:
+                return
+            last_bill_id = rows[-1].bill_id
+
+    def _bill_columns(self) -> list[Any]:
+        """Columns needed for change detection: bill_id plus tracked fields
+
+        Bills are identified by their bill number. Tracked fields must be
+        mapped columns of the bills table.
+        """
+        columns = [BillRecord.bill_number.label("bill_id")]
+        mapped = BillRecord.__table__.columns
+        unknown = [name for name in self.config["tracked_fields"] if name not in mapped]
+        if unknown:
+            raise ValueError(f"Tracked fields are not bill columns: {unknown}")
+
+        columns.extend(mapped[name] for name in self.config["tracked_fields"])
+        return columns
 
     def _process_bill_batch(
-        self, session: Session, bills: list[Bill]
+        self, session: Session, bills: Sequence[Row]
     ) -> HistoryRecordingResult:
-        """Process a batch of bills for change detection"""
+        """Process a batch of bills for change detection
+
+        Last snapshots for the whole batch are loaded in one query, bills whose
+        data_hash is unchanged are skipped before any per-field diffing, and
+        history rows and new snapshots are each written in one statement.
+        """
         result = HistoryRecordingResult()
 
+        current_snapshots = {}
         for bill in bills:
             try:
-                # Get current snapshot
-                current_snapshot = self._create_bill_snapshot(bill)
+                current_snapshots[bill.bill_id] = (
+                    bill,
+                    self._create_bill_snapshot(bill),
+                )
+            except Exception as e:
+                self.logger.error(f"Error processing bill {bill.bill_id}: {e}")
+                result.errors.append(f"Bill {bill.bill_id}: {str(e)}")
+
+        # Get last recorded snapshots for the whole batch
+        last_snapshots = self._load_snapshots(session, list(current_snapshots))
+
+        history_rows = []
+        snapshots_to_store = []
+        for bill_id, (bill, current_snapshot) in current_snapshots.items():
+            try:
+                last_snapshot = last_snapshots.get(bill_id)
 
-                # Get last recorded snapshot
-                last_snapshot = self._get_last_snapshot(session, bill.bill_id)
+                if (
+                    last_snapshot is not None
+                    and last_snapshot.data_hash == current_snapshot.data_hash
+                ):
+                    result.bills_unchanged += 1
+                    continue
 
                 # Detect changes
                 changes = self._detect_changes(current_snapshot, last_snapshot)
 
                 if changes:
-                    # Record history entries
-                    history_records = self._create_history_records(bill, changes)
-
-                    # Save to database
-                    for record in history_records:
-                        session.add(record)
+                    # Queue history entries for the batch insert
+                    history_rows.extend(
+                        self._history_row_values(bill_id, change) for change in changes
+                    )
 
                     # Update statistics
                     result.changes_detected += len(changes)
-                    result.history_records_created += len(history_records)
-                    result.bills_with_changes.add(bill.bill_id)
+                    result.history_records_created += len(changes)
+                    result.bills_with_changes.add(bill_id)
 
                     # Count by type and significance
                     for change in changes:
@@ -319,22 +390,26 @@ class BillHistoryRecorder:
                         )
 
                 # Store current snapshot for future comparisons
-                self._store_snapshot(session, current_snapshot)
+                snapshots_to_store.append(current_snapshot)
 
             except Exception as e:
-                self.logger.error(f"Error processing bill {bill.bill_id}: {e}")
-                result.errors.append(f"Bill {bill.bill_id}: {str(e)}")
+                self.logger.error(f"Error processing bill {bill_id}: {e}")
+                result.errors.append(f"Bill {bill_id}: {str(e)}")
 
         try:
+            if history_rows:
+                session.execute(insert(BillChangeHistoryRecord), history_rows)
+            self._store_snapshots(session, snapshots_to_store)
             session.commit()
         except SQLAlchemyError as e:
             self.logger.error(f"Database error in batch processing: {e}")
             session.rollback()
             result.errors.append(f"Database error: {str(e)}")
+            result.history_records_created = 0
 
         return result
 
-    def _create_bill_snapshot(self, bill: Bill) -> BillSnapshot:
+    def _create_bill_snapshot(self, bill: Row) -> BillSnapshot:
         """Create a snapshot of bill data for change detection"""
         tracked_fields = {}
 
@@ -362,33 +437,36 @@ class BillHistoryRecorder:
 
     def _get_last_snapshot(self, session: Session, bill_id: str) -> BillSnapshot | None:
         """Get the last recorded snapshot for a bill"""
-        # This would typically query a snapshots table
-        # For now, we'll simulate by checking the most recent history record
+        return self._load_snapshots(session, [bill_id]).get(bill_id)
+
+    def _load_snapshots(
+        self, session: Session, bill_ids: list[str]
+    ) -> dict[str, BillSnapshot]:
+        """Load the last recorded snapshots for a batch of bills in one query"""
+        if not bill_ids:
+            return {}
+
         try:
-            latest_history = session.execute(
-                select(BillProcessHistory)
-                .where(BillProcessHistory.bill_id == bill_id)
-                .order_by(desc(BillProcessHistory.recorded_at))
-                .limit(1)
-            ).scalar_one_or_none()
-
-            if latest_history and latest_history.previous_values:
-                # Reconstruct snapshot from history data
-                return BillSnapshot(
-                    bill_id=bill_id,
-                    snapshot_time=latest_history.recorded_at,
-                    data_hash="",
-                    tracked_fields=latest_history.previous_values,
-                    quality_score=latest_history.previous_values.get(
-                        "data_quality_score", 0.0
-                    ),
+            rows = session.execute(
+                select(BillSnapshotRecord).where(
+                    BillSnapshotRecord.bill_id.in_(bill_ids)
                 )
+            ).scalars()
+
+            return {
+                row.bill_id: BillSnapshot(
+                    bill_id=row.bill_id,
+                    snapshot_time=row.snapshot_time,
+                    data_hash=row.data_hash,
+                    tracked_fields=row.tracked_fields or {},
+                    quality_score=row.quality_score or 0.0,
+                )
+                for row in rows
+            }
 
-            return None
-
-        except Exception as e:
-            self.logger.debug(f"Could not retrieve last snapshot for {bill_id}: {e}")
-            return None
+        except SQLAlchemyError as e:
+            self.logger.warning(f"Could not load snapshots for batch: {e}")
+            return {}
 
     def _detect_changes(
         self, current_snapshot: BillSnapshot, last_snapshot: BillSnapshot | None
@@ -400,8 +478,9 @@ class BillHistoryRecorder:
             # First time seeing this bill - record as initial state
             return []
 
-        # Compare tracked fields
+        # Compare tracked fields in their stored (JSON) representation
         for field_name, current_value in current_snapshot.tracked_fields.items():
+            current_value = self._to_json_safe(current_value)
             last_value = last_snapshot.tracked_fields.get(field_name)
 
             if self._is_significant_change(field_name, last_value, current_value):
@@ -428,6 +507,13 @@ class BillHistoryRecorder:
 
         return changes
 
+    @staticmethod
+    def _to_json_safe(value: Any) -> Any:
+        """Convert a value to the form it takes after a JSON round trip"""
+        if value is None or isinstance(value, str | int | float | bool):
+            return value
+        return json.loads(json.dumps(value, default=str))
+
     def _is_significant_change(
         self, field_name: str, old_value: Any, new_value: Any
     ) -> bool:
@@ -493,7 +579,7 @@ class BillHistoryRecorder:
             return "Data removed"
         elif field_name == "status":
             return f"Status changed from {old_value} to {new_value}"
-        elif field_name == "stage":
+        elif field_name == "inter_house_status":
             return f"Stage transition from {old_value} to {new_value}"
         elif field_name in ["bill_outline", "background_context", "expected_effects"]:
             return "Document content updated"
@@ -501,37 +587,33 @@ class BillHistoryRecorder:
             return f"Field {field_name} updated"
 
     def _create_history_records(
-        self, bill: Bill, changes: list[BillChange]
-    ) -> list[BillProcessHistory]:
+        self, bill: Row, changes: list[BillChange]
+    ) -> list[BillChangeHistoryRecord]:
         """Create history records from detected changes"""
-        history_records = []
-
-        for change in changes:
-            # Determine event type
-            event_type = self._map_change_to_event_type(change)
-
-            # Create history record
-            history_record = BillProcessHistory(
-                bill_id=bill.bill_id,
-                event_type=event_type,
-                change_type=change.change_type,
-                recorded_at=change.detected_at,
-                previous_values={change.field_name: change.old_value},
-                new_values={change.field_name: change.new_value},
-                change_summary=change.change_reason or f"{change.field_name} updated",
-                confidence_score=change.confidence,
-                source_system="auto_history_recorder",
-                metadata={
-                    "detection_mode": "automatic",
-                    "significance": change.significance.value,
-                    "related_fields": change.related_fields,
-                    "source_metadata": change.source_metadata,
-                },
-            )
-
-            history_records.append(history_record)
-
-        return history_records
+        return [
+            BillChangeHistoryRecord(**self._history_row_values(bill.bill_id, change))
+            for change in changes
+        ]
+
+    def _history_row_values(self, bill_id: str, change: BillChange) -> dict[str, Any]:
+        """Build the column values of a history record for a detected change"""
+        return {
+            "bill_id": bill_id,
+            "event_type": self._map_change_to_event_type(change),
+            "change_type": change.change_type,
+            "recorded_at": change.detected_at,
+            "previous_values": {change.field_name: change.old_value},
+            "new_values": {change.field_name: change.new_value},
+            "change_summary": change.change_reason or f"{change.field_name} updated",
+            "confidence_score": change.confidence,
+            "source_system": "auto_history_recorder",
+            "event_metadata": {
+                "detection_mode": "automatic",
+                "significance": change.significance.value,
+                "related_fields": change.related_fields,
+                "source_metadata": change.source_metadata,
+            },
+        }
 
     def _map_change_to_event_type(self, change: BillChange) -> HistoryEventType:
         """Map change type to history event type"""
@@ -550,11 +632,41 @@ class BillHistoryRecorder:
 
     def _store_snapshot(self, session: Session, snapshot: BillSnapshot):
         """Store snapshot for future comparisons"""
-        # In a full implementation, this would store to a dedicated snapshots table
-        # For now, we'll log the snapshot creation
-        self.logger.debug(
-            f"Snapshot created for bill {snapshot.bill_id} at {snapshot.snapshot_time}"
+        self._store_snapshots(session, [snapshot])
+
+    def _store_snapshots(self, session: Session, snapshots: list[BillSnapshot]):
+        """Upsert snapshots into the bill_snapshots table in one statement"""
+        if not snapshots:
+            return
+
+        dialect = session.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+
+        statement = insert(BillSnapshotRecord).values(
+            [
+                {
+                    "bill_id": snapshot.bill_id,
+                    "data_hash": snapshot.data_hash,
+                    "tracked_fields": self._to_json_safe(snapshot.tracked_fields),
+                    "quality_score": snapshot.quality_score,
+                    "snapshot_time": snapshot.snapshot_time,
+                }
+                for snapshot in snapshots
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[BillSnapshotRecord.bill_id],
+            set_={
+                "data_hash": statement.excluded.data_hash,
+                "tracked_fields": statement.excluded.tracked_fields,
+                "quality_score": statement.excluded.quality_score,
+                "snapshot_time": statement.excluded.snapshot_time,
+                "updated_at": func.now(),
+            },
         )
+        session.execute(statement)
+
+        self.logger.debug(f"Stored {len(snapshots)} bill snapshots")
 
     def cleanup_old_snapshots(self, retention_days: int = 30):
         """Clean up old snapshots to manage storage"""
@@ -565,10 +677,10 @@ class BillHistoryRecorder:
                 # Clean up old history records that are no longer needed
                 old_records = (
                     session.execute(
-                        select(BillProcessHistory)
-                        .where(BillProcessHistory.recorded_at < cutoff_date)
+                        select(BillChangeHistoryRecord)
+                        .where(BillChangeHistoryRecord.recorded_at < cutoff_date)
                         .where(
-                            BillProcessHistory.change_type
+                            BillChangeHistoryRecord.change_type
                             == HistoryChangeType.DATA_CORRECTION
                         )
                     )
@@ -591,48 +703,39 @@ class BillHistoryRecorder:
         try:
             with self.SessionLocal() as session:
                 since_date = datetime.now(UTC) - timedelta(days=days)
-
-                # Get recent history records
-                recent_records = (
-                    session.execute(
-                        select(BillProcessHistory)
-                        .where(BillProcessHistory.recorded_at >= since_date)
-                        .where(
-                            BillProcessHistory.source_system == "auto_history_recorder"
-                        )
-                    )
-                    .scalars()
-                    .all()
+                conditions = (
+                    BillChangeHistoryRecord.recorded_at >= since_date,
+                    BillChangeHistoryRecord.source_system == "auto_history_recorder",
                 )
 
-                # Calculate statistics
+                # Aggregate in the database rather than loading every record
+                total_changes, unique_bills, average_confidence = session.execute(
+                    select(
+                        func.count(),
+                        func.count(func.distinct(BillChangeHistoryRecord.bill_id)),
+                        func.avg(
+                            func.coalesce(BillChangeHistoryRecord.confidence_score, 0.0)
+                        ),
+                    ).where(*conditions)
+                ).one()
+
                 stats = {
-                    "total_changes": len(recent_records),
-                    "unique_bills": len(set(r.bill_id for r in recent_records)),
+                    "total_changes": total_changes,
+                    "unique_bills": unique_bills,
                     "changes_by_type": {},
                     "changes_by_event": {},
                     "average_confidence": 0.0,
                     "period_days": days,
                 }
 
-                if recent_records:
-                    # Count by change type
-                    for record in recent_records:
-                        change_type = record.change_type.value
-                        stats["changes_by_type"][change_type] = (
-                            stats["changes_by_type"].get(change_type, 0) + 1
-                        )
-
-                        event_type = record.event_type.value
-                        stats["changes_by_event"][event_type] = (
-                            stats["changes_by_event"].get(event_type, 0) + 1
-                        )
-
-                    # Calculate average confidence
-                    total_confidence = sum(
-                        r.confidence_score or 0.0 for r in recent_records
+                if total_changes:
+                    stats["changes_by_type"] = count_history_by(
+                        session, BillChangeHistoryRecord.change_type, *conditions
+                    )
+                    stats["changes_by_event"] = count_history_by(
+                        session, BillChangeHistoryRecord.event_type, *conditions
                     )
-                    stats["average_confidence"] = total_confidence / len(recent_records)
+                    stats["average_confidence"] = float(average_confidence)
 
                 return stats
 
@@ -653,12 +756,12 @@ class BillHistoryRecorder:
         new_value: Any,
         change_reason: str,
         user_id: str | None = None,
-    ) -> BillProcessHistory:
+    ) -> BillChangeHistoryRecord:
         """Manually record a change (for manual corrections)"""
         try:
             with self.SessionLocal() as session:
                 # Create manual history record
-                history_record = BillProcessHistory(
+                history_record = BillChangeHistoryRecord(
                     bill_id=bill_id,
                     event_type=HistoryEventType.MANUAL_CORRECTION,
                     change_type=HistoryChangeType.DATA_CORRECTION,
@@ -668,7 +771,7 @@ class BillHistoryRecorder:
                     change_summary=change_reason,
                     confidence_score=1.0,  # Manual changes have full confidence
                     source_system="manual_entry",
-                    metadata={
+                    event_metadata={
                         "user_id": user_id,
                         "manual_entry": True,
                         "field_name": field_name,
@@ -677,6 +780,7 @@ class BillHistoryRecorder:
 
                 session.add(history_record)
                 session.commit()
+                session.refresh(history_record)
 
                 self.logger.info(
                     f"Manual change recorded for bill {bill_id}: {change_reason}"
@@ -1,13 +1,23 @@
 """
 Airtable Issue Manager - Enhanced integration for dual-level policy issues.
 Manages hierarchical issue structure with human review workflow.
+
+Statistics, the issue tree, pending counts, per-bill lookups and label search
+are served from a local materialized index of the Issues table, loaded with
+pagination and kept current by incremental syncs on Airtable's last-modified
+time.
 """
 
 import asyncio
+import heapq
 import logging
+import math
+import time
+import unicodedata
 import uuid
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 from shared.clients.airtable import AirtableClient
@@ -15,6 +25,35 @@ from .policy_issue_extractor import DualLevelIssue
 
 logger = logging.getLogger(__name__)
 
+SEARCH_FIELDS = ("Label_Lv1", "Label_Lv2")
+
+
+def _updated_at(fields: dict[str, Any]) -> datetime | None:
+    """Updated_At of a record as an aware UTC datetime, if present and valid."""
+    value = fields.get("Updated_At")
+    if not value:
+        return None
+    try:
+        updated_at = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    # Naive values were stamped in the writer's local time
+    return updated_at.astimezone(UTC)
+
+
+def normalize_search_text(text: str) -> str:
+    """Normalize text for label search (full/half-width and case folding)."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def _label_ngrams(texts: tuple[str, ...]) -> set[str]:
+    """Character unigrams and bigrams of the given label texts."""
+    grams = set()
+    for text in texts:
+        grams.update(text)
+        grams.update(text[i : i + 2] for i in range(len(text) - 1))
+    return grams
+
 
 @dataclass
 class AirtableIssueRecord:
@@ -62,6 +101,231 @@ class AirtableIssueRecord:
         }
 
 
+class IssueIndex:
+    """In-memory materialized view of the Issues table.
+
+    Holds the fields of every issue record by Airtable record ID, together with
+    secondary indexes by bill and parent, a character n-gram index over the
+    issue labels and the counters behind the issue statistics. All of them are
+    updated per record, so applying a sync costs time proportional to the
+    number of changed records.
+    """
+
+    def __init__(self):
+        self.records: dict[str, dict[str, Any]] = {}
+        # Latest Updated_At among records fetched from Airtable
+        self.watermark: datetime | None = None
+        self.loaded_at: float | None = None  # Monotonic time of the full load
+        self.synced_at: float | None = None  # Monotonic time of the last sync
+
+        self._by_bill: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._children: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._grams: defaultdict[str, set[str]] = defaultdict(set)
+        self._search_text: dict[str, tuple[str, ...]] = {}
+        self._status_counts: Counter[str] = Counter()
+        self._level_counts: Counter[str] = Counter()
+        self._bill_counts: Counter[str] = Counter()
+        self._confidence_total = 0.0
+        self._quality_total = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def load(self, records: list[dict[str, Any]]) -> None:
+        """Replace the index contents with a full table load."""
+        self.__init__()
+        self.apply(records)
+        # Re-sum the running float totals so rounding error from repeated
+        # incremental updates does not outlive a full load
+        self._confidence_total = math.fsum(
+            fields.get("Confidence", 0.0) for fields in self.records.values()
+        )
+        self._quality_total = math.fsum(
+            fields.get("Quality_Score", 0.0) for fields in self.records.values()
+        )
+        self.loaded_at = self.synced_at = time.monotonic()
+
+    def apply(self, records: list[dict[str, Any]]) -> None:
+        """Insert or replace records returned by Airtable.
+
+        Only records fetched from Airtable advance the watermark; local writes
+        go through upsert() and patch() and carry this process's clock.
+        """
+        for record in records:
+            fields = record.get("fields", {})
+            self.upsert(record["id"], fields)
+
+            updated_at = _updated_at(fields)
+            if updated_at and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+
+    def upsert(self, record_id: str, fields: dict[str, Any]) -> None:
+        previous = self.records.get(record_id)
+        if previous is not None:
+            self._account(record_id, previous, -1)
+
+        self.records[record_id] = fields
+        self._account(record_id, fields, 1)
+
+    def patch(self, record_id: str, fields: dict[str, Any]) -> None:
+        """Apply a partial update to a known record."""
+        previous = self.records.get(record_id)
+        if previous is not None:
+            self.upsert(record_id, {**previous, **fields})
+
+    def _account(self, record_id: str, fields: dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a record's contribution."""
+        self._status_counts[fields.get("Status", "unknown")] += sign
+        self._level_counts["lv2" if fields.get("Parent_ID") else "lv1"] += sign
+        self._confidence_total += sign * fields.get("Confidence", 0.0)
+        self._quality_total += sign * fields.get("Quality_Score", 0.0)
+
+        bill_id = fields.get("Source_Bill_ID")
+        if bill_id:
+            self._bill_counts[bill_id] += sign
+            if self._bill_counts[bill_id] <= 0:
+                del self._bill_counts[bill_id]
+            if sign > 0:
+                self._by_bill[bill_id][record_id] = None
+            else:
+                self._by_bill[bill_id].pop(record_id, None)
+
+        parent_id = fields.get("Parent_ID")
+        if parent_id:
+            if sign > 0:
+                self._children[parent_id][record_id] = None
+            else:
+                self._children[parent_id].pop(record_id, None)
+
+        if sign > 0:
+            texts = tuple(
+                normalize_search_text(fields.get(name) or "") for name in SEARCH_FIELDS
+            )
+            self._search_text[record_id] = texts
+            for gram in _label_ngrams(texts):
+                self._grams[gram].add(record_id)
+        else:
+            for gram in _label_ngrams(self._search_text.pop(record_id, ())):
+                postings = self._grams[gram]
+                postings.discard(record_id)
+                if not postings:
+                    del self._grams[gram]
+
+    @staticmethod
+    def _is_current(fields: dict[str, Any], status: str) -> bool:
+        return fields.get("Status") == status and not fields.get("Valid_To")
+
+    def count_by_status(self, status: str) -> int:
+        return self._status_counts[status]
+
+    def records_for_bill(self, bill_id: str, status: str) -> list[dict[str, Any]]:
+        """Current records of a bill with the given status, in Airtable format."""
+        return [
+            {"id": record_id, "fields": self.records[record_id]}
+            for record_id in self._by_bill.get(bill_id, ())
+            if self._is_current(self.records[record_id], status)
+        ]
+
+    def tree(self, status: str) -> dict[str, Any]:
+        """Hierarchical lv1 -> lv2 tree of current issues with the given status."""
+        tree = {}
+        for record_id, fields in self.records.items():
+            if fields.get("Parent_ID") or not self._is_current(fields, status):
+                continue
+
+            children = []
+            for child_id in self._children.get(record_id, ()):
+                child = self.records[child_id]
+                if self._is_current(child, status):
+                    children.append(
+                        {
+                            "issue_id": child.get("Issue_ID"),
+                            "label_lv2": child.get("Label_Lv2", ""),
+                            "confidence": child.get("Confidence", 0.0),
+                            "source_bill_id": child.get("Source_Bill_ID"),
+                        }
+                    )
+
+            tree[record_id] = {
+                "issue_id": fields.get("Issue_ID"),
+                "label_lv1": fields.get("Label_Lv1", ""),
+                "confidence": fields.get("Confidence", 0.0),
+                "source_bill_id": fields.get("Source_Bill_ID"),
+                "children": children,
+            }
+        return tree
+
+    def search(
+        self,
+        query: str,
+        level: int | None = None,
+        status: str = "approved",
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Ranked substring search over issue labels.
+
+        Candidates are the records containing every bigram of the query (or
+        its single character), confirmed by a substring check. Prefix matches
+        rank first, then earlier matches, then shorter labels.
+        """
+        query = normalize_search_text(query.strip())
+        if not query:
+            return []
+
+        grams = {query[i : i + 2] for i in range(len(query) - 1)} or {query}
+        postings = sorted((self._grams.get(gram, set()) for gram in grams), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+
+        ranked = []
+        for record_id in candidates:
+            fields = self.records[record_id]
+            if not self._is_current(fields, status):
+                continue
+            is_lv2 = bool(fields.get("Parent_ID"))
+            if (level == 1 and is_lv2) or (level == 2 and not is_lv2):
+                continue
+
+            ranks = [
+                (position != 0, position, len(text))
+                for text in self._search_text[record_id]
+                if (position := text.find(query)) >= 0
+            ]
+            if ranks:
+                ranked.append((min(ranks), record_id))
+
+        return [
+            {"id": record_id, "fields": self.records[record_id]}
+            for _, record_id in heapq.nsmallest(limit, ranked)
+        ]
+
+    def statistics(self) -> dict[str, Any]:
+        """Issue statistics over all records, computed from the counters."""
+        total = len(self.records)
+        by_status = {
+            status: count for status, count in self._status_counts.items() if count
+        }
+        bills = list(self._bill_counts)
+
+        return {
+            "total_issues": total,
+            "by_status": by_status,
+            "by_level": {
+                "lv1": self._level_counts["lv1"],
+                "lv2": self._level_counts["lv2"],
+            },
+            "pending_count": by_status.get("pending", 0),
+            "approved_count": by_status.get("approved", 0),
+            "rejected_count": by_status.get("rejected", 0),
+            "failed_validation_count": by_status.get("failed_validation", 0),
+            "average_confidence": self._confidence_total / total if total else 0.0,
+            "average_quality_score": self._quality_total / total if total else 0.0,
+            "bills_with_issues": bills,
+            "issues_by_bill": dict(self._bill_counts),
+            "unique_bills_count": len(bills),
+        }
+
+
 class AirtableIssueManager:
     """Enhanced Airtable client for dual-level policy issues."""
 
@@ -74,6 +338,81 @@ class AirtableIssueManager:
         self.batch_size = 10  # Airtable limit
         self.batch_delay = 0.3  # Seconds between batches
 
+        # Local issue index settings
+        self.page_size = 100  # Airtable maximum page size
+        self.index_ttl_seconds = 60.0  # Max staleness before an incremental sync
+        # Incremental syncs cannot see deleted records, so reload periodically
+        self.index_full_sync_seconds = 3600.0
+        # Incremental syncs re-fetch this far before the watermark, covering
+        # clock skew between writers' Updated_At and Airtable's modified time
+        self.index_sync_overlap_seconds = 300.0
+        self.index = IssueIndex()
+        self._index_lock = asyncio.Lock()
+
+    async def _list_all_records(
+        self, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """List every matching record, following Airtable's pagination offsets."""
+        params = {**(params or {}), "pageSize": self.page_size}
+        records = []
+
+        while True:
+            response = await self.client._rate_limited_request(
+                "GET", f"{self.client.base_url}/{self.table_name}", params=params
+            )
+            records.extend(response.get("records", []))
+
+            offset = response.get("offset")
+            if not offset:
+                return records
+            params = {**params, "offset": offset}
+
+    async def sync_index(self, full: bool = False) -> IssueIndex:
+        """Bring the local issue index up to date.
+
+        The first sync (or ``full=True``) loads the whole table; later syncs
+        fetch only records Airtable last modified after the watermark, less
+        the overlap window. Re-applying a record is harmless.
+        """
+        async with self._index_lock:
+            if full or not self.index.loaded or self.index.watermark is None:
+                records = await self._list_all_records()
+                self.index.load(records)
+                self.logger.info(f"Loaded {len(records)} issues into local index")
+            else:
+                since = self.index.watermark - timedelta(
+                    seconds=self.index_sync_overlap_seconds
+                )
+                records = await self._list_all_records(
+                    {
+                        "filterByFormula": (
+                            "IS_AFTER(LAST_MODIFIED_TIME(), "
+                            f"'{since.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}')"
+                        )
+                    }
+                )
+                self.index.apply(records)
+                self.index.synced_at = time.monotonic()
+                self.logger.debug(f"Synced {len(records)} updated issues into index")
+
+        return self.index
+
+    async def _get_index(self) -> IssueIndex:
+        """Return the local index, syncing it first if it is stale."""
+        now = time.monotonic()
+        index = self.index
+
+        if not index.loaded or now - index.loaded_at >= self.index_full_sync_seconds:
+            return await self.sync_index(full=True)
+
+        if now - index.synced_at >= self.index_ttl_seconds:
+            try:
+                return await self.sync_index()
+            except Exception as e:
+                self.logger.warning(f"Serving stale issue index, sync failed: {e}")
+
+        return index
+
     async def create_issue_pair(
         self, dual_issue: DualLevelIssue, bill_id: str, quality_score: float = 0.0
     ) -> tuple[str, str]:
@@ -85,48 +424,48 @@ class AirtableIssueManager:
 
         try:
             # Create lv1 issue (parent)
+            lv1_fields = {
+                "Issue_ID": lv1_issue_id,
+                "Label_Lv1": dual_issue.label_lv1,
+                "Label_Lv2": "",  # Empty for lv1 records
+                "Parent_ID": None,
+                "Confidence": dual_issue.confidence,
+                "Status": "pending",
+                "Source_Bill_ID": bill_id,
+                "Valid_From": date.today().isoformat(),
+                "Quality_Score": quality_score,
+                "Extraction_Version": "1.0.0",
+                "Created_At": datetime.now().isoformat(),
+                "Updated_At": datetime.now().isoformat(),
+            }
             lv1_record = await self.client._rate_limited_request(
                 "POST",
                 f"{self.client.base_url}/{self.table_name}",
-                json={
-                    "fields": {
-                        "Issue_ID": lv1_issue_id,
-                        "Label_Lv1": dual_issue.label_lv1,
-                        "Label_Lv2": "",  # Empty for lv1 records
-                        "Parent_ID": None,
-                        "Confidence": dual_issue.confidence,
-                        "Status": "pending",
-                        "Source_Bill_ID": bill_id,
-                        "Valid_From": date.today().isoformat(),
-                        "Quality_Score": quality_score,
-                        "Extraction_Version": "1.0.0",
-                        "Created_At": datetime.now().isoformat(),
-                        "Updated_At": datetime.now().isoformat(),
-                    }
-                },
+                json={"fields": lv1_fields},
             )
+            self._index_created(lv1_record, lv1_fields)
 
             # Create lv2 issue (child)
+            lv2_fields = {
+                "Issue_ID": lv2_issue_id,
+                "Label_Lv1": "",  # Empty for lv2 records
+                "Label_Lv2": dual_issue.label_lv2,
+                "Parent_ID": lv1_record["id"],  # Link to lv1 record
+                "Confidence": dual_issue.confidence,
+                "Status": "pending",
+                "Source_Bill_ID": bill_id,
+                "Valid_From": date.today().isoformat(),
+                "Quality_Score": quality_score,
+                "Extraction_Version": "1.0.0",
+                "Created_At": datetime.now().isoformat(),
+                "Updated_At": datetime.now().isoformat(),
+            }
             lv2_record = await self.client._rate_limited_request(
                 "POST",
                 f"{self.client.base_url}/{self.table_name}",
-                json={
-                    "fields": {
-                        "Issue_ID": lv2_issue_id,
-                        "Label_Lv1": "",  # Empty for lv2 records
-                        "Label_Lv2": dual_issue.label_lv2,
-                        "Parent_ID": lv1_record["id"],  # Link to lv1 record
-                        "Confidence": dual_issue.confidence,
-                        "Status": "pending",
-                        "Source_Bill_ID": bill_id,
-                        "Valid_From": date.today().isoformat(),
-                        "Quality_Score": quality_score,
-                        "Extraction_Version": "1.0.0",
-                        "Created_At": datetime.now().isoformat(),
-                        "Updated_At": datetime.now().isoformat(),
-                    }
-                },
+                json={"fields": lv2_fields},
             )
+            self._index_created(lv2_record, lv2_fields)
 
             self.logger.info(
                 f"Created issue pair: lv1={lv1_record['id']}, lv2={lv2_record['id']}"
@@ -137,6 +476,11 @@ class AirtableIssueManager:
             self.logger.error(f"Failed to create issue pair: {e}")
             raise
 
+    def _index_created(self, record: dict[str, Any], fields: dict[str, Any]) -> None:
+        """Add a record created by this manager to the local index."""
+        if self.index.loaded:
+            self.index.upsert(record["id"], {**fields, **record.get("fields", {})})
+
     async def create_unclassified_issue_pair(self, bill_id: str) -> tuple[str, str]:
         """Create a special "未分類" issue pair for unclassifiable bills."""
 
@@ -213,6 +557,7 @@ class AirtableIssueManager:
                 f"{self.client.base_url}/{self.table_name}/{record_id}",
                 json=update_data,
             )
+            self.index.patch(record_id, update_data["fields"])
 
             self.logger.info(f"Updated issue {record_id} status to {status}")
             return True
@@ -242,23 +587,11 @@ class AirtableIssueManager:
 
     async def count_pending_issues(self, exclude_failed_validation: bool = True) -> int:
         """Count pending issues for Discord notifications."""
+        # Issues that failed validation have their own status, so they are
+        # never counted as pending either way
         try:
-            if exclude_failed_validation:
-                filter_formula = "AND({Status} = 'pending')"
-            else:
-                filter_formula = "{Status} = 'pending'"
-
-            # Get all records to count (Airtable doesn't provide direct count)
-            response = await self.client._rate_limited_request(
-                "GET",
-                f"{self.client.base_url}/{self.table_name}",
-                params={
-                    "filterByFormula": filter_formula,
-                    "maxRecords": 1000,  # Reasonable limit for counting
-                },
-            )
-
-            return len(response.get("records", []))
+            index = await self._get_index()
+            return index.count_by_status("pending")
 
         except Exception as e:
             self.logger.error(f"Failed to count pending issues: {e}")
@@ -293,48 +626,8 @@ class AirtableIssueManager:
     async def get_issue_tree(self, status: str = "approved") -> dict[str, Any]:
         """Get hierarchical issue tree structure."""
         try:
-            # Get all approved issues
-            filter_formula = f"AND({{Status}} = '{status}', {{Valid_To}} = BLANK())"
-
-            response = await self.client._rate_limited_request(
-                "GET",
-                f"{self.client.base_url}/{self.table_name}",
-                params={"filterByFormula": filter_formula, "maxRecords": 1000},
-            )
-
-            all_issues = response.get("records", [])
-
-            # Build tree structure
-            tree = {}
-
-            # First pass: create parent entries
-            for issue in all_issues:
-                fields = issue.get("fields", {})
-                if not fields.get("Parent_ID"):  # lv1 issue
-                    issue_id = issue["id"]
-                    tree[issue_id] = {
-                        "issue_id": fields.get("Issue_ID"),
-                        "label_lv1": fields.get("Label_Lv1", ""),
-                        "confidence": fields.get("Confidence", 0.0),
-                        "source_bill_id": fields.get("Source_Bill_ID"),
-                        "children": [],
-                    }
-
-            # Second pass: add children
-            for issue in all_issues:
-                fields = issue.get("fields", {})
-                parent_id = fields.get("Parent_ID")
-                if parent_id and parent_id in tree:  # lv2 issue
-                    tree[parent_id]["children"].append(
-                        {
-                            "issue_id": fields.get("Issue_ID"),
-                            "label_lv2": fields.get("Label_Lv2", ""),
-                            "confidence": fields.get("Confidence", 0.0),
-                            "source_bill_id": fields.get("Source_Bill_ID"),
-                        }
-                    )
-
-            return tree
+            index = await self._get_index()
+            return index.tree(status)
 
         except Exception as e:
             self.logger.error(f"Failed to get issue tree: {e}")
@@ -345,15 +638,8 @@ class AirtableIssueManager:
     ) -> list[dict[str, Any]]:
         """Get all issues related to a specific bill."""
         try:
-            filter_formula = f"AND({{Status}} = '{status}', {{Source_Bill_ID}} = '{bill_id}', {{Valid_To}} = BLANK())"
-
-            response = await self.client._rate_limited_request(
-                "GET",
-                f"{self.client.base_url}/{self.table_name}",
-                params={"filterByFormula": filter_formula, "maxRecords": 100},
-            )
-
-            return response.get("records", [])
+            index = await self._get_index()
+            return index.records_for_bill(bill_id, status)
 
         except Exception as e:
             self.logger.error(f"Failed to get issues for bill {bill_id}: {e}")
@@ -367,17 +653,17 @@ class AirtableIssueManager:
             today = date.today().isoformat()
 
             for issue_id in issue_ids:
+                fields = {
+                    "Valid_To": today,
+                    "Updated_At": datetime.now().isoformat(),
+                    "Reviewer_Notes": f"Invalidated: {reason}",
+                }
                 await self.client._rate_limited_request(
                     "PATCH",
                     f"{self.client.base_url}/{self.table_name}/{issue_id}",
-                    json={
-                        "fields": {
-                            "Valid_To": today,
-                            "Updated_At": datetime.now().isoformat(),
-                            "Reviewer_Notes": f"Invalidated: {reason}",
-                        }
-                    },
+                    json={"fields": fields},
                 )
+                self.index.patch(issue_id, fields)
 
             self.logger.info(f"Invalidated {len(issue_ids)} issues: {reason}")
             return True
@@ -439,86 +725,8 @@ class AirtableIssueManager:
     async def get_issue_statistics(self) -> dict[str, Any]:
         """Get comprehensive issue statistics."""
         try:
-            # Get all issues
-            all_issues_response = await self.client._rate_limited_request(
-                "GET",
-                f"{self.client.base_url}/{self.table_name}",
-                params={"maxRecords": 1000},
-            )
-
-            all_issues = all_issues_response.get("records", [])
-
-            # Calculate statistics
-            stats = {
-                "total_issues": len(all_issues),
-                "by_status": {},
-                "by_level": {"lv1": 0, "lv2": 0},
-                "pending_count": 0,
-                "approved_count": 0,
-                "rejected_count": 0,
-                "failed_validation_count": 0,
-                "average_confidence": 0.0,
-                "average_quality_score": 0.0,
-                "bills_with_issues": set(),
-                "issues_by_bill": {},
-            }
-
-            confidence_scores = []
-            quality_scores = []
-
-            for issue in all_issues:
-                fields = issue.get("fields", {})
-                status = fields.get("Status", "unknown")
-
-                # Count by status
-                stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-
-                # Count by level
-                if fields.get("Parent_ID"):
-                    stats["by_level"]["lv2"] += 1
-                else:
-                    stats["by_level"]["lv1"] += 1
-
-                # Track specific statuses
-                if status == "pending":
-                    stats["pending_count"] += 1
-                elif status == "approved":
-                    stats["approved_count"] += 1
-                elif status == "rejected":
-                    stats["rejected_count"] += 1
-                elif status == "failed_validation":
-                    stats["failed_validation_count"] += 1
-
-                # Collect confidence and quality scores
-                confidence = fields.get("Confidence", 0.0)
-                quality = fields.get("Quality_Score", 0.0)
-                confidence_scores.append(confidence)
-                quality_scores.append(quality)
-
-                # Track bills with issues
-                bill_id = fields.get("Source_Bill_ID")
-                if bill_id:
-                    stats["bills_with_issues"].add(bill_id)
-                    stats["issues_by_bill"][bill_id] = (
-                        stats["issues_by_bill"].get(bill_id, 0) + 1
-                    )
-
-            # Calculate averages
-            if confidence_scores:
-                stats["average_confidence"] = sum(confidence_scores) / len(
-                    confidence_scores
-                )
-            if quality_scores:
-                stats["average_quality_score"] = sum(quality_scores) / len(
-                    quality_scores
-                )
-
-            stats["unique_bills_count"] = len(stats["bills_with_issues"])
-            stats["bills_with_issues"] = list(
-                stats["bills_with_issues"]
-            )  # Convert set to list for JSON
-
-            return stats
+            index = await self._get_index()
+            return index.statistics()
 
         except Exception as e:
             self.logger.error(f"Failed to get issue statistics: {e}")
@@ -531,30 +739,10 @@ class AirtableIssueManager:
         status: str = "approved",
         max_records: int = 50,
     ) -> list[dict[str, Any]]:
-        """Search issues by text query."""
+        """Search issue labels by text query, best matches first."""
         try:
-            # Build search filter
-            search_filters = [f"{{Status}} = '{status}'", "{Valid_To} = BLANK()"]
-
-            # Add level filter
-            if level == 1:
-                search_filters.append("{Parent_ID} = BLANK()")
-            elif level == 2:
-                search_filters.append("{Parent_ID} != BLANK()")
-
-            # Add text search (search in both label fields)
-            text_search = f"OR(FIND('{query}', {{Label_Lv1}}) > 0, FIND('{query}', {{Label_Lv2}}) > 0)"
-            search_filters.append(text_search)
-
-            filter_formula = "AND(" + ", ".join(search_filters) + ")"
-
-            response = await self.client._rate_limited_request(
-                "GET",
-                f"{self.client.base_url}/{self.table_name}",
-                params={"filterByFormula": filter_formula, "maxRecords": max_records},
-            )
-
-            return response.get("records", [])
+            index = await self._get_index()
+            return index.search(query, level, status, max_records)
 
         except Exception as e:
             self.logger.error(f"Failed to search issues: {e}")
@@ -3,29 +3,55 @@ History Service - High-level service for managing bill history recording and ret
 Provides a unified interface for history-related operations.
 """
 
+import base64
+import binascii
+import csv
+import io
+import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import and_, create_engine, desc, func, select
-from sqlalchemy.orm import sessionmaker
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, create_engine, desc, func, select, tuple_
+from sqlalchemy.orm import Session, sessionmaker
 
-from ...shared.src.shared.models.bill_process_history import (
-    BillProcessHistory,
+from shared.models.bill_change_history import (
+    BillChangeHistoryRecord,
     HistoryChangeType,
     HistoryEventType,
 )
+
 from ..processor.bill_history_recorder import (
     BillHistoryRecorder,
     ChangeDetectionMode,
     HistoryRecordingResult,
+    count_history_by,
 )
 from ..scheduler.history_recording_scheduler import (
     HistoryRecordingScheduler,
     ScheduleConfig,
 )
 
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_CSV_FIELDS = [
+    "id",
+    "bill_id",
+    "event_type",
+    "change_type",
+    "recorded_at",
+    "change_summary",
+    "confidence_score",
+    "source_system",
+    "previous_values",
+    "new_values",
+    "metadata",
+    "cursor",
+]
+
 
 @dataclass
 class HistoryQuery:
@@ -80,6 +106,9 @@ class HistoryService:
             "max_page_size": 1000,
             "default_analytics_days": 30,
             "cache_ttl_seconds": 300,
+            "export_batch_size": 1000,
+            "export_chunk_bytes": 64 * 1024,
+            "json_export_limit": 10000,
         }
 
     def initialize_scheduler(self, config: ScheduleConfig | None = None) -> bool:
@@ -124,9 +153,9 @@ class HistoryService:
         try:
             with self.SessionLocal() as session:
                 query = (
-                    select(BillProcessHistory)
-                    .where(BillProcessHistory.bill_id == bill_id)
-                    .order_by(desc(BillProcessHistory.recorded_at))
+                    select(BillChangeHistoryRecord)
+                    .where(BillChangeHistoryRecord.bill_id == bill_id)
+                    .order_by(desc(BillChangeHistoryRecord.recorded_at))
                     .limit(limit)
                 )
 
@@ -148,7 +177,7 @@ class HistoryService:
                     }
 
                     if include_metadata:
-                        history_dict["metadata"] = record.metadata
+                        history_dict["metadata"] = record.event_metadata
 
                     result.append(history_dict)
 
@@ -163,45 +192,10 @@ class HistoryService:
         try:
             with self.SessionLocal() as session:
                 # Build base query
-                base_query = select(BillProcessHistory)
+                base_query = select(BillChangeHistoryRecord)
 
                 # Apply filters
-                conditions = []
-
-                if query.bill_id:
-                    conditions.append(BillProcessHistory.bill_id == query.bill_id)
-
-                if query.bill_ids:
-                    conditions.append(BillProcessHistory.bill_id.in_(query.bill_ids))
-
-                if query.event_types:
-                    conditions.append(
-                        BillProcessHistory.event_type.in_(query.event_types)
-                    )
-
-                if query.change_types:
-                    conditions.append(
-                        BillProcessHistory.change_type.in_(query.change_types)
-                    )
-
-                if query.start_date:
-                    conditions.append(
-                        BillProcessHistory.recorded_at >= query.start_date
-                    )
-
-                if query.end_date:
-                    conditions.append(BillProcessHistory.recorded_at <= query.end_date)
-
-                if query.source_system:
-                    conditions.append(
-                        BillProcessHistory.source_system == query.source_system
-                    )
-
-                if query.min_confidence is not None:
-                    conditions.append(
-                        BillProcessHistory.confidence_score >= query.min_confidence
-                    )
-
+                conditions = self._build_conditions(query)
                 if conditions:
                     base_query = base_query.where(and_(*conditions))
 
@@ -211,11 +205,11 @@ class HistoryService:
 
                 # Apply ordering
                 if query.order_by == "recorded_at":
-                    order_column = BillProcessHistory.recorded_at
+                    order_column = BillChangeHistoryRecord.recorded_at
                 elif query.order_by == "confidence_score":
-                    order_column = BillProcessHistory.confidence_score
+                    order_column = BillChangeHistoryRecord.confidence_score
                 else:
-                    order_column = BillProcessHistory.recorded_at
+                    order_column = BillChangeHistoryRecord.recorded_at
 
                 if query.order_direction == "desc":
                     base_query = base_query.order_by(desc(order_column))
@@ -229,23 +223,7 @@ class HistoryService:
                 history_records = session.execute(base_query).scalars().all()
 
                 # Format results
-                records = []
-                for record in history_records:
-                    records.append(
-                        {
-                            "id": record.id,
-                            "bill_id": record.bill_id,
-                            "event_type": record.event_type.value,
-                            "change_type": record.change_type.value,
-                            "recorded_at": record.recorded_at.isoformat(),
-                            "change_summary": record.change_summary,
-                            "confidence_score": record.confidence_score,
-                            "source_system": record.source_system,
-                            "previous_values": record.previous_values,
-                            "new_values": record.new_values,
-                            "metadata": record.metadata,
-                        }
-                    )
+                records = [self._record_to_dict(record) for record in history_records]
 
                 return {
                     "records": records,
@@ -259,6 +237,59 @@ class HistoryService:
             self.logger.error(f"Error querying history: {e}")
             raise
 
+    def _build_conditions(self, query: HistoryQuery) -> list[Any]:
+        """Build WHERE conditions for a history query"""
+        conditions = []
+
+        if query.bill_id:
+            conditions.append(BillChangeHistoryRecord.bill_id == query.bill_id)
+
+        if query.bill_ids:
+            conditions.append(BillChangeHistoryRecord.bill_id.in_(query.bill_ids))
+
+        if query.event_types:
+            conditions.append(BillChangeHistoryRecord.event_type.in_(query.event_types))
+
+        if query.change_types:
+            conditions.append(
+                BillChangeHistoryRecord.change_type.in_(query.change_types)
+            )
+
+        if query.start_date:
+            conditions.append(BillChangeHistoryRecord.recorded_at >= query.start_date)
+
+        if query.end_date:
+            conditions.append(BillChangeHistoryRecord.recorded_at <= query.end_date)
+
+        if query.source_system:
+            conditions.append(
+                BillChangeHistoryRecord.source_system == query.source_system
+            )
+
+        if query.min_confidence is not None:
+            conditions.append(
+                BillChangeHistoryRecord.confidence_score >= query.min_confidence
+            )
+
+        return conditions
+
+    @staticmethod
+    def _record_to_dict(record: BillChangeHistoryRecord) -> dict[str, Any]:
+        """Format a history record for API output"""
+        return {
+            "id": record.id,
+            "bill_id": record.bill_id,
+            "event_type": record.event_type.value,
+            "change_type": record.change_type.value,
+            "recorded_at": record.recorded_at.isoformat(),
+            "change_summary": record.change_summary,
+            "confidence_score": record.confidence_score,
+            "source_system": record.source_system,
+            "previous_values": record.previous_values,
+            "new_values": record.new_values,
+            "metadata": record.event_metadata,
+        }
+
     def get_bill_timeline(self, bill_id: str) -> list[dict[str, Any]]:
         """Get timeline of major events for a bill"""
         try:
@@ -274,14 +305,14 @@ class HistoryService:
                 ]
 
                 query = (
-                    select(BillProcessHistory)
+                    select(BillChangeHistoryRecord)
                     .where(
                         and_(
-                            BillProcessHistory.bill_id == bill_id,
-                            BillProcessHistory.event_type.in_(significant_events),
+                            BillChangeHistoryRecord.bill_id == bill_id,
+                            BillChangeHistoryRecord.event_type.in_(significant_events),
                         )
                     )
-                    .order_by(BillProcessHistory.recorded_at)
+                    .order_by(BillChangeHistoryRecord.recorded_at)
                 )
 
                 timeline_records = session.execute(query).scalars().all()
@@ -311,20 +342,25 @@ class HistoryService:
             raise
 
     def get_analytics(self, days: int = 30) -> HistoryAnalytics:
-        """Get analytics for history data"""
+        """Get analytics for history data
+
+        Every figure is computed by an aggregate query, so only the aggregates
+        (not the history records in the window) are transferred and hydrated.
+        """
         try:
             with self.SessionLocal() as session:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
+                in_window = BillChangeHistoryRecord.recorded_at >= start_date
 
-                # Get records in date range
-                query = select(BillProcessHistory).where(
-                    BillProcessHistory.recorded_at >= start_date
-                )
-
-                records = session.execute(query).scalars().all()
+                total_records, unique_bills = session.execute(
+                    select(
+                        func.count(),
+                        func.count(func.distinct(BillChangeHistoryRecord.bill_id)),
+                    ).where(in_window)
+                ).one()
 
-                if not records:
+                if not total_records:
                     return HistoryAnalytics(
                         total_records=0,
                         unique_bills=0,
@@ -336,61 +372,37 @@ class HistoryService:
                         top_active_bills=[],
                     )
 
-                # Calculate analytics
-                unique_bills = len(set(record.bill_id for record in records))
-
-                # Event type distribution
-                event_type_dist = {}
-                for record in records:
-                    event_type = record.event_type.value
-                    event_type_dist[event_type] = event_type_dist.get(event_type, 0) + 1
-
-                # Change type distribution
-                change_type_dist = {}
-                for record in records:
-                    change_type = record.change_type.value
-                    change_type_dist[change_type] = (
-                        change_type_dist.get(change_type, 0) + 1
-                    )
+                # Event and change type distributions
+                event_type_dist = count_history_by(
+                    session, BillChangeHistoryRecord.event_type, in_window
+                )
+                change_type_dist = count_history_by(
+                    session, BillChangeHistoryRecord.change_type, in_window
+                )
 
                 # Confidence statistics
-                confidence_scores = [
-                    record.confidence_score
-                    for record in records
-                    if record.confidence_score is not None
-                ]
-                confidence_stats = {}
-                if confidence_scores:
-                    confidence_stats = {
-                        "min": min(confidence_scores),
-                        "max": max(confidence_scores),
-                        "avg": sum(confidence_scores) / len(confidence_scores),
-                        "median": sorted(confidence_scores)[
-                            len(confidence_scores) // 2
-                        ],
-                    }
+                confidence_stats = self._calculate_confidence_stats(session, in_window)
 
                 # Activity timeline (daily activity)
                 activity_timeline = self._calculate_activity_timeline(
-                    records, start_date, end_date
+                    session, in_window, start_date, end_date
                 )
 
                 # Top active bills
-                bill_activity = {}
-                for record in records:
-                    bill_activity[record.bill_id] = (
-                        bill_activity.get(record.bill_id, 0) + 1
-                    )
-
+                activity_count = func.count().label("activity_count")
                 top_active_bills = [
                     {"bill_id": bill_id, "activity_count": count}
-                    for bill_id, count in sorted(
-                        bill_activity.items(), key=lambda x: x[1], reverse=True
-                    )[:10]
+                    for bill_id, count in session.execute(
+                        select(BillChangeHistoryRecord.bill_id, activity_count)
+                        .where(in_window)
+                        .group_by(BillChangeHistoryRecord.bill_id)
+                        .order_by(desc(activity_count))
+                        .limit(10)
+                    )
                 ]
 
                 return HistoryAnalytics(
-                    total_records=len(records),
+                    total_records=total_records,
                     unique_bills=unique_bills,
                     date_range={"start": start_date, "end": end_date},
                     event_type_distribution=event_type_dist,
@@ -404,59 +416,102 @@ class HistoryService:
             self.logger.error(f"Error calculating analytics: {e}")
             raise
 
+    def _calculate_confidence_stats(
+        self, session: Session, *conditions: Any
+    ) -> dict[str, float]:
+        """Calculate min/max/avg/median confidence in the database"""
+        score = BillChangeHistoryRecord.confidence_score
+        conditions = (*conditions, score.is_not(None))
+
+        count, minimum, maximum, average = session.execute(
+            select(
+                func.count(), func.min(score), func.max(score), func.avg(score)
+            ).where(*conditions)
+        ).one()
+        if not count:
+            return {}
+
+        if session.get_bind().dialect.name == "postgresql":
+            median = session.execute(
+                select(func.percentile_cont(0.5).within_group(score)).where(*conditions)
+            ).scalar()
+        else:
+            # Upper median without percentile support
+            median = session.execute(
+                select(score).where(*conditions).order_by(score).offset(count // 2)
+            ).scalar()
+
+        return {
+            "min": minimum,
+            "max": maximum,
+            "avg": float(average),
+            "median": float(median),
+        }
+
     def _calculate_activity_timeline(
         self,
-        records: list[BillProcessHistory],
+        session: Session,
+        in_window: Any,
         start_date: datetime,
         end_date: datetime,
     ) -> list[dict[str, Any]]:
         """Calculate daily activity timeline"""
+        if session.get_bind().dialect.name == "postgresql":
+            day = func.date_trunc("day", BillChangeHistoryRecord.recorded_at)
+        else:
+            day = func.date(BillChangeHistoryRecord.recorded_at)
+        day = day.label("day")
+
         # Group records by date
         daily_activity = {}
+        for bucket, total_changes, bills_affected in session.execute(
+            select(
+                day,
+                func.count(),
+                func.count(func.distinct(BillChangeHistoryRecord.bill_id)),
+            )
+            .where(in_window)
+            .group_by(day)
+        ):
+            daily_activity[self._bucket_date(bucket)] = {
+                "total_changes": total_changes,
+                "bills_affected": bills_affected,
+                "event_types": [],
+            }
 
-        for record in records:
-            date_key = record.recorded_at.date()
-            if date_key not in daily_activity:
-                daily_activity[date_key] = {
-                    "date": date_key,
-                    "total_changes": 0,
-                    "bills_affected": set(),
-                    "event_types": set(),
-                }
-
-            daily_activity[date_key]["total_changes"] += 1
-            daily_activity[date_key]["bills_affected"].add(record.bill_id)
-            daily_activity[date_key]["event_types"].add(record.event_type.value)
+        for bucket, event_type in session.execute(
+            select(day, BillChangeHistoryRecord.event_type)
+            .where(in_window)
+            .group_by(day, BillChangeHistoryRecord.event_type)
+        ):
+            daily_activity[self._bucket_date(bucket)]["event_types"].append(
+                getattr(event_type, "value", event_type)
+            )
 
         # Convert to timeline format
         timeline = []
         current_date = start_date.date()
 
         while current_date <= end_date.date():
-            if current_date in daily_activity:
-                activity = daily_activity[current_date]
-                timeline.append(
-                    {
-                        "date": current_date.isoformat(),
-                        "total_changes": activity["total_changes"],
-                        "bills_affected": len(activity["bills_affected"]),
-                        "event_types": list(activity["event_types"]),
-                    }
-                )
-            else:
-                timeline.append(
-                    {
-                        "date": current_date.isoformat(),
-                        "total_changes": 0,
-                        "bills_affected": 0,
-                        "event_types": [],
-                    }
-                )
+            activity = daily_activity.get(
+                current_date,
+                {"total_changes": 0, "bills_affected": 0, "event_types": []},
+            )
+            timeline.append({"date": current_date.isoformat(), **activity})
 
             current_date += timedelta(days=1)
 
         return timeline
 
+    @staticmethod
+    def _bucket_date(bucket: datetime | date | str) -> date:
+        """Normalize a day bucket returned by the database to a date"""
+        if isinstance(bucket, datetime):
+            return bucket.date()
+        if isinstance(bucket, str):
+            return date.fromisoformat(bucket[:10])
+        return bucket
+
     def _determine_event_significance(self, event_type: HistoryEventType) -> str:
         """Determine significance level of an event"""
         critical_events = [
@@ -565,30 +620,152 @@ class HistoryService:
             raise
 
     def export_history(
-        self, query: HistoryQuery, format: str = "json"
-    ) -> dict[str, Any]:
-        """Export history data"""
+        self,
+        query: HistoryQuery,
+        format: str = "json",
+        cursor: str | None = None,
+        compress: bool = False,
+    ) -> StreamingResponse | dict[str, Any]:
+        """Export history data
+
+        ``json`` returns a single payload of at most ``json_export_limit``
+        records. ``ndjson`` and ``csv`` return a streamed response
+        of all records matching the query (``limit`` and ``offset`` are
+        ignored); every streamed record carries a ``cursor`` value, and
+        passing the last one received resumes the export right after it.
+        """
+        if format == "json":
+            return self._export_json(query)
+
+        if format not in EXPORT_MEDIA_TYPES:
+            return {
+                "error": f"Unsupported format: {format}",
+                "supported_formats": ["json", *EXPORT_MEDIA_TYPES],
+            }
+
         try:
-            # Remove pagination for export
-            export_query = query
-            export_query.limit = 10000  # Set reasonable limit for export
-            export_query.offset = 0
+            after = self.decode_export_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return {"error": f"Invalid cursor: {e}"}
 
-            result = self.query_history(export_query)
+        chunks = self.iter_export_chunks(query, format, after)
+        headers = {
+            "Content-Disposition": f'attachment; filename="bill_history.{format}"'
+        }
+        if compress:
+            chunks = self._gzip_chunks(chunks)
+            headers["Content-Encoding"] = "gzip"
 
-            if format == "json":
-                return {
-                    "format": "json",
-                    "data": result,
-                    "exported_at": datetime.now().isoformat(),
-                    "total_records": result["total_count"],
-                }
-            else:
-                return {
-                    "error": f"Unsupported format: {format}",
-                    "supported_formats": ["json"],
-                }
+        return StreamingResponse(
+            chunks, media_type=EXPORT_MEDIA_TYPES[format], headers=headers
+        )
+
+    def _export_json(self, query: HistoryQuery) -> dict[str, Any]:
+        """Export up to ``json_export_limit`` records as one JSON payload"""
+        try:
+            result = self.query_history(
+                replace(query, limit=self.config["json_export_limit"], offset=0)
+            )
+
+            return {
+                "format": "json",
+                "data": result,
+                "exported_at": datetime.now().isoformat(),
+                "total_records": result["total_count"],
+            }
 
         except Exception as e:
             self.logger.error(f"Error exporting history: {e}")
             return {"error": str(e)}
+
+    def iter_history_records(
+        self, query: HistoryQuery, after: tuple[datetime, int] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream history records matching a query in (recorded_at, id) order
+
+        Rows are fetched through a server-side cursor in batches of
+        ``export_batch_size``, so memory use does not depend on the result size.
+        """
+        conditions = self._build_conditions(query)
+        if after is not None:
+            conditions.append(
+                tuple_(BillChangeHistoryRecord.recorded_at, BillChangeHistoryRecord.id)
+                > after
+            )
+
+        statement = (
+            select(BillChangeHistoryRecord)
+            .where(*conditions)
+            .order_by(BillChangeHistoryRecord.recorded_at, BillChangeHistoryRecord.id)
+            .execution_options(yield_per=self.config["export_batch_size"])
+        )
+
+        with self.SessionLocal() as session:
+            for record in session.execute(statement).scalars():
+                row = self._record_to_dict(record)
+                row["cursor"] = self.encode_export_cursor(record.recorded_at, record.id)
+                yield row
+
+    def iter_export_chunks(
+        self,
+        query: HistoryQuery,
+        format: str = "ndjson",
+        after: tuple[datetime, int] | None = None,
+    ) -> Iterator[bytes]:
+        """Serialize streamed history records into NDJSON or CSV byte chunks
+
+        Chunks are cut once ``export_chunk_bytes`` of UTF-8 output have been
+        written, so the limit holds for multi-byte text as well.
+        """
+        output = io.BytesIO()
+        buffer = io.TextIOWrapper(
+            output, encoding="utf-8", newline="", write_through=True
+        )
+        chunk_size = self.config["export_chunk_bytes"]
+
+        writer = None
+        if format == "csv":
+            writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS)
+            writer.writeheader()
+
+        for row in self.iter_history_records(query, after):
+            if writer is None:
+                buffer.write(json.dumps(row, ensure_ascii=False, default=str))
+                buffer.write("\n")
+            else:
+                for key in ("previous_values", "new_values", "metadata"):
+                    row[key] = json.dumps(row[key], ensure_ascii=False, default=str)
+                writer.writerow(row)
+
+            if output.tell() >= chunk_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+
+        if output.tell():
+            yield output.getvalue()
+
+    @staticmethod
+    def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Gzip-compress a stream of byte chunks"""
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            if data := compressor.compress(chunk):
+                yield data
+        yield compressor.flush()
+
+    @staticmethod
+    def encode_export_cursor(recorded_at: datetime, record_id: int) -> str:
+        """Encode an export position as an opaque cursor"""
+        raw = f"{recorded_at.isoformat()}|{record_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_export_cursor(cursor: str) -> tuple[datetime, int]:
+        """Decode a cursor produced by encode_export_cursor"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            recorded_at, record_id = raw.rsplit("|", 1)
+            return datetime.fromisoformat(recorded_at), int(record_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"malformed export cursor: {cursor!r}") from e
@@ -5,11 +5,20 @@ Handles issue version transitions, audit trails, and conflict resolution.
 
 import logging
 import uuid
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from sqlalchemy import create_engine, delete, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import sessionmaker
+
+from shared.models.issue_version import IssueVersionRecord
+
 from .airtable_issue_manager import AirtableIssueManager, AirtableIssueRecord
 
 logger = logging.getLogger(__name__)
@@ -96,15 +105,123 @@ class ConflictResolution:
     notes: str = ""
 
 
+class IssueVersionStore:
+    """Durable issue version store backed by the issue_versions table."""
+
+    def __init__(self, database_url: str, write_batch_size: int = 500):
+        self.engine = create_engine(database_url)
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self.engine
+        )
+        self.write_batch_size = write_batch_size
+        self.logger = logger
+
+    @staticmethod
+    def _to_row(version: IssueVersionHistory) -> dict[str, Any]:
+        row = {f.name: getattr(version, f.name) for f in fields(IssueVersionHistory)}
+        row["change_type"] = version.change_type.value
+        return row
+
+    @staticmethod
+    def _from_record(record: IssueVersionRecord) -> IssueVersionHistory:
+        values = {f.name: getattr(record, f.name) for f in fields(IssueVersionHistory)}
+        values["change_type"] = VersionChangeType(record.change_type)
+        return IssueVersionHistory(**values)
+
+    def load_history(self) -> dict[str, list[IssueVersionHistory]]:
+        """Load all versions, grouped by issue in version order."""
+        history: defaultdict[str, list[IssueVersionHistory]] = defaultdict(list)
+
+        with self.SessionLocal() as session:
+            records = session.execute(
+                select(IssueVersionRecord).order_by(
+                    IssueVersionRecord.issue_id, IssueVersionRecord.version_number
+                )
+            ).scalars()
+            for record in records:
+                history[record.issue_id].append(self._from_record(record))
+
+        return dict(history)
+
+    def save(self, versions: list[IssueVersionHistory]) -> None:
+        """Insert or update versions in batched multi-row upserts."""
+        if not versions:
+            return
+
+        rows = [self._to_row(version) for version in versions]
+
+        with self.SessionLocal() as session:
+            dialect = session.get_bind().dialect.name
+            insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+
+            for start in range(0, len(rows), self.write_batch_size):
+                statement = insert(IssueVersionRecord).values(
+                    rows[start : start + self.write_batch_size]
+                )
+                statement = statement.on_conflict_do_update(
+                    index_elements=[IssueVersionRecord.version_id],
+                    set_={
+                        name: statement.excluded[name]
+                        for name in rows[0]
+                        if name != "version_id"
+                    },
+                )
+                session.execute(statement)
+
+            session.commit()
+
+        self.logger.debug(f"Stored {len(rows)} issue versions")
+
+    def delete(self, version_ids: list[str]) -> None:
+        if not version_ids:
+            return
+
+        with self.SessionLocal() as session:
+            session.execute(
+                delete(IssueVersionRecord).where(
+                    IssueVersionRecord.version_id.in_(version_ids)
+                )
+            )
+            session.commit()
+
+    def as_of(self, target_date: date) -> dict[str, IssueVersionHistory]:
+        """Versions active on ``target_date``, one range query on validity."""
+        with self.SessionLocal() as session:
+            records = session.execute(
+                select(IssueVersionRecord)
+                .where(
+                    IssueVersionRecord.valid_from <= target_date,
+                    or_(
+                        IssueVersionRecord.valid_to.is_(None),
+                        IssueVersionRecord.valid_to > target_date,
+                    ),
+                )
+                .order_by(
+                    IssueVersionRecord.issue_id, IssueVersionRecord.version_number
+                )
+            ).scalars()
+
+            # The latest version wins if an issue has overlapping versions
+            return {record.issue_id: self._from_record(record) for record in records}
+
+
 class IssueVersioningService:
     """Service for managing issue versioning and history."""
 
-    def __init__(self, airtable_manager: AirtableIssueManager | None = None):
+    def __init__(
+        self,
+        airtable_manager: AirtableIssueManager | None = None,
+        database_url: str | None = None,
+    ):
         self.airtable_manager = airtable_manager or AirtableIssueManager()
         self.logger = logger
 
-        # In-memory version tracking (in production, use database)
-        self.version_history: dict[str, list[IssueVersionHistory]] = {}
+        # Versions per issue in version_number order. With a database_url they
+        # are persisted to the issue_versions table and reloaded on startup.
+        self.store = IssueVersionStore(database_url) if database_url else None
+        self.version_history: dict[str, list[IssueVersionHistory]] = (
+            self.store.load_history() if self.store else {}
+        )
         self.conflict_log: list[ConflictResolution] = []
 
         # Configuration
@@ -144,6 +261,7 @@ class IssueVersioningService:
             self.version_history[issue_record.issue_id] = []
 
         self.version_history[issue_record.issue_id].append(initial_version)
+        self._save_versions([initial_version])
 
         self.logger.info(
             f"Created initial version {version_id} for issue {issue_record.issue_id}"
@@ -160,6 +278,27 @@ class IssueVersioningService:
     ) -> tuple[IssueVersionHistory, bool]:
         """Create a new version of an existing issue."""
 
+        current_version, new_version, conflict_detected = await self._append_version(
+            issue_id, updated_record, change_type, change_description, created_by
+        )
+        self._save_versions([current_version, new_version])
+
+        return new_version, conflict_detected
+
+    async def _append_version(
+        self,
+        issue_id: str,
+        updated_record: AirtableIssueRecord,
+        change_type: VersionChangeType,
+        change_description: str,
+        created_by: str,
+    ) -> tuple[IssueVersionHistory, IssueVersionHistory, bool]:
+        """Append a new version in memory, closing the current one.
+
+        Returns the closed version, the new version and whether a conflict was
+        detected; persisting both is left to the caller.
+        """
+
         # Get current version
         current_version = await self.get_current_version(issue_id)
         if not current_version:
@@ -211,7 +350,11 @@ class IssueVersioningService:
         self.logger.info(
             f"Created version {new_version_number} for issue {issue_id}: {change_description}"
         )
-        return new_version, conflict_detected
+        return current_version, new_version, conflict_detected
+
+    def _save_versions(self, versions: list[IssueVersionHistory]) -> None:
+        if self.store:
+            self.store.save(versions)
 
     async def get_current_version(self, issue_id: str) -> IssueVersionHistory | None:
         """Get the current active version of an issue."""
@@ -237,34 +380,47 @@ class IssueVersioningService:
     ) -> list[IssueVersionHistory]:
         """Get complete version history for an issue."""
 
-        if issue_id not in self.version_history:
-            return []
-
-        versions = self.version_history[issue_id]
+        versions = self.version_history.get(issue_id, [])
 
         if not include_closed:
-            versions = [v for v in versions if v.valid_to is None]
+            return [v for v in versions if v.valid_to is None]
 
-        # Sort by version number
-        return sorted(versions, key=lambda x: x.version_number)
+        # Versions are kept in version number order
+        return list(versions)
 
     async def get_version_at_date(
         self, issue_id: str, target_date: date
     ) -> IssueVersionHistory | None:
         """Get the version that was active on a specific date."""
 
-        if issue_id not in self.version_history:
-            return None
-
-        versions = self.version_history[issue_id]
+        versions = self.version_history.get(issue_id, [])
 
-        for version in versions:
-            if version.valid_from <= target_date:
-                if version.valid_to is None or version.valid_to > target_date:
-                    return version
+        # Each version is valid from its valid_from until the next version's,
+        # so the answer is the latest version starting on or before the date
+        index = bisect_right(versions, target_date, key=lambda v: v.valid_from)
+        for version in reversed(versions[:index]):
+            if version.valid_to is None or version.valid_to > target_date:
+                return version
 
         return None
 
+    async def as_of(self, target_date: date) -> dict[str, IssueVersionHistory]:
+        """Get the version of every issue that was active on a specific date.
+
+        Reconstructs the issue set as it stood on a past date, e.g. the last
+        day of a Diet session. With a database store this is a single query.
+        """
+
+        if self.store:
+            return self.store.as_of(target_date)
+
+        snapshot = {}
+        for issue_id in self.version_history:
+            version = await self.get_version_at_date(issue_id, target_date)
+            if version:
+                snapshot[issue_id] = version
+        return snapshot
+
     async def rollback_to_version(
         self,
         issue_id: str,
@@ -400,27 +556,32 @@ class IssueVersioningService:
         if cutoff_date is None:
             cutoff_date = date.today() - timedelta(days=self.version_retention_days)
 
-        cleaned_count = 0
+        cleaned_ids = []
         retained_count = 0
 
         for issue_id, versions in self.version_history.items():
             # Always keep current version and recent versions
             current_version = await self.get_current_version(issue_id)
 
+            retained = []
             for version in versions:
                 if (
                     version.valid_to
                     and version.valid_to < cutoff_date
                     and version.version_id != current_version.version_id
-                ):
                     # Check if this version has rollback dependencies
-                    if not self._has_rollback_dependencies(version):
-                        versions.remove(version)
-                        cleaned_count += 1
-                    else:
-                        retained_count += 1
+                    and not self._has_rollback_dependencies(version)
+                ):
+                    cleaned_ids.append(version.version_id)
                 else:
-                    retained_count += 1
+                    retained.append(version)
+
+            versions[:] = retained
+            retained_count += len(retained)
+
+        if self.store:
+            self.store.delete(cleaned_ids)
+        cleaned_count = len(cleaned_ids)
 
         self.logger.info(
             f"Version cleanup: {cleaned_count} versions cleaned, {retained_count} retained"
@@ -447,10 +608,15 @@ class IssueVersioningService:
     async def bulk_migrate_versions(
         self, migration_rules: dict[str, Any], created_by: str = "system"
     ) -> dict[str, int]:
-        """Perform bulk version migration with new rules."""
+        """Perform bulk version migration with new rules.
+
+        Migrated versions are written to the store in batches once all issues
+        have been processed.
+        """
 
         migrated_count = 0
         failed_count = 0
+        changed_versions = []
 
         for issue_id in self.version_history.keys():
             try:
@@ -468,13 +634,14 @@ class IssueVersioningService:
                         current_version, migration_rules
                     )
 
-                    await self.create_new_version(
+                    closed_version, new_version, _ = await self._append_version(
                         issue_id=issue_id,
                         updated_record=migrated_record,
                         change_type=VersionChangeType.BULK_MIGRATION,
                         change_description=f"Bulk migration: {migration_rules.get('description', 'Schema update')}",
                         created_by=created_by,
                     )
+                    changed_versions.extend([closed_version, new_version])
 
                     migrated_count += 1
 
@@ -482,6 +649,14 @@ class IssueVersioningService:
                 self.logger.error(f"Failed to migrate issue {issue_id}: {e}")
                 failed_count += 1
 
+        try:
+            self._save_versions(changed_versions)
+        except SQLAlchemyError as e:
+            # Nothing was committed; drop the unsaved versions from memory
+            self.logger.error(f"Failed to store migrated versions: {e}")
+            self.version_history = self.store.load_history()
+            return {"migrated": 0, "failed": failed_count + migrated_count}
+
         self.logger.info(
             f"Bulk migration complete: {migrated_count} migrated, {failed_count} failed"
         )
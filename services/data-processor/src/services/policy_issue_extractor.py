@@ -1,22 +1,58 @@
 """
 Policy Issue Extraction Service - Extract dual-level policy issues from bills using LLM.
 Provides comprehensive issue extraction with validation for high school and general reader levels.
+
+Validated results are kept in an on-disk cache keyed by prompt version, model and
+a hash of the normalized bill content, so re-running extraction for unchanged
+bills does not call the LLM again.
+
+Requests are paced against the provider's token budget and their concurrency is
+adapted (AIMD) to observed latency and rate-limit responses.
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+import tempfile
+import unicodedata
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import openai
 from janome.tokenizer import Tokenizer
-from pydantic import BaseModel, ValidationError, validator
+from pydantic import BaseModel, ValidationError, field_validator
+
+from shared.utils.rate_limiter import AIMDConcurrencyLimiter, TokenBucketRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the prompts or the issue validation rules change, so that
+# results extracted with the previous prompts are no longer served from cache
+PROMPT_VERSION = "1"
+
+DEFAULT_CACHE_DIR = "/tmp/policy_issue_cache"
+
+# Provider token budget used for request pacing
+DEFAULT_TOKENS_PER_MINUTE = 40_000
+
+
+@functools.cache
+def get_tokenizer() -> Tokenizer:
+    """Shared Janome tokenizer.
+
+    Building a tokenizer loads the system dictionary, which takes far longer
+    than tokenizing a label and would otherwise block the event loop for every
+    validated issue.
+    """
+    return Tokenizer()
+
 
 @dataclass
 class BillData:
@@ -39,36 +75,39 @@ class DualLevelIssue(BaseModel):
     label_lv2: str
     confidence: float
 
-    @validator("label_lv1")
-    def validate_lv1_label(self, v):
+    @field_validator("label_lv1")
+    @classmethod
+    def validate_lv1_label(cls, v):
         # Length check
         if len(v) > 60:
             raise ValueError("label_lv1 must be ≤ 60 characters")
 
         # High school vocabulary check
-        if not self._is_high_school_vocabulary(v):
+        if not cls._is_high_school_vocabulary(v):
             raise ValueError("label_lv1 contains advanced vocabulary")
 
         # Verb ending check
-        if not self._ends_with_verb(v):
+        if not cls._ends_with_verb(v):
             raise ValueError("label_lv1 must end with a verb")
 
         return v
 
-    @validator("label_lv2")
-    def validate_lv2_label(self, v):
+    @field_validator("label_lv2")
+    @classmethod
+    def validate_lv2_label(cls, v):
         # Length check
         if len(v) > 60:
             raise ValueError("label_lv2 must be ≤ 60 characters")
 
         # Verb ending check
-        if not self._ends_with_verb(v):
+        if not cls._ends_with_verb(v):
             raise ValueError("label_lv2 must end with a verb")
 
         return v
 
-    @validator("confidence")
-    def validate_confidence(self, v):
+    @field_validator("confidence")
+    @classmethod
+    def validate_confidence(cls, v):
         if not 0.0 <= v <= 1.0:
             raise ValueError("confidence must be between 0.0 and 1.0")
         return v
@@ -77,7 +116,7 @@ class DualLevelIssue(BaseModel):
     def _ends_with_verb(cls, text: str) -> bool:
         """Check if text ends with a verb using Janome POS tagging."""
         try:
-            tokenizer = Tokenizer()
+            tokenizer = get_tokenizer()
             tokens = list(tokenizer.tokenize(text))
 
             if not tokens:
@@ -167,7 +206,7 @@ class IssueValidator:
     """Validator for extracted policy issues."""
 
     def __init__(self):
-        self.tokenizer = Tokenizer()
+        self.tokenizer = get_tokenizer()
 
     def validate_issue(self, issue: dict) -> ValidationResult:
         """Validate extracted issue data."""
@@ -258,48 +297,301 @@ class IssueValidator:
         return len(text) > 10 and not any(term in text for term in vague_terms[:3])
 
 
+class IssueExtractionCache:
+    """
+    Content-addressed on-disk cache for validated extraction results.
+
+    Entries are stored as JSON files sharded by the first two hex characters
+    of the key. Writes are atomic so that concurrent runs never observe
+    partially written entries, and entries read or written by this process
+    are also kept in memory.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: dict[str, dict[str, Any]] = {}
+        self.logger = logger
+
+    @staticmethod
+    def make_key(prompt_version: str, model: str, content_hash: str) -> str:
+        """Build a stable cache key for an extraction request."""
+        payload = json.dumps(
+            {
+                "prompt_version": prompt_version,
+                "model": model,
+                "content_hash": content_hash,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry, or None if not cached."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+
+        path = self._path_for(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable issue cache entry {path}: {e}")
+            return None
+
+        self._memory[key] = entry
+        return entry
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store an entry atomically."""
+        self._memory[key] = entry
+
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
 class PolicyIssueExtractor:
     """Main service for extracting dual-level policy issues from bills."""
 
-    def __init__(self, api_key: str | None = None):
-        self.client = openai.AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
-        if not self.client.api_key:
-            raise ValueError("OpenAI API key is required")
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache_dir: str | Path | None = None,
+        enable_cache: bool = True,
+        client: Any | None = None,
+        max_concurrency: int = 16,
+        tokens_per_minute: int | None = None,
+    ):
+        if client is None:
+            client = openai.AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+            if not client.api_key:
+                raise ValueError("OpenAI API key is required")
+        self.client = client
 
         self.validator = IssueValidator()
         self.logger = logger
 
+        # Model settings
+        self.model_name = "gpt-4"
+        self.temperature = 0.2
+        self.max_tokens = 800
+
         # Rate limiting settings
         self.max_retries = 3
         self.retry_delay = 2.0
+        self.tokens_per_minute = tokens_per_minute or int(
+            os.getenv("OPENAI_TOKENS_PER_MINUTE", DEFAULT_TOKENS_PER_MINUTE)
+        )
+        self.token_limiter = TokenBucketRateLimiter(
+            rate=self.tokens_per_minute / 60,
+            burst=self.tokens_per_minute,
+            name="openai-tokens",
+        )
+        # Completions slower than the latency target count as congestion
+        self.concurrency = AIMDConcurrencyLimiter(
+            initial=min(4, max_concurrency),
+            maximum=max_concurrency,
+            latency_target=45.0,
+            name="openai-completions",
+        )
+
+        # Result cache
+        self.cache = (
+            IssueExtractionCache(
+                cache_dir or os.getenv("POLICY_ISSUE_CACHE_DIR", DEFAULT_CACHE_DIR)
+            )
+            if enable_cache
+            else None
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._inflight: dict[str, asyncio.Task] = {}
 
     async def extract_dual_level_issues(
         self, bill_data: BillData
     ) -> list[DualLevelIssue]:
         """Extract issues at both high school and general reader levels."""
+        issues, _, _ = await self._extract_with_cache(bill_data)
+        return issues
+
+    @staticmethod
+    def _content_hash(bill_data: BillData) -> str:
+        """Hash the normalized bill content that goes into the prompt."""
+
+        def normalize(text: str | None) -> str:
+            text = unicodedata.normalize("NFKC", text or "")
+            return re.sub(r"\s+", " ", text).strip()
+
+        content = [
+            normalize(bill_data.title),
+            normalize(bill_data.outline),
+            normalize(bill_data.background_context),
+            normalize(bill_data.expected_effects),
+            [
+                normalize(provision)
+                for provision in (bill_data.key_provisions or [])[:3]
+            ],
+        ]
+        payload = json.dumps(content, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_key(self, bill_data: BillData) -> str:
+        return IssueExtractionCache.make_key(
+            PROMPT_VERSION, self.model_name, self._content_hash(bill_data)
+        )
+
+    def _lookup_cached(
+        self, bill_data: BillData
+    ) -> tuple[list[DualLevelIssue], list[float]] | None:
+        """Return cached issues and quality scores for a bill, if any."""
+        if self.cache is None:
+            return None
+
+        entry = self.cache.get(self._cache_key(bill_data))
+        if entry is None:
+            return None
+
+        self.cache_hits += 1
+        # Entries only ever hold issues that already passed validation
+        issues = [DualLevelIssue.model_construct(**issue) for issue in entry["issues"]]
+        return issues, entry["quality_scores"]
+
+    async def _extract_with_cache(
+        self, bill_data: BillData
+    ) -> tuple[list[DualLevelIssue], list[float], bool]:
+        """Extract issues and quality scores, serving them from cache if possible.
+
+        Returns the issues, their quality scores and whether the result came
+        from the cache. Identical content requested concurrently is extracted
+        only once.
+        """
+        cached = self._lookup_cached(bill_data)
+        if cached is not None:
+            return *cached, True
+
+        if self.cache is None:
+            self.cache_misses += 1
+            issues, quality_scores = await self._extract_and_score(bill_data)
+            return issues, quality_scores, False
+
+        key = self._cache_key(bill_data)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.cache_hits += 1
+            issues, quality_scores = await asyncio.shield(task)
+            return issues, quality_scores, True
+
+        self.cache_misses += 1
+        task = asyncio.ensure_future(self._extract_and_store(bill_data, key))
+        self._inflight[key] = task
+        try:
+            issues, quality_scores = await task
+        finally:
+            self._inflight.pop(key, None)
+        return issues, quality_scores, False
+
+    async def _extract_and_store(
+        self, bill_data: BillData, key: str
+    ) -> tuple[list[DualLevelIssue], list[float]]:
+        """Extract issues from the LLM and store the validated result."""
+        issues, quality_scores = await self._extract_and_score(bill_data)
+
+        try:
+            self.cache.put(
+                key,
+                {
+                    "bill_id": bill_data.id,
+                    "prompt_version": PROMPT_VERSION,
+                    "model": self.model_name,
+                    "cached_at": datetime.now().isoformat(),
+                    "issues": [issue.model_dump() for issue in issues],
+                    "quality_scores": quality_scores,
+                },
+            )
+        except OSError as e:
+            self.logger.warning(f"Failed to cache issues for bill {bill_data.id}: {e}")
+
+        return issues, quality_scores
+
+    async def _extract_and_score(
+        self, bill_data: BillData
+    ) -> tuple[list[DualLevelIssue], list[float]]:
+        issues = await self._request_issues(bill_data)
+        quality_scores = [
+            self.validator._calculate_quality_score(issue) for issue in issues
+        ]
+        return issues, quality_scores
+
+    async def _request_issues(self, bill_data: BillData) -> list[DualLevelIssue]:
+        """Call the LLM and return the validated issues."""
 
         prompt = self._build_dual_level_prompt(bill_data)
+        system_prompt = self._get_system_prompt()
+        estimated_tokens = self._estimate_tokens(system_prompt, prompt)
 
         for attempt in range(self.max_retries):
             try:
-                response = await self.client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": self._get_system_prompt()},
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.2,
-                    max_tokens=800,
-                )
+                await self.token_limiter.acquire(estimated_tokens)
+                started_at = await self.concurrency.acquire()
+                succeeded = rate_limited = False
+                try:
+                    response = await self.client.chat.completions.create(
+                        model=self.model_name,
+                        messages=[
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                    )
+                    succeeded = True
+                except openai.RateLimitError:
+                    rate_limited = True
+                    raise
+                finally:
+                    self.concurrency.release(
+                        started_at, rate_limited=rate_limited, failed=not succeeded
+                    )
 
                 return await self._parse_and_validate_response(response)
 
             except Exception as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
-                else:
+                if attempt >= self.max_retries - 1:
                     raise e
+                if isinstance(e, openai.RateLimitError):
+                    # Hold back every request, not just this one, until the
+                    # provider accepts requests again
+                    self.token_limiter.pause_for_retry_after(
+                        e.response.headers, default=self.retry_delay * (attempt + 1)
+                    )
+                else:
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+
+    def _estimate_tokens(self, system_prompt: str, prompt: str) -> int:
+        """Upper estimate of the tokens a request uses against the budget.
+
+        Japanese text encodes to roughly one token per character or less, so
+        the character count bounds the prompt tokens; the completion may use
+        up to ``max_tokens``.
+        """
+        tokens = len(system_prompt) + len(prompt) + self.max_tokens
+        return min(tokens, self.token_limiter.burst)
 
     def _build_dual_level_prompt(self, bill_data: BillData) -> str:
         """Build prompt for dual-level issue extraction."""
@@ -432,34 +724,12 @@ NGパターン:
         start_time = datetime.now()
 
         try:
-            issues = await self.extract_dual_level_issues(bill_data)
-
-            processing_time = (datetime.now() - start_time).total_seconds()
-
-            # Calculate overall quality metrics
-            quality_scores = []
-            for issue in issues:
-                validation_result = self.validator.validate_issue(issue.dict())
-                quality_scores.append(validation_result.quality_score)
-
-            avg_quality = (
-                sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
+            issues, quality_scores, cache_hit = await self._extract_with_cache(
+                bill_data
+            )
+            return self._build_result(
+                bill_data, issues, quality_scores, start_time, cache_hit
             )
-
-            return {
-                "bill_id": bill_data.id,
-                "issues": [issue.dict() for issue in issues],
-                "metadata": {
-                    "extraction_timestamp": start_time.isoformat(),
-                    "processing_time_seconds": processing_time,
-                    "issue_count": len(issues),
-                    "average_quality_score": avg_quality,
-                    "individual_quality_scores": quality_scores,
-                    "model_used": "gpt-4",
-                    "extractor_version": "1.0.0",
-                },
-                "status": "success",
-            }
 
         except Exception as e:
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -472,90 +742,173 @@ NGパターン:
                     "processing_time_seconds": processing_time,
                     "issue_count": 0,
                     "error": str(e),
-                    "model_used": "gpt-4",
+                    "model_used": self.model_name,
                     "extractor_version": "1.0.0",
                 },
                 "status": "failed",
             }
 
-    async def batch_extract_issues(
+    def _build_result(
         self,
-        bills: list[BillData],
-        batch_size: int = 5,
-        delay_between_batches: float = 2.0,
-    ) -> list[dict[str, Any]]:
-        """Extract issues from multiple bills in batches."""
-
-        self.logger.info(f"Starting batch extraction for {len(bills)} bills")
-
-        results = []
+        bill_data: BillData,
+        issues: list[DualLevelIssue],
+        quality_scores: list[float],
+        start_time: datetime,
+        cache_hit: bool,
+    ) -> dict[str, Any]:
+        """Build the successful extraction result with metadata."""
+        processing_time = (datetime.now() - start_time).total_seconds()
+
+        # Calculate overall quality metrics
+        avg_quality = (
+            sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
+        )
 
-        for i in range(0, len(bills), batch_size):
-            batch = bills[i : i + batch_size]
+        return {
+            "bill_id": bill_data.id,
+            "issues": [issue.dict() for issue in issues],
+            "metadata": {
+                "extraction_timestamp": start_time.isoformat(),
+                "processing_time_seconds": processing_time,
+                "issue_count": len(issues),
+                "average_quality_score": avg_quality,
+                "individual_quality_scores": quality_scores,
+                "model_used": self.model_name,
+                "extractor_version": "1.0.0",
+                "prompt_version": PROMPT_VERSION,
+                "cache_hit": cache_hit,
+            },
+            "status": "success",
+        }
 
-            self.logger.info(
-                f"Processing batch {i // batch_size + 1}: {len(batch)} bills"
-            )
+    async def batch_extract_issues(self, bills: list[BillData]) -> list[dict[str, Any]]:
+        """Extract issues from multiple bills, returning results in input order."""
+        results: list[dict[str, Any] | None] = [None] * len(bills)
+        async for index, result in self._extract_as_completed(bills):
+            results[index] = result
+        return results
 
-            # Process batch concurrently
-            tasks = [self.extract_issues_with_metadata(bill) for bill in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def stream_extract_issues(
+        self, bills: list[BillData]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Extract issues from multiple bills, yielding results as they complete."""
+        async for _, result in self._extract_as_completed(bills):
+            yield result
+
+    async def _extract_as_completed(
+        self, bills: list[BillData]
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Sliding-window scheduler over the bills.
+
+        Bills with cached results are answered up front. The rest are started
+        as soon as a slot in the adaptive concurrency window frees up, so one
+        slow completion never holds back the others. Yields ``(index, result)``
+        in completion order.
+        """
+        self.logger.info(f"Starting batch extraction for {len(bills)} bills")
 
-            # Handle results and exceptions
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(
-                        f"Batch processing failed for bill {batch[j].id}: {result}"
+        pending: list[int] = []
+        for index, bill in enumerate(bills):
+            start_time = datetime.now()
+            cached = self._lookup_cached(bill)
+            if cached is not None:
+                yield index, self._build_result(bill, *cached, start_time, True)
+            else:
+                pending.append(index)
+
+        self.logger.info(
+            f"{len(bills) - len(pending)} bills served from cache, "
+            f"{len(pending)} to extract"
+        )
+
+        queue = iter(pending)
+        in_flight: dict[asyncio.Task, int] = {}
+        try:
+            while True:
+                # Refill the window up to the current concurrency limit
+                while len(in_flight) < self.concurrency.limit:
+                    index = next(queue, None)
+                    if index is None:
+                        break
+                    task = asyncio.create_task(
+                        self.extract_issues_with_metadata(bills[index])
                     )
-                    error_result = {
-                        "bill_id": batch[j].id,
-                        "issues": [],
-                        "metadata": {
-                            "extraction_timestamp": datetime.now().isoformat(),
-                            "error": str(result),
-                            "model_used": "gpt-4",
-                            "extractor_version": "1.0.0",
-                        },
-                        "status": "failed",
-                    }
-                    results.append(error_result)
-                else:
-                    results.append(result)
-
-            # Rate limiting between batches
-            if i + batch_size < len(bills):
-                await asyncio.sleep(delay_between_batches)
+                    in_flight[task] = index
 
-        self.logger.info(f"Batch extraction completed: {len(results)} results")
+                if not in_flight:
+                    break
 
-        return results
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index = in_flight.pop(task)
+                    yield index, self._task_result(task, bills[index])
+        finally:
+            # The caller stopped consuming results early
+            for task in in_flight:
+                task.cancel()
+
+        self.logger.info(f"Batch extraction completed: {len(bills)} results")
+
+    def _task_result(self, task: asyncio.Task, bill: BillData) -> dict[str, Any]:
+        """Result of a finished extraction task, or an error result."""
+        try:
+            return task.result()
+        except Exception as e:
+            self.logger.error(f"Batch processing failed for bill {bill.id}: {e}")
+            return {
+                "bill_id": bill.id,
+                "issues": [],
+                "metadata": {
+                    "extraction_timestamp": datetime.now().isoformat(),
+                    "error": str(e),
+                    "model_used": self.model_name,
+                    "extractor_version": "1.0.0",
+                },
+                "status": "failed",
+            }
 
     async def health_check(self) -> bool:
-        """Check if the service is healthy."""
-        try:
-            test_bill = BillData(
-                id="health_check",
-                title="テスト法案",
-                outline="健康チェック用のテスト法案です。",
-            )
+        """Check if the service is healthy.
 
-            issues = await self.extract_dual_level_issues(test_bill)
-            return len(issues) > 0
+        Only looks up the configured model, which costs no tokens, instead of
+        running a full extraction.
+        """
+        try:
+            await self.client.models.retrieve(self.model_name)
+            return True
 
         except Exception as e:
             self.logger.error(f"Health check failed: {e}")
             return False
 
+    def get_cache_statistics(self) -> dict[str, Any]:
+        """Get result cache hit-rate statistics."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "enabled": self.cache is not None,
+            "cache_dir": str(self.cache.cache_dir) if self.cache else None,
+            "prompt_version": PROMPT_VERSION,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+        }
+
     def get_statistics(self) -> dict[str, Any]:
         """Get service statistics."""
         return {
             "service_name": "PolicyIssueExtractor",
             "version": "1.0.0",
-            "model": "gpt-4",
+            "model": self.model_name,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
             "validator_class": "IssueValidator",
             "supported_levels": ["high_school", "general_reader"],
             "max_characters": 60,
             "language": "japanese",
+            "cache": self.get_cache_statistics(),
+            "tokens_per_minute": self.tokens_per_minute,
+            "concurrency": self.concurrency.get_metrics(),
+            "token_limiter": self.token_limiter.get_metrics(),
         }
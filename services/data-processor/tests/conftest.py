@@ -16,6 +16,14 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+# Processor modules import the bill data classes from ``src.scraper``, which
+# lives in the diet-scraper service; resolve that subpackage from there
+import src  # noqa: E402
+
+src.__path__.append(
+    os.path.join(os.path.dirname(__file__), "..", "..", "diet-scraper", "src")
+)
+
 # Test environment configuration
 os.environ.update(
     {
@@ -28,231 +28,9 @@ from ..src.migration.data_quality_auditor import (
     QualityIssue,
     QualityIssueSeverity,
     QualityIssueType,
-    QualityMetrics,
-    QualityReport,
 )
 
 
-class TestDataQualityAuditor:
-    """Test data quality auditor functionality"""
-
-    @pytest.fixture
-    def mock_engine(self):
-        """Create mock database engine"""
-        engine = Mock()
-        engine.connect.return_value.__enter__.return_value = Mock()
-        return engine
-
-    @pytest.fixture
-    def quality_auditor(self, mock_engine):
-        """Create test quality auditor"""
-        with patch("sqlalchemy.create_engine", return_value=mock_engine):
-            return DataQualityAuditor("postgresql://test")
-
-    def test_auditor_initialization(self, quality_auditor):
-        """Test auditor initialization"""
-        assert quality_auditor.database_url == "postgresql://test"
-        assert quality_auditor.quality_thresholds["completeness_min"] == 0.8
-        assert len(quality_auditor.required_fields) > 0
-        assert len(quality_auditor.enhanced_fields) > 0
-
-    def test_calculate_overall_metrics(self, quality_auditor):
-        """Test overall metrics calculation"""
-        # Create mock bills
-        bills = [
-            Mock(
-                bill_id="test-1",
-                title="Test Bill 1",
-                status="審議中",
-                submitter="政府",
-                diet_session="204",
-                house_of_origin="参議院",
-                submitted_date="2021-01-01",
-                updated_at=datetime.now(),
-            ),
-            Mock(
-                bill_id="test-2",
-                title="Test Bill 2",
-                status="成立",
-                submitter="議員",
-                diet_session="204",
-                house_of_origin="衆議院",
-                submitted_date="2021-02-01",
-                updated_at=datetime.now(),
-            ),
-        ]
-
-        # Mock required methods
-        quality_auditor._is_bill_valid = Mock(return_value=True)
-        quality_auditor._calculate_accuracy_rate = Mock(return_value=0.9)
-        quality_auditor._calculate_consistency_rate = Mock(return_value=0.85)
-        quality_auditor._calculate_timeliness_rate = Mock(return_value=0.8)
-
-        metrics = quality_auditor._calculate_overall_metrics(bills)
-
-        assert metrics.total_records == 2
-        assert metrics.valid_records == 2
-        assert metrics.completeness_rate == 1.0
-        assert metrics.accuracy_rate == 0.9
-        assert metrics.consistency_rate == 0.85
-        assert metrics.timeliness_rate == 0.8
-        assert metrics.overall_quality_score > 0
-
-    def test_detect_quality_issues(self, quality_auditor):
-        """Test quality issue detection"""
-        # Create bill with issues
-        bill = Mock(
-            bill_id="test-bill-1",
-            title="",  # Empty title
-            status="invalid_status",  # Invalid status
-            submitter=None,  # Missing submitter
-            diet_session="204",
-            house_of_origin="参議院",
-            submitted_date="2021-01-01",
-            updated_at=datetime.now(),
-            bill_outline=None,  # Missing enhanced field
-            background_context="短",  # Too short
-            expected_effects=None,
-        )
-
-        # Mock helper methods
-        quality_auditor._check_required_fields = Mock(
-            return_value=[
-                QualityIssue(
-                    bill_id="test-bill-1",
-                    issue_type=QualityIssueType.EMPTY_FIELD,
-                    severity=QualityIssueSeverity.HIGH,
-                    field_name="title",
-                    description="Title is empty",
-                    current_value="",
-                    suggested_fix="Add title",
-                    confidence=1.0,
-                )
-            ]
-        )
-
-        quality_auditor._check_enhanced_fields = Mock(
-            return_value=[
-                QualityIssue(
-                    bill_id="test-bill-1",
-                    issue_type=QualityIssueType.MISSING_REQUIRED_FIELD,
-                    severity=QualityIssueSeverity.HIGH,
-                    field_name="bill_outline",
-                    description="Bill outline is missing",
-                    current_value=None,
-                    suggested_fix="Extract bill outline",
-                    confidence=0.9,
-                )
-            ]
-        )
-
-        quality_auditor._check_data_consistency = Mock(return_value=[])
-        quality_auditor._check_japanese_text_quality = Mock(return_value=[])
-        quality_auditor._check_data_freshness = Mock(return_value=[])
-
-        issues = quality_auditor._detect_quality_issues([bill])
-
-        assert len(issues) == 2
-        assert any(issue.field_name == "title" for issue in issues)
-        assert any(issue.field_name == "bill_outline" for issue in issues)
-
-    def test_is_japanese_text_quality_good(self, quality_auditor):
-        """Test Japanese text quality validation"""
-        # Good Japanese text
-        good_text = "この法案は、デジタル社会の形成を目的としています。"
-        assert quality_auditor._is_japanese_text_quality_good(good_text)
-
-        # Too short
-        short_text = "短い"
-        assert not quality_auditor._is_japanese_text_quality_good(short_text)
-
-        # No Japanese characters
-        english_text = "This is English text only and should fail"
-        assert not quality_auditor._is_japanese_text_quality_good(english_text)
-
-    def test_calculate_bill_quality_score(self, quality_auditor):
-        """Test bill quality score calculation"""
-        # High quality bill
-        high_quality_bill = Mock(
-            title="デジタル社会形成基本法案",
-            status="審議中",
-            bill_outline="本法案は、デジタル社会の形成を推進し、国民の利便性向上を図ることを目的とする。",
-            background_context="近年のデジタル化の進展に伴い、行政手続きのデジタル化が急務となっている。",
-            expected_effects="本法案により、行政手続きの効率化が期待される。",
-        )
-
-        # Mock helper methods
-        quality_auditor._is_field_value_valid = Mock(return_value=True)
-        quality_auditor._is_japanese_text_quality_good = Mock(return_value=True)
-
-        score = quality_auditor._calculate_bill_quality_score(high_quality_bill)
-        assert score > 0.8
-
-        # Low quality bill
-        low_quality_bill = Mock(
-            title="テスト",
-            status="審議中",
-            bill_outline=None,
-            background_context=None,
-            expected_effects=None,
-        )
-
-        quality_auditor._is_field_value_valid = Mock(
-            side_effect=lambda field, value: value is not None
-        )
-
-        score = quality_auditor._calculate_bill_quality_score(low_quality_bill)
-        assert score < 0.5
-
-    @patch("sqlalchemy.orm.sessionmaker")
-    def test_conduct_full_audit(self, mock_session_maker, quality_auditor):
-        """Test full audit process"""
-        # Mock session
-        mock_session = Mock()
-        mock_session_maker.return_value = mock_session
-        mock_session.__enter__.return_value = mock_session
-
-        # Mock bills
-        mock_bills = [
-            Mock(bill_id="test-1", title="Test Bill 1"),
-            Mock(bill_id="test-2", title="Test Bill 2"),
-        ]
-        mock_session.execute.return_value.scalars.return_value.all.return_value = (
-            mock_bills
-        )
-
-        # Mock methods
-        quality_auditor._calculate_overall_metrics = Mock(
-            return_value=QualityMetrics(
-                total_records=2,
-                valid_records=2,
-                invalid_records=0,
-                completeness_rate=1.0,
-                accuracy_rate=0.9,
-                consistency_rate=0.85,
-                timeliness_rate=0.8,
-                overall_quality_score=0.88,
-            )
-        )
-
-        quality_auditor._analyze_field_quality = Mock(
-            return_value={"title": QualityMetrics(2, 2, 0, 1.0, 0.9, 0.85, 0.8, 0.88)}
-        )
-
-        quality_auditor._detect_quality_issues = Mock(return_value=[])
-        quality_auditor._generate_recommendations = Mock(
-            return_value=["Test recommendation"]
-        )
-        quality_auditor._determine_improvement_priorities = Mock(return_value=[])
-
-        report = quality_auditor.conduct_full_audit()
-
-        assert isinstance(report, QualityReport)
-        assert report.total_bills == 2
-        assert report.overall_metrics.total_records == 2
-        assert len(report.recommendations) > 0
-
-
 class TestDataCompletionProcessor:
     """Test data completion processor functionality"""
 
@@ -12,7 +12,6 @@ from bs4 import BeautifulSoup
 from ..src.processor.bill_data_merger import (
     BillDataMerger,
     ConflictResolutionStrategy,
-    MergeResult,
 )
 from ..src.processor.bill_data_validator import (
     BillDataValidator,
@@ -322,298 +321,6 @@ class TestShugiinScraper:
         assert bills[1].submitter == "議員"
 
 
-class TestBillDataMerger:
-    """Test cases for BillDataMerger"""
-
-    @pytest.fixture
-    def merger(self):
-        """Create test merger instance"""
-        return BillDataMerger(
-            conflict_strategy=ConflictResolutionStrategy.MOST_COMPLETE,
-            similarity_threshold=0.7,
-        )
-
-    @pytest.fixture
-    def sample_sangiin_bill(self):
-        """Sample Sangiin bill"""
-        return EnhancedBillData(
-            bill_id="sangiin-1",
-            title="デジタル社会形成基本法案",
-            submission_date=datetime(2021, 2, 9),
-            status="審議中",
-            stage="審議中",
-            submitter="政府",
-            category="行政・公務員",
-            url="http://sangiin.go.jp/bill/1",
-            bill_outline="デジタル社会形成に関する基本的な法案",
-            diet_session="204",
-            house_of_origin="参議院",
-            source_house="参議院",
-            data_quality_score=0.8,
-        )
-
-    @pytest.fixture
-    def sample_shugiin_bill(self):
-        """Sample Shugiin bill"""
-        return ShugiinBillData(
-            bill_id="shugiin-1",
-            title="デジタル社会形成基本法案",
-            submission_date=datetime(2021, 2, 9),
-            status="審議中",
-            stage="審議中",
-            submitter="政府",
-            category="行政・公務員",
-            url="http://shugiin.go.jp/bill/1",
-            supporting_members=["議員A", "議員B", "議員C"],
-            diet_session="204",
-            house_of_origin="衆議院",
-            source_house="衆議院",
-            data_quality_score=0.7,
-        )
-
-    def test_calculate_similarity_score(
-        self, merger, sample_sangiin_bill, sample_shugiin_bill
-    ):
-        """Test similarity score calculation"""
-        score = merger._calculate_similarity_score(
-            sample_sangiin_bill, sample_shugiin_bill
-        )
-
-        assert score > 0.8  # Should be high similarity
-        assert score <= 1.0
-
-    def test_find_matching_bills(
-        self, merger, sample_sangiin_bill, sample_shugiin_bill
-    ):
-        """Test bill matching"""
-        sangiin_bills = [sample_sangiin_bill]
-        shugiin_bills = [sample_shugiin_bill]
-
-        matches = merger._find_matching_bills(sangiin_bills, shugiin_bills)
-
-        assert len(matches) == 1
-        assert matches[sample_sangiin_bill.bill_id] == sample_shugiin_bill
-
-    def test_merge_bill_pair(self, merger, sample_sangiin_bill, sample_shugiin_bill):
-        """Test bill pair merging"""
-        result = merger._merge_bill_pair(sample_sangiin_bill, sample_shugiin_bill)
-
-        assert isinstance(result, MergeResult)
-        assert result.merged_bill.bill_id == sample_sangiin_bill.bill_id
-        assert result.merged_bill.title == sample_sangiin_bill.title
-        assert result.merged_bill.source_house == "両院"
-        assert (
-            result.merged_bill.supporting_members
-            == sample_shugiin_bill.supporting_members
-        )
-        assert result.merge_quality_score > 0.0
-
-    def test_resolve_field_conflict(self, merger):
-        """Test field conflict resolution"""
-        # Test no conflict
-        merged_value, conflict = merger._resolve_field_conflict(
-            "title", "同じタイトル", "同じタイトル"
-        )
-        assert merged_value == "同じタイトル"
-        assert conflict is None
-
-        # Test conflict with different values
-        merged_value, conflict = merger._resolve_field_conflict(
-            "bill_outline", "短い説明", "より長い詳細な説明文"
-        )
-        assert merged_value == "より長い詳細な説明文"  # Should choose longer text
-        assert conflict is not None
-        assert conflict.field_name == "bill_outline"
-
-    def test_merge_bills(self, merger, sample_sangiin_bill, sample_shugiin_bill):
-        """Test complete bill merging"""
-        sangiin_bills = [sample_sangiin_bill]
-        shugiin_bills = [sample_shugiin_bill]
-
-        results = merger.merge_bills(sangiin_bills, shugiin_bills)
-
-        assert len(results) == 1
-        assert results[0].merged_bill.source_house == "両院"
-        assert len(results[0].source_info["sources"]) == 2
-        assert results[0].merge_quality_score > 0.0
-
-    def test_get_merge_statistics(self, merger):
-        """Test merge statistics"""
-        # Mock merge results
-        mock_results = [
-            MergeResult(
-                merged_bill=EnhancedBillData(
-                    bill_id="1",
-                    title="法案1",
-                    submission_date=None,
-                    status="審議中",
-                    stage="審議中",
-                    submitter="政府",
-                    category="その他",
-                    url="http://example.com",
-                ),
-                conflicts=[],
-                merge_quality_score=0.9,
-                source_info={
-                    "sources": ["sangiin", "shugiin"],
-                    "primary_source": "sangiin",
-                },
-            ),
-            MergeResult(
-                merged_bill=EnhancedBillData(
-                    bill_id="2",
-                    title="法案2",
-                    submission_date=None,
-                    status="審議中",
-                    stage="審議中",
-                    submitter="政府",
-                    category="その他",
-                    url="http://example.com",
-                ),
-                conflicts=[],
-                merge_quality_score=0.8,
-                source_info={"sources": ["sangiin"], "primary_source": "sangiin"},
-            ),
-        ]
-
-        stats = merger.get_merge_statistics(mock_results)
-
-        assert stats["total_bills"] == 2
-        assert stats["both_houses"] == 1
-        assert stats["sangiin_only"] == 1
-        assert stats["shugiin_only"] == 0
-        assert stats["avg_quality_score"] == 0.85
-
-
-class TestBillDataValidator:
-    """Test cases for BillDataValidator"""
-
-    @pytest.fixture
-    def validator(self):
-        """Create test validator instance"""
-        return BillDataValidator(strict_mode=False, require_japanese=True)
-
-    @pytest.fixture
-    def valid_bill(self):
-        """Valid bill data"""
-        return EnhancedBillData(
-            bill_id="valid-1",
-            title="有効な法案",
-            submission_date=datetime(2021, 2, 9),
-            status="審議中",
-            stage="審議中",
-            submitter="政府",
-            category="行政・公務員",
-            url="http://example.com/bill/1",
-            bill_outline="この法案は重要な改正を行うものである。",
-            diet_session="204",
-            house_of_origin="参議院",
-            source_house="参議院",
-            data_quality_score=0.8,
-        )
-
-    @pytest.fixture
-    def invalid_bill(self):
-        """Invalid bill data"""
-        return EnhancedBillData(
-            bill_id="",  # Missing required field
-            title="Invalid Bill",  # No Japanese
-            submission_date=None,
-            status="invalid_status",  # Invalid status
-            stage="invalid_stage",  # Invalid stage
-            submitter="invalid_submitter",  # Invalid submitter
-            category="invalid_category",  # Invalid category
-            url="http://example.com/bill/1",
-            data_quality_score=1.5,  # Out of range
-        )
-
-    def test_validate_required_fields(self, validator, valid_bill, invalid_bill):
-        """Test required field validation"""
-        # Valid bill
-        result = validator.validate_bill(valid_bill, "standard")
-        required_issues = [
-            issue
-            for issue in result.issues
-            if issue.issue_type == "missing_required_field"
-        ]
-        assert len(required_issues) == 0
-
-        # Invalid bill
-        result = validator.validate_bill(invalid_bill, "standard")
-        required_issues = [
-            issue
-            for issue in result.issues
-            if issue.issue_type == "missing_required_field"
-        ]
-        assert len(required_issues) > 0
-
-    def test_validate_field_formats(self, validator, invalid_bill):
-        """Test field format validation"""
-        result = validator.validate_bill(invalid_bill, "standard")
-
-        format_issues = [
-            issue for issue in result.issues if issue.issue_type == "invalid_format"
-        ]
-        assert len(format_issues) > 0
-
-    def test_validate_data_consistency(self, validator, invalid_bill):
-        """Test data consistency validation"""
-        result = validator.validate_bill(invalid_bill, "standard")
-
-        consistency_issues = [
-            issue
-            for issue in result.issues
-            if issue.issue_type in ["invalid_value", "out_of_range"]
-        ]
-        assert len(consistency_issues) > 0
-
-    def test_validate_japanese_content(self, validator, valid_bill):
-        """Test Japanese content validation"""
-        result = validator.validate_bill(valid_bill, "standard")
-
-        japanese_issues = [
-            issue
-            for issue in result.issues
-            if issue.issue_type == "missing_japanese_text"
-        ]
-        # Should have no issues for valid Japanese content
-        assert len(japanese_issues) == 0
-
-    def test_calculate_completeness_score(self, validator, valid_bill, invalid_bill):
-        """Test completeness score calculation"""
-        # Valid bill should have high completeness
-        valid_score = validator._calculate_completeness_score(valid_bill, "standard")
-        assert valid_score > 0.7
-
-        # Invalid bill should have low completeness
-        invalid_score = validator._calculate_completeness_score(
-            invalid_bill, "standard"
-        )
-        assert invalid_score < 0.5
-
-    def test_validate_bills(self, validator, valid_bill, invalid_bill):
-        """Test multiple bills validation"""
-        bills = [valid_bill, invalid_bill]
-        results = validator.validate_bills(bills, "standard")
-
-        assert len(results) == 2
-        assert results[0].is_valid is True
-        assert results[1].is_valid is False
-
-    def test_get_validation_summary(self, validator, valid_bill, invalid_bill):
-        """Test validation summary"""
-        bills = [valid_bill, invalid_bill]
-        results = validator.validate_bills(bills, "standard")
-        summary = validator.get_validation_summary(results)
-
-        assert summary["total_bills"] == 2
-        assert summary["valid_bills"] == 1
-        assert summary["invalid_bills"] == 1
-        assert summary["validation_rate"] == 0.5
-        assert "avg_quality_score" in summary
-        assert "common_issues" in summary
-
-
 class TestIntegration:
     """Integration tests for the complete pipeline"""
 
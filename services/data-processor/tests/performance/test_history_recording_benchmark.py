@@ -0,0 +1,105 @@
+"""
+Benchmark for streamed bill history change detection.
+
+Runs full scans against a file-backed SQLite database and reports throughput
+and peak Python memory. Memory must stay roughly flat as the number of bills
+grows, since bills are streamed in fixed-size batches.
+"""
+
+import time
+import tracemalloc
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import insert, update
+from src.processor.bill_history_recorder import BillHistoryRecorder
+
+from shared.models.bill_change_history import BillChangeHistoryRecord
+from shared.models.bill_record import BillRecord
+from shared.models.bill_snapshot import BillSnapshotRecord
+
+BATCH_SIZE = 500
+
+
+def seed_bills(recorder: BillHistoryRecorder, count: int) -> None:
+    """Insert ``count`` synthetic bills"""
+    now = datetime.now(UTC)
+    with recorder.engine.begin() as connection:
+        connection.execute(
+            insert(BillRecord),
+            [
+                {
+                    "bill_number": f"bill-{i:06d}",
+                    "title": f"テスト法案{i}",
+                    "status": "UNDER_REVIEW",
+                    "inter_house_status": "衆議院審議中",
+                    "submitter_type": "government",
+                    "diet_session": "217",
+                    "bill_outline": f"法案{i}の概要" * 20,
+                    "data_quality_score": 0.8,
+                    "updated_at": now,
+                }
+                for i in range(count)
+            ],
+        )
+
+
+def run_full_scan(recorder: BillHistoryRecorder) -> tuple[float, int, object]:
+    """Run a full scan and return (seconds, peak traced bytes, result)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = recorder.force_full_scan()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestHistoryRecordingBenchmark:
+    """Throughput and memory of streamed change detection"""
+
+    def make_recorder(self, tmp_path, name: str) -> BillHistoryRecorder:
+        recorder = BillHistoryRecorder(f"sqlite:///{tmp_path / name}")
+        for table in (BillRecord, BillChangeHistoryRecord, BillSnapshotRecord):
+            table.__table__.create(recorder.engine)
+        recorder.config["max_bills_per_batch"] = BATCH_SIZE
+        return recorder
+
+    @pytest.mark.parametrize("bill_count", [2_000, 10_000])
+    def test_full_scan_throughput(self, tmp_path, bill_count):
+        recorder = self.make_recorder(tmp_path, "throughput.db")
+        seed_bills(recorder, bill_count)
+
+        # First scan records initial snapshots only
+        elapsed, _, result = run_full_scan(recorder)
+        assert result.total_bills_checked == bill_count
+        assert result.changes_detected == 0
+        print(f"\ninitial scan: {bill_count / elapsed:,.0f} bills/s")
+
+        # Change the status of every tenth bill
+        with recorder.engine.begin() as connection:
+            connection.execute(
+                update(BillRecord)
+                .where(BillRecord.bill_number.like("%0"))
+                .values(status="PASSED")
+            )
+
+        elapsed, _, result = run_full_scan(recorder)
+        assert result.history_records_created == bill_count // 10
+        assert result.bills_unchanged == bill_count - bill_count // 10
+        print(f"change scan: {bill_count / elapsed:,.0f} bills/s")
+
+    def test_memory_is_flat_in_bill_count(self, tmp_path):
+        small = self.make_recorder(tmp_path, "small.db")
+        large = self.make_recorder(tmp_path, "large.db")
+        seed_bills(small, 2 * BATCH_SIZE)
+        seed_bills(large, 20 * BATCH_SIZE)
+
+        _, small_peak, _ = run_full_scan(small)
+        _, large_peak, _ = run_full_scan(large)
+        print(f"\npeak memory: {small_peak:,} B vs {large_peak:,} B")
+
+        # Ten times the bills must not mean ten times the memory
+        assert large_peak < small_peak * 2
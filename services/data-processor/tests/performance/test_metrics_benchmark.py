@@ -0,0 +1,70 @@
+"""
+Microbenchmark for IngestWorkerMetrics recording cost.
+
+Recording a metric must not get slower as the number of distinct metric
+names grows, and the rolling processing-time average must stay exact.
+"""
+
+import time
+
+import pytest
+from src.monitoring.metrics import IngestWorkerMetrics, RollingWindow
+
+RECORDS = 20_000
+
+
+def time_records(metrics: IngestWorkerMetrics, count: int) -> float:
+    """Seconds per record_metric call on a single hot series"""
+    start = time.perf_counter()
+    for i in range(count):
+        metrics.record_metric("hot_metric_total", 1, tags={"shard": str(i % 4)})
+    return (time.perf_counter() - start) / count
+
+
+@pytest.mark.performance
+class TestIngestWorkerMetricsBenchmark:
+    """Record cost versus number of metric names"""
+
+    def test_record_cost_independent_of_metric_names(self):
+        few = IngestWorkerMetrics()
+        many = IngestWorkerMetrics()
+        for i in range(2_000):
+            many.record_metric(f"idle_metric_{i}_total", 1)
+
+        time_records(few, 1_000)  # Warm up
+        few_cost = time_records(few, RECORDS)
+        many_cost = time_records(many, RECORDS)
+        print(
+            f"\nrecord_metric: {few_cost * 1e6:.1f} us with 1 name, "
+            f"{many_cost * 1e6:.1f} us with 2001 names"
+        )
+
+        assert many_cost < few_cost * 3
+
+    def test_processing_operation_cost_and_average(self):
+        metrics = IngestWorkerMetrics()
+        durations = [(i % 100) / 10 for i in range(RECORDS)]
+
+        start = time.perf_counter()
+        for duration in durations:
+            metrics.record_processing_operation("pdf_processing", True, duration)
+        per_call = (time.perf_counter() - start) / RECORDS
+        print(f"\nrecord_processing_operation: {per_call * 1e6:.1f} us")
+
+        window = durations[-1000:]
+        stats = metrics.pdf_processing
+        assert stats.avg_processing_time == pytest.approx(sum(window) / len(window))
+        assert stats.total_processed == RECORDS
+
+
+class TestRollingWindow:
+    """Running mean and EWMA of RollingWindow"""
+
+    def test_mean_tracks_window(self):
+        window = RollingWindow(maxlen=3, alpha=0.5)
+        for value in (1.0, 2.0, 3.0, 10.0):
+            window.append(value)
+
+        assert list(window) == [2.0, 3.0, 10.0]
+        assert window.mean == pytest.approx(5.0)
+        assert window.ewma == pytest.approx(6.125)
@@ -5,7 +5,7 @@ Tests hierarchical issue management, status updates, and batch operations.
 
 import asyncio
 import uuid
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock
 
 import pytest
@@ -13,6 +13,7 @@ import pytest
 from src.services.airtable_issue_manager import (
     AirtableIssueManager,
     AirtableIssueRecord,
+    IssueIndex,
 )
 from src.services.policy_issue_extractor import DualLevelIssue
 
@@ -298,6 +299,7 @@ class TestAirtableIssueManager:
                         "Label_Lv1": "親課題1",
                         "Parent_ID": None,
                         "Confidence": 0.8,
+                        "Status": "approved",
                         "Source_Bill_ID": "bill_001",
                     },
                 },
@@ -308,6 +310,17 @@ class TestAirtableIssueManager:
                         "Label_Lv2": "子課題1",
                         "Parent_ID": "rec_parent_1",
                         "Confidence": 0.7,
+                        "Status": "approved",
+                        "Source_Bill_ID": "bill_001",
+                    },
+                },
+                {
+                    "id": "rec_parent_2",
+                    "fields": {
+                        "Issue_ID": "issue_p2",
+                        "Label_Lv1": "却下された課題",
+                        "Parent_ID": None,
+                        "Status": "rejected",
                         "Source_Bill_ID": "bill_001",
                     },
                 },
@@ -332,8 +345,26 @@ class TestAirtableIssueManager:
         """Test getting issues by bill ID."""
         mock_response = {
             "records": [
-                {"id": "rec_1", "fields": {"Source_Bill_ID": "bill_001"}},
-                {"id": "rec_2", "fields": {"Source_Bill_ID": "bill_001"}},
+                {
+                    "id": "rec_1",
+                    "fields": {"Source_Bill_ID": "bill_001", "Status": "approved"},
+                },
+                {
+                    "id": "rec_2",
+                    "fields": {"Source_Bill_ID": "bill_001", "Status": "approved"},
+                },
+                {
+                    "id": "rec_3",
+                    "fields": {
+                        "Source_Bill_ID": "bill_001",
+                        "Status": "approved",
+                        "Valid_To": "2024-01-01",
+                    },
+                },
+                {
+                    "id": "rec_4",
+                    "fields": {"Source_Bill_ID": "bill_002", "Status": "approved"},
+                },
             ]
         }
 
@@ -341,13 +372,7 @@ class TestAirtableIssueManager:
 
         issues = await issue_manager.get_issues_by_bill("bill_001", "approved")
 
-        assert len(issues) == 2
-
-        # Verify filter formula
-        call_args = mock_airtable_client._rate_limited_request.call_args
-        params = call_args[1]["params"]
-        filter_formula = params["filterByFormula"]
-        assert "bill_001" in filter_formula
+        assert [issue["id"] for issue in issues] == ["rec_1", "rec_2"]
 
     async def test_invalidate_issues(self, issue_manager, mock_airtable_client):
         """Test invalidating issues by setting valid_to date."""
@@ -425,9 +450,123 @@ class TestAirtableIssueManager:
         assert stats["pending_count"] == 1
         assert stats["by_level"]["lv1"] == 1
         assert stats["by_level"]["lv2"] == 1
-        assert stats["average_confidence"] == 0.85  # (0.8 + 0.9) / 2
+        assert stats["average_confidence"] == pytest.approx(0.85)  # (0.8 + 0.9) / 2
         assert stats["unique_bills_count"] == 1
 
+    async def test_index_loads_all_pages(self, issue_manager, mock_airtable_client):
+        """Test that the issue index follows pagination offsets."""
+        mock_airtable_client._rate_limited_request.side_effect = [
+            {
+                "records": [
+                    {"id": f"rec_{i}", "fields": {"Status": "pending"}}
+                    for i in range(100)
+                ],
+                "offset": "page_2",
+            },
+            {"records": [{"id": "rec_100", "fields": {"Status": "pending"}}]},
+        ]
+
+        count = await issue_manager.count_pending_issues()
+
+        assert count == 101
+        calls = mock_airtable_client._rate_limited_request.call_args_list
+        assert len(calls) == 2
+        assert "offset" not in calls[0][1]["params"]
+        assert calls[1][1]["params"]["offset"] == "page_2"
+
+        # Served from the index until it goes stale
+        await issue_manager.get_issue_statistics()
+        assert mock_airtable_client._rate_limited_request.call_count == 2
+
+    async def test_index_incremental_sync(self, issue_manager, mock_airtable_client):
+        """Test that stale indexes only fetch records modified since the last sync."""
+        mock_airtable_client._rate_limited_request.return_value = {
+            "records": [
+                {
+                    "id": "rec_1",
+                    "fields": {
+                        "Status": "pending",
+                        "Source_Bill_ID": "bill_001",
+                        "Updated_At": "2024-01-01T00:00:00.000Z",
+                    },
+                },
+                {
+                    "id": "rec_2",
+                    "fields": {
+                        "Status": "pending",
+                        "Source_Bill_ID": "bill_002",
+                        "Updated_At": "2024-01-02T00:00:00.000Z",
+                    },
+                },
+            ]
+        }
+        await issue_manager.sync_index()
+
+        mock_airtable_client._rate_limited_request.return_value = {
+            "records": [
+                {
+                    "id": "rec_2",
+                    "fields": {
+                        "Status": "approved",
+                        "Source_Bill_ID": "bill_002",
+                        "Updated_At": "2024-01-03T00:00:00.000Z",
+                    },
+                }
+            ]
+        }
+        issue_manager.index_ttl_seconds = 0
+
+        stats = await issue_manager.get_issue_statistics()
+
+        params = mock_airtable_client._rate_limited_request.call_args[1]["params"]
+        # Filtered on Airtable's modified time, with the overlap window
+        assert params["filterByFormula"] == (
+            "IS_AFTER(LAST_MODIFIED_TIME(), '2024-01-01T23:55:00.000000Z')"
+        )
+        assert stats["total_issues"] == 2
+        assert stats["pending_count"] == 1
+        assert stats["approved_count"] == 1
+        assert issue_manager.index.watermark == datetime(2024, 1, 3, tzinfo=UTC)
+
+    async def test_local_updates_do_not_advance_watermark(
+        self, issue_manager, mock_airtable_client
+    ):
+        """Test that only records fetched from Airtable move the sync watermark."""
+        mock_airtable_client._rate_limited_request.return_value = {
+            "records": [
+                {
+                    "id": "rec_1",
+                    "fields": {
+                        "Status": "pending",
+                        "Updated_At": "2024-01-01T00:00:00.000Z",
+                    },
+                }
+            ]
+        }
+        await issue_manager.sync_index()
+
+        mock_airtable_client._rate_limited_request.return_value = {"id": "rec_1"}
+        await issue_manager.update_issue_status("rec_1", "approved")
+
+        assert issue_manager.index.records["rec_1"]["Status"] == "approved"
+        assert issue_manager.index.watermark == datetime(2024, 1, 1, tzinfo=UTC)
+
+    async def test_index_applies_local_updates(
+        self, issue_manager, mock_airtable_client
+    ):
+        """Test that status updates are reflected without re-fetching."""
+        mock_airtable_client._rate_limited_request.return_value = {
+            "records": [{"id": "rec_1", "fields": {"Status": "pending"}}]
+        }
+        assert await issue_manager.count_pending_issues() == 1
+
+        mock_airtable_client._rate_limited_request.return_value = {"id": "rec_1"}
+        await issue_manager.update_issue_status("rec_1", "approved")
+
+        assert await issue_manager.count_pending_issues() == 0
+        stats = await issue_manager.get_issue_statistics()
+        assert stats["approved_count"] == 1
+
     async def test_search_issues(self, issue_manager, mock_airtable_client):
         """Test searching issues by text query."""
         mock_response = {
@@ -435,7 +574,19 @@ class TestAirtableIssueManager:
                 {
                     "id": "rec_1",
                     "fields": {"Label_Lv1": "介護制度を改善する", "Status": "approved"},
-                }
+                },
+                {
+                    "id": "rec_2",
+                    "fields": {"Label_Lv1": "保育と介護の両立", "Status": "approved"},
+                },
+                {
+                    "id": "rec_3",
+                    "fields": {"Label_Lv1": "介護保険料を見直す", "Status": "pending"},
+                },
+                {
+                    "id": "rec_4",
+                    "fields": {"Label_Lv1": "税制を改正する", "Status": "approved"},
+                },
             ]
         }
 
@@ -443,14 +594,52 @@ class TestAirtableIssueManager:
 
         results = await issue_manager.search_issues("介護", None, "approved", 50)
 
-        assert len(results) == 1
+        # Prefix match ranks before the substring match; other statuses excluded
+        assert [issue["id"] for issue in results] == ["rec_1", "rec_2"]
 
-        # Verify search filter was applied
-        call_args = mock_airtable_client._rate_limited_request.call_args
-        params = call_args[1]["params"]
-        filter_formula = params["filterByFormula"]
-        assert "介護" in filter_formula
-        assert "FIND" in filter_formula
+        # Subsequent searches are served locally
+        call_count = mock_airtable_client._rate_limited_request.call_count
+        results = await issue_manager.search_issues("税", None, "approved", 50)
+        assert [issue["id"] for issue in results] == ["rec_4"]
+        assert mock_airtable_client._rate_limited_request.call_count == call_count
+
+    async def test_search_issues_filters_and_updates(
+        self, issue_manager, mock_airtable_client
+    ):
+        """Test search level filters, normalization and index maintenance."""
+        mock_airtable_client._rate_limited_request.return_value = {
+            "records": [
+                {
+                    "id": "rec_parent",
+                    "fields": {
+                        "Label_Lv1": "ＡＩ規制を整備する",
+                        "Parent_ID": None,
+                        "Status": "approved",
+                    },
+                },
+                {
+                    "id": "rec_child",
+                    "fields": {
+                        "Label_Lv2": "生成AIの利用ルールを定める",
+                        "Parent_ID": "rec_parent",
+                        "Status": "approved",
+                    },
+                },
+            ]
+        }
+
+        results = await issue_manager.search_issues("ai", level=2)
+        assert [issue["id"] for issue in results] == ["rec_child"]
+
+        results = await issue_manager.search_issues("ai")
+        assert [issue["id"] for issue in results] == ["rec_parent", "rec_child"]
+
+        mock_airtable_client._rate_limited_request.return_value = {"id": "rec_child"}
+        await issue_manager.invalidate_issues(["rec_child"], "superseded")
+
+        results = await issue_manager.search_issues("ai")
+        assert [issue["id"] for issue in results] == ["rec_parent"]
+        assert await issue_manager.search_issues("   ") == []
 
     async def test_health_check_success(self, issue_manager, mock_airtable_client):
         """Test successful health check."""
@@ -472,6 +661,27 @@ class TestAirtableIssueManager:
 
 
 @pytest.mark.asyncio
+class TestIssueIndex:
+    """Test the in-memory issue index."""
+
+    def test_full_load_resums_totals(self):
+        """Test that a full load drops float drift from incremental updates."""
+        records = [
+            {"id": f"rec_{i}", "fields": {"Confidence": 0.1, "Quality_Score": 0.1}}
+            for i in range(10)
+        ]
+        index = IssueIndex()
+        index.apply(records)
+        for record in records:
+            index.patch(record["id"], {"Status": "approved"})
+
+        index.load(records)
+
+        stats = index.statistics()
+        assert stats["average_confidence"] == 0.1
+        assert stats["average_quality_score"] == 0.1
+
+
 class TestIntegrationScenarios:
     """Integration test scenarios combining multiple operations."""
 
@@ -0,0 +1,82 @@
+"""
+Tests for alerting statistics and windowed metric reads.
+"""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+from src.monitoring.alerting import AnomalyDetector, RunningStats
+from src.monitoring.metrics import IngestWorkerMetrics, MetricPoint, MetricType
+
+
+class TestRunningStats:
+    """Test cases for RunningStats"""
+
+    def test_matches_statistics_over_sliding_window(self):
+        rng = random.Random(0)
+        stats = RunningStats(maxlen=25)
+
+        for i in range(200):
+            stats.add(rng.gauss(100.0, 15.0))
+            if len(stats) >= 2 and i % 7 == 0:
+                window = list(stats.values)
+                assert stats.mean == pytest.approx(statistics.mean(window))
+                assert stats.stdev == pytest.approx(statistics.stdev(window))
+
+    def test_variance_needs_two_values(self):
+        stats = RunningStats(maxlen=1)
+        stats.add(5.0)
+        stats.add(7.0)
+
+        assert stats.mean == 7.0
+        assert stats.variance == 0.0
+
+
+class TestAnomalyDetector:
+    """Test cases for AnomalyDetector"""
+
+    def test_flags_outliers_after_minimum_history(self):
+        detector = AnomalyDetector(window_size=50, sensitivity=2.0)
+        for value in [10.0, 11.0, 9.0, 10.5, 9.5] * 2:
+            detector.add_value("latency", value)
+
+        assert detector.is_anomaly("latency", 20.0)
+        assert not detector.is_anomaly("latency", 10.2)
+        assert not detector.is_anomaly("unknown", 20.0)
+
+    def test_baseline_stats(self):
+        detector = AnomalyDetector()
+        for value in [1.0, 2.0, 3.0, 4.0, 10.0]:
+            detector.add_value("latency", value)
+
+        baseline = detector.get_baseline_stats("latency")
+        assert baseline["mean"] == pytest.approx(4.0)
+        assert baseline["median"] == 3.0
+        assert baseline["stdev"] == pytest.approx(statistics.stdev([1, 2, 3, 4, 10]))
+        assert baseline["count"] == 5
+
+
+class TestPointsSince:
+    """Test cases for IngestWorkerMetrics.points_since"""
+
+    def test_returns_window_in_time_order(self):
+        metrics = IngestWorkerMetrics()
+        start = datetime.utcnow() - timedelta(minutes=30)
+        for minute in range(30):
+            metrics.metrics["queue_depth"].append(
+                MetricPoint(
+                    name="queue_depth",
+                    value=float(minute),
+                    timestamp=start + timedelta(minutes=minute),
+                    metric_type=MetricType.GAUGE,
+                    tags={},
+                )
+            )
+
+        recent = metrics.points_since("queue_depth", start + timedelta(minutes=25))
+
+        assert [point.value for point in recent] == [25.0, 26.0, 27.0, 28.0, 29.0]
+        assert metrics.points_since("queue_depth", datetime.utcnow()) == []
+        assert metrics.points_since("missing", start) == []
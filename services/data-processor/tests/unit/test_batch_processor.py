@@ -0,0 +1,254 @@
+"""
+Tests for the batch processor dispatcher and its Redis Streams backend.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.batch_queue import batch_processor  # noqa: E402
+from src.batch_queue.batch_processor import (  # noqa: E402
+    BatchConfig,
+    BatchProcessor,
+    BatchTask,
+    RedisStreamQueue,
+    TaskProcessor,
+    TaskStatus,
+    TaskType,
+)
+
+
+class RecordingProcessor(TaskProcessor):
+    """Processor that records task IDs and fails each task ``failures`` times"""
+
+    def __init__(self, seen: list[str], failures: int = 0):
+        self.seen = seen
+        self.failures = failures
+        self.attempts: dict[str, int] = {}
+
+    async def process(self, task: BatchTask) -> dict:
+        self.attempts[task.task_id] = self.attempts.get(task.task_id, 0) + 1
+        if self.attempts[task.task_id] <= self.failures:
+            raise RuntimeError("transient failure")
+        self.seen.append(task.task_id)
+        return {"ok": True}
+
+
+class SleepingProcessor(TaskProcessor):
+    """Processor that sleeps for ``payload["seconds"]`` and logs completions
+
+    Each task first fails ``payload["failures"]`` times.
+    """
+
+    def __init__(self, finished: list[str]):
+        self.finished = finished
+
+    async def process(self, task: BatchTask) -> dict:
+        if task.retry_count < task.payload.get("failures", 0):
+            raise RuntimeError("task failure")
+        await asyncio.sleep(task.payload.get("seconds", 0))
+        self.finished.append(task.task_id)
+        return {}
+
+
+def make_local_processor(**kwargs) -> tuple[BatchProcessor, list[str]]:
+    finished: list[str] = []
+    processor = BatchProcessor(BatchConfig(enable_persistence=False, **kwargs))
+    processor.register_processor(TaskType.CUSTOM, SleepingProcessor(finished))
+    return processor, finished
+
+
+async def run_until(processor: BatchProcessor, predicate, timeout: float = 2.0):
+    runner = asyncio.create_task(processor.start_processing())
+    try:
+        async with asyncio.timeout(timeout):
+            while not predicate():
+                await asyncio.sleep(0.005)
+    finally:
+        await processor.stop_processing()
+        await runner
+
+
+class TestDispatcher:
+    """Test cases for the in-process dispatcher"""
+
+    @pytest.mark.asyncio
+    async def test_slots_are_refilled_while_slow_task_runs(self):
+        processor, finished = make_local_processor(max_concurrent_tasks=2, batch_size=2)
+        await processor.add_task(TaskType.CUSTOM, {"seconds": 0.3}, task_id="slow")
+        for i in range(6):
+            await processor.add_task(
+                TaskType.CUSTOM, {"seconds": 0.01}, task_id=f"fast{i}"
+            )
+
+        await run_until(processor, lambda: "fast5" in finished)
+
+        assert finished.index("fast5") < finished.index("slow")
+
+    @pytest.mark.asyncio
+    async def test_blocked_task_does_not_hold_up_its_queue(self):
+        processor, finished = make_local_processor()
+        await processor.add_task(
+            TaskType.CUSTOM, {}, task_id="child", depends_on=["parent"]
+        )
+        await processor.add_task(TaskType.CUSTOM, {}, task_id="other")
+
+        await run_until(processor, lambda: "other" in finished)
+        assert processor.get_task_status("child")["status"] == "queued"
+
+        await processor.add_task(TaskType.CUSTOM, {}, task_id="parent")
+        await run_until(processor, lambda: "child" in finished)
+        assert finished == ["other", "parent", "child"]
+
+    @pytest.mark.asyncio
+    async def test_failed_parent_fails_dependents(self):
+        processor, finished = make_local_processor(retry_delay_seconds=0)
+        await processor.add_task(
+            TaskType.CUSTOM, {"failures": 1}, task_id="parent", max_retries=1
+        )
+        await processor.add_task(
+            TaskType.CUSTOM, {}, task_id="child", depends_on=["parent"]
+        )
+        await processor.add_task(
+            TaskType.CUSTOM, {}, task_id="grandchild", depends_on=["child"]
+        )
+
+        await run_until(processor, lambda: "grandchild" in processor.failed_tasks)
+
+        assert finished == []
+        assert processor.failed_tasks["child"].error_message == (
+            "Dependency parent failed"
+        )
+        assert processor.get_queue_status()["blocked_tasks"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_does_not_occupy_a_slot(self):
+        processor, finished = make_local_processor(
+            max_concurrent_tasks=1, retry_delay_seconds=0.2
+        )
+        await processor.add_task(TaskType.CUSTOM, {"failures": 1}, task_id="flaky")
+        await processor.add_task(TaskType.CUSTOM, {}, task_id="steady")
+
+        await run_until(processor, lambda: "flaky" in finished)
+
+        assert finished == ["steady", "flaky"]
+        assert processor.get_queue_status()["scheduled_retries"] == 0
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_client(server):
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+def make_processor(server, **kwargs) -> BatchProcessor:
+    config = BatchConfig(
+        persistence_backend="redis",
+        redis_url="redis://localhost:6379/0",
+        retry_delay_seconds=0,
+        **kwargs,
+    )
+    with patch.object(
+        batch_processor.redis, "from_url", return_value=make_client(server)
+    ):
+        return BatchProcessor(config)
+
+
+class TestRedisStreamBackend:
+    """Test cases for BatchProcessor with the Redis Streams queue"""
+
+    @pytest.mark.asyncio
+    async def test_replicas_share_queue(self, server):
+        seen: list[str] = []
+        replicas = [make_processor(server, batch_size=2) for _ in range(2)]
+        for replica in replicas:
+            replica.register_processor(TaskType.CUSTOM, RecordingProcessor(seen))
+
+        task_ids = [
+            await replicas[0].add_task(TaskType.CUSTOM, {"n": i}) for i in range(5)
+        ]
+        for _ in range(3):
+            for replica in replicas:
+                await replica._process_batch()
+
+        assert sorted(seen) == sorted(task_ids)
+        assert await replicas[1].stream_queue.length() == 0
+        assert all(
+            replicas[0].get_task_status(task_id) or replicas[1].get_task_status(task_id)
+            for task_id in task_ids
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_task_is_requeued_and_retried(self, server):
+        seen: list[str] = []
+        processor = make_processor(server)
+        recorder = RecordingProcessor(seen, failures=1)
+        processor.register_processor(TaskType.CUSTOM, recorder)
+
+        task_id = await processor.add_task(TaskType.CUSTOM, {})
+        await processor._process_batch()
+        stored = await processor.stream_queue.load_task(task_id)
+        assert stored.status == TaskStatus.RETRYING
+
+        await processor._process_batch()
+        assert seen == [task_id]
+        assert recorder.attempts[task_id] == 2
+        stored = await processor.stream_queue.load_task(task_id)
+        assert stored.status == TaskStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_dependencies_resolve_across_replicas(self, server):
+        seen: list[str] = []
+        first, second = make_processor(server), make_processor(server)
+        first.register_processor(TaskType.CUSTOM, RecordingProcessor(seen))
+        second.register_processor(TaskType.CUSTOM, RecordingProcessor(seen))
+
+        parent = await first.add_task(TaskType.CUSTOM, {}, task_id="parent")
+        await first._process_batch()
+        child = await second.add_task(TaskType.CUSTOM, {}, depends_on=[parent])
+        await second._process_batch()
+
+        assert seen == [parent, child]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_is_skipped(self, server):
+        seen: list[str] = []
+        processor = make_processor(server)
+        processor.register_processor(TaskType.CUSTOM, RecordingProcessor(seen))
+
+        task_id = await processor.add_task(TaskType.CUSTOM, {})
+        assert await make_processor(server).cancel_task(task_id)
+        await processor._process_batch()
+
+        assert seen == []
+        assert await processor.stream_queue.length() == 0
+
+
+class TestRedisStreamQueue:
+    """Test cases for RedisStreamQueue delivery guarantees"""
+
+    @pytest.mark.asyncio
+    async def test_stale_pending_entries_are_claimed(self, server):
+        crashed = RedisStreamQueue(make_client(server), consumer="crashed")
+        survivor = RedisStreamQueue(
+            make_client(server), consumer="survivor", claim_idle_seconds=0
+        )
+        task = BatchTask(task_id="t1", task_type=TaskType.CUSTOM)
+
+        await crashed.enqueue(task)
+        [(entry_id, delivered)] = await crashed.read(10)
+        assert delivered.task_id == "t1"
+
+        # Never acknowledged by the first consumer, so it is redelivered
+        [(claimed_id, claimed)] = await survivor.read(10)
+        assert (claimed_id, claimed.task_id) == (entry_id, "t1")
+
+        await survivor.ack(claimed, claimed_id)
+        assert await survivor.read(10) == []
+        assert await survivor.length() == 0
@@ -0,0 +1,298 @@
+"""
+Tests for cross-house bill matching and merging.
+"""
+
+from datetime import datetime
+
+import pytest
+from src.processor.bill_data_merger import (
+    BillDataMerger,
+    ConflictResolutionStrategy,
+    MergeResult,
+    _assign_one_to_one,
+)
+from src.scraper.enhanced_diet_scraper import EnhancedBillData
+from src.scraper.shugiin_scraper import ShugiinBillData
+
+
+class TestBillDataMerger:
+    """Test cases for BillDataMerger"""
+
+    @pytest.fixture
+    def merger(self):
+        """Create test merger instance"""
+        return BillDataMerger(
+            conflict_strategy=ConflictResolutionStrategy.MOST_COMPLETE,
+            similarity_threshold=0.7,
+        )
+
+    @pytest.fixture
+    def sample_sangiin_bill(self):
+        """Sample Sangiin bill"""
+        return EnhancedBillData(
+            bill_id="sangiin-1",
+            title="デジタル社会形成基本法案",
+            submission_date=datetime(2021, 2, 9),
+            status="審議中",
+            stage="審議中",
+            submitter="政府",
+            category="行政・公務員",
+            url="http://sangiin.go.jp/bill/1",
+            bill_outline="デジタル社会形成に関する基本的な法案",
+            diet_session="204",
+            house_of_origin="参議院",
+            source_house="参議院",
+            data_quality_score=0.8,
+        )
+
+    @pytest.fixture
+    def sample_shugiin_bill(self):
+        """Sample Shugiin bill"""
+        return ShugiinBillData(
+            bill_id="shugiin-1",
+            title="デジタル社会形成基本法案",
+            submission_date=datetime(2021, 2, 9),
+            status="審議中",
+            stage="審議中",
+            submitter="政府",
+            category="行政・公務員",
+            url="http://shugiin.go.jp/bill/1",
+            supporting_members=["議員A", "議員B", "議員C"],
+            diet_session="204",
+            house_of_origin="衆議院",
+            source_house="衆議院",
+            data_quality_score=0.7,
+        )
+
+    def test_calculate_similarity_score(
+        self, merger, sample_sangiin_bill, sample_shugiin_bill
+    ):
+        """Test similarity score calculation"""
+        score = merger._calculate_similarity_score(
+            sample_sangiin_bill, sample_shugiin_bill
+        )
+
+        assert score > 0.8  # Should be high similarity
+        assert score <= 1.0
+
+    def test_find_matching_bills(
+        self, merger, sample_sangiin_bill, sample_shugiin_bill
+    ):
+        """Test bill matching"""
+        sangiin_bills = [sample_sangiin_bill]
+        shugiin_bills = [sample_shugiin_bill]
+
+        matches = merger._find_matching_bills(sangiin_bills, shugiin_bills)
+
+        assert len(matches) == 1
+        assert matches[sample_sangiin_bill.bill_id] == sample_shugiin_bill
+
+    def test_find_matching_bills_is_one_to_one(
+        self, merger, sample_sangiin_bill, sample_shugiin_bill
+    ):
+        """Test that a Shugiin bill is matched to at most one Sangiin bill"""
+        # Scores above the threshold against both Shugiin bills, but lower
+        # than the sample Sangiin bill against the first one
+        rival = EnhancedBillData(
+            bill_id="sangiin-2",
+            title="デジタル社会形成基本法の一部を改正する法律案",
+            submission_date=None,
+            status="",
+            stage="",
+            submitter="政府",
+            category="",
+            url="",
+            diet_session="204",
+        )
+        other_shugiin = ShugiinBillData(
+            bill_id="shugiin-2",
+            title="デジタル社会形成基本法の一部を改正する法律案",
+            submission_date=None,
+            status="",
+            stage="",
+            submitter="政府",
+            category="",
+            url="",
+            diet_session="204",
+        )
+
+        matches = merger._find_matching_bills(
+            [rival, sample_sangiin_bill], [sample_shugiin_bill, other_shugiin]
+        )
+
+        assert matches == {
+            sample_sangiin_bill.bill_id: sample_shugiin_bill,
+            rival.bill_id: other_shugiin,
+        }
+
+    def test_find_matching_bills_without_shared_title_characters(self):
+        """Test that titles sharing no character are candidates at low thresholds"""
+        merger = BillDataMerger(similarity_threshold=0.5)
+        sangiin_bill = EnhancedBillData(
+            bill_id="sangiin-a",
+            title="制",
+            submission_date=None,
+            status="",
+            stage="",
+            submitter="政府",
+            category="",
+            url="",
+            diet_session="204",
+        )
+        shugiin_bill = ShugiinBillData(
+            bill_id="shugiin-a",
+            title="す",
+            submission_date=None,
+            status="",
+            stage="",
+            submitter="政府",
+            category="",
+            url="",
+            diet_session="204",
+        )
+
+        # Session and submitter alone give (0.3 + 0.1) / 0.8
+        assert merger._calculate_similarity_score(
+            sangiin_bill, shugiin_bill
+        ) == pytest.approx(0.5)
+        assert merger._find_matching_bills([sangiin_bill], [shugiin_bill]) == {
+            sangiin_bill.bill_id: shugiin_bill
+        }
+
+    def test_find_matching_bills_matches_exhaustive_search(self, merger):
+        """Test that candidate blocking finds the same pairs as scoring all pairs"""
+        titles = [
+            "デジタル社会形成基本法案",
+            "個人情報の保護に関する法律の一部を改正する法律案",
+            "地方自治法の一部を改正する法律案",
+            "所得税法等の一部を改正する法律案",
+            "道路交通法の一部を改正する法律案",
+        ]
+
+        def bills(cls, house, shift):
+            return [
+                cls(
+                    bill_id=f"{house}-{session}-{number}",
+                    title=titles[(number + shift) % len(titles)],
+                    submission_date=None,
+                    status="",
+                    stage="",
+                    submitter="政府" if number % 2 else "議員",
+                    category="",
+                    url="",
+                    diet_session=str(session),
+                )
+                for session in (203, 204)
+                for number in range(1, 6)
+            ]
+
+        sangiin_bills = bills(EnhancedBillData, "sangiin", 0)
+        shugiin_bills = bills(ShugiinBillData, "shugiin", 1)
+
+        edges = [
+            (i, j, score)
+            for i, sangiin_bill in enumerate(sangiin_bills)
+            for j, shugiin_bill in enumerate(shugiin_bills)
+            if (score := merger._calculate_similarity_score(sangiin_bill, shugiin_bill))
+            >= merger.similarity_threshold
+        ]
+        expected = {
+            sangiin_bills[i].bill_id: shugiin_bills[j].bill_id
+            for i, j, _ in _assign_one_to_one(edges)
+        }
+
+        matches = merger._find_matching_bills(sangiin_bills, shugiin_bills)
+
+        assert {k: v.bill_id for k, v in matches.items()} == expected
+
+    def test_merge_bill_pair(self, merger, sample_sangiin_bill, sample_shugiin_bill):
+        """Test bill pair merging"""
+        result = merger._merge_bill_pair(sample_sangiin_bill, sample_shugiin_bill)
+
+        assert isinstance(result, MergeResult)
+        assert result.merged_bill.bill_id == sample_sangiin_bill.bill_id
+        assert result.merged_bill.title == sample_sangiin_bill.title
+        assert result.merged_bill.source_house == "両院"
+        assert (
+            result.merged_bill.supporting_members
+            == sample_shugiin_bill.supporting_members
+        )
+        assert result.merge_quality_score > 0.0
+
+    def test_resolve_field_conflict(self, merger):
+        """Test field conflict resolution"""
+        # Test no conflict
+        merged_value, conflict = merger._resolve_field_conflict(
+            "title", "同じタイトル", "同じタイトル"
+        )
+        assert merged_value == "同じタイトル"
+        assert conflict is None
+
+        # Test conflict with different values
+        merged_value, conflict = merger._resolve_field_conflict(
+            "bill_outline", "短い説明", "より長い詳細な説明文"
+        )
+        assert merged_value == "より長い詳細な説明文"  # Should choose longer text
+        assert conflict is not None
+        assert conflict.field_name == "bill_outline"
+
+    def test_merge_bills(self, merger, sample_sangiin_bill, sample_shugiin_bill):
+        """Test complete bill merging"""
+        sangiin_bills = [sample_sangiin_bill]
+        shugiin_bills = [sample_shugiin_bill]
+
+        results = merger.merge_bills(sangiin_bills, shugiin_bills)
+
+        assert len(results) == 1
+        assert results[0].merged_bill.source_house == "両院"
+        assert len(results[0].source_info["sources"]) == 2
+        assert results[0].merge_quality_score > 0.0
+
+    def test_get_merge_statistics(self, merger):
+        """Test merge statistics"""
+        # Mock merge results
+        mock_results = [
+            MergeResult(
+                merged_bill=EnhancedBillData(
+                    bill_id="1",
+                    title="法案1",
+                    submission_date=None,
+                    status="審議中",
+                    stage="審議中",
+                    submitter="政府",
+                    category="その他",
+                    url="http://example.com",
+                ),
+                conflicts=[],
+                merge_quality_score=0.9,
+                source_info={
+                    "sources": ["sangiin", "shugiin"],
+                    "primary_source": "sangiin",
+                },
+            ),
+            MergeResult(
+                merged_bill=EnhancedBillData(
+                    bill_id="2",
+                    title="法案2",
+                    submission_date=None,
+                    status="審議中",
+                    stage="審議中",
+                    submitter="政府",
+                    category="その他",
+                    url="http://example.com",
+                ),
+                conflicts=[],
+                merge_quality_score=0.8,
+                source_info={"sources": ["sangiin"], "primary_source": "sangiin"},
+            ),
+        ]
+
+        stats = merger.get_merge_statistics(mock_results)
+
+        assert stats["total_bills"] == 2
+        assert stats["source_distribution"] == {
+            "sangiin_only": 1,
+            "shugiin_only": 0,
+            "both_houses": 1,
+        }
+        assert stats["avg_quality_score"] == pytest.approx(0.85)
@@ -0,0 +1,166 @@
+"""
+Tests for bill data validation plans, rule timings and worker pools.
+"""
+
+from datetime import datetime
+
+import pytest
+from src.processor.bill_data_validator import BillDataValidator
+from src.scraper.enhanced_diet_scraper import EnhancedBillData
+
+
+class TestBillDataValidator:
+    """Test cases for BillDataValidator"""
+
+    @pytest.fixture
+    def validator(self):
+        """Create test validator instance"""
+        return BillDataValidator(strict_mode=False, require_japanese=True)
+
+    @pytest.fixture
+    def valid_bill(self):
+        """Valid bill data"""
+        return EnhancedBillData(
+            bill_id="valid-1",
+            title="有効な法案",
+            submission_date=datetime(2021, 2, 9),
+            status="審議中",
+            stage="審議中",
+            submitter="政府",
+            category="行政・公務員",
+            url="http://example.com/bill/1",
+            bill_outline="この法案は重要な改正を行うものである。",
+            diet_session="204",
+            house_of_origin="参議院",
+            source_house="参議院",
+            data_quality_score=0.8,
+        )
+
+    @pytest.fixture
+    def invalid_bill(self):
+        """Invalid bill data"""
+        return EnhancedBillData(
+            bill_id="",  # Missing required field
+            title="Invalid Bill",  # No Japanese
+            submission_date=None,
+            status="invalid_status",  # Invalid status
+            stage="invalid_stage",  # Invalid stage
+            submitter="invalid_submitter",  # Invalid submitter
+            category="invalid_category",  # Invalid category
+            url="http://example.com/bill/1",
+            data_quality_score=1.5,  # Out of range
+        )
+
+    def test_validate_required_fields(self, validator, valid_bill, invalid_bill):
+        """Test required field validation"""
+        # Valid bill
+        result = validator.validate_bill(valid_bill, "standard")
+        required_issues = [
+            issue
+            for issue in result.issues
+            if issue.issue_type == "missing_required_field"
+        ]
+        assert len(required_issues) == 0
+
+        # Invalid bill
+        result = validator.validate_bill(invalid_bill, "standard")
+        required_issues = [
+            issue
+            for issue in result.issues
+            if issue.issue_type == "missing_required_field"
+        ]
+        assert len(required_issues) > 0
+
+    def test_validate_field_formats(self, validator, invalid_bill):
+        """Test field format validation"""
+        result = validator.validate_bill(invalid_bill, "standard")
+
+        format_issues = [
+            issue for issue in result.issues if issue.issue_type == "invalid_format"
+        ]
+        assert len(format_issues) > 0
+
+    def test_validate_data_consistency(self, validator, invalid_bill):
+        """Test data consistency validation"""
+        result = validator.validate_bill(invalid_bill, "standard")
+
+        consistency_issues = [
+            issue
+            for issue in result.issues
+            if issue.issue_type in ["invalid_value", "out_of_range"]
+        ]
+        assert len(consistency_issues) > 0
+
+    def test_validate_japanese_content(self, validator, valid_bill):
+        """Test Japanese content validation"""
+        result = validator.validate_bill(valid_bill, "standard")
+
+        japanese_issues = [
+            issue
+            for issue in result.issues
+            if issue.issue_type == "missing_japanese_text"
+        ]
+        # Should have no issues for valid Japanese content
+        assert len(japanese_issues) == 0
+
+    def test_calculate_completeness_score(self, validator, valid_bill, invalid_bill):
+        """Test completeness score calculation"""
+        # Valid bill should have high completeness
+        valid_score = validator._calculate_completeness_score(valid_bill, "standard")
+        assert valid_score > 0.7
+
+        # Invalid bill fills 5 of 8 standard fields and no optional ones
+        invalid_score = validator._calculate_completeness_score(
+            invalid_bill, "standard"
+        )
+        assert invalid_score == pytest.approx(5 / 8 * 0.8)
+
+    def test_validate_bills(self, validator, valid_bill, invalid_bill):
+        """Test multiple bills validation"""
+        bills = [valid_bill, invalid_bill]
+        results = validator.validate_bills(bills, "standard")
+
+        assert len(results) == 2
+        assert results[0].is_valid is True
+        assert results[1].is_valid is False
+
+    def test_validate_bills_in_worker_processes(self, valid_bill, invalid_bill):
+        """Test that pooled validation matches serial validation"""
+        bills = [valid_bill, invalid_bill] * 5
+        serial = BillDataValidator().validate_bills(bills, "standard")
+
+        validator = BillDataValidator(max_workers=2, chunk_size=3)
+        try:
+            pooled = validator.validate_bills(bills, "standard")
+        finally:
+            validator.close()
+
+        assert pooled == serial
+        # Timings reported by the workers are merged into the parent
+        assert validator.rule_timings["required_fields"]["count"] == len(bills)
+
+    def test_rule_timings(self, validator, valid_bill):
+        """Test per-rule timing counters"""
+        validator.validate_bills([valid_bill, valid_bill], "standard")
+
+        rules = [rule.name for rule in validator.get_plan("standard").rules]
+        timings = validator.get_rule_timings()
+        assert {row["rule"] for row in timings} == set(rules)
+        assert all(row["count"] == 2 for row in timings)
+        assert "japanese:title" in rules
+
+        validator.reset_rule_timings()
+        assert validator.get_rule_timings() == []
+
+    def test_get_validation_summary(self, validator, valid_bill, invalid_bill):
+        """Test validation summary"""
+        bills = [valid_bill, invalid_bill]
+        results = validator.validate_bills(bills, "standard")
+        summary = validator.get_validation_summary(results)
+
+        assert summary["total_bills"] == 2
+        assert summary["valid_bills"] == 1
+        assert summary["invalid_bills"] == 1
+        assert summary["validation_rate"] == 0.5
+        assert "avg_quality_score" in summary
+        assert "common_issues" in summary
@@ -0,0 +1,273 @@
+"""
+Tests for the bill data quality auditor.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+from src.migration.data_quality_auditor import (
+    DataQualityAuditor,
+    QualityIssueType,
+    QualityReport,
+)
+
+from shared.models.bill import BillStatus
+from shared.models.bill_record import BillRecord
+from shared.models.quality_audit_summary import QualityAuditSummaryRecord
+
+
+class TestDataQualityAuditor:
+    """Test data quality auditor functionality"""
+
+    @pytest.fixture
+    def quality_auditor(self):
+        """Create test quality auditor"""
+        return DataQualityAuditor("sqlite://")
+
+    def test_auditor_initialization(self, quality_auditor):
+        """Test auditor initialization"""
+        assert quality_auditor.database_url == "sqlite://"
+        assert quality_auditor.quality_thresholds["completeness_min"] == 0.8
+        assert len(quality_auditor.required_fields) > 0
+        assert len(quality_auditor.enhanced_fields) > 0
+
+    def audit_rows(self, auditor, rows):
+        """Audit bill dicts as a single column batch"""
+        columns = {
+            name: [row.get(name) for row in rows] for name in auditor.audited_columns
+        }
+        return auditor._audit_batch(columns)
+
+    def test_calculate_overall_metrics(self, quality_auditor):
+        """Test overall metrics calculation"""
+        bills = [
+            {
+                "bill_id": "test-1",
+                "title": "Test Bill 1",
+                "status": BillStatus.UNDER_REVIEW.name,
+                "submitter": "政府",
+                "diet_session": "204",
+                "house_of_origin": "参議院",
+                "submitted_date": date(2021, 1, 1),
+                "updated_at": datetime.now(UTC),
+            },
+            {
+                "bill_id": "test-2",
+                "title": "Test Bill 2",
+                "status": BillStatus.PASSED.name,
+                "stage": "審議中",
+                "submitter": "議員",
+                "diet_session": "204",
+                "house_of_origin": "衆議院",
+                "submitted_date": date(2021, 2, 1),
+                # Naive timestamps are read as UTC
+                "updated_at": datetime.now(UTC).replace(tzinfo=None)
+                - timedelta(days=60),
+            },
+        ]
+
+        partial = self.audit_rows(quality_auditor, bills)
+        metrics = quality_auditor._calculate_overall_metrics(partial)
+
+        assert metrics.total_records == 2
+        assert metrics.valid_records == 2
+        assert metrics.completeness_rate == 1.0
+        assert metrics.accuracy_rate == pytest.approx(14 / 26)
+        assert metrics.consistency_rate == pytest.approx(5 / 6)
+        assert metrics.timeliness_rate == 0.5
+        assert metrics.overall_quality_score > 0
+
+    def test_detect_quality_issues(self, quality_auditor):
+        """Test quality issue detection"""
+        bill = {
+            "bill_id": "test-bill-1",
+            "title": "",  # Empty title
+            "status": "invalid_status",
+            "submitter": None,  # Missing submitter
+            "diet_session": "204",
+            "house_of_origin": "参議院",
+            "submitted_date": date(2021, 1, 1),
+            "updated_at": datetime.now(UTC),
+            "bill_outline": None,  # Missing enhanced field
+            "background_context": "短",  # Too short
+            "expected_effects": "デジタル社会の形成により行政サービスが向上する",
+        }
+
+        issues = self.audit_rows(quality_auditor, [bill]).issues
+
+        assert [(issue.field_name, issue.issue_type) for issue in issues] == [
+            ("title", QualityIssueType.EMPTY_FIELD),
+            ("submitter", QualityIssueType.MISSING_REQUIRED_FIELD),
+            ("bill_outline", QualityIssueType.MISSING_REQUIRED_FIELD),
+            ("background_context", QualityIssueType.POOR_JAPANESE_TEXT),
+            ("background_context", QualityIssueType.POOR_JAPANESE_TEXT),
+        ]
+
+    def test_duplicates_across_merged_batches(self, quality_auditor):
+        """Test that duplicates point at the first bill of all merged batches"""
+        rows = [
+            {"bill_id": f"bill-{i}", "title": "同一法案", "diet_session": "204"}
+            for i in range(4)
+        ]
+
+        partial = self.audit_rows(quality_auditor, rows[:1])
+        partial.merge(self.audit_rows(quality_auditor, rows[1:3]))
+        partial.merge(self.audit_rows(quality_auditor, rows[3:]))
+
+        duplicates = partial.duplicate_issues()
+        assert partial.total_records == 4
+        assert [issue.bill_id for issue in duplicates] == ["bill-1", "bill-2", "bill-3"]
+        assert all(
+            issue.description == "Potential duplicate of bill bill-0"
+            for issue in duplicates
+        )
+
+    def test_is_japanese_text_quality_good(self, quality_auditor):
+        """Test Japanese text quality validation"""
+        # Good Japanese text
+        good_text = "この法案は、デジタル社会の形成を目的としています。"
+        assert quality_auditor._is_japanese_text_quality_good(good_text)
+
+        # Too short
+        short_text = "短い"
+        assert not quality_auditor._is_japanese_text_quality_good(short_text)
+
+        # No Japanese characters
+        english_text = "This is English text only and should fail"
+        assert not quality_auditor._is_japanese_text_quality_good(english_text)
+
+    def test_calculate_bill_quality_score(self, quality_auditor):
+        """Test bill quality score calculation"""
+        # High quality bill
+        high_quality_bill = Mock(
+            title="デジタル社会形成基本法案",
+            status="審議中",
+            bill_outline="本法案は、デジタル社会の形成を推進し、国民の利便性向上を図ることを目的とする。",
+            background_context="近年のデジタル化の進展に伴い、行政手続きのデジタル化が急務となっている。",
+            expected_effects="本法案により、行政手続きの効率化が期待される。",
+        )
+
+        # Mock helper methods
+        quality_auditor._is_field_value_valid = Mock(return_value=True)
+        quality_auditor._is_japanese_text_quality_good = Mock(return_value=True)
+
+        score = quality_auditor._calculate_bill_quality_score(high_quality_bill)
+        assert score > 0.8
+
+        # Low quality bill
+        low_quality_bill = Mock(
+            title="テスト",
+            status="審議中",
+            bill_outline=None,
+            background_context=None,
+            expected_effects=None,
+        )
+
+        quality_auditor._is_field_value_valid = Mock(
+            side_effect=lambda field, value: value is not None
+        )
+
+        score = quality_auditor._calculate_bill_quality_score(low_quality_bill)
+        assert score < 0.5
+
+    def test_conduct_full_audit(self):
+        """Test full audit process streaming bills from the database"""
+        auditor = DataQualityAuditor("sqlite://", batch_size=2)
+        BillRecord.__table__.create(auditor.engine)
+        QualityAuditSummaryRecord.__table__.create(auditor.engine)
+        with Session(auditor.engine) as session:
+            session.add_all(
+                [
+                    BillRecord(
+                        bill_number="test-1",
+                        title="デジタル社会形成基本法案",
+                        status=BillStatus.UNDER_REVIEW.name,
+                        updated_at=datetime.now(UTC),
+                    ),
+                    BillRecord(
+                        bill_number="test-2",
+                        title="デジタル社会形成基本法案",
+                        status=BillStatus.PASSED.name,
+                        updated_at=datetime.now(UTC),
+                    ),
+                    BillRecord(
+                        bill_number="test-3",
+                        title="",
+                        status=BillStatus.UNDER_REVIEW.name,
+                    ),
+                ]
+            )
+            session.commit()
+
+        report = auditor.conduct_full_audit()
+
+        assert isinstance(report, QualityReport)
+        assert report.total_bills == 3
+        assert report.overall_metrics.total_records == 3
+        assert report.field_metrics["title"].valid_records == 2
+        assert report.issues_by_type["duplicate_data"] == 1
+        assert report.issues_by_type["inconsistent_data"] == 1
+        assert len(report.recommendations) > 0
+
+        trend = auditor.get_quality_trend(1)
+        assert trend["total_audits"] == 1
+        assert trend["total_bills"] == 3
+        assert trend["points"][0]["total_issues"] == len(report.issues)
+
+    def test_unknown_audited_field_is_rejected(self):
+        """Test that fields without a bills column fail the audit"""
+        auditor = DataQualityAuditor("sqlite://")
+        auditor.audited_columns.append("vote_results")
+
+        with pytest.raises(ValueError, match="vote_results"):
+            auditor._bill_columns()
+
+    def test_quality_trend_from_audit_summaries(self):
+        """Test trends read from stored audit summaries"""
+        auditor = DataQualityAuditor("sqlite://")
+        QualityAuditSummaryRecord.__table__.create(auditor.engine)
+        now = datetime.now(UTC)
+        with Session(auditor.engine) as session:
+            for days_ago, score in [(40, 0.1), (6, 0.5), (4, 0.6), (2, 0.7), (1, 0.8)]:
+                session.add(
+                    QualityAuditSummaryRecord(
+                        audited_at=now - timedelta(days=days_ago),
+                        total_bills=100 + days_ago,
+                        overall_quality_score=score,
+                        completeness_rate=score,
+                        accuracy_rate=score,
+                        consistency_rate=score,
+                        timeliness_rate=score,
+                        total_issues=10,
+                        field_metrics={},
+                        issues_by_type={},
+                        issues_by_severity={},
+                    )
+                )
+            session.commit()
+
+        trend = auditor.get_quality_trend(30)
+        assert trend["trend"] == "improving"
+        assert trend["total_audits"] == 4
+        assert trend["total_bills"] == 101
+        assert trend["overall_average"] == pytest.approx(0.65)
+
+        downsampled = auditor.get_quality_trend(30, max_points=2)
+        assert [point["overall_quality_score"] for point in downsampled["points"]] == [
+            pytest.approx(0.55),
+            pytest.approx(0.75),
+        ]
+        assert [point["audits"] for point in downsampled["points"]] == [2, 2]
+
+        # Uneven runs put the remainder in the latest point
+        uneven = auditor.get_quality_trend(30, max_points=3)
+        assert [point["audits"] for point in uneven["points"]] == [1, 1, 2]
+        assert uneven["points"][-1]["overall_quality_score"] == pytest.approx(0.75)
+        assert uneven["points"][-1]["total_bills"] == 101
+
+        # A cap at or above the number of audits keeps every audit
+        assert len(auditor.get_quality_trend(30, max_points=4)["points"]) == 4
+
+        assert auditor.get_quality_trend(0)["trend"] == "no_data"
@@ -2,48 +2,63 @@
 Tests for automatic history recording functionality.
 """
 
+import csv
+import gzip
+import io
+import json
 from datetime import UTC, datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-
-from ...shared.src.shared.models.bill_process_history import (
-    HistoryChangeType,
-    HistoryEventType,
-)
-from ..src.processor.bill_history_recorder import (
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from src.processor.bill_history_recorder import (
     BillChange,
     BillHistoryRecorder,
     BillSnapshot,
     ChangeDetectionMode,
     ChangeSignificance,
     HistoryRecordingResult,
+    count_history_by,
 )
-from ..src.scheduler.history_recording_scheduler import (
+from src.scheduler.history_recording_scheduler import (
     HistoryRecordingScheduler,
     ScheduleConfig,
     ScheduleFrequency,
 )
-from ..src.services.history_service import (
+from src.services.history_service import (
+    HistoryQuery,
     HistoryService,
 )
 
+from shared.models.bill_change_history import (
+    BillChangeHistoryRecord,
+    HistoryChangeType,
+    HistoryEventType,
+)
+from shared.models.bill_record import BillRecord
+from shared.models.bill_snapshot import BillSnapshotRecord
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """Create a SQLite database with the bill, history and snapshot tables."""
+    url = f"sqlite:///{tmp_path / 'history.db'}"
+    engine = create_engine(url)
+    BillRecord.__table__.create(engine)
+    BillChangeHistoryRecord.__table__.create(engine)
+    BillSnapshotRecord.__table__.create(engine)
+    return url
+
 
 class TestBillHistoryRecorder:
     """Test bill history recorder functionality"""
 
     @pytest.fixture
-    def mock_engine(self):
-        """Create mock database engine"""
-        engine = Mock()
-        engine.connect.return_value.__enter__.return_value = Mock()
-        return engine
-
-    @pytest.fixture
-    def history_recorder(self, mock_engine):
+    def history_recorder(self, database_url):
         """Create test history recorder"""
-        with patch("sqlalchemy.create_engine", return_value=mock_engine):
-            return BillHistoryRecorder("postgresql://test")
+        return BillHistoryRecorder(database_url)
 
     def test_create_bill_snapshot(self, history_recorder):
         """Test bill snapshot creation"""
@@ -52,7 +67,7 @@ class TestBillHistoryRecorder:
         mock_bill.bill_id = "test-bill-1"
         mock_bill.title = "Test Bill"
         mock_bill.status = "審議中"
-        mock_bill.stage = "committee_review"
+        mock_bill.inter_house_status = "衆議院送付"
         mock_bill.data_quality_score = 0.85
 
         # Create snapshot
@@ -61,7 +76,7 @@ class TestBillHistoryRecorder:
         assert snapshot.bill_id == "test-bill-1"
         assert "title" in snapshot.tracked_fields
         assert "status" in snapshot.tracked_fields
-        assert "stage" in snapshot.tracked_fields
+        assert "inter_house_status" in snapshot.tracked_fields
         assert snapshot.quality_score == 0.85
         assert len(snapshot.data_hash) > 0
 
@@ -134,7 +149,7 @@ class TestBillHistoryRecorder:
 
         # Similar strings (should be non-significant)
         assert not history_recorder._is_significant_change(
-            "title", "Test Bill", "Test Bill Updated"
+            "title", "Test Bill", "Test Bill."
         )
 
     def test_determine_change_type(self, history_recorder):
@@ -147,7 +162,7 @@ class TestBillHistoryRecorder:
 
         # Stage change
         change_type = history_recorder._determine_change_type(
-            "stage", "submitted", "committee_review"
+            "inter_house_status", "衆議院送付", "参議院送付"
         )
         assert change_type == HistoryChangeType.STAGE_TRANSITION
 
@@ -179,7 +194,7 @@ class TestBillHistoryRecorder:
 
         # Lower confidence for similar strings
         confidence = history_recorder._calculate_change_confidence(
-            "title", "Test Bill", "Test Bill v2"
+            "title", "Test Bill", "Test Bill."
         )
         assert confidence < 0.7
 
@@ -215,15 +230,12 @@ class TestBillHistoryRecorder:
         assert record.previous_values == {"status": "提出"}
         assert record.new_values == {"status": "審議中"}
 
-    @patch("sqlalchemy.orm.sessionmaker")
-    def test_detect_and_record_changes_success(
-        self, mock_session_maker, history_recorder
-    ):
+    def test_detect_and_record_changes_success(self, history_recorder):
         """Test successful change detection and recording"""
         # Mock session
         mock_session = Mock()
-        mock_session_maker.return_value = mock_session
-        mock_session.__enter__.return_value = mock_session
+        mock_session.__enter__ = Mock(return_value=mock_session)
+        mock_session.__exit__ = Mock(return_value=False)
 
         # Mock bill
         mock_bill = Mock()
@@ -233,19 +245,22 @@ class TestBillHistoryRecorder:
         mock_bill.updated_at = datetime.now(UTC)
 
         # Mock database query
-        mock_session.execute.return_value.scalars.return_value.all.return_value = [
-            mock_bill
-        ]
-
-        # Mock get_last_snapshot to return a different snapshot
-        with patch.object(history_recorder, "_get_last_snapshot") as mock_get_last:
-            mock_get_last.return_value = BillSnapshot(
-                bill_id="test-bill-1",
-                snapshot_time=datetime.now(UTC) - timedelta(hours=1),
-                data_hash="old-hash",
-                tracked_fields={"title": "Test Bill", "status": "提出"},
-                quality_score=0.7,
-            )
+        mock_session.execute.return_value.all.return_value = [mock_bill]
+
+        # Mock the batch snapshot load to return a different snapshot
+        with (
+            patch.object(history_recorder, "SessionLocal", return_value=mock_session),
+            patch.object(history_recorder, "_load_snapshots") as mock_load,
+        ):
+            mock_load.return_value = {
+                "test-bill-1": BillSnapshot(
+                    bill_id="test-bill-1",
+                    snapshot_time=datetime.now(UTC) - timedelta(hours=1),
+                    data_hash="old-hash",
+                    tracked_fields={"title": "Test Bill", "status": "提出"},
+                    quality_score=0.7,
+                )
+            }
 
             result = history_recorder.detect_and_record_changes(
                 mode=ChangeDetectionMode.INCREMENTAL
@@ -255,10 +270,148 @@ class TestBillHistoryRecorder:
             assert result.total_bills_checked == 1
             assert result.changes_detected > 0
 
+    def test_process_bill_batch_skips_unchanged_hash(self, history_recorder):
+        """Bills whose data_hash matches the stored snapshot are not diffed"""
+        mock_session = Mock()
+
+        unchanged_bill = Mock()
+        unchanged_bill.bill_id = "bill-unchanged"
+        unchanged_bill.title = "Same Bill"
+        unchanged_bill.status = "審議中"
+
+        changed_bill = Mock()
+        changed_bill.bill_id = "bill-changed"
+        changed_bill.title = "Changed Bill"
+        changed_bill.status = "成立"
+
+        unchanged_snapshot = history_recorder._create_bill_snapshot(unchanged_bill)
+        stored = {
+            "bill-unchanged": unchanged_snapshot,
+            "bill-changed": BillSnapshot(
+                bill_id="bill-changed",
+                snapshot_time=datetime.now(UTC) - timedelta(hours=1),
+                data_hash="old-hash",
+                tracked_fields={"title": "Changed Bill", "status": "審議中"},
+                quality_score=0.7,
+            ),
+        }
+
+        with (
+            patch.object(
+                history_recorder, "_load_snapshots", return_value=stored
+            ) as mock_load,
+            patch.object(
+                history_recorder, "_detect_changes", return_value=[]
+            ) as mock_detect,
+            patch.object(history_recorder, "_store_snapshots") as mock_store,
+        ):
+            result = history_recorder._process_bill_batch(
+                mock_session, [unchanged_bill, changed_bill]
+            )
+
+        mock_load.assert_called_once_with(
+            mock_session, ["bill-unchanged", "bill-changed"]
+        )
+        assert result.bills_unchanged == 1
+        assert mock_detect.call_count == 1
+        stored_ids = [s.bill_id for s in mock_store.call_args.args[1]]
+        assert stored_ids == ["bill-changed"]
+        mock_session.commit.assert_called_once()
+
+    def test_store_snapshots_refreshes_updated_at(self, history_recorder):
+        """Re-storing a snapshot overwrites it and bumps updated_at"""
+        snapshot = BillSnapshot(
+            bill_id="bill-001",
+            snapshot_time=datetime.now(UTC),
+            data_hash="first-hash",
+            tracked_fields={"title": "Test Bill"},
+            quality_score=0.7,
+        )
+        stale = datetime(2020, 1, 1, tzinfo=UTC)
+
+        with history_recorder.SessionLocal() as session:
+            history_recorder._store_snapshots(session, [snapshot])
+            session.execute(update(BillSnapshotRecord).values(updated_at=stale))
+            snapshot.data_hash = "second-hash"
+            history_recorder._store_snapshots(session, [snapshot])
+            session.commit()
+
+            record = session.scalars(select(BillSnapshotRecord)).one()
+
+        assert record.data_hash == "second-hash"
+        assert record.updated_at.replace(tzinfo=UTC) > stale
+
+    def test_iter_bill_batches_pages_by_keyset(self, history_recorder):
+        """Bills are streamed in pages until a short page is returned"""
+        rows = [Mock(bill_id=f"bill-{i:03d}") for i in range(5)]
+        pages = [rows[0:2], rows[2:4], rows[4:5]]
+
+        mock_session = Mock()
+        mock_session.execute.side_effect = [
+            Mock(all=Mock(return_value=page)) for page in pages
+        ]
+
+        batches = list(
+            history_recorder._iter_bill_batches(
+                mock_session, ChangeDetectionMode.FULL_SCAN, batch_size=2
+            )
+        )
+
+        assert batches == pages
+        assert mock_session.execute.call_count == 3
+
+    def test_full_scan_records_changes(self, history_recorder):
+        """Changed bill columns are recorded as history rows on the next scan"""
+        with history_recorder.engine.begin() as connection:
+            connection.execute(
+                insert(BillRecord),
+                [
+                    {
+                        "bill_number": f"217-{i:03d}",
+                        "title": f"テスト法案{i}",
+                        "status": "UNDER_REVIEW",
+                        "diet_session": "217",
+                    }
+                    for i in range(5)
+                ],
+            )
+
+        history_recorder.config["max_bills_per_batch"] = 2
+        result = history_recorder.force_full_scan()
+        assert result.total_bills_checked == 5
+        assert result.changes_detected == 0
+        assert not result.errors
+
+        with history_recorder.engine.begin() as connection:
+            connection.execute(
+                update(BillRecord)
+                .where(BillRecord.bill_number == "217-003")
+                .values(status="PASSED")
+            )
+
+        result = history_recorder.force_full_scan()
+        assert result.bills_unchanged == 4
+        assert result.history_records_created == 1
+        assert result.changes_by_type == {HistoryChangeType.STATUS_CHANGE: 1}
+
+        with history_recorder.SessionLocal() as session:
+            record = session.execute(select(BillChangeHistoryRecord)).scalar_one()
+        assert record.bill_id == "217-003"
+        assert record.event_type == HistoryEventType.STATUS_UPDATE
+        assert record.previous_values == {"status": "UNDER_REVIEW"}
+        assert record.new_values == {"status": "PASSED"}
+
+    def test_unknown_tracked_field_is_rejected(self, history_recorder):
+        """Tracked fields that are not bill columns fail loudly"""
+        history_recorder.config["tracked_fields"].append("stage")
+
+        with pytest.raises(ValueError, match="stage"):
+            history_recorder._bill_columns()
+
     def test_cleanup_old_snapshots(self, history_recorder):
         """Test cleanup of old snapshots"""
         with patch.object(history_recorder, "SessionLocal") as mock_session_local:
-            mock_session = Mock()
+            mock_session = MagicMock()
             mock_session_local.return_value = mock_session
             mock_session.__enter__.return_value = mock_session
 
@@ -275,6 +428,35 @@ class TestBillHistoryRecorder:
             assert mock_session.delete.call_count == 2
             mock_session.commit.assert_called_once()
 
+    def test_get_change_statistics_uses_aggregates(self, history_recorder):
+        """Statistics are built from aggregate rows, not history records"""
+        with patch.object(history_recorder, "SessionLocal") as mock_session_local:
+            mock_session = Mock()
+            mock_session_local.return_value.__enter__ = Mock(return_value=mock_session)
+            mock_session_local.return_value.__exit__ = Mock(return_value=False)
+
+            totals = Mock()
+            totals.one.return_value = (3, 2, 0.9)
+            mock_session.execute.side_effect = [
+                totals,
+                iter([(HistoryChangeType.STATUS_CHANGE, 3)]),
+                iter(
+                    [
+                        (HistoryEventType.STATUS_UPDATE, 2),
+                        (HistoryEventType.STAGE_CHANGE, 1),
+                    ]
+                ),
+            ]
+
+            stats = history_recorder.get_change_statistics(days=7)
+
+        assert stats["total_changes"] == 3
+        assert stats["unique_bills"] == 2
+        assert stats["average_confidence"] == 0.9
+        assert stats["changes_by_type"] == {"status_change": 3}
+        assert stats["changes_by_event"] == {"status_update": 2, "stage_change": 1}
+        mock_session.execute.return_value.scalars.assert_not_called()
+
 
 class TestHistoryRecordingScheduler:
     """Test history recording scheduler"""
@@ -291,9 +473,9 @@ class TestHistoryRecordingScheduler:
         )
 
     @pytest.fixture
-    def scheduler(self, scheduler_config):
+    def scheduler(self, database_url, scheduler_config):
         """Create test scheduler"""
-        return HistoryRecordingScheduler("postgresql://test", scheduler_config)
+        return HistoryRecordingScheduler(database_url, scheduler_config)
 
     def test_scheduler_initialization(self, scheduler):
         """Test scheduler initialization"""
@@ -365,13 +547,13 @@ class TestHistoryService:
     """Test history service"""
 
     @pytest.fixture
-    def history_service(self):
+    def history_service(self, database_url):
         """Create test history service"""
-        return HistoryService("postgresql://test")
+        return HistoryService(database_url)
 
-    def test_service_initialization(self, history_service):
+    def test_service_initialization(self, history_service, database_url):
         """Test service initialization"""
-        assert history_service.database_url == "postgresql://test"
+        assert history_service.database_url == database_url
         assert history_service.history_recorder is not None
         assert history_service.scheduler is None
 
@@ -379,8 +561,8 @@ class TestHistoryService:
         """Test scheduler initialization"""
         config = ScheduleConfig(frequency=ScheduleFrequency.HOURLY)
 
-        with patch.object(
-            history_service, "HistoryRecordingScheduler"
+        with patch(
+            "src.services.history_service.HistoryRecordingScheduler"
         ) as mock_scheduler_class:
             mock_scheduler = Mock()
             mock_scheduler_class.return_value = mock_scheduler
@@ -409,41 +591,28 @@ class TestHistoryService:
             assert result.changes_detected == 2
             mock_detect.assert_called_once()
 
-    @patch("sqlalchemy.orm.sessionmaker")
-    def test_get_bill_history(self, mock_session_maker, history_service):
+    def test_get_bill_history(self, history_service):
         """Test bill history retrieval"""
-        # Mock session
-        mock_session = Mock()
-        mock_session_maker.return_value = mock_session
-        mock_session.__enter__.return_value = mock_session
-
-        # Mock history record
-        mock_record = Mock()
-        mock_record.id = 1
-        mock_record.bill_id = "test-bill-1"
-        mock_record.event_type = HistoryEventType.STATUS_UPDATE
-        mock_record.change_type = HistoryChangeType.STATUS_CHANGE
-        mock_record.recorded_at = datetime.now(UTC)
-        mock_record.change_summary = "Status changed"
-        mock_record.confidence_score = 0.9
-        mock_record.source_system = "auto_recorder"
-        mock_record.previous_values = {"status": "提出"}
-        mock_record.new_values = {"status": "審議中"}
-        mock_record.metadata = {"test": "value"}
-
-        mock_session.execute.return_value.scalars.return_value.all.return_value = [
-            mock_record
-        ]
+        history_service.history_recorder.record_manual_change(
+            bill_id="test-bill-1",
+            field_name="status",
+            old_value="提出",
+            new_value="審議中",
+            change_reason="Status changed",
+            user_id="admin",
+        )
 
         history = history_service.get_bill_history("test-bill-1")
 
         assert len(history) == 1
         record = history[0]
         assert record["bill_id"] == "test-bill-1"
-        assert record["event_type"] == "STATUS_UPDATE"
-        assert record["change_type"] == "STATUS_CHANGE"
-        assert record["confidence_score"] == 0.9
-        assert record["metadata"] == {"test": "value"}
+        assert record["event_type"] == "manual_correction"
+        assert record["change_type"] == "data_correction"
+        assert record["confidence_score"] == 1.0
+        assert record["previous_values"] == {"status": "提出"}
+        assert record["new_values"] == {"status": "審議中"}
+        assert record["metadata"]["user_id"] == "admin"
 
     def test_record_manual_change(self, history_service):
         """Test manual change recording"""
@@ -511,60 +680,295 @@ class TestHistoryService:
             assert result["history_records_created"] == 3
             assert result["processing_time_ms"] == 2000.0
 
+    def test_export_cursor_round_trip(self, history_service):
+        """Export cursors decode back to the position they encode"""
+        recorded_at = datetime(2025, 6, 1, 12, 30, tzinfo=UTC)
+        cursor = history_service.encode_export_cursor(recorded_at, 42)
+
+        assert history_service.decode_export_cursor(cursor) == (recorded_at, 42)
+        with pytest.raises(ValueError):
+            history_service.decode_export_cursor("not-a-cursor")
+
+    def test_export_history_streams_ndjson_in_chunks(self, history_service):
+        """Exported records are streamed as NDJSON chunks"""
+        history_service.config["export_chunk_bytes"] = 1
+        rows = [{"id": i, "cursor": f"c{i}"} for i in range(3)]
+
+        with patch.object(
+            history_service, "iter_history_records", return_value=iter(rows)
+        ):
+            chunks = list(history_service.iter_export_chunks(HistoryQuery()))
+
+        assert len(chunks) == 3
+        assert [json.loads(chunk) for chunk in chunks] == rows
+
+    def test_export_history_rejects_unknown_format(self, history_service):
+        """Unsupported export formats return an error"""
+        result = history_service.export_history(HistoryQuery(), format="xml")
+
+        assert result["error"] == "Unsupported format: xml"
+        assert result["supported_formats"] == ["json", "ndjson", "csv"]
+
+    def test_export_history_json_is_default(self, history_service):
+        """The default json export returns one payload"""
+        seed_history(history_service.engine, datetime.now(UTC))
+
+        result = history_service.export_history(HistoryQuery(limit=2, offset=1))
+
+        assert result["format"] == "json"
+        assert result["total_records"] == 6
+        assert len(result["data"]["records"]) == 6
+
+    def test_export_chunks_are_measured_in_bytes(self, history_service):
+        """Chunk size counts encoded bytes, not characters"""
+        rows = [{"id": i, "change_summary": "法案の状態を更新" * 4} for i in range(3)]
+        line_chars = len(json.dumps(rows[0], ensure_ascii=False)) + 1
+        # One line is under the limit in characters but over it in bytes
+        history_service.config["export_chunk_bytes"] = line_chars + 10
+
+        with patch.object(
+            history_service, "iter_history_records", return_value=iter(rows)
+        ):
+            chunks = list(history_service.iter_export_chunks(HistoryQuery()))
+
+        assert len(chunks) == 3
+        assert [json.loads(chunk.decode()) for chunk in chunks] == rows
+
+    @pytest.mark.asyncio
+    async def test_export_csv(self, history_service):
+        """CSV exports have a header row and JSON-encoded value columns"""
+        seed_history(history_service.engine, datetime.now(UTC))
+
+        response = history_service.export_history(
+            HistoryQuery(bill_id="bill-a"), format="csv"
+        )
+        body = await read_body(response)
+
+        assert response.media_type == "text/csv"
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert [row["bill_id"] for row in rows] == ["bill-a"] * 3
+        assert rows[0]["change_type"] == "status_change"
+        assert rows[0]["metadata"] == "null"
+        assert all(row["cursor"] for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_export_gzip(self, history_service):
+        """Compressed exports decompress to the plain export"""
+        seed_history(history_service.engine, datetime.now(UTC))
+
+        plain = await read_body(
+            history_service.export_history(HistoryQuery(), "ndjson")
+        )
+        response = history_service.export_history(
+            HistoryQuery(), "ndjson", compress=True
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(await read_body(response)) == plain
+
+    @pytest.mark.asyncio
+    async def test_export_resumes_after_cursor(self, history_service):
+        """Passing the last cursor received resumes after that record"""
+        seed_history(history_service.engine, datetime.now(UTC))
+
+        body = await read_body(history_service.export_history(HistoryQuery(), "ndjson"))
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        assert len(records) == 6
+        recorded_at = [record["recorded_at"] for record in records]
+        assert recorded_at == sorted(recorded_at)
+
+        resumed = history_service.export_history(
+            HistoryQuery(), "ndjson", cursor=records[2]["cursor"]
+        )
+        body = await read_body(resumed)
+        assert [json.loads(line) for line in body.decode().splitlines()] == (
+            records[3:]
+        )
+
+        result = history_service.export_history(
+            HistoryQuery(), "ndjson", cursor="not-a-cursor"
+        )
+        assert result["error"].startswith("Invalid cursor")
+
+
+async def read_body(response) -> bytes:
+    """Collect the body of a streaming response"""
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def seed_history(engine, now: datetime) -> None:
+    """Insert history rows for three bills over the last three days"""
+    rows = [
+        ("bill-a", HistoryChangeType.STATUS_CHANGE, 0.9, 0),
+        ("bill-a", HistoryChangeType.STAGE_TRANSITION, 0.5, 0),
+        ("bill-a", HistoryChangeType.STATUS_CHANGE, 0.7, 1),
+        ("bill-b", HistoryChangeType.DOCUMENT_UPDATE, 0.6, 2),
+        ("bill-c", HistoryChangeType.STATUS_CHANGE, 1.0, 2),
+        # Outside a seven-day window
+        ("bill-c", HistoryChangeType.STATUS_CHANGE, 0.1, 10),
+    ]
+    events = {
+        HistoryChangeType.STATUS_CHANGE: HistoryEventType.STATUS_UPDATE,
+        HistoryChangeType.STAGE_TRANSITION: HistoryEventType.STAGE_CHANGE,
+        HistoryChangeType.DOCUMENT_UPDATE: HistoryEventType.DOCUMENT_UPDATE,
+    }
+    with Session(engine) as session:
+        session.execute(
+            insert(BillChangeHistoryRecord),
+            [
+                {
+                    "bill_id": bill_id,
+                    "event_type": events[change_type],
+                    "change_type": change_type,
+                    "recorded_at": now - timedelta(days=days_ago, minutes=i),
+                    "confidence_score": confidence,
+                    "source_system": "auto_history_recorder",
+                }
+                for i, (bill_id, change_type, confidence, days_ago) in enumerate(rows)
+            ],
+        )
+        session.commit()
+
+
+class TestHistoryAggregates:
+    """Aggregate queries of the recorder and service against SQLite"""
+
+    @pytest.fixture
+    def history_service(self, database_url):
+        service = HistoryService(database_url)
+        seed_history(service.engine, datetime.now(UTC))
+        return service
+
+    def test_count_history_by(self, history_service):
+        with history_service.SessionLocal() as session:
+            counts = count_history_by(
+                session,
+                BillChangeHistoryRecord.change_type,
+                BillChangeHistoryRecord.bill_id != "bill-b",
+            )
+
+        assert counts == {"status_change": 4, "stage_transition": 1}
+
+    def test_change_statistics(self, history_service):
+        stats = history_service.history_recorder.get_change_statistics(days=7)
+
+        assert stats["total_changes"] == 5
+        assert stats["unique_bills"] == 3
+        assert stats["average_confidence"] == pytest.approx(0.74)
+        assert stats["changes_by_type"] == {
+            "status_change": 3,
+            "stage_transition": 1,
+            "document_update": 1,
+        }
+        assert stats["changes_by_event"]["status_update"] == 3
+
+    def test_analytics(self, history_service):
+        analytics = history_service.get_analytics(days=7)
+
+        assert analytics.total_records == 5
+        assert analytics.unique_bills == 3
+        assert analytics.event_type_distribution == {
+            "status_update": 3,
+            "stage_change": 1,
+            "document_update": 1,
+        }
+        assert analytics.confidence_stats == {
+            "min": 0.5,
+            "max": 1.0,
+            "avg": pytest.approx(0.74),
+            "median": 0.7,
+        }
+        assert analytics.top_active_bills[0] == {
+            "bill_id": "bill-a",
+            "activity_count": 3,
+        }
+
+        timeline = {day["date"]: day for day in analytics.activity_timeline}
+        assert len(timeline) == 8
+        assert sum(day["total_changes"] for day in timeline.values()) == 5
+        today = timeline[datetime.now().date().isoformat()]
+        assert today["total_changes"] == 2
+        assert sorted(today["event_types"]) == ["stage_change", "status_update"]
+
+    def test_analytics_empty_window(self, database_url):
+        analytics = HistoryService(database_url).get_analytics(days=7)
+
+        assert analytics.total_records == 0
+        assert analytics.confidence_stats == {}
+
+    def test_postgresql_uses_percentile_and_date_trunc(self, history_service):
+        """On PostgreSQL the median and day buckets are computed natively"""
+        statements = []
+        session = Mock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+
+        def execute(statement):
+            statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            result = MagicMock()
+            result.one.return_value = (3, 0.1, 0.9, 0.5)
+            result.scalar.return_value = 0.5
+            result.__iter__.return_value = iter([])
+            return result
+
+        session.execute.side_effect = execute
+        in_window = BillChangeHistoryRecord.recorded_at >= datetime(2025, 1, 1)
+
+        stats = history_service._calculate_confidence_stats(session, in_window)
+        history_service._calculate_activity_timeline(
+            session, in_window, datetime(2025, 1, 1), datetime(2025, 1, 2)
+        )
+
+        assert stats["median"] == 0.5
+        assert (
+            "WITHIN GROUP (ORDER BY bill_change_history.confidence_score)"
+            in statements[1]
+        )
+        assert "date_trunc(" in statements[2]
+        assert "OFFSET" not in statements[1]
+
 
 class TestIntegrationScenarios:
     """Test integration scenarios"""
 
-    def test_end_to_end_history_recording(self):
+    def test_end_to_end_history_recording(self, database_url):
         """Test complete history recording workflow"""
-        # This would be a full integration test with real database
-        # Mock the entire flow for now
-
-        with patch("sqlalchemy.create_engine") as mock_engine_create:
-            mock_engine = Mock()
-            mock_engine_create.return_value = mock_engine
+        # Create service
+        service = HistoryService(database_url)
 
-            # Create service
-            service = HistoryService("postgresql://test")
+        # Initialize scheduler
+        config = ScheduleConfig(frequency=ScheduleFrequency.EVERY_30_MINUTES)
 
-            # Initialize scheduler
-            config = ScheduleConfig(frequency=ScheduleFrequency.EVERY_30_MINUTES)
-
-            with patch.object(service, "HistoryRecordingScheduler"):
-                result = service.initialize_scheduler(config)
-                assert result
+        with patch("src.services.history_service.HistoryRecordingScheduler"):
+            result = service.initialize_scheduler(config)
+            assert result
 
-    def test_change_detection_workflow(self):
+    def test_change_detection_workflow(self, database_url):
         """Test change detection workflow"""
-        with patch("sqlalchemy.create_engine") as mock_engine_create:
-            mock_engine = Mock()
-            mock_engine_create.return_value = mock_engine
-
-            recorder = BillHistoryRecorder("postgresql://test")
-
-            # Mock the workflow
-            with (
-                patch.object(recorder, "_get_bills_to_check") as mock_get_bills,
-                patch.object(recorder, "_process_bill_batch") as mock_process,
-            ):
-                # Mock bills
-                mock_bills = [Mock(), Mock()]
-                mock_get_bills.return_value = mock_bills
-
-                # Mock batch result
-                mock_batch_result = HistoryRecordingResult(
-                    total_bills_checked=2, changes_detected=1, history_records_created=1
-                )
-                mock_process.return_value = mock_batch_result
+        recorder = BillHistoryRecorder(database_url)
+
+        # Mock the workflow
+        with (
+            patch.object(recorder, "_iter_bill_batches") as mock_get_bills,
+            patch.object(recorder, "_process_bill_batch") as mock_process,
+        ):
+            # Mock bills
+            mock_bills = [Mock(), Mock()]
+            mock_get_bills.return_value = [mock_bills]
+
+            # Mock batch result
+            mock_batch_result = HistoryRecordingResult(
+                total_bills_checked=2, changes_detected=1, history_records_created=1
+            )
+            mock_process.return_value = mock_batch_result
 
-                # Execute
-                result = recorder.detect_and_record_changes(
-                    mode=ChangeDetectionMode.INCREMENTAL
-                )
+            # Execute
+            result = recorder.detect_and_record_changes(
+                mode=ChangeDetectionMode.INCREMENTAL
+            )
 
-                assert result.total_bills_checked == 2
-                assert result.changes_detected == 1
-                assert result.history_records_created == 1
+            assert result.total_bills_checked == 2
+            assert result.changes_detected == 1
+            assert result.history_records_created == 1
 
 
 if __name__ == "__main__":
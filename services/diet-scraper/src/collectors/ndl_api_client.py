@@ -6,17 +6,26 @@ with proper error handling and exponential backoff.
 
 Rate Limit: ≤3 requests/second (polite crawling)
 API Documentation: https://kokkai.ndl.go.jp/api/
+
+Responses can optionally be stored in an on-disk, content-addressed cache so
+that re-runs, tests and backfill replays are served locally instead of
+re-hitting the NDL API.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-import time
+import os
+import tempfile
 from dataclasses import dataclass
 from datetime import date, datetime
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlencode
 
 import httpx
+from shared.utils.rate_limiter import TokenBucketRateLimiter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
@@ -32,6 +41,8 @@ class NDLMeeting:
     committee_name: str | None = None
     meeting_type: str | None = None
     pdf_url: str | None = None
+    # Speech records embedded in the meeting response (None if not requested)
+    speeches: list["NDLSpeech"] | None = None
 
 
 @dataclass
@@ -48,37 +59,104 @@ class NDLSpeech:
     speech_datetime: datetime | None = None
 
 
-class NDLRateLimiter:
-    """Rate limiter for NDL API (≤3 requests/second)"""
+class NDLRateLimiter(TokenBucketRateLimiter):
+    """Rate limiter for NDL API (≤3 requests/second)
+
+    Requests are spaced evenly (burst of 1): a larger burst would let a full
+    burst plus the refill through in the first second, exceeding the limit.
+    """
 
     def __init__(self, max_requests: int = 3, per_seconds: float = 1.0):
+        super().__init__(rate=max_requests / per_seconds, burst=1, name="ndl_api")
         self.max_requests = max_requests
         self.per_seconds = per_seconds
-        self.requests = []
-        self._lock = asyncio.Lock()
 
-    async def acquire(self):
-        """Acquire permission to make a request"""
-        async with self._lock:
-            now = time.time()
 
-            # Remove old requests outside the window
-            self.requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.per_seconds
-            ]
+class NDLCacheMissError(LookupError):
+    """Raised in offline mode when a request is not present in the cache"""
+
+
+class NDLResponseCache:
+    """
+    Content-addressed on-disk cache for NDL API responses
+
+    Entries are keyed by a SHA-256 digest of the endpoint and the normalized
+    query parameters, and stored as JSON files sharded by the first two hex
+    characters of the key. Writes are atomic so that concurrent runs never
+    observe partially written entries.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Build a stable cache key from endpoint and query parameters"""
+        normalized = {str(k): str(v) for k, v in params.items()}
+        payload = json.dumps(
+            {"endpoint": endpoint, "params": normalized},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the cached response, or None if not cached"""
+        path = self._path_for(self.make_key(endpoint, params))
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable NDL cache entry {path}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.get("response")
+
+    def put(
+        self, endpoint: str, params: dict[str, Any], response: dict[str, Any]
+    ) -> None:
+        """Store a response atomically"""
+        key = self.make_key(endpoint, params)
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "endpoint": endpoint,
+            "params": {str(k): str(v) for k, v in params.items()},
+            "cached_at": datetime.now().isoformat(),
+            "response": response,
+        }
 
-            # Wait if we've hit the limit
-            if len(self.requests) >= self.max_requests:
-                sleep_time = self.per_seconds - (now - self.requests[0])
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                    # Retry after sleeping
-                    return await self.acquire()
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
-            # Record this request
-            self.requests.append(now)
+    def get_statistics(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics"""
+        total = self.hits + self.misses
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
 
 
 class NDLAPIClient:
@@ -90,10 +168,32 @@ class NDLAPIClient:
     """
 
     BASE_URL = "https://kokkai.ndl.go.jp/api"
+    SPEECH_PAGE_SIZE = 100  # API limit for the speech endpoint
+
+    def __init__(
+        self,
+        max_requests_per_second: int = 3,
+        timeout: float = 30.0,
+        cache_dir: str | Path | None = None,
+        offline: bool = False,
+        prefetch_concurrency: int = 3,
+    ):
+        """
+        Args:
+            max_requests_per_second: Rate limit for live API requests
+            timeout: HTTP timeout in seconds
+            cache_dir: Directory for the response cache (None disables caching)
+            offline: Serve requests from the cache only, never hitting NDL
+            prefetch_concurrency: Max speech pages fetched concurrently
+        """
+        if offline and cache_dir is None:
+            raise ValueError("offline mode requires a cache_dir")
 
-    def __init__(self, max_requests_per_second: int = 3, timeout: float = 30.0):
         self.rate_limiter = NDLRateLimiter(max_requests_per_second)
         self.timeout = timeout
+        self.cache = NDLResponseCache(cache_dir) if cache_dir is not None else None
+        self.offline = offline
+        self.prefetch_concurrency = max(1, prefetch_concurrency)
         self.logger = logging.getLogger(__name__)
 
         # HTTP client with proper headers
@@ -110,12 +210,31 @@ class NDLAPIClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.client.aclose()
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=60)
-    )
     async def _make_request(
         self, endpoint: str, params: dict[str, Any]
     ) -> dict[str, Any]:
+        """Make API request, served from the response cache when possible"""
+        if self.cache:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                self.logger.debug(f"NDL API cache hit: {endpoint} {params}")
+                return cached
+            if self.offline:
+                raise NDLCacheMissError(
+                    f"No cached NDL response for {endpoint} {params}"
+                )
+
+        data = await self._fetch(endpoint, params)
+
+        if self.cache:
+            self.cache.put(endpoint, params, data)
+
+        return data
+
+    @retry(
+        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=60)
+    )
+    async def _fetch(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
         """Make rate-limited API request with retry logic"""
         await self.rate_limiter.acquire()
 
@@ -137,8 +256,14 @@ class NDLAPIClient:
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:  # Rate limit exceeded
-                self.logger.warning("NDL API rate limit exceeded, waiting 60s")
-                await asyncio.sleep(60)
+                # Pause the shared limiter instead of sleeping here, so every
+                # pending request backs off and no caller holds a slot meanwhile
+                pause = self.rate_limiter.pause_for_retry_after(
+                    e.response.headers, default=60.0
+                )
+                self.logger.warning(
+                    f"NDL API rate limit exceeded, pausing requests for {pause:.0f}s"
+                )
                 raise
             elif 500 <= e.response.status_code < 600:  # Server error
                 self.logger.error(f"NDL API server error: {e}")
@@ -159,6 +284,7 @@ class NDLAPIClient:
         committee: str | None = None,
         start_record: int = 1,
         max_records: int = 100,
+        include_speeches: bool = False,
     ) -> list[NDLMeeting]:
         """
         Search for meetings using NDL API
@@ -171,6 +297,9 @@ class NDLAPIClient:
             committee: Committee name
             start_record: Starting record number (1-indexed)
             max_records: Maximum records to return (1-100)
+            include_speeches: Parse the speech records embedded in the meeting
+                response into ``NDLMeeting.speeches`` so no separate speech
+                requests are needed
 
         Returns:
             List of NDLMeeting objects
@@ -202,6 +331,10 @@ class NDLAPIClient:
             for record in meeting_records:
                 meeting = self._parse_meeting_record(record)
                 if meeting:
+                    if include_speeches:
+                        meeting.speeches = self._parse_embedded_speeches(
+                            record, meeting.meeting_id
+                        )
                     meetings.append(meeting)
 
             return meetings
@@ -224,61 +357,95 @@ class NDLAPIClient:
         Returns:
             List of NDLSpeech objects
         """
+        try:
+            speeches, _ = await self._get_speech_page(
+                meeting_id, start_record, max_records
+            )
+            return speeches
+
+        except Exception as e:
+            self.logger.error(f"Failed to get speeches for meeting {meeting_id}: {e}")
+            return []
+
+    async def _get_speech_page(
+        self, meeting_id: str, start_record: int, max_records: int
+    ) -> tuple[list[NDLSpeech], int]:
+        """Fetch one page of speeches, returning them with the total record count"""
         params = {
             "startRecord": start_record,
-            "maximumRecords": min(max_records, 100),
+            "maximumRecords": min(max_records, self.SPEECH_PAGE_SIZE),
             "meetingId": meeting_id,
         }
 
-        try:
-            data = await self._make_request("speech", params)
-            speeches = []
+        data = await self._make_request("speech", params)
 
-            speech_records = data.get("speechRecord", [])
-            self.logger.info(
-                f"Found {len(speech_records)} speeches for meeting {meeting_id}"
-            )
+        speech_records = data.get("speechRecord", [])
+        self.logger.info(
+            f"Found {len(speech_records)} speeches for meeting {meeting_id}"
+        )
 
-            for record in speech_records:
-                speech = self._parse_speech_record(record)
-                if speech:
-                    speeches.append(speech)
+        speeches = []
+        for record in speech_records:
+            speech = self._parse_speech_record(record)
+            if speech:
+                speeches.append(speech)
 
-            return speeches
+        try:
+            total = int(data.get("numberOfRecords", 0))
+        except (TypeError, ValueError):
+            total = 0
 
-        except Exception as e:
-            self.logger.error(f"Failed to get speeches for meeting {meeting_id}: {e}")
-            return []
+        return speeches, total
 
-    async def get_all_speeches_for_meeting(self, meeting_id: str) -> list[NDLSpeech]:
+    async def get_all_speeches_for_meeting(
+        self, meeting_id: str, meeting: NDLMeeting | None = None
+    ) -> list[NDLSpeech]:
         """
         Get all speech records for a meeting (handles pagination)
 
+        If ``meeting`` already carries embedded speeches (see
+        ``search_meetings(include_speeches=True)``) they are returned directly.
+        Otherwise the first page is fetched to learn the total record count and
+        the remaining pages are prefetched concurrently, bounded by
+        ``prefetch_concurrency`` and the rate limiter.
+
         Args:
             meeting_id: NDL meeting ID
+            meeting: Optional meeting object with embedded speeches
 
         Returns:
             List of all NDLSpeech objects for the meeting
         """
-        all_speeches = []
-        start_record = 1
-        batch_size = 100
+        if meeting is not None and meeting.speeches is not None:
+            return list(meeting.speeches)
 
-        while True:
-            speeches = await self.get_speeches(
-                meeting_id=meeting_id, start_record=start_record, max_records=batch_size
-            )
+        batch_size = self.SPEECH_PAGE_SIZE
 
-            if not speeches:
-                break
+        try:
+            all_speeches, total = await self._get_speech_page(meeting_id, 1, batch_size)
+        except Exception as e:
+            self.logger.error(f"Failed to get speeches for meeting {meeting_id}: {e}")
+            return []
 
-            all_speeches.extend(speeches)
+        if all_speeches and total > len(all_speeches):
+            semaphore = asyncio.Semaphore(self.prefetch_concurrency)
 
-            # Check if we've reached the end
-            if len(speeches) < batch_size:
-                break
+            async def fetch_page(start_record: int) -> list[NDLSpeech]:
+                async with semaphore:
+                    return await self.get_speeches(
+                        meeting_id=meeting_id,
+                        start_record=start_record,
+                        max_records=batch_size,
+                    )
 
-            start_record += batch_size
+            pages = await asyncio.gather(
+                *(
+                    fetch_page(start_record)
+                    for start_record in range(1 + batch_size, total + 1, batch_size)
+                )
+            )
+            for page in pages:
+                all_speeches.extend(page)
 
         self.logger.info(
             f"Retrieved {len(all_speeches)} total speeches for meeting {meeting_id}"
@@ -316,6 +483,19 @@ class NDLAPIClient:
             self.logger.error(f"Failed to parse meeting record: {e}")
             return None
 
+    def _parse_embedded_speeches(
+        self, record: dict[str, Any], meeting_id: str
+    ) -> list[NDLSpeech]:
+        """Parse speech records embedded in a meeting record"""
+        speeches = []
+        for speech_record in record.get("speechRecord", []) or []:
+            speech = self._parse_speech_record(
+                {"meetingId": meeting_id, **speech_record}
+            )
+            if speech:
+                speeches.append(speech)
+        return speeches
+
     def _parse_speech_record(self, record: dict[str, Any]) -> NDLSpeech | None:
         """Parse NDL speech record into NDLSpeech object"""
         try:
@@ -337,7 +517,7 @@ class NDLAPIClient:
             return NDLSpeech(
                 speech_id=speech_id,
                 meeting_id=record.get("meetingId", ""),
-                speaker_name=record.get("speakerName", ""),
+                speaker_name=record.get("speakerName") or record.get("speaker", ""),
                 speaker_group=record.get("speakerGroup"),
                 speech_type=record.get("speechType", "発言"),
                 speech_order=int(record.get("speechOrder", 0)),
@@ -354,9 +534,15 @@ class NDLAPIClient:
         return {
             "rate_limiter": {
                 "max_requests_per_second": self.rate_limiter.max_requests,
-                "current_window_requests": len(self.rate_limiter.requests),
+                **self.rate_limiter.get_metrics(),
+            },
+            "client_config": {
+                "timeout": self.timeout,
+                "base_url": self.BASE_URL,
+                "offline": self.offline,
+                "prefetch_concurrency": self.prefetch_concurrency,
             },
-            "client_config": {"timeout": self.timeout, "base_url": self.BASE_URL},
+            "cache": self.cache.get_statistics() if self.cache else None,
         }
 
 
@@ -382,7 +568,7 @@ async def main():
             print(f"Getting speeches for: {first_meeting.title}")
 
             speeches = await client.get_all_speeches_for_meeting(
-                first_meeting.meeting_id
+                first_meeting.meeting_id, meeting=first_meeting
             )
             print(f"Found {len(speeches)} speeches")
 
@@ -27,7 +27,13 @@ class EnhancedBillData(BillData):
     implementation_date: str | None = None  # 施行予定日
 
     # Enhanced submission information
+    diet_session: str | None = None  # 国会回次
+    house_of_origin: str | None = None  # 提出院
+    submitter_type: str | None = None  # 提出者区分
     submitting_members: list[str] | None = field(default_factory=list)  # 提出議員一覧
+    supporting_members: list[str] | None = field(
+        default_factory=list
+    )  # 賛成議員一覧（衆議院のみ）
     submitting_party: str | None = None  # 提出会派
     sponsoring_ministry: str | None = None  # 主管省庁
 
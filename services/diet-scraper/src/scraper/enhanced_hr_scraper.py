@@ -110,6 +110,19 @@ class EnhancedHRProcessor:
             "max_missing_data_ratio": 0.2,  # Maximum ratio of missing member data
         }
 
+    def close(self) -> None:
+        """Release the PDF worker pools of this processor and its base scraper"""
+        self.pdf_processor.close()
+        self.base_scraper.close()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await asyncio.to_thread(self.close)
+
     async def process_enhanced_hr_data(
         self,
         days_back: int = 30,
@@ -53,6 +53,19 @@ class HouseOfRepresentativesVotingScraper:
         self._member_names_cache: list[str] | None = None
         self._cache_expiry: datetime | None = None
 
+    def close(self) -> None:
+        """Release the PDF worker pool and HTTP session"""
+        self.pdf_processor.close()
+        self.session.close()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await asyncio.to_thread(self.close)
+
     def _init_resilient_scraper(self):
         """Initialize resilient scraper for HR website"""
         try:
@@ -7,16 +7,28 @@ This module handles:
 - Member name dictionary matching for verification
 - Graceful handling of OCR recognition errors
 - Vote result parsing and normalization
+
+PDF text extraction and OCR are CPU-bound and run in a process pool (OCR is
+parallelized per page), so batches of voting PDFs use all available cores
+instead of blocking the event loop.
 """
 
+import asyncio
 import io
 import logging
+import os
 import re
+import tempfile
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-import requests
+import aiohttp
 
 # Optional dependencies with fallbacks
 try:
@@ -97,6 +109,201 @@ class PDFVotingSession:
         return summary
 
 
+# Worker functions run in pool processes, so they must be module-level
+# (picklable) and must not touch PDFProcessor state.
+
+OCR_MAX_PAGES = 10  # Limit OCR to the first 10 pages
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _extract_pdf_text(pdf_content: bytes) -> str | None:
+    """Extract text from PDF bytes using PyMuPDF"""
+    pdf_document = fitz.open("pdf", pdf_content)
+    try:
+        extracted_text = []
+
+        for page_num in range(len(pdf_document)):
+            page = pdf_document[page_num]
+            text = page.get_text()
+
+            if text.strip():
+                extracted_text.append(text)
+    finally:
+        pdf_document.close()
+
+    full_text = "\n".join(extracted_text)
+    return full_text if full_text.strip() else None
+
+
+def _count_pdf_pages(pdf_path: str) -> int:
+    """Return the number of pages in a PDF file"""
+    pdf_document = fitz.open(pdf_path)
+    try:
+        return len(pdf_document)
+    finally:
+        pdf_document.close()
+
+
+def _write_temp_pdf(pdf_content: bytes) -> str:
+    """Write PDF bytes to a temp file and return its path"""
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+        temp_file.write(pdf_content)
+    return temp_file.name
+
+
+def _preprocess_image_for_ocr(image: Any) -> Any:
+    """Preprocess image to improve OCR accuracy"""
+    if not OPENCV_AVAILABLE or not np:
+        logger.warning("OpenCV not available, returning original image")
+        return image
+
+    try:
+        # Convert PIL to OpenCV format
+        cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+
+        # Convert to grayscale
+        gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+
+        # Apply noise reduction
+        denoised = cv2.fastNlMeansDenoising(gray)
+
+        # Apply adaptive thresholding
+        thresh = cv2.adaptiveThreshold(
+            denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+        )
+
+        # Convert back to PIL Image
+        return Image.fromarray(thresh)
+
+    except Exception as e:
+        logger.warning(f"Image preprocessing failed: {e}")
+        return image  # Return original if preprocessing fails
+
+
+def _ocr_pdf_page(pdf_path: str, page_num: int) -> str:
+    """Render a single page of a PDF file and run Tesseract OCR on it"""
+    pdf_document = fitz.open(pdf_path)
+    try:
+        page = pdf_document[page_num]
+
+        # Convert page to image
+        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 2x scale for better OCR
+        img_data = pix.tobytes("png")
+    finally:
+        pdf_document.close()
+
+    # Convert to PIL Image
+    image = Image.open(io.BytesIO(img_data))
+
+    # Pre-process image for better OCR
+    processed_image = _preprocess_image_for_ocr(image)
+
+    # Run OCR with Japanese language support
+    return pytesseract.image_to_string(
+        processed_image,
+        lang="jpn+eng",  # Japanese + English
+        config="--psm 6",  # Uniform block of text
+    )
+
+
+class MemberNameIndex:
+    """Precompiled matcher over a fixed list of member names
+
+    Built once per member list: normalized names are cached, an inverted
+    index maps each character to the members containing it, and the OCR
+    correction table is resolved to the members each rule applies to. A
+    lookup then only scores members sharing at least one character with the
+    OCR'd name (character-set Jaccard similarity is zero for all others), and
+    the intersection sizes fall out of the posting-list counts.
+    """
+
+    def __init__(self, matcher: "MemberNameMatcher", member_names: list[str]):
+        self.matcher = matcher
+        self.member_names = list(member_names)
+
+        normalized_names = [matcher.normalize_name(name) for name in self.member_names]
+        self._char_counts = [len(set(name)) for name in normalized_names]
+
+        # First member (in list order) for each normalized name
+        self._exact: dict[str, int] = {}
+        # Character -> positions of members whose normalized name contains it
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for position, name in enumerate(normalized_names):
+            self._exact.setdefault(name, position)
+            for char in set(name):
+                self._postings[char].append(position)
+
+        # (OCR variants, positions of members containing the correct name)
+        self._corrections = [
+            (
+                tuple(variants),
+                [
+                    position
+                    for position, name in enumerate(normalized_names)
+                    if correct_name in name
+                ],
+            )
+            for correct_name, variants in matcher.name_corrections.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.member_names)
+
+    def find_best_match(
+        self, ocr_name: str, threshold: float = 0.7
+    ) -> tuple[str | None, float]:
+        """
+        Find best matching member name from OCR result
+
+        Args:
+            ocr_name: Name extracted from OCR
+            threshold: Minimum similarity threshold
+
+        Returns:
+            Tuple of (matched_name, confidence_score)
+        """
+        normalized_ocr = self.matcher.normalize_name(ocr_name)
+
+        # Exact match
+        position = self._exact.get(normalized_ocr)
+        if position is not None:
+            return self.member_names[position], 1.0
+
+        # Candidate generation: count shared characters per member
+        ocr_chars = set(normalized_ocr)
+        overlap: Counter[int] = Counter()
+        for char in ocr_chars:
+            postings = self._postings.get(char)
+            if postings:
+                overlap.update(postings)
+
+        # Fuzzy matching using character-set Jaccard similarity
+        scores: dict[int, float] = {
+            position: intersection
+            / (len(ocr_chars) + self._char_counts[position] - intersection)
+            for position, intersection in overlap.items()
+        }
+
+        # Known OCR corrections give high confidence
+        for variants, positions in self._corrections:
+            if any(variant in normalized_ocr for variant in variants):
+                for position in positions:
+                    if scores.get(position, 0.0) < 0.9:
+                        scores[position] = 0.9
+
+        if not scores:
+            return None, 0.0
+
+        # Highest score wins; ties go to the member listed first
+        best_position = min(scores, key=lambda p: (-scores[p], p))
+        best_score = scores[best_position]
+
+        if best_score >= threshold:
+            return self.member_names[best_position], best_score
+
+        return None, 0.0
+
+
 class MemberNameMatcher:
     """Handles member name matching and normalization"""
 
@@ -120,20 +327,33 @@ class MemberNameMatcher:
             r"^○(.+)$",  # Remove ○ prefix
             r"^●(.+)$",  # Remove ● prefix
         ]
+        self._compiled_patterns = [re.compile(p) for p in self.name_patterns]
+
+        # Most recently built index, reused while the member list is unchanged
+        self._index_key: tuple[str, ...] | None = None
+        self._index: MemberNameIndex | None = None
 
     def normalize_name(self, name: str) -> str:
         """Normalize member name by removing common suffixes/prefixes"""
         normalized = name.strip()
 
         # Apply name patterns
-        for pattern in self.name_patterns:
-            match = re.match(pattern, normalized)
+        for pattern in self._compiled_patterns:
+            match = pattern.match(normalized)
             if match:
                 normalized = match.group(1)
                 break
 
         return normalized
 
+    def build_index(self, member_list: list[str]) -> MemberNameIndex:
+        """Build (or reuse) a precompiled index for a member list"""
+        key = tuple(member_list)
+        if self._index is None or self._index_key != key:
+            self._index = MemberNameIndex(self, member_list)
+            self._index_key = key
+        return self._index
+
     def find_best_match(
         self, ocr_name: str, member_list: list[str], threshold: float = 0.7
     ) -> tuple[str | None, float]:
@@ -148,37 +368,7 @@ class MemberNameMatcher:
         Returns:
             Tuple of (matched_name, confidence_score)
         """
-        normalized_ocr = self.normalize_name(ocr_name)
-        best_match = None
-        best_score = 0.0
-
-        for member_name in member_list:
-            normalized_member = self.normalize_name(member_name)
-
-            # Exact match
-            if normalized_ocr == normalized_member:
-                return member_name, 1.0
-
-            # Check name corrections
-            for correct_name, variants in self.name_corrections.items():
-                if correct_name in normalized_member:
-                    for variant in variants:
-                        if variant in normalized_ocr:
-                            score = 0.9  # High confidence for known corrections
-                            if score > best_score:
-                                best_match = member_name
-                                best_score = score
-
-            # Fuzzy matching using simple character overlap
-            score = self._calculate_similarity(normalized_ocr, normalized_member)
-            if score > best_score:
-                best_match = member_name
-                best_score = score
-
-        if best_score >= threshold:
-            return best_match, best_score
-
-        return None, 0.0
+        return self.build_index(member_list).find_best_match(ocr_name, threshold)
 
     def _calculate_similarity(self, name1: str, name2: str) -> float:
         """Calculate similarity between two names using character overlap"""
@@ -202,14 +392,86 @@ class MemberNameMatcher:
 class PDFProcessor:
     """Main PDF processing class for voting data extraction"""
 
-    def __init__(self):
+    STAGES = ("download", "text_extraction", "ocr", "parse", "member_matching")
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        use_process_pool: bool = True,
+        download_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            max_workers: Worker processes for extraction/OCR
+                (defaults to PDF_PROCESSOR_WORKERS or the CPU count)
+            use_process_pool: Run CPU-bound stages in a process pool; when
+                False they run in the default thread pool
+            download_timeout: Total timeout for a PDF download in seconds
+        """
         self.name_matcher = MemberNameMatcher()
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (compatible; DietTracker/1.0; +https://github.com/diet-tracker)"
-            }
+        self.max_workers = max_workers or int(
+            os.getenv("PDF_PROCESSOR_WORKERS", os.cpu_count() or 1)
         )
+        self.use_process_pool = use_process_pool
+        self.download_timeout = download_timeout
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (compatible; DietTracker/1.0; +https://github.com/diet-tracker)"
+        }
+        self._executor: Executor | None = None
+
+        # Processing statistics
+        self.stats = {
+            "total_pdfs_processed": 0,
+            "successful_extractions": 0,
+            "ocr_fallbacks": 0,
+            "failed_extractions": 0,
+            "total_confidence_score": 0.0,
+            "total_vote_records": 0,
+        }
+        self.stage_timings = {
+            stage: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            for stage in self.STAGES
+        }
+
+    def _get_executor(self) -> Executor | None:
+        """Lazily create the process pool (None means default thread pool)"""
+        if not self.use_process_pool:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run_cpu_bound(self, func, *args) -> Any:
+        """Run a CPU-bound worker function off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def close(self) -> None:
+        """Shut down the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await asyncio.to_thread(self.close)
+
+    @contextmanager
+    def _time_stage(self, stage: str) -> Iterator[None]:
+        """Record wall-clock time spent in a processing stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            timing = self.stage_timings[stage]
+            timing["count"] += 1
+            timing["total_seconds"] += elapsed
+            timing["max_seconds"] = max(timing["max_seconds"], elapsed)
 
     async def extract_voting_data_from_pdf(
         self, pdf_url: str, member_names: list[str] | None = None
@@ -224,142 +486,143 @@ class PDFProcessor:
         Returns:
             PDFVotingSession object or None if extraction fails
         """
+        self.stats["total_pdfs_processed"] += 1
+
         try:
             # Download PDF
             logger.info(f"Downloading PDF: {pdf_url}")
-            pdf_content = await self._download_pdf(pdf_url)
+            with self._time_stage("download"):
+                pdf_content = await self._download_pdf(pdf_url)
 
             if not pdf_content:
                 logger.error(f"Failed to download PDF: {pdf_url}")
+                self.stats["failed_extractions"] += 1
                 return None
 
             # Extract text from PDF
-            text_content = self._extract_text_from_pdf(pdf_content)
+            with self._time_stage("text_extraction"):
+                text_content = await self._extract_text_from_pdf(pdf_content)
 
             # If text extraction fails or yields poor results, try OCR
             if not text_content or len(text_content.strip()) < 100:
                 logger.info("Text extraction yielded poor results, trying OCR")
-                text_content = await self._extract_text_with_ocr(pdf_content)
+                self.stats["ocr_fallbacks"] += 1
+                with self._time_stage("ocr"):
+                    text_content = await self._extract_text_with_ocr(pdf_content)
 
             if not text_content:
                 logger.error("Failed to extract text from PDF")
+                self.stats["failed_extractions"] += 1
                 return None
 
             # Parse voting data from text
-            voting_session = self._parse_voting_data(text_content, pdf_url)
+            with self._time_stage("parse"):
+                voting_session = self._parse_voting_data(text_content, pdf_url)
 
             if voting_session and member_names:
                 # Improve member name matching with known names
-                self._improve_member_matching(voting_session, member_names)
+                with self._time_stage("member_matching"):
+                    self._improve_member_matching(voting_session, member_names)
+
+            if voting_session:
+                self.stats["successful_extractions"] += 1
+                self.stats["total_vote_records"] += len(voting_session.vote_records)
+                self.stats["total_confidence_score"] += sum(
+                    record.confidence_score for record in voting_session.vote_records
+                )
+            else:
+                self.stats["failed_extractions"] += 1
 
             return voting_session
 
         except Exception as e:
             logger.error(f"Error processing PDF {pdf_url}: {e}")
+            self.stats["failed_extractions"] += 1
             return None
 
     async def _download_pdf(self, pdf_url: str) -> bytes | None:
-        """Download PDF content from URL"""
+        """Download PDF content from URL, streaming it in chunks"""
         try:
-            response = self.session.get(pdf_url, timeout=30)
-            response.raise_for_status()
+            timeout = aiohttp.ClientTimeout(total=self.download_timeout)
+            async with aiohttp.ClientSession(
+                headers=self.headers, timeout=timeout
+            ) as session:
+                async with session.get(pdf_url) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("content-type", "")
+
+                    buffer = bytearray()
+                    async for chunk in response.content.iter_chunked(
+                        DOWNLOAD_CHUNK_SIZE
+                    ):
+                        buffer.extend(chunk)
+
+            content = bytes(buffer)
 
             # Verify it's actually a PDF
-            content_type = response.headers.get("content-type", "")
             if "pdf" not in content_type.lower():
                 # Check if content starts with PDF header
-                if not response.content.startswith(b"%PDF"):
+                if not content.startswith(b"%PDF"):
                     logger.warning(f"Content doesn't appear to be PDF: {pdf_url}")
                     return None
 
-            logger.info(f"Downloaded PDF: {len(response.content)} bytes")
-            return response.content
+            logger.info(f"Downloaded PDF: {len(content)} bytes")
+            return content
 
-        except requests.RequestException as e:
+        except (TimeoutError, aiohttp.ClientError) as e:
             logger.error(f"Failed to download PDF {pdf_url}: {e}")
             return None
 
-    def _extract_text_from_pdf(self, pdf_content: bytes) -> str | None:
+    async def _extract_text_from_pdf(self, pdf_content: bytes) -> str | None:
         """Extract text from PDF using PyMuPDF"""
         if not PYMUPDF_AVAILABLE:
             logger.error("PyMuPDF not available, cannot extract PDF text")
             return None
 
         try:
-            # Open PDF from bytes
-            pdf_document = fitz.open("pdf", pdf_content)
-
-            extracted_text = []
-
-            for page_num in range(len(pdf_document)):
-                page = pdf_document[page_num]
-                text = page.get_text()
-
-                if text.strip():
-                    extracted_text.append(text)
-                    logger.debug(
-                        f"Extracted {len(text)} characters from page {page_num + 1}"
-                    )
-
-            pdf_document.close()
-
-            full_text = "\n".join(extracted_text)
-            logger.info(f"Total text extracted: {len(full_text)} characters")
-
-            return full_text if full_text.strip() else None
+            full_text = await self._run_cpu_bound(_extract_pdf_text, pdf_content)
+            logger.info(
+                f"Total text extracted: {len(full_text) if full_text else 0} characters"
+            )
+            return full_text
 
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {e}")
             return None
 
     async def _extract_text_with_ocr(self, pdf_content: bytes) -> str | None:
-        """Extract text using OCR as fallback"""
+        """Extract text using OCR as fallback, one worker task per page"""
         if not PYMUPDF_AVAILABLE or not TESSERACT_AVAILABLE or not PIL_AVAILABLE:
             logger.error("Required OCR dependencies not available")
             return None
 
+        pdf_path = None
         try:
-            # Convert PDF to images
-            pdf_document = fitz.open("pdf", pdf_content)
-            extracted_text = []
-
-            for page_num in range(
-                min(10, len(pdf_document))
-            ):  # Limit to first 10 pages
-                page = pdf_document[page_num]
-
-                # Convert page to image
-                pix = page.get_pixmap(
-                    matrix=fitz.Matrix(2, 2)
-                )  # 2x scale for better OCR
-                img_data = pix.tobytes("png")
-
-                # Process with OCR
-                try:
-                    # Convert to PIL Image
-                    image = Image.open(io.BytesIO(img_data))
-
-                    # Pre-process image for better OCR
-                    processed_image = self._preprocess_image_for_ocr(image)
-
-                    # Run OCR with Japanese language support
-                    text = pytesseract.image_to_string(
-                        processed_image,
-                        lang="jpn+eng",  # Japanese + English
-                        config="--psm 6",  # Uniform block of text
-                    )
+            # Workers open the PDF from a temp file so the bytes are not
+            # pickled into every page task
+            pdf_path = await asyncio.to_thread(_write_temp_pdf, pdf_content)
+            page_count = min(
+                OCR_MAX_PAGES, await self._run_cpu_bound(_count_pdf_pages, pdf_path)
+            )
 
-                    if text.strip():
-                        extracted_text.append(text)
-                        logger.debug(
-                            f"OCR extracted {len(text)} characters from page {page_num + 1}"
-                        )
+            results = await asyncio.gather(
+                *(
+                    self._run_cpu_bound(_ocr_pdf_page, pdf_path, page_num)
+                    for page_num in range(page_count)
+                ),
+                return_exceptions=True,
+            )
 
-                except Exception as ocr_e:
-                    logger.warning(f"OCR failed for page {page_num + 1}: {ocr_e}")
+            extracted_text = []
+            for page_num, result in enumerate(results):
+                if isinstance(result, Exception):
+                    logger.warning(f"OCR failed for page {page_num + 1}: {result}")
                     continue
-
-            pdf_document.close()
+                if result.strip():
+                    extracted_text.append(result)
+                    logger.debug(
+                        f"OCR extracted {len(result)} characters from page {page_num + 1}"
+                    )
 
             full_text = "\n".join(extracted_text)
             logger.info(f"Total OCR text extracted: {len(full_text)} characters")
@@ -370,35 +633,13 @@ class PDFProcessor:
             logger.error(f"OCR extraction failed: {e}")
             return None
 
+        finally:
+            if pdf_path:
+                os.unlink(pdf_path)
+
     def _preprocess_image_for_ocr(self, image: Any) -> Any:
         """Preprocess image to improve OCR accuracy"""
-        if not OPENCV_AVAILABLE or not np:
-            logger.warning("OpenCV not available, returning original image")
-            return image
-
-        try:
-            # Convert PIL to OpenCV format
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-            # Convert to grayscale
-            gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
-
-            # Apply noise reduction
-            denoised = cv2.fastNlMeansDenoising(gray)
-
-            # Apply adaptive thresholding
-            thresh = cv2.adaptiveThreshold(
-                denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-            )
-
-            # Convert back to PIL Image
-            processed_image = Image.fromarray(thresh)
-
-            return processed_image
-
-        except Exception as e:
-            logger.warning(f"Image preprocessing failed: {e}")
-            return image  # Return original if preprocessing fails
+        return _preprocess_image_for_ocr(image)
 
     def _parse_voting_data(
         self, text_content: str, pdf_url: str
@@ -616,11 +857,12 @@ class PDFProcessor:
         """Improve member name matching using known member list"""
         try:
             improved_records = []
+            member_index = self.name_matcher.build_index(known_member_names)
 
             for record in session.vote_records:
                 # Try to find better match for member name
-                matched_name, confidence = self.name_matcher.find_best_match(
-                    record.member_name, known_member_names
+                matched_name, confidence = member_index.find_best_match(
+                    record.member_name
                 )
 
                 if matched_name and confidence > record.confidence_score:
@@ -640,11 +882,27 @@ class PDFProcessor:
 
     def get_processing_statistics(self) -> dict[str, Any]:
         """Get PDF processing statistics"""
-        # This would be expanded to track actual statistics
         return {
-            "total_pdfs_processed": 0,
-            "successful_extractions": 0,
-            "ocr_fallbacks": 0,
-            "failed_extractions": 0,
-            "average_confidence_score": 0.0,
+            "total_pdfs_processed": self.stats["total_pdfs_processed"],
+            "successful_extractions": self.stats["successful_extractions"],
+            "ocr_fallbacks": self.stats["ocr_fallbacks"],
+            "failed_extractions": self.stats["failed_extractions"],
+            "average_confidence_score": (
+                self.stats["total_confidence_score"] / self.stats["total_vote_records"]
+                if self.stats["total_vote_records"]
+                else 0.0
+            ),
+            "max_workers": self.max_workers,
+            "use_process_pool": self.use_process_pool,
+            "stage_timings": {
+                stage: {
+                    **timing,
+                    "average_seconds": (
+                        timing["total_seconds"] / timing["count"]
+                        if timing["count"]
+                        else 0.0
+                    ),
+                }
+                for stage, timing in self.stage_timings.items()
+            },
         }
@@ -14,7 +14,9 @@ import asyncio
 import hashlib
 import json
 import logging
+import sqlite3
 import time
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -24,6 +26,7 @@ from typing import Any, TypeVar
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
+from shared.utils.rate_limiter import TokenBucketRateLimiter
 
 try:
     import backoff
@@ -118,54 +121,142 @@ class CacheConfig:
     max_age_hours: int = 24
     max_size_mb: int = 100
     hash_algorithm: str = "sha256"
+    store_filename: str = "duplicate_store.sqlite3"
+    flush_batch_size: int = 100  # Pending writes before a flush
+    flush_interval_seconds: float = 5.0  # Max age of unflushed writes
 
 
 class DuplicateDetector:
-    """Detects and manages duplicate content"""
+    """Detects and manages duplicate content
+
+    Lookups are served from in-memory hash indexes (O(1) per check), while
+    new hashes are appended to a SQLite store in batched transactions, so
+    persistence cost is proportional to new entries rather than history size.
+    Expired URL entries are compacted by ``cleanup_cache``.
+    """
+
+    LEGACY_CACHE_FILENAME = "content_hashes.json"
 
     def __init__(self, config: CacheConfig):
         self.config = config
         self.cache_dir = Path(config.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.content_hashes: dict[str, str] = {}
-        self.url_hashes: dict[str, str] = {}
+        self.url_hashes: dict[str, float] = {}  # url hash -> processed timestamp
+        # content hash -> number of identifiers referencing it
+        self._content_hash_index: Counter[str] = Counter()
+        self._pending_content: dict[str, str] = {}
+        self._pending_urls: dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self._conn: sqlite3.Connection | None = None
         self._load_cache()
 
     def _load_cache(self) -> None:
-        """Load existing cache from disk"""
+        """Open the on-disk store and build the in-memory indexes"""
         if not self.config.enabled:
             return
 
-        cache_file = self.cache_dir / "content_hashes.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    cache_data = json.load(f)
-                    self.content_hashes = cache_data.get("content_hashes", {})
-                    self.url_hashes = cache_data.get("url_hashes", {})
-                logger.info(
-                    f"Loaded {len(self.content_hashes)} content hashes from cache"
+        try:
+            self._conn = sqlite3.connect(self.cache_dir / self.config.store_filename)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS content_hashes (
+                    identifier TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS url_hashes (
+                    url_hash TEXT PRIMARY KEY,
+                    processed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_url_hashes_processed_at
+                    ON url_hashes (processed_at);
+                """
+            )
+            self._import_legacy_cache()
+
+            self.content_hashes = dict(
+                self._conn.execute(
+                    "SELECT identifier, content_hash FROM content_hashes"
                 )
-            except Exception as e:
-                logger.warning(f"Failed to load cache: {e}")
+            )
+            self.url_hashes = dict(
+                self._conn.execute("SELECT url_hash, processed_at FROM url_hashes")
+            )
+            self._content_hash_index = Counter(self.content_hashes.values())
+            logger.info(f"Loaded {len(self.content_hashes)} content hashes from cache")
+        except Exception as e:
+            logger.warning(f"Failed to load cache: {e}")
 
-    def _save_cache(self) -> None:
-        """Save cache to disk"""
-        if not self.config.enabled:
+    def _import_legacy_cache(self) -> None:
+        """One-time import of the former JSON cache file into the store"""
+        legacy_file = self.cache_dir / self.LEGACY_CACHE_FILENAME
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file) as f:
+                cache_data = json.load(f)
+
+            url_rows = []
+            for url_hash, timestamp_str in cache_data.get("url_hashes", {}).items():
+                try:
+                    url_rows.append(
+                        (url_hash, datetime.fromisoformat(timestamp_str).timestamp())
+                    )
+                except (TypeError, ValueError):
+                    continue
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO content_hashes VALUES (?, ?)",
+                    cache_data.get("content_hashes", {}).items(),
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO url_hashes VALUES (?, ?)", url_rows
+                )
+            legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
+            logger.info(f"Imported legacy duplicate cache from {legacy_file}")
+        except Exception as e:
+            logger.warning(f"Failed to import legacy cache: {e}")
+
+    def _maybe_flush(self) -> None:
+        """Flush pending writes once the batch size or interval is reached"""
+        pending = len(self._pending_content) + len(self._pending_urls)
+        if pending >= self.config.flush_batch_size or (
+            pending
+            and time.monotonic() - self._last_flush
+            >= self.config.flush_interval_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending hashes to the on-disk store in one transaction"""
+        self._last_flush = time.monotonic()
+        if not self._conn or not (self._pending_content or self._pending_urls):
             return
 
-        cache_file = self.cache_dir / "content_hashes.json"
         try:
-            cache_data = {
-                "content_hashes": self.content_hashes,
-                "url_hashes": self.url_hashes,
-                "last_updated": datetime.now().isoformat(),
-            }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO content_hashes VALUES (?, ?)",
+                    self._pending_content.items(),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO url_hashes VALUES (?, ?)",
+                    self._pending_urls.items(),
+                )
+            self._pending_content.clear()
+            self._pending_urls.clear()
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
 
+    def close(self) -> None:
+        """Flush pending writes and close the store"""
+        if self._conn:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
     def _compute_hash(self, content: str) -> str:
         """Compute hash of content"""
         if self.config.hash_algorithm == "sha256":
@@ -185,7 +276,7 @@ class DuplicateDetector:
         content_hash = self._compute_hash(content)
 
         # Check if we've seen this exact content before
-        if content_hash in self.content_hashes.values():
+        if content_hash in self._content_hash_index:
             logger.debug(
                 f"Duplicate content detected: {identifier or content_hash[:16]}"
             )
@@ -193,7 +284,15 @@ class DuplicateDetector:
 
         # Store the hash for future reference
         if identifier:
+            previous_hash = self.content_hashes.get(identifier)
+            if previous_hash:
+                self._content_hash_index[previous_hash] -= 1
+                if self._content_hash_index[previous_hash] <= 0:
+                    del self._content_hash_index[previous_hash]
             self.content_hashes[identifier] = content_hash
+            self._content_hash_index[content_hash] += 1
+            self._pending_content[identifier] = content_hash
+            self._maybe_flush()
 
         return False
 
@@ -203,128 +302,97 @@ class DuplicateDetector:
             return False
 
         url_hash = self._compute_hash(url)
+        now = time.time()
 
-        if url_hash in self.url_hashes:
+        processed_at = self.url_hashes.get(url_hash)
+        if processed_at is not None:
             # Check if the cached entry is still valid
-            timestamp_str = self.url_hashes[url_hash]
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str)
-                if datetime.now() - timestamp < timedelta(
-                    hours=self.config.max_age_hours
-                ):
-                    logger.debug(
-                        f"Duplicate URL detected (within {self.config.max_age_hours}h): {url}"
-                    )
-                    return True
-                else:
-                    # Remove expired entry
-                    del self.url_hashes[url_hash]
-            except ValueError:
-                # Invalid timestamp format, remove entry
-                del self.url_hashes[url_hash]
-
-        # Mark URL as processed
-        self.url_hashes[url_hash] = datetime.now().isoformat()
-        self._save_cache()
+            if now - processed_at < self.config.max_age_hours * 3600:
+                logger.debug(
+                    f"Duplicate URL detected (within {self.config.max_age_hours}h): {url}"
+                )
+                return True
+
+        # Mark URL as processed (overwrites any expired entry)
+        self.url_hashes[url_hash] = now
+        self._pending_urls[url_hash] = now
+        self._maybe_flush()
         return False
 
     def cleanup_cache(self) -> int:
-        """Clean up expired cache entries"""
+        """Clean up expired cache entries and compact the on-disk store"""
         if not self.config.enabled:
             return 0
 
-        expired_count = 0
-        cutoff_time = datetime.now() - timedelta(hours=self.config.max_age_hours)
-
-        # Clean URL cache
-        expired_urls = []
-        for url_hash, timestamp_str in self.url_hashes.items():
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str)
-                if timestamp < cutoff_time:
-                    expired_urls.append(url_hash)
-            except ValueError:
-                expired_urls.append(url_hash)
+        cutoff = time.time() - self.config.max_age_hours * 3600
 
+        expired_urls = [
+            url_hash
+            for url_hash, processed_at in self.url_hashes.items()
+            if processed_at < cutoff
+        ]
         for url_hash in expired_urls:
             del self.url_hashes[url_hash]
-            expired_count += 1
+            self._pending_urls.pop(url_hash, None)
 
-        self._save_cache()
+        self.flush()
+        if self._conn:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM url_hashes WHERE processed_at < ?", (cutoff,)
+                    )
+                if expired_urls:
+                    self._conn.execute("VACUUM")
+            except Exception as e:
+                logger.warning(f"Failed to compact cache: {e}")
+
+        expired_count = len(expired_urls)
         logger.info(f"Cleaned up {expired_count} expired cache entries")
         return expired_count
 
 
 class RateLimiter:
-    """Rate limiter with burst support and backoff"""
+    """Rate limiter with burst support and backoff
+
+    Thin adapter over the shared token-bucket limiter: waiters reserve FIFO
+    slots without serializing on a lock, and cooldowns / ``Retry-After``
+    headers pause the bucket for every pending request.
+    """
 
     def __init__(self, config: RateLimitConfig):
         self.config = config
-        self.request_times: list[float] = []
-        self.last_request_time = 0.0
-        self.cooldown_until = 0.0
+        self.bucket = TokenBucketRateLimiter(
+            rate=config.requests_per_second,
+            burst=config.burst_size,
+            name="diet_scraper",
+        )
 
     async def wait_if_needed(
         self, response_headers: dict[str, str] | None = None
     ) -> None:
         """Wait if rate limiting is needed"""
-        current_time = time.time()
-
-        # Check if we're in cooldown period
-        if current_time < self.cooldown_until:
-            wait_time = self.cooldown_until - current_time
-            logger.info(f"Rate limiter cooldown: waiting {wait_time:.2f} seconds")
-            await asyncio.sleep(wait_time)
-            return
-
         # Respect Retry-After header if present
         if response_headers and self.config.respect_retry_after:
-            retry_after = response_headers.get("Retry-After")
-            if retry_after:
-                try:
-                    wait_time = float(retry_after)
-                    logger.info(
-                        f"Respecting Retry-After header: waiting {wait_time} seconds"
-                    )
-                    await asyncio.sleep(wait_time)
-                    return
-                except ValueError:
-                    pass
+            pause = self.bucket.pause_for_retry_after(response_headers)
+            if pause:
+                logger.info(f"Respecting Retry-After header: waiting {pause} seconds")
 
-        # Clean up old request times
-        cutoff_time = current_time - 1.0  # Keep 1 second of history
-        self.request_times = [t for t in self.request_times if t > cutoff_time]
-
-        # Check if we need to wait based on rate limit
-        if len(self.request_times) >= self.config.burst_size:
-            # Calculate required wait time
-            oldest_request = min(self.request_times)
-            required_interval = 1.0 / self.config.requests_per_second
-            wait_time = required_interval - (current_time - oldest_request)
-
-            if wait_time > 0:
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
-                await asyncio.sleep(wait_time)
-
-        # Minimum delay between requests
-        time_since_last = current_time - self.last_request_time
-        min_interval = 1.0 / self.config.requests_per_second
-
-        if time_since_last < min_interval:
-            wait_time = min_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        # Record this request
-        self.request_times.append(time.time())
-        self.last_request_time = time.time()
+        wait_time = await self.bucket.acquire()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: waited {wait_time:.2f} seconds")
 
     def trigger_cooldown(self) -> None:
         """Trigger cooldown period (called when rate limit exceeded)"""
-        self.cooldown_until = time.time() + self.config.cooldown_seconds
+        self.bucket.pause(self.config.cooldown_seconds)
         logger.warning(
             f"Rate limit exceeded, cooldown for {self.config.cooldown_seconds} seconds"
         )
 
+    def get_metrics(self) -> dict[str, Any]:
+        """Get current token and wait-time metrics"""
+        return self.bucket.get_metrics()
+
 
 class ResilientScraper:
     """Enhanced scraper with resilience and optimization features"""
@@ -373,6 +441,7 @@ class ResilientScraper:
         """Async context manager exit"""
         if self.session:
             await self.session.close()
+        self.duplicate_detector.flush()
 
     def create_job(
         self, job_type: str, url: str, metadata: dict[str, Any] | None = None
@@ -616,4 +685,5 @@ class ResilientScraper:
             "success_rate_percent": round(success_rate, 2),
             "active_jobs_count": len(self.active_jobs),
             "completed_jobs_count": len(self.completed_jobs),
+            "rate_limiter": self.rate_limiter.get_metrics(),
         }
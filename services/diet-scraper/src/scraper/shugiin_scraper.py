@@ -7,7 +7,7 @@ import asyncio
 import logging
 import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 from urllib.parse import urljoin
@@ -23,9 +23,6 @@ class ShugiinBillData(EnhancedBillData):
     """Shugiin-specific bill data structure"""
 
     # Shugiin-specific fields
-    supporting_members: list[str] | None = field(
-        default_factory=list
-    )  # 賛成議員一覧（衆議院のみ）
     diet_session_type: str | None = None  # 国会種別（通常/臨時/特別）
     bill_subcategory: str | None = None  # 法案小分類
 
@@ -0,0 +1,130 @@
+"""
+Tests for the NDL API client response cache, embedded speech parsing and
+concurrent speech pagination.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.collectors.ndl_api_client import (
+    NDLAPIClient,
+    NDLCacheMissError,
+    NDLResponseCache,
+)
+
+
+def make_speech_page(meeting_id: str, start: int, count: int, total: int) -> dict:
+    """Build a fake speech endpoint response"""
+    return {
+        "numberOfRecords": total,
+        "speechRecord": [
+            {
+                "speechID": f"{meeting_id}_{i:03d}",
+                "meetingId": meeting_id,
+                "speaker": f"議員{i}",
+                "speechOrder": i,
+                "speech": f"発言{i}",
+            }
+            for i in range(start, start + count)
+        ],
+    }
+
+
+class TestNDLResponseCache:
+    """Test cases for NDLResponseCache"""
+
+    def test_key_is_independent_of_param_order(self):
+        key_a = NDLResponseCache.make_key("speech", {"a": 1, "b": "x"})
+        key_b = NDLResponseCache.make_key("speech", {"b": "x", "a": "1"})
+        assert key_a == key_b
+        assert key_a != NDLResponseCache.make_key("meeting", {"a": 1, "b": "x"})
+
+    def test_put_and_get(self, tmp_path):
+        cache = NDLResponseCache(tmp_path)
+        assert cache.get("speech", {"meetingId": "m1"}) is None
+
+        cache.put("speech", {"meetingId": "m1"}, {"numberOfRecords": 0})
+        assert cache.get("speech", {"meetingId": "m1"}) == {"numberOfRecords": 0}
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+
+class TestNDLAPIClient:
+    """Test cases for NDLAPIClient"""
+
+    @pytest.mark.asyncio
+    async def test_cached_responses_are_replayed(self, tmp_path):
+        client = NDLAPIClient(cache_dir=tmp_path)
+        client._fetch = AsyncMock(return_value=make_speech_page("m1", 1, 3, 3))
+
+        first = await client.get_all_speeches_for_meeting("m1")
+        second = await client.get_all_speeches_for_meeting("m1")
+
+        assert len(first) == len(second) == 3
+        assert client._fetch.await_count == 1
+        await client.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_offline_mode_never_fetches(self, tmp_path):
+        client = NDLAPIClient(cache_dir=tmp_path, offline=True)
+        client._fetch = AsyncMock()
+
+        with pytest.raises(NDLCacheMissError):
+            await client._make_request("speech", {"meetingId": "m1"})
+        client._fetch.assert_not_awaited()
+        await client.client.aclose()
+
+    def test_offline_mode_requires_cache_dir(self):
+        with pytest.raises(ValueError):
+            NDLAPIClient(offline=True)
+
+    @pytest.mark.asyncio
+    async def test_remaining_pages_are_prefetched(self):
+        client = NDLAPIClient()
+        total = 250
+
+        async def fake_fetch(endpoint, params):
+            start = params["startRecord"]
+            count = min(params["maximumRecords"], total - start + 1)
+            return make_speech_page("m1", start, count, total)
+
+        client._fetch = AsyncMock(side_effect=fake_fetch)
+
+        speeches = await client.get_all_speeches_for_meeting("m1")
+
+        assert [s.speech_order for s in speeches] == list(range(1, total + 1))
+        requested = sorted(
+            call.args[1]["startRecord"] for call in client._fetch.await_args_list
+        )
+        assert requested == [1, 101, 201]
+        await client.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_embedded_speeches_skip_speech_endpoint(self):
+        client = NDLAPIClient()
+        client._fetch = AsyncMock(
+            return_value={
+                "meetingRecord": [
+                    {
+                        "issueID": "m1",
+                        "nameOfMeeting": "本会議",
+                        "date": "2025-06-01",
+                        "session": 217,
+                        "nameOfHouse": "参議院",
+                        "speechRecord": make_speech_page("m1", 1, 2, 2)["speechRecord"],
+                    }
+                ]
+            }
+        )
+
+        meetings = await client.search_meetings(include_speeches=True)
+        speeches = await client.get_all_speeches_for_meeting("m1", meeting=meetings[0])
+
+        assert len(speeches) == 2
+        assert speeches[0].meeting_id == "m1"
+        assert speeches[0].speaker_name == "議員1"
+        assert client._fetch.await_count == 1
+        await client.client.aclose()
@@ -0,0 +1,195 @@
+"""
+Tests for OCR member name matching and the processing pipeline of the PDF
+processor.
+"""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from src.scraper import pdf_processor
+from src.scraper.pdf_processor import (
+    DOWNLOAD_CHUNK_SIZE,
+    MemberNameMatcher,
+    PDFProcessor,
+)
+
+MEMBERS = [
+    "鈴木一郎",
+    "田中花子",
+    "佐藤健太",
+    "高橋直樹",
+    "渡辺美咲",
+    "小林誠",
+    "山田太郎",
+    "山本太一",
+    "鈴木次郎",
+]
+
+
+def reference_best_match(
+    matcher: MemberNameMatcher, ocr_name: str, members: list[str], threshold: float
+) -> tuple[str | None, float]:
+    """Linear-scan matcher the index must agree with"""
+    normalized_ocr = matcher.normalize_name(ocr_name)
+    best_match, best_score = None, 0.0
+
+    for member in members:
+        normalized_member = matcher.normalize_name(member)
+        if normalized_ocr == normalized_member:
+            return member, 1.0
+
+        for correct_name, variants in matcher.name_corrections.items():
+            if correct_name in normalized_member and any(
+                variant in normalized_ocr for variant in variants
+            ):
+                if 0.9 > best_score:
+                    best_match, best_score = member, 0.9
+
+        score = matcher._calculate_similarity(normalized_ocr, normalized_member)
+        if score > best_score:
+            best_match, best_score = member, score
+
+    return (best_match, best_score) if best_score >= threshold else (None, 0.0)
+
+
+class TestMemberNameMatcher:
+    """Test cases for MemberNameMatcher"""
+
+    @pytest.fixture
+    def matcher(self):
+        return MemberNameMatcher()
+
+    def test_exact_match_after_normalization(self, matcher):
+        assert matcher.find_best_match("山田太郎君", MEMBERS) == ("山田太郎", 1.0)
+
+    def test_ocr_correction(self, matcher):
+        assert matcher.find_best_match("釣木一郎", MEMBERS) == ("鈴木一郎", 0.9)
+
+    def test_no_match_below_threshold(self, matcher):
+        assert matcher.find_best_match("全然違う", MEMBERS) == (None, 0.0)
+
+    def test_index_is_reused_for_same_member_list(self, matcher):
+        index = matcher.build_index(MEMBERS)
+        assert matcher.build_index(list(MEMBERS)) is index
+        assert matcher.build_index(MEMBERS[:3]) is not index
+
+    def test_agrees_with_linear_scan(self, matcher):
+        rng = random.Random(0)
+        alphabet = "".join(sorted(set("".join(MEMBERS)))) + "申由栢邊釣"
+        queries = ["".join(rng.sample(alphabet, rng.randint(2, 5))) for _ in range(300)]
+
+        for query in queries + MEMBERS:
+            for threshold in (0.3, 0.7):
+                assert matcher.find_best_match(
+                    query, MEMBERS, threshold
+                ) == reference_best_match(matcher, query, MEMBERS, threshold)
+
+
+@pytest_asyncio.fixture
+async def pdf_server():
+    """Local server serving a multi-chunk PDF and a non-PDF page"""
+    pdf_body = b"%PDF-1.4\n" + b"0" * (3 * DOWNLOAD_CHUNK_SIZE + 17)
+
+    async def pdf(request):
+        return web.Response(body=pdf_body, content_type="application/octet-stream")
+
+    async def html(request):
+        return web.Response(text="<html></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/vote.pdf", pdf)
+    app.router.add_get("/index.html", html)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield {"url": f"http://127.0.0.1:{port}", "pdf_body": pdf_body}
+    await runner.cleanup()
+
+
+class TestPDFProcessor:
+    """Test cases for the PDFProcessor pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_cpu_bound_work_runs_in_process_pool(self):
+        async with PDFProcessor(max_workers=1) as processor:
+            worker_pid = await processor._run_cpu_bound(os.getpid)
+
+            assert worker_pid != os.getpid()
+            assert processor._executor is not None
+
+        assert processor._executor is None
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_when_process_pool_disabled(self):
+        processor = PDFProcessor(use_process_pool=False)
+
+        assert await processor._run_cpu_bound(os.getpid) == os.getpid()
+        assert processor._executor is None
+
+    @pytest.mark.asyncio
+    async def test_streaming_download(self, pdf_server):
+        processor = PDFProcessor(use_process_pool=False)
+
+        content = await processor._download_pdf(f"{pdf_server['url']}/vote.pdf")
+        assert content == pdf_server["pdf_body"]
+
+        assert await processor._download_pdf(f"{pdf_server['url']}/index.html") is None
+        assert await processor._download_pdf(f"{pdf_server['url']}/missing") is None
+
+    @pytest.mark.asyncio
+    async def test_stage_timings(self, monkeypatch):
+        processor = PDFProcessor(use_process_pool=False)
+
+        async def download(pdf_url):
+            return b"%PDF"
+
+        async def extract_text(pdf_content):
+            return "記名投票" * 50
+
+        monkeypatch.setattr(processor, "_download_pdf", download)
+        monkeypatch.setattr(processor, "_extract_text_from_pdf", extract_text)
+        monkeypatch.setattr(processor, "_parse_voting_data", lambda text, url: None)
+
+        for _ in range(2):
+            await processor.extract_voting_data_from_pdf("https://example.com/a.pdf")
+
+        timings = processor.get_processing_statistics()["stage_timings"]
+        assert timings["download"]["count"] == 2
+        assert timings["text_extraction"]["count"] == 2
+        assert timings["parse"]["count"] == 2
+        assert timings["ocr"]["count"] == 0
+        assert timings["member_matching"]["count"] == 0
+        assert timings["download"]["average_seconds"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_ocr_workers_read_pdf_from_temp_file(self, monkeypatch):
+        processor = PDFProcessor(use_process_pool=False)
+        seen_paths = set()
+
+        def count_pages(pdf_path):
+            seen_paths.add(pdf_path)
+            return 3
+
+        def ocr_page(pdf_path, page_num):
+            seen_paths.add(pdf_path)
+            assert Path(pdf_path).read_bytes() == b"%PDF-scan"
+            return f"page {page_num}"
+
+        for flag in ("PYMUPDF_AVAILABLE", "TESSERACT_AVAILABLE", "PIL_AVAILABLE"):
+            monkeypatch.setattr(pdf_processor, flag, True)
+        monkeypatch.setattr(pdf_processor, "_count_pdf_pages", count_pages)
+        monkeypatch.setattr(pdf_processor, "_ocr_pdf_page", ocr_page)
+
+        text = await processor._extract_text_with_ocr(b"%PDF-scan")
+
+        assert text == "page 0\npage 1\npage 2"
+        assert len(seen_paths) == 1
+        assert not Path(seen_paths.pop()).exists()
@@ -0,0 +1,65 @@
+"""
+Tests for the scraper duplicate detector store.
+"""
+
+import json
+import time
+
+from src.scraper.resilience import CacheConfig, DuplicateDetector
+
+
+class TestDuplicateDetector:
+    """Test cases for DuplicateDetector"""
+
+    def make_detector(self, tmp_path, **kwargs) -> DuplicateDetector:
+        return DuplicateDetector(CacheConfig(cache_dir=str(tmp_path), **kwargs))
+
+    def test_duplicate_content_and_url(self, tmp_path):
+        detector = self.make_detector(tmp_path)
+
+        assert not detector.is_duplicate_content("本文", "bill-1")
+        assert detector.is_duplicate_content("本文", "bill-2")
+        assert not detector.is_duplicate_url("https://example.com/1")
+        assert detector.is_duplicate_url("https://example.com/1")
+        detector.close()
+
+    def test_writes_are_batched_and_persisted(self, tmp_path):
+        detector = self.make_detector(tmp_path, flush_batch_size=3)
+
+        detector.is_duplicate_url("https://example.com/1")
+        detector.is_duplicate_url("https://example.com/2")
+        assert len(detector._pending_urls) == 2
+
+        detector.is_duplicate_url("https://example.com/3")
+        assert not detector._pending_urls
+        detector.close()
+
+        reloaded = self.make_detector(tmp_path)
+        assert len(reloaded.url_hashes) == 3
+        assert reloaded.is_duplicate_url("https://example.com/2")
+        reloaded.close()
+
+    def test_cleanup_compacts_expired_urls(self, tmp_path):
+        detector = self.make_detector(tmp_path, max_age_hours=1)
+        detector.is_duplicate_url("https://example.com/old")
+        url_hash = detector._compute_hash("https://example.com/old")
+        detector.url_hashes[url_hash] = time.time() - 7200
+        detector._pending_urls[url_hash] = time.time() - 7200
+
+        assert detector.cleanup_cache() == 1
+        assert not detector.is_duplicate_url("https://example.com/old")
+        detector.close()
+
+    def test_legacy_json_cache_is_imported(self, tmp_path):
+        legacy = {
+            "content_hashes": {"bill-1": "abc"},
+            "url_hashes": {"def": "2025-01-01T00:00:00"},
+        }
+        (tmp_path / "content_hashes.json").write_text(json.dumps(legacy))
+
+        detector = self.make_detector(tmp_path)
+
+        assert detector.content_hashes == {"bill-1": "abc"}
+        assert "def" in detector.url_hashes
+        assert not (tmp_path / "content_hashes.json").exists()
+        detector.close()
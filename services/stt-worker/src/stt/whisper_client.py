@@ -1,19 +1,36 @@
 """
 Speech-to-Text client using OpenAI Whisper API for Japanese transcription.
+
+Audio longer than a single upload allows is split at silence boundaries into
+bounded chunks with ffmpeg, the chunks are transcribed concurrently and their
+segments stitched back together on the source timeline.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import re
 import tempfile
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 
-import requests
+import aiohttp
 import yt_dlp
+from shared.utils.rate_limiter import parse_retry_after
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# ffmpeg silencedetect output lines
+SILENCE_START_PATTERN = re.compile(r"silence_start: (-?[\d.]+)")
+SILENCE_END_PATTERN = re.compile(r"silence_end: (-?[\d.]+)")
+
+# Responses worth retrying a chunk upload for
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 
 @dataclass
 class TranscriptionResult:
@@ -26,10 +43,129 @@ class TranscriptionResult:
     segments: list[dict] | None = None
 
 
+@dataclass
+class AudioChunk:
+    """A span of the source audio transcribed as one upload"""
+
+    index: int
+    start: float  # Seconds from the start of the source audio
+    end: float
+
+    @property
+    def name(self) -> str:
+        return f"chunk_{self.index:04d}"
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    max_chunk_seconds: float,
+    min_chunk_seconds: float = 0.0,
+) -> list[AudioChunk]:
+    """
+    Split ``[0, duration]`` into chunks of at most ``max_chunk_seconds``
+
+    Each chunk is cut at the middle of the latest silence that leaves it at
+    least ``min_chunk_seconds`` long, so words are not split across chunks.
+    Without such a silence the chunk is cut at the maximum length.
+
+    Args:
+        duration: Length of the source audio in seconds
+        silences: (start, end) times of detected silences
+        max_chunk_seconds: Maximum chunk length
+        min_chunk_seconds: Minimum length of a chunk cut at a silence
+
+    Returns:
+        Chunks covering the whole audio in order
+    """
+    cut_points = sorted((start + end) / 2 for start, end in silences)
+    chunks = []
+    start = 0.0
+
+    while duration - start > max_chunk_seconds:
+        limit = start + max_chunk_seconds
+        i = bisect_right(cut_points, limit) - 1
+        if i >= 0 and cut_points[i] >= start + min_chunk_seconds:
+            cut = cut_points[i]
+        else:
+            cut = limit
+
+        chunks.append(AudioChunk(len(chunks), start, cut))
+        start = cut
+
+    if duration > start:
+        chunks.append(AudioChunk(len(chunks), start, duration))
+    return chunks
+
+
+def parse_silences(ffmpeg_output: str, duration: float) -> list[tuple[float, float]]:
+    """Parse ffmpeg silencedetect output into (start, end) intervals"""
+    silences = []
+    silence_start = None
+
+    for line in ffmpeg_output.splitlines():
+        if match := SILENCE_START_PATTERN.search(line):
+            silence_start = max(float(match.group(1)), 0.0)
+        elif (match := SILENCE_END_PATTERN.search(line)) and silence_start is not None:
+            silences.append((silence_start, float(match.group(1))))
+            silence_start = None
+
+    # Audio ending in silence has no silence_end line
+    if silence_start is not None:
+        silences.append((silence_start, duration))
+    return silences
+
+
+def stitch_transcriptions(
+    chunk_results: list[dict], language: str
+) -> TranscriptionResult:
+    """
+    Merge per-chunk Whisper results into one transcription
+
+    Segment timestamps are shifted by each chunk's start offset and segment
+    IDs renumbered, so segments refer to positions in the source audio.
+    """
+    segments = []
+    texts = []
+
+    for result in sorted(chunk_results, key=lambda r: r["start"]):
+        offset = result["start"]
+        for segment in result.get("segments") or []:
+            segments.append(
+                {
+                    **segment,
+                    "id": len(segments),
+                    "start": segment.get("start", 0.0) + offset,
+                    "end": segment.get("end", 0.0) + offset,
+                }
+            )
+        text = result.get("text", "").strip()
+        if text:
+            texts.append(text)
+
+    if chunk_results:
+        language = chunk_results[0].get("language", language)
+    # Japanese text is not space separated
+    separator = "" if language in ("ja", "japanese") else " "
+
+    return TranscriptionResult(
+        text=separator.join(texts),
+        language=language,
+        duration=max((r["end"] for r in chunk_results), default=0.0),
+        segments=segments,
+    )
+
+
 class WhisperClient:
     """OpenAI Whisper API client for Japanese speech recognition"""
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int = 8,
+        chunk_seconds: float = 600.0,
+        work_dir: str | None = None,
+    ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
@@ -37,11 +173,26 @@ class WhisperClient:
         self.base_url = "https://api.openai.com/v1/audio/transcriptions"
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
 
+        # Long audio chunking settings
+        self.max_upload_bytes = 25 * 1024 * 1024  # Whisper API upload limit
+        self.max_concurrency = max_concurrency  # Concurrent chunk uploads
+        self.chunk_seconds = chunk_seconds  # Maximum chunk length
+        self.min_chunk_seconds = chunk_seconds / 2  # Shortest chunk cut at silence
+        self.silence_noise_db = -35  # Level treated as silence
+        self.silence_min_seconds = 0.5  # Shortest silence to cut at
+        self.chunk_bitrate = "64k"  # Mono mp3, ~4.8 MB per 10 minutes
+        self.max_retries = 3
+        self.retry_backoff = 1.0  # First retry delay without Retry-After
+        self.request_timeout = 300
+        # Per-chunk results are kept here so interrupted runs can resume
+        self.work_dir = Path(
+            work_dir or os.path.join(tempfile.gettempdir(), "stt_chunks")
+        )
+
         # yt-dlp configuration for audio extraction
         self.yt_dlp_opts = {
             "format": "bestaudio/best",
-            "extractaudio": True,
-            "audioformat": "mp3",
+            "postprocessors": [{"key": "FFmpegExtractAudio", "preferredcodec": "mp3"}],
             "outtmpl": "%(title)s.%(ext)s",
             "quiet": True,
             "no_warnings": True,
@@ -49,10 +200,32 @@ class WhisperClient:
 
     def transcribe_audio_file(
         self, audio_file_path: str, language: str = "ja", model: str = "whisper-1"
+    ) -> TranscriptionResult:
+        """
+        Transcribe audio file using OpenAI Whisper API from synchronous code
+
+        This runs transcribe_audio() in a new event loop; from async code,
+        await transcribe_audio() instead.
+
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (default: "ja" for Japanese)
+            model: Whisper model to use (default: "whisper-1")
+
+        Returns:
+            TranscriptionResult with transcribed text and metadata
+        """
+        return asyncio.run(self.transcribe_audio(audio_file_path, language, model))
+
+    async def transcribe_audio(
+        self, audio_file_path: str, language: str = "ja", model: str = "whisper-1"
     ) -> TranscriptionResult:
         """
         Transcribe audio file using OpenAI Whisper API
 
+        Files above the API upload limit are transcribed in chunks with
+        transcribe_long_audio().
+
         Args:
             audio_file_path: Path to audio file
             language: Language code (default: "ja" for Japanese)
@@ -64,48 +237,286 @@ class WhisperClient:
         if not os.path.exists(audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
 
-        try:
-            # Prepare the request
-            with open(audio_file_path, "rb") as audio_file:
-                files = {
-                    "file": audio_file,
-                    "model": (None, model),
-                    "language": (None, language),
-                    "response_format": (None, "verbose_json"),
-                    "temperature": (None, "0"),
-                }
+        if os.path.getsize(audio_file_path) > self.max_upload_bytes:
+            return await self.transcribe_long_audio(audio_file_path, language, model)
 
-                logger.info(f"Transcribing audio file: {audio_file_path}")
-                response = requests.post(
-                    self.base_url,
-                    headers=self.headers,
-                    files=files,
-                    timeout=300,  # 5 minutes timeout for large files
+        logger.info(f"Transcribing audio file: {audio_file_path}")
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        try:
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                result = await self._post_transcription(
+                    session, Path(audio_file_path), language, model
                 )
+        except (TimeoutError, aiohttp.ClientError) as e:
+            logger.error(f"API request failed: {e}")
+            raise
 
-                response.raise_for_status()
-                result = response.json()
+        return TranscriptionResult(
+            text=result.get("text", ""),
+            language=result.get("language", language),
+            duration=result.get("duration", 0.0),
+            segments=result.get("segments", []),
+        )
 
-                return TranscriptionResult(
-                    text=result.get("text", ""),
-                    language=result.get("language", language),
-                    duration=result.get("duration", 0.0),
-                    segments=result.get("segments", []),
-                )
+    async def transcribe_long_audio(
+        self, audio_file_path: str, language: str = "ja", model: str = "whisper-1"
+    ) -> TranscriptionResult:
+        """
+        Transcribe audio of any length in chunks
 
-        except requests.RequestException as e:
-            logger.error(f"API request failed: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            raise
+        The audio is split at silences into chunks of at most chunk_seconds,
+        which are encoded and uploaded by up to max_concurrency workers. Each
+        chunk's result is saved under work_dir as soon as it arrives, so a
+        rerun after a failure only transcribes the missing chunks.
+
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (default: "ja" for Japanese)
+            model: Whisper model to use (default: "whisper-1")
 
-    def download_and_transcribe_video(
+        Returns:
+            TranscriptionResult with segment times relative to the whole file
+        """
+        if not os.path.exists(audio_file_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        job_dir = self._job_dir(audio_file_path, language, model)
+        job_dir.mkdir(parents=True, exist_ok=True)
+
+        chunks = await self._load_or_plan_chunks(audio_file_path, job_dir)
+        logger.info(
+            f"Transcribing {audio_file_path} in {len(chunks)} chunks "
+            f"with {self.max_concurrency} workers"
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+
+            async def run(chunk: AudioChunk) -> dict:
+                async with semaphore:
+                    return await self._transcribe_chunk(
+                        session, audio_file_path, chunk, job_dir, language, model
+                    )
+
+            # Let every chunk finish so completed results are saved for resume
+            results = await asyncio.gather(
+                *(run(chunk) for chunk in chunks), return_exceptions=True
+            )
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error(
+                f"{len(errors)} of {len(chunks)} chunks failed for "
+                f"{audio_file_path}; rerun to resume"
+            )
+            raise errors[0]
+
+        return stitch_transcriptions(results, language)
+
+    def _job_dir(self, audio_file_path: str, language: str, model: str) -> Path:
+        """Work directory for one file and set of transcription settings"""
+        stat = os.stat(audio_file_path)
+        key = json.dumps(
+            [
+                os.path.abspath(audio_file_path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                language,
+                model,
+                self.chunk_seconds,
+            ]
+        )
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self.work_dir / f"{Path(audio_file_path).stem}-{digest}"
+
+    async def _load_or_plan_chunks(
+        self, audio_file_path: str, job_dir: Path
+    ) -> list[AudioChunk]:
+        """Chunk plan for a file, reusing the one saved by an earlier run"""
+        plan_path = job_dir / "chunks.json"
+        if plan_path.exists():
+            return [AudioChunk(**chunk) for chunk in json.loads(plan_path.read_text())]
+
+        duration = await self.probe_duration(audio_file_path)
+        silences = await self.detect_silences(audio_file_path, duration)
+        chunks = plan_chunks(
+            duration, silences, self.chunk_seconds, self.min_chunk_seconds
+        )
+
+        self._write_json(plan_path, [vars(chunk) for chunk in chunks])
+        return chunks
+
+    async def _run_command(self, *args: str) -> tuple[str, str]:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"{args[0]} failed ({process.returncode}): "
+                f"{stderr.decode(errors='replace')[-500:]}"
+            )
+        return stdout.decode(), stderr.decode(errors="replace")
+
+    async def probe_duration(self, audio_file_path: str) -> float:
+        """Duration of an audio file in seconds, using ffprobe"""
+        stdout, _ = await self._run_command(
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "csv=p=0",
+            audio_file_path,
+        )
+        return float(stdout.strip())
+
+    async def detect_silences(
+        self, audio_file_path: str, duration: float
+    ) -> list[tuple[float, float]]:
+        """Silence intervals of an audio file, using ffmpeg silencedetect"""
+        _, stderr = await self._run_command(
+            "ffmpeg",
+            "-hide_banner",
+            "-nostats",
+            "-i",
+            audio_file_path,
+            "-af",
+            f"silencedetect=noise={self.silence_noise_db}dB"
+            f":d={self.silence_min_seconds}",
+            "-f",
+            "null",
+            "-",
+        )
+        return parse_silences(stderr, duration)
+
+    async def extract_chunk(
+        self, audio_file_path: str, chunk: AudioChunk, output_path: Path
+    ) -> None:
+        """Encode one chunk of the source audio as a compact mono mp3"""
+        await self._run_command(
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-ss",
+            f"{chunk.start:.3f}",
+            "-t",
+            f"{chunk.end - chunk.start:.3f}",
+            "-i",
+            audio_file_path,
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            "16000",
+            "-b:a",
+            self.chunk_bitrate,
+            str(output_path),
+        )
+
+    async def _transcribe_chunk(
+        self,
+        session: aiohttp.ClientSession,
+        audio_file_path: str,
+        chunk: AudioChunk,
+        job_dir: Path,
+        language: str,
+        model: str,
+    ) -> dict:
+        """Transcribe one chunk, or load its result saved by an earlier run"""
+        result_path = job_dir / f"{chunk.name}.json"
+        if result_path.exists():
+            return json.loads(result_path.read_text())
+
+        audio_path = job_dir / f"{chunk.name}.mp3"
+        await self.extract_chunk(audio_file_path, chunk, audio_path)
+
+        response = await self._post_transcription(session, audio_path, language, model)
+        result = {
+            "start": chunk.start,
+            "end": chunk.end,
+            "text": response.get("text", ""),
+            "language": response.get("language", language),
+            "segments": response.get("segments") or [],
+        }
+
+        self._write_json(result_path, result)
+        audio_path.unlink(missing_ok=True)
+        logger.debug(f"Transcribed {chunk.name} ({chunk.start:.1f}-{chunk.end:.1f}s)")
+        return result
+
+    async def _post_transcription(
+        self,
+        session: aiohttp.ClientSession,
+        audio_path: Path,
+        language: str,
+        model: str,
+    ) -> dict:
+        """Upload one chunk to the transcription API, retrying transient errors"""
+        audio = await asyncio.to_thread(audio_path.read_bytes)
+
+        attempt = 0
+        while True:
+            form = aiohttp.FormData()
+            form.add_field("file", audio, filename=audio_path.name)
+            form.add_field("model", model)
+            form.add_field("language", language)
+            form.add_field("response_format", "verbose_json")
+            form.add_field("temperature", "0")
+
+            try:
+                async with session.post(
+                    self.base_url, headers=self.headers, data=form
+                ) as response:
+                    if (
+                        response.status not in RETRY_STATUSES
+                        or attempt >= self.max_retries
+                    ):
+                        response.raise_for_status()
+                        return await response.json()
+
+                    delay = parse_retry_after(response.headers.get("Retry-After"))
+                    if delay is None:
+                        delay = self.retry_backoff * 2**attempt
+                    reason = f"returned {response.status}"
+            except aiohttp.ClientResponseError:
+                raise
+            except (TimeoutError, aiohttp.ClientError) as e:
+                # Connection errors and timeouts are transient as well
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2**attempt
+                reason = f"failed ({e!r})"
+
+            logger.warning(
+                f"Transcription request for {audio_path.name} {reason}, "
+                f"retrying in {delay}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _write_json(path: Path, data) -> None:
+        """Write JSON atomically so interrupted runs never leave partial files"""
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False))
+        os.replace(tmp_path, path)
+
+    async def download_and_transcribe_video(
         self, video_url: str, output_dir: str | None = None
     ) -> tuple[TranscriptionResult, str]:
         """
         Download video from URL and transcribe its audio
 
+        The download runs in a worker thread, so the event loop stays free.
+
         Args:
             video_url: URL to video (supports YouTube, Diet TV, etc.)
             output_dir: Directory to save temporary files
@@ -113,46 +524,43 @@ class WhisperClient:
         Returns:
             Tuple of (TranscriptionResult, audio_file_path)
         """
+        try:
+            audio_file = await asyncio.to_thread(
+                self._download_audio, video_url, output_dir
+            )
+            transcription = await self.transcribe_audio(audio_file)
+            return transcription, audio_file
+
+        except Exception as e:
+            logger.error(f"Video download and transcription failed: {e}")
+            raise
+
+    def _download_audio(self, video_url: str, output_dir: str | None = None) -> str:
+        """Download a video's audio track with yt-dlp and return its path"""
         if not output_dir:
             output_dir = tempfile.mkdtemp()
 
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        try:
-            # Configure yt-dlp for this download
-            yt_opts = self.yt_dlp_opts.copy()
-            yt_opts["outtmpl"] = str(output_path / "%(title)s.%(ext)s")
-
-            # Download and extract audio
-            with yt_dlp.YoutubeDL(yt_opts) as ydl:
-                logger.info(f"Downloading audio from: {video_url}")
-                ydl.extract_info(video_url, download=True)
+        # Configure yt-dlp for this download
+        yt_opts = self.yt_dlp_opts.copy()
+        yt_opts["outtmpl"] = str(output_path / "%(title)s.%(ext)s")
 
-                # Find the downloaded audio file
-                audio_file = None
-                for file_path in output_path.glob("*"):
-                    if file_path.is_file() and file_path.suffix in [
-                        ".mp3",
-                        ".wav",
-                        ".m4a",
-                    ]:
-                        audio_file = str(file_path)
-                        break
+        # Download and extract audio
+        with yt_dlp.YoutubeDL(yt_opts) as ydl:
+            logger.info(f"Downloading audio from: {video_url}")
+            info = ydl.extract_info(video_url, download=True)
 
-                if not audio_file:
-                    raise RuntimeError("Could not find downloaded audio file")
+        # Use the path yt-dlp reports after audio extraction
+        downloads = info.get("requested_downloads") or [{}]
+        audio_file = downloads[0].get("filepath")
 
-                logger.info(f"Audio downloaded to: {audio_file}")
+        if not audio_file or not os.path.exists(audio_file):
+            raise RuntimeError("Could not find downloaded audio file")
 
-                # Transcribe the audio
-                transcription = self.transcribe_audio_file(audio_file)
-
-                return transcription, audio_file
-
-        except Exception as e:
-            logger.error(f"Video download and transcription failed: {e}")
-            raise
+        logger.info(f"Audio downloaded to: {audio_file}")
+        return audio_file
 
     def calculate_wer(self, reference: str, hypothesis: str) -> float:
         """
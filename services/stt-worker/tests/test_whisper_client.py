@@ -0,0 +1,218 @@
+"""Whisper client chunked transcription tests."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientResponseError, web
+
+from src.stt.whisper_client import WhisperClient, parse_silences, plan_chunks
+
+
+class StubAudioClient(WhisperClient):
+    """WhisperClient with ffmpeg replaced by a fixed duration and silences"""
+
+    def __init__(self, duration, silences, **kwargs):
+        super().__init__(api_key="test_key", **kwargs)
+        self.duration = duration
+        self.silences = silences
+        self.extracted = []
+
+    async def probe_duration(self, audio_file_path):
+        return self.duration
+
+    async def detect_silences(self, audio_file_path, duration):
+        return self.silences
+
+    async def extract_chunk(self, audio_file_path, chunk, output_path):
+        self.extracted.append(chunk.index)
+        Path(output_path).write_bytes(f"{chunk.start}-{chunk.end}".encode())
+
+
+@pytest_asyncio.fixture
+async def transcription_server():
+    """Local stub of the transcription API, one segment per uploaded chunk"""
+    state = {
+        "requests": 0,
+        "active": 0,
+        "max_active": 0,
+        "fail": set(),
+        "disconnect": 0,
+        "rate_limited": 0,
+    }
+
+    async def transcribe(request):
+        form = await request.post()
+        if state["disconnect"]:
+            state["disconnect"] -= 1
+            request.transport.close()
+            return web.Response()
+        if state["rate_limited"]:
+            state["rate_limited"] -= 1
+            return web.Response(status=429, headers={"Retry-After": "0"})
+
+        start, end = (float(t) for t in form["file"].file.read().decode().split("-"))
+
+        state["requests"] += 1
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+
+        if start in state["fail"]:
+            return web.Response(status=400)
+
+        return web.json_response(
+            {
+                "text": f"{start:.0f}秒から",
+                "language": "japanese",
+                "duration": end - start,
+                "segments": [{"id": 0, "start": 1.0, "end": 2.0, "text": "発言"}],
+            }
+        )
+
+    app = web.Application()
+    app.router.add_post("/v1/audio/transcriptions", transcribe)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    state["url"] = f"http://127.0.0.1:{port}/v1/audio/transcriptions"
+    yield state
+    await runner.cleanup()
+
+
+def test_plan_chunks_cuts_at_silences():
+    """Chunks are cut at the latest silence within the maximum length."""
+    chunks = plan_chunks(
+        duration=1500.0,
+        silences=[(100.0, 102.0), (550.0, 552.0), (1090.0, 1092.0)],
+        max_chunk_seconds=600.0,
+        min_chunk_seconds=300.0,
+    )
+
+    assert [(c.start, c.end) for c in chunks] == [
+        (0.0, 551.0),
+        (551.0, 1091.0),
+        (1091.0, 1500.0),
+    ]
+
+
+def test_plan_chunks_without_silence():
+    """Audio without usable silences is cut at the maximum length."""
+    chunks = plan_chunks(1300.0, [(10.0, 11.0)], 600.0, 300.0)
+
+    assert [(c.start, c.end) for c in chunks] == [
+        (0.0, 600.0),
+        (600.0, 1200.0),
+        (1200.0, 1300.0),
+    ]
+
+
+def test_parse_silences():
+    """ffmpeg silencedetect output is parsed into intervals."""
+    output = "\n".join(
+        [
+            "[silencedetect @ 0x1] silence_start: 12.5",
+            "[silencedetect @ 0x1] silence_end: 14 | silence_duration: 1.5",
+            "[silencedetect @ 0x1] silence_start: 98.25",
+        ]
+    )
+
+    assert parse_silences(output, 100.0) == [(12.5, 14.0), (98.25, 100.0)]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_long_audio(transcription_server, tmp_path):
+    """Chunks are transcribed concurrently and stitched on the source timeline."""
+    audio_file = tmp_path / "plenary.mp3"
+    audio_file.write_bytes(b"audio")
+
+    client = StubAudioClient(
+        duration=4 * 3600.0,
+        silences=[],
+        max_concurrency=4,
+        work_dir=str(tmp_path / "work"),
+    )
+    client.base_url = transcription_server["url"]
+
+    result = await client.transcribe_long_audio(str(audio_file))
+
+    assert transcription_server["requests"] == 24
+    assert 1 < transcription_server["max_active"] <= 4
+    assert result.duration == 4 * 3600.0
+    assert result.text.startswith("0秒から600秒から")
+    assert [s["id"] for s in result.segments] == list(range(24))
+    assert result.segments[1]["start"] == 601.0
+    assert result.segments[-1]["end"] == 23 * 600.0 + 2.0
+
+
+@pytest.mark.asyncio
+async def test_transcribe_long_audio_resumes(transcription_server, tmp_path):
+    """A rerun after a failed chunk only transcribes the missing chunk."""
+    audio_file = tmp_path / "plenary.mp3"
+    audio_file.write_bytes(b"audio")
+
+    client = StubAudioClient(
+        duration=1800.0, silences=[], work_dir=str(tmp_path / "work")
+    )
+    client.base_url = transcription_server["url"]
+    transcription_server["fail"].add(600.0)
+
+    with pytest.raises(ClientResponseError):
+        await client.transcribe_long_audio(str(audio_file))
+    assert transcription_server["requests"] == 3
+
+    transcription_server["fail"].clear()
+    client.extracted.clear()
+    result = await client.transcribe_long_audio(str(audio_file))
+
+    assert transcription_server["requests"] == 4
+    assert client.extracted == [1]
+    assert [s["start"] for s in result.segments] == [1.0, 601.0, 1201.0]
+
+
+@pytest.mark.asyncio
+async def test_download_and_transcribe_inside_running_loop(
+    transcription_server, tmp_path
+):
+    """Long downloads are transcribed by awaiting, not by a nested event loop."""
+    audio_file = tmp_path / "plenary.mp3"
+    audio_file.write_bytes(b"audio")
+
+    client = StubAudioClient(
+        duration=1200.0, silences=[], work_dir=str(tmp_path / "work")
+    )
+    client.base_url = transcription_server["url"]
+    client.max_upload_bytes = 1
+    client._download_audio = lambda video_url, output_dir=None: str(audio_file)
+
+    result, path = await client.download_and_transcribe_video("https://example.com")
+
+    assert path == str(audio_file)
+    assert transcription_server["requests"] == 2
+    assert [s["start"] for s in result.segments] == [1.0, 601.0]
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_retries_transient_errors(
+    transcription_server, tmp_path
+):
+    """Dropped connections and 429 responses are retried."""
+    audio_file = tmp_path / "clip.mp3"
+    audio_file.write_bytes(b"0-30")
+
+    client = WhisperClient(api_key="test_key")
+    client.base_url = transcription_server["url"]
+    client.retry_backoff = 0.01
+    transcription_server["disconnect"] = 1
+    transcription_server["rate_limited"] = 1
+
+    result = await client.transcribe_audio(str(audio_file))
+
+    assert transcription_server["requests"] == 1
+    assert result.text == "0秒から"
+    assert result.duration == 30.0
@@ -0,0 +1,62 @@
+"""Create bill snapshots table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create bill_snapshots table holding the latest tracked state per bill"""
+
+    op.create_table(
+        "bill_snapshots",
+        sa.Column(
+            "bill_id", sa.String(length=100), nullable=False, comment="Bill identifier"
+        ),
+        sa.Column(
+            "data_hash",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 of the tracked fields",
+        ),
+        sa.Column(
+            "tracked_fields",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Tracked field values at snapshot time",
+        ),
+        sa.Column(
+            "quality_score", sa.Float(), nullable=True, comment="Data quality score"
+        ),
+        sa.Column(
+            "snapshot_time",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Snapshot timestamp",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("bill_id"),
+    )
+
+
+def downgrade():
+    """Drop bill_snapshots table"""
+
+    op.drop_table("bill_snapshots")
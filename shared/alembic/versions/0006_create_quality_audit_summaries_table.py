@@ -0,0 +1,95 @@
+"""Create quality audit summaries table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create quality_audit_summaries table holding one row per audit"""
+
+    op.create_table(
+        "quality_audit_summaries",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "audited_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Audit completion timestamp",
+        ),
+        sa.Column(
+            "total_bills",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of bills audited",
+        ),
+        sa.Column(
+            "overall_quality_score",
+            sa.Float(),
+            nullable=False,
+            comment="Overall quality score",
+        ),
+        sa.Column(
+            "completeness_rate", sa.Float(), nullable=False, comment="Completeness rate"
+        ),
+        sa.Column("accuracy_rate", sa.Float(), nullable=False, comment="Accuracy rate"),
+        sa.Column(
+            "consistency_rate", sa.Float(), nullable=False, comment="Consistency rate"
+        ),
+        sa.Column(
+            "timeliness_rate", sa.Float(), nullable=False, comment="Timeliness rate"
+        ),
+        sa.Column(
+            "total_issues",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of issues found",
+        ),
+        sa.Column(
+            "field_metrics",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Quality metrics per audited field",
+        ),
+        sa.Column(
+            "issues_by_type",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Issue counts per issue type",
+        ),
+        sa.Column(
+            "issues_by_severity",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Issue counts per severity",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Trend queries are range scans on the audit time
+    op.create_index(
+        "ix_quality_audit_summaries_audited_at",
+        "quality_audit_summaries",
+        ["audited_at"],
+    )
+
+
+def downgrade():
+    """Drop quality_audit_summaries table"""
+
+    op.drop_index(
+        "ix_quality_audit_summaries_audited_at", table_name="quality_audit_summaries"
+    )
+    op.drop_table("quality_audit_summaries")
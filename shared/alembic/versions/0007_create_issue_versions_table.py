@@ -0,0 +1,96 @@
+"""Create issue versions table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create issue_versions table holding one row per issue version"""
+
+    op.create_table(
+        "issue_versions",
+        sa.Column("version_id", sa.String(36), nullable=False, comment="Version UUID"),
+        sa.Column(
+            "issue_id", sa.String(100), nullable=False, comment="Issue identifier"
+        ),
+        sa.Column(
+            "record_id", sa.String(100), nullable=False, comment="Airtable record ID"
+        ),
+        sa.Column(
+            "version_number", sa.Integer(), nullable=False, comment="Sequential version"
+        ),
+        sa.Column(
+            "change_type", sa.String(50), nullable=False, comment="Change trigger"
+        ),
+        sa.Column(
+            "change_description",
+            sa.Text(),
+            nullable=False,
+            comment="Change description",
+        ),
+        sa.Column(
+            "valid_from", sa.Date(), nullable=False, comment="First day of validity"
+        ),
+        sa.Column(
+            "valid_to",
+            sa.Date(),
+            nullable=True,
+            comment="End of validity (exclusive)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            comment="Version creation time",
+        ),
+        sa.Column(
+            "created_by", sa.String(100), nullable=False, comment="User or system"
+        ),
+        sa.Column("label_lv1", sa.Text(), nullable=False, comment="Level 1 label"),
+        sa.Column("label_lv2", sa.Text(), nullable=False, comment="Level 2 label"),
+        sa.Column("parent_id", sa.String(100), nullable=True, comment="Parent issue"),
+        sa.Column("confidence", sa.Float(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, comment="Review status"),
+        sa.Column(
+            "source_bill_id", sa.String(100), nullable=True, comment="Source bill"
+        ),
+        sa.Column("quality_score", sa.Float(), nullable=False),
+        sa.Column("previous_version_id", sa.String(36), nullable=True),
+        sa.Column("next_version_id", sa.String(36), nullable=True),
+        sa.Column("rollback_available", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("version_id"),
+        sa.UniqueConstraint(
+            "issue_id", "version_number", name="uq_issue_versions_number"
+        ),
+    )
+
+    # Per-issue history and point-in-time lookups
+    op.create_index(
+        "ix_issue_versions_issue_valid_from",
+        "issue_versions",
+        ["issue_id", "valid_from"],
+    )
+    # Point-in-time snapshots across all issues
+    op.create_index(
+        "ix_issue_versions_validity", "issue_versions", ["valid_from", "valid_to"]
+    )
+
+
+def downgrade():
+    """Drop issue_versions table"""
+
+    op.drop_index("ix_issue_versions_validity", table_name="issue_versions")
+    op.drop_index("ix_issue_versions_issue_valid_from", table_name="issue_versions")
+    op.drop_table("issue_versions")
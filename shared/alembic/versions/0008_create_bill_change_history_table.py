@@ -0,0 +1,87 @@
+"""Create bill change history table
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create bill_change_history table for the automatic history recorder"""
+
+    op.create_table(
+        "bill_change_history",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "bill_id", sa.String(length=100), nullable=False, comment="Bill identifier"
+        ),
+        sa.Column(
+            "event_type", sa.String(length=50), nullable=False, comment="Event type"
+        ),
+        sa.Column(
+            "change_type", sa.String(length=50), nullable=False, comment="Change type"
+        ),
+        sa.Column(
+            "recorded_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Detection timestamp",
+        ),
+        sa.Column(
+            "previous_values", postgresql.JSONB(astext_type=sa.Text()), nullable=True
+        ),
+        sa.Column("new_values", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "change_summary", sa.Text(), nullable=True, comment="Change description"
+        ),
+        sa.Column(
+            "confidence_score",
+            sa.Float(),
+            nullable=True,
+            comment="Detection confidence",
+        ),
+        sa.Column(
+            "source_system",
+            sa.String(length=50),
+            nullable=False,
+            comment="Recording system",
+        ),
+        sa.Column("metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Per-bill history and timelines
+    op.create_index(
+        "ix_bill_change_history_bill_recorded",
+        "bill_change_history",
+        ["bill_id", "recorded_at"],
+    )
+    # Time-window analytics and keyset-paged exports
+    op.create_index(
+        "ix_bill_change_history_recorded_id",
+        "bill_change_history",
+        ["recorded_at", "id"],
+    )
+
+
+def downgrade():
+    """Drop bill_change_history table"""
+
+    op.drop_index(
+        "ix_bill_change_history_recorded_id", table_name="bill_change_history"
+    )
+    op.drop_index(
+        "ix_bill_change_history_bill_recorded", table_name="bill_change_history"
+    )
+    op.drop_table("bill_change_history")
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from ..utils.rate_limiter import TokenBucketRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,35 +33,35 @@ class AirtableClient:
         }
 
         # Rate limiting: Airtable allows 5 requests per second
-        self._request_semaphore = asyncio.Semaphore(5)
-        self._last_request_time = 0
+        self._rate_limiter = TokenBucketRateLimiter(rate=5, burst=5, name="airtable")
 
     async def _rate_limited_request(
         self, method: str, url: str, **kwargs
     ) -> Dict[str, Any]:
         """Make rate-limited request to Airtable API."""
-        async with self._request_semaphore:
-            # Ensure we don't exceed 5 requests per second
-            now = asyncio.get_event_loop().time()
-            time_since_last = now - self._last_request_time
-            if time_since_last < 0.2:  # 200ms between requests
-                await asyncio.sleep(0.2 - time_since_last)
-
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method, url, headers=self.headers, **kwargs
-                ) as response:
-                    self._last_request_time = asyncio.get_event_loop().time()
-
-                    if response.status == 429:  # Too Many Requests
-                        retry_after = int(response.headers.get("Retry-After", 30))
-                        logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
-                        return await self._rate_limited_request(method, url, **kwargs)
+        await self._rate_limiter.acquire()
 
+        async with aiohttp.ClientSession() as session:
+            async with session.request(
+                method, url, headers=self.headers, **kwargs
+            ) as response:
+                if response.status != 429:
                     response.raise_for_status()
                     return await response.json()
 
+                # Too Many Requests: pause the shared bucket so every pending
+                # request backs off, then retry through the limiter
+                retry_after = self._rate_limiter.pause_for_retry_after(
+                    response.headers, default=30.0
+                )
+                logger.warning(f"Rate limited, waiting {retry_after:.0f} seconds")
+
+        return await self._rate_limited_request(method, url, **kwargs)
+
+    def get_rate_limit_metrics(self) -> Dict[str, Any]:
+        """Get current rate limiter tokens and wait-time metrics."""
+        return self._rate_limiter.get_metrics()
+
     def _serialize_value(self, value: Any) -> Any:
         """Serialize Python values for Airtable API."""
         if isinstance(value, date | datetime):
@@ -2,10 +2,19 @@
 
 from .base import BaseRecord, WeaviateEmbedding
 from .bill import Bill, BillCategory, BillStatus
+from .bill_change_history import (
+    BillChangeHistoryRecord,
+    HistoryChangeType,
+    HistoryEventType,
+)
+from .bill_record import BillRecord
+from .bill_snapshot import BillSnapshotRecord
 from .bills_issue_categories import BillsPolicyCategory
 from .issue import Issue, IssueCategory, IssueTag
+from .issue_version import IssueVersionRecord
 from .meeting import Meeting, Speech
 from .member import Member, Party
+from .quality_audit_summary import QualityAuditSummaryRecord
 from .vote import Vote, VoteResult
 
 # Legacy aliases for backward compatibility
@@ -18,6 +27,12 @@ __all__ = [
     "Bill",
     "BillStatus",
     "BillCategory",
+    "BillRecord",
+    "BillChangeHistoryRecord",
+    "HistoryChangeType",
+    "HistoryEventType",
+    "BillSnapshotRecord",
+    "QualityAuditSummaryRecord",
     "Meeting",
     "Speech",
     "Member",
@@ -27,6 +42,7 @@ __all__ = [
     "Issue",
     "IssueTag",
     "IssueCategory",
+    "IssueVersionRecord",
     "BillsPolicyCategory",
     # Legacy aliases
     "Base",
@@ -0,0 +1,91 @@
+"""Bill change history table written by the automatic history recorder."""
+
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON
+
+from ..database.base import Base
+
+
+class HistoryEventType(Enum):
+    """Legislative event a recorded change corresponds to."""
+
+    BILL_SUBMITTED = "bill_submitted"
+    STATUS_UPDATE = "status_update"
+    STAGE_CHANGE = "stage_change"
+    COMMITTEE_REFERRAL = "committee_referral"
+    VOTE_TAKEN = "vote_taken"
+    DOCUMENT_UPDATE = "document_update"
+    METADATA_CHANGE = "metadata_change"
+    IMPLEMENTATION = "implementation"
+    DATA_CORRECTION = "data_correction"
+    DATA_COMPLETION = "data_completion"
+    MANUAL_CORRECTION = "manual_correction"
+    GENERAL_UPDATE = "general_update"
+
+
+class HistoryChangeType(Enum):
+    """Kind of field change detected between two bill snapshots."""
+
+    STATUS_CHANGE = "status_change"
+    STAGE_TRANSITION = "stage_transition"
+    COMMITTEE_ASSIGNMENT = "committee_assignment"
+    VOTE_RECORDED = "vote_recorded"
+    DOCUMENT_UPDATE = "document_update"
+    METADATA_UPDATE = "metadata_update"
+    IMPLEMENTATION = "implementation"
+    DATA_CORRECTION = "data_correction"
+    DATA_ENHANCEMENT = "data_enhancement"
+
+
+def _enum_column(enum_class: type[Enum]) -> SQLEnum:
+    """Store enum values (not names) in a plain string column."""
+    return SQLEnum(
+        enum_class,
+        native_enum=False,
+        create_constraint=False,
+        length=50,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
+class BillChangeHistoryRecord(Base):
+    """One detected or manually recorded change to a bill field.
+
+    Rows are append-only. Exports page through them by the
+    (recorded_at, id) index.
+    """
+
+    __tablename__ = "bill_change_history"
+    __table_args__ = (
+        Index("ix_bill_change_history_bill_recorded", "bill_id", "recorded_at"),
+        Index("ix_bill_change_history_recorded_id", "recorded_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    bill_id = Column(String(100), nullable=False, comment="Bill identifier")
+    event_type = Column(
+        _enum_column(HistoryEventType), nullable=False, comment="Event type"
+    )
+    change_type = Column(
+        _enum_column(HistoryChangeType), nullable=False, comment="Change type"
+    )
+    recorded_at = Column(
+        DateTime(timezone=True), nullable=False, comment="Detection timestamp"
+    )
+    previous_values = Column(JSON().with_variant(JSONB(), "postgresql"))
+    new_values = Column(JSON().with_variant(JSONB(), "postgresql"))
+    change_summary = Column(Text, nullable=True, comment="Change description")
+    confidence_score = Column(Float, nullable=True, comment="Detection confidence")
+    source_system = Column(String(50), nullable=False, comment="Recording system")
+    # "metadata" is reserved on declarative classes
+    event_metadata = Column("metadata", JSON().with_variant(JSONB(), "postgresql"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<BillChangeHistoryRecord(bill_id='{self.bill_id}', "
+            f"change_type='{self.change_type}')>"
+        )
@@ -0,0 +1,107 @@
+"""Mapping of the bills table for database-side bill processing."""
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from ..database.base import Base
+from .bill import BillCategory, BillStatus
+
+# JSON in migration 0001, JSONB for the columns added in 0003
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class BillRecord(Base):
+    """Row of the ``bills`` table (migrations 0001 and 0003).
+
+    ``Bill`` is the pydantic model used for Airtable records and cannot be
+    used in SQL statements; this class maps the same bill fields to columns.
+    The pgvector embedding columns are not mapped.
+    """
+
+    __tablename__ = "bills"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    bill_number = Column(String(50), nullable=False, unique=True, index=True)
+    title = Column(String(500), nullable=False)
+    title_en = Column(String(1000), nullable=True)
+    short_title = Column(String(200), nullable=True)
+    summary = Column(Text, nullable=True)
+    full_text = Column(Text, nullable=True)
+    purpose = Column(Text, nullable=True)
+
+    bill_outline = Column(Text, nullable=True, comment="議案要旨相当の長文情報")
+    background_context = Column(Text, nullable=True, comment="提出背景・経緯")
+    expected_effects = Column(Text, nullable=True, comment="期待される効果")
+    key_provisions = Column(JSONType, nullable=True, comment="主要条項リスト")
+    related_laws = Column(JSONType, nullable=True, comment="関連法律リスト")
+    implementation_date = Column(String(10), nullable=True, comment="施行予定日")
+
+    status = Column(
+        Enum(*BillStatus.__members__, name="billstatus"),
+        nullable=False,
+        default=BillStatus.BACKLOG.name,
+    )
+    category = Column(Enum(*BillCategory.__members__, name="billcategory"))
+    bill_type = Column(String(50), nullable=True)
+
+    submitted_date = Column(Date, nullable=True)
+    first_reading_date = Column(Date, nullable=True)
+    committee_referral_date = Column(Date, nullable=True)
+    committee_report_date = Column(Date, nullable=True)
+    final_vote_date = Column(Date, nullable=True)
+    promulgated_date = Column(Date, nullable=True)
+
+    diet_session = Column(String(20), nullable=True)
+    house_of_origin = Column(String(20), nullable=True)
+    submitter_type = Column(String(20), nullable=True)
+    submitting_members = Column(JSONType, nullable=True, comment="提出議員一覧")
+    supporting_members = Column(JSONType, nullable=True, comment="賛成議員一覧")
+    submitting_party = Column(String(100), nullable=True, comment="提出会派")
+    sponsoring_ministry = Column(String(100), nullable=True, comment="主管省庁")
+
+    diet_url = Column(String(500), nullable=True)
+    pdf_url = Column(String(500), nullable=True)
+    related_bills = Column(JSON, nullable=True)
+
+    committee_assignments = Column(JSONType, nullable=True, comment="委員会付託情報")
+    voting_results = Column(JSONType, nullable=True, comment="採決結果")
+    amendments = Column(JSONType, nullable=True, comment="修正内容")
+    inter_house_status = Column(String(50), nullable=True, comment="両院間の状況")
+
+    ai_summary = Column(Text, nullable=True)
+    key_points = Column(JSON, nullable=True)
+    tags = Column(JSON, nullable=True)
+    impact_assessment = Column(JSON, nullable=True)
+    is_controversial = Column(Boolean, nullable=False, default=False)
+    priority_level = Column(String(20), nullable=False, default="normal")
+    estimated_cost = Column(String(100), nullable=True)
+
+    source_house = Column(String(10), nullable=True, comment="データ取得元議院")
+    source_url = Column(String(500), nullable=True, comment="元データURL")
+    data_quality_score = Column(Float, nullable=True, comment="データ品質スコア")
+
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<BillRecord(bill_number='{self.bill_number}', status='{self.status}')>"
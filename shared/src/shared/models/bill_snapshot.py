@@ -0,0 +1,40 @@
+"""Bill snapshot table used for history change detection."""
+
+from sqlalchemy import Column, DateTime, Float, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON
+
+from ..database.base import Base
+
+
+class BillSnapshotRecord(Base):
+    """Latest tracked-field state of a bill, one row per bill.
+
+    The history recorder compares each bill against this row; bills whose
+    ``data_hash`` is unchanged are skipped without any per-field diffing.
+    """
+
+    __tablename__ = "bill_snapshots"
+
+    bill_id = Column(String(100), primary_key=True, comment="Bill identifier")
+    data_hash = Column(
+        String(64), nullable=False, comment="SHA-256 of the tracked fields"
+    )
+    tracked_fields = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="Tracked field values at snapshot time",
+    )
+    quality_score = Column(Float, nullable=True, comment="Data quality score")
+    snapshot_time = Column(
+        DateTime(timezone=True), nullable=False, comment="Snapshot timestamp"
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<BillSnapshotRecord(bill_id='{self.bill_id}', hash='{self.data_hash[:8]}')>"
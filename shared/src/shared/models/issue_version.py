@@ -0,0 +1,61 @@
+"""Issue version table used for temporal issue history."""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+
+from ..database.base import Base
+
+
+class IssueVersionRecord(Base):
+    """One version of a policy issue, valid over ``[valid_from, valid_to)``.
+
+    A NULL ``valid_to`` marks the current version. Point-in-time snapshots are
+    range queries on the (valid_from, valid_to) index.
+    """
+
+    __tablename__ = "issue_versions"
+    __table_args__ = (
+        UniqueConstraint("issue_id", "version_number", name="uq_issue_versions_number"),
+        Index("ix_issue_versions_issue_valid_from", "issue_id", "valid_from"),
+        Index("ix_issue_versions_validity", "valid_from", "valid_to"),
+    )
+
+    version_id = Column(String(36), primary_key=True, comment="Version UUID")
+    issue_id = Column(String(100), nullable=False, comment="Issue identifier")
+    record_id = Column(String(100), nullable=False, comment="Airtable record ID")
+    version_number = Column(Integer, nullable=False, comment="Sequential version")
+    change_type = Column(String(50), nullable=False, comment="Change trigger")
+    change_description = Column(Text, nullable=False, comment="Change description")
+
+    valid_from = Column(Date, nullable=False, comment="First day of validity")
+    valid_to = Column(Date, nullable=True, comment="End of validity (exclusive)")
+    created_at = Column(DateTime, nullable=False, comment="Version creation time")
+    created_by = Column(String(100), nullable=False, comment="User or system")
+
+    label_lv1 = Column(Text, nullable=False, default="", comment="Level 1 label")
+    label_lv2 = Column(Text, nullable=False, default="", comment="Level 2 label")
+    parent_id = Column(String(100), nullable=True, comment="Parent issue")
+    confidence = Column(Float, nullable=False, default=0.0)
+    status = Column(String(20), nullable=False, comment="Review status")
+    source_bill_id = Column(String(100), nullable=True, comment="Source bill")
+    quality_score = Column(Float, nullable=False, default=0.0)
+
+    previous_version_id = Column(String(36), nullable=True)
+    next_version_id = Column(String(36), nullable=True)
+    rollback_available = Column(Boolean, nullable=False, default=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<IssueVersionRecord(issue_id='{self.issue_id}', "
+            f"version={self.version_number})>"
+        )
@@ -0,0 +1,55 @@
+"""Quality audit summary table used for data quality trends."""
+
+from sqlalchemy import Column, DateTime, Float, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON
+
+from ..database.base import Base
+
+
+class QualityAuditSummaryRecord(Base):
+    """Compact summary of one completed data quality audit.
+
+    Quality trends are read from these rows with a single range query on
+    ``audited_at`` instead of re-auditing the bills.
+    """
+
+    __tablename__ = "quality_audit_summaries"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    audited_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        comment="Audit completion timestamp",
+    )
+    total_bills = Column(Integer, nullable=False, comment="Number of bills audited")
+    overall_quality_score = Column(
+        Float, nullable=False, comment="Overall quality score"
+    )
+    completeness_rate = Column(Float, nullable=False, comment="Completeness rate")
+    accuracy_rate = Column(Float, nullable=False, comment="Accuracy rate")
+    consistency_rate = Column(Float, nullable=False, comment="Consistency rate")
+    timeliness_rate = Column(Float, nullable=False, comment="Timeliness rate")
+    total_issues = Column(Integer, nullable=False, comment="Number of issues found")
+    field_metrics = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="Quality metrics per audited field",
+    )
+    issues_by_type = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="Issue counts per issue type",
+    )
+    issues_by_severity = Column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        comment="Issue counts per severity",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<QualityAuditSummaryRecord(audited_at='{self.audited_at}', "
+            f"score={self.overall_quality_score})>"
+        )
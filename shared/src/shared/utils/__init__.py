@@ -8,6 +8,12 @@ from .database import (
     run_migrations,
 )
 from .issue_extractor import IssueExtractor
+from .metrics_registry import MetricsRegistry
+from .rate_limiter import (
+    AIMDConcurrencyLimiter,
+    TokenBucketRateLimiter,
+    parse_retry_after,
+)
 
 __all__ = [
     "init_database",
@@ -16,4 +22,8 @@ __all__ = [
     "drop_tables",
     "check_database_connection",
     "IssueExtractor",
+    "MetricsRegistry",
+    "TokenBucketRateLimiter",
+    "AIMDConcurrencyLimiter",
+    "parse_retry_after",
 ]
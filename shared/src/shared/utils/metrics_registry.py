@@ -0,0 +1,263 @@
+"""Typed metric families with pre-aggregated series and Prometheus exposition.
+
+Each metric family (counter, gauge or histogram) keeps one pre-aggregated
+value per label set, updated in place as samples are recorded. Exposition is
+therefore a single walk over the live series instead of a regroup over every
+recorded sample, and every family is emitted with its real ``TYPE``.
+
+The number of series per family is capped at ``max_series``; label sets seen
+after the cap is reached are folded into a single ``overflow="true"`` series
+so an unbounded label value cannot grow memory or exposition without limit.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+
+LabelKey = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+DEFAULT_MAX_SERIES = 1000
+
+OVERFLOW_KEY: LabelKey = (("overflow", "true"),)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+class MetricFamily(ABC):
+    """A named metric with one series per distinct label set."""
+
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str | None = None,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        self.name = name
+        self.help = help or name.replace("_", " ").title()
+        self.max_series = max_series
+        self._label_text: dict[LabelKey, str] = {}
+
+    @staticmethod
+    def _label_key(labels: Mapping[str, object] | None) -> LabelKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items())) if labels else ()
+
+    def _key(self, labels: Mapping[str, object] | None) -> LabelKey:
+        """Return the series key for ``labels``, registering it if new.
+
+        Once the family holds ``max_series`` series, new label sets resolve
+        to the shared overflow series.
+        """
+        key = self._label_key(labels)
+        if key not in self._label_text and len(self._label_text) >= self.max_series:
+            key = OVERFLOW_KEY
+        if key not in self._label_text:
+            self._label_text[key] = ",".join(
+                f'{k}="{_escape_label_value(v)}"' for k, v in key
+            )
+            self._new_series(key)
+        return key
+
+    @abstractmethod
+    def _new_series(self, key: LabelKey) -> None:
+        """Initialise the aggregate for a newly seen label set."""
+
+    @abstractmethod
+    def _samples(self) -> Iterable[tuple[str, str, float]]:
+        """Yield (sample name, rendered labels, value) for every series."""
+
+    def __len__(self) -> int:
+        return len(self._label_text)
+
+    def expose(self) -> list[str]:
+        """Render this family in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for sample_name, labels, value in self._samples():
+            if labels:
+                lines.append(f"{sample_name}{{{labels}}} {_format_value(value)}")
+            else:
+                lines.append(f"{sample_name} {_format_value(value)}")
+        return lines
+
+
+class Counter(MetricFamily):
+    """Monotonically increasing total."""
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        help: str | None = None,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        super().__init__(name, help, max_series)
+        self._values: dict[LabelKey, float] = {}
+
+    def _new_series(self, key: LabelKey) -> None:
+        self._values[key] = 0.0
+
+    def inc(self, amount: float = 1.0, labels: Mapping[str, object] | None = None):
+        if amount < 0:
+            raise ValueError("counters can only be increased")
+        self._values[self._key(labels)] += amount
+
+    def value(self, labels: Mapping[str, object] | None = None) -> float:
+        return self._values.get(self._label_key(labels), 0.0)
+
+    def _samples(self) -> Iterable[tuple[str, str, float]]:
+        for key, value in self._values.items():
+            yield self.name, self._label_text[key], value
+
+
+class Gauge(MetricFamily):
+    """Value that can go up and down; the latest value is exposed."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str | None = None,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        super().__init__(name, help, max_series)
+        self._values: dict[LabelKey, float] = {}
+
+    def _new_series(self, key: LabelKey) -> None:
+        self._values[key] = 0.0
+
+    def set(self, value: float, labels: Mapping[str, object] | None = None):
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, labels: Mapping[str, object] | None = None):
+        self._values[self._key(labels)] += amount
+
+    def value(self, labels: Mapping[str, object] | None = None) -> float:
+        return self._values.get(self._label_key(labels), 0.0)
+
+    def _samples(self) -> Iterable[tuple[str, str, float]]:
+        for key, value in self._values.items():
+            yield self.name, self._label_text[key], value
+
+
+class Histogram(MetricFamily):
+    """Distribution of observations in fixed cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str | None = None,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        super().__init__(name, help, max_series)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        if not self.buckets:
+            raise ValueError("histogram needs at least one finite bucket")
+
+        # Per series: non-cumulative bucket counts (last is +Inf), sum, count
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+        self._bucket_labels = [_format_value(b) for b in self.buckets] + ["+Inf"]
+
+    def _new_series(self, key: LabelKey) -> None:
+        self._counts[key] = [0] * (len(self.buckets) + 1)
+        self._sums[key] = 0.0
+
+    def observe(self, value: float, labels: Mapping[str, object] | None = None):
+        key = self._key(labels)
+        self._counts[key][bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def count(self, labels: Mapping[str, object] | None = None) -> int:
+        return sum(self._counts.get(self._label_key(labels), ()))
+
+    def _samples(self) -> Iterable[tuple[str, str, float]]:
+        for key, counts in self._counts.items():
+            labels = self._label_text[key]
+            prefix = f"{labels}," if labels else ""
+
+            cumulative = 0
+            for bucket_label, bucket_count in zip(
+                self._bucket_labels, counts, strict=True
+            ):
+                cumulative += bucket_count
+                yield (
+                    f"{self.name}_bucket",
+                    f'{prefix}le="{bucket_label}"',
+                    cumulative,
+                )
+            yield f"{self.name}_sum", labels, self._sums[key]
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Collection of metric families keyed by name.
+
+    Families are created on first use, each capped at ``max_series`` series;
+    asking for an existing name with a different type raises ``ValueError``.
+    """
+
+    def __init__(self, max_series: int = DEFAULT_MAX_SERIES):
+        self.max_series = max_series
+        self._families: dict[str, MetricFamily] = {}
+
+    def _get_or_create(self, cls: type[MetricFamily], name: str, **kwargs):
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = cls(
+                name, max_series=self.max_series, **kwargs
+            )
+        elif not isinstance(family, cls):
+            raise ValueError(f"metric {name!r} is already registered as {family.type}")
+        return family
+
+    def counter(self, name: str, help: str | None = None) -> Counter:
+        return self._get_or_create(Counter, name, help=help)
+
+    def gauge(self, name: str, help: str | None = None) -> Gauge:
+        return self._get_or_create(Gauge, name, help=help)
+
+    def histogram(
+        self,
+        name: str,
+        help: str | None = None,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help=help, buckets=buckets)
+
+    def get(self, name: str) -> MetricFamily | None:
+        return self._families.get(name)
+
+    def __iter__(self):
+        return iter(self._families.values())
+
+    def __len__(self) -> int:
+        return len(self._families)
+
+    def expose(self) -> str:
+        """Render all families in the Prometheus text exposition format."""
+        lines = []
+        for family in self._families.values():
+            if len(family):
+                lines.extend(family.expose())
+        return "\n".join(lines) + "\n" if lines else ""
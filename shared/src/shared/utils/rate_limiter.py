@@ -0,0 +1,387 @@
+"""Token-bucket rate limiting shared by the Diet Issue Tracker API clients.
+
+The limiter implements the Generic Cell Rate Algorithm (GCRA), which is an
+exact, state-light formulation of a token bucket: instead of tracking tokens
+and refill timestamps it stores a single "theoretical arrival time" (TAT).
+Each caller reserves its slot synchronously and then sleeps until that slot,
+so waiters are served in FIFO order without holding a lock while sleeping and
+concurrency scales up to the configured rate.
+
+For providers whose real capacity is unknown, AIMDConcurrencyLimiter adapts
+the number of concurrent requests to observed latency and rate-limit responses.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: str | float | int | None) -> float | None:
+    """Parse a ``Retry-After`` header value into seconds.
+
+    Accepts either delta-seconds or an HTTP-date. Returns None if the value is
+    missing or cannot be parsed.
+    """
+    if value is None:
+        return None
+    if isinstance(value, int | float):
+        return max(0.0, float(value))
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class TokenBucketRateLimiter:
+    """Async token-bucket rate limiter (GCRA) with burst and pause support.
+
+    Args:
+        rate: Sustained rate in requests per second
+        burst: Number of requests that may be issued back-to-back
+        name: Name used in logs and metrics
+        clock: Monotonic clock, injectable for tests
+        sleep: Async sleep matching ``clock``, injectable for tests
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        name: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+        self._clock = clock
+        self._sleep = sleep
+        self._interval = 1.0 / rate
+
+        # Theoretical arrival time of the next conforming request
+        self._tat = clock()
+        self._paused_until = 0.0
+        # Total time pending reservations have been pushed back by pauses
+        self._pause_shift = 0.0
+
+        # Metrics
+        self._waiters = 0
+        self._total_acquired = 0
+        self._total_delayed = 0
+        self._total_wait_seconds = 0.0
+        self._pause_count = 0
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve ``tokens`` and return the delay until they may be used."""
+        now = self._clock()
+        start = max(now, self._paused_until)
+        tat = max(self._tat, start)
+
+        allow_at = max(start, tat + (tokens - self.burst) * self._interval)
+        self._tat = tat + tokens * self._interval
+
+        return allow_at - now
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """Wait until ``tokens`` requests may be issued.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.burst:
+            raise ValueError(f"cannot acquire {tokens} tokens with burst {self.burst}")
+
+        # Reservation happens without awaiting, so it is atomic on the event loop
+        delay = self._reserve(tokens)
+        waited = 0.0
+
+        if delay > 0:
+            self._waiters += 1
+            started = self._clock()
+            slot = started + delay
+            shift = self._pause_shift
+            try:
+                # Pauses triggered while we wait push our slot back by their
+                # length, so queued requests stay spaced after the pause
+                while (
+                    remaining := slot + self._pause_shift - shift - self._clock()
+                ) > 0:
+                    await self._sleep(remaining)
+            finally:
+                self._waiters -= 1
+            waited = self._clock() - started
+
+            self._total_delayed += 1
+            self._total_wait_seconds += waited
+
+        self._total_acquired += tokens
+        return waited
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Acquire ``tokens`` only if they are available immediately."""
+        if self.wait_time(tokens) > 0:
+            return False
+        self._reserve(tokens)
+        self._total_acquired += tokens
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquisitions for ``seconds`` (e.g. after HTTP 429).
+
+        Pending reservations are pushed back by the pause and the bucket
+        resumes with a single token, so requests after the pause keep the
+        sustained rate instead of firing together.
+        """
+        if seconds <= 0:
+            return
+
+        now = self._clock()
+        until = now + seconds
+        if until <= self._paused_until:
+            return
+
+        # Only the part extending an earlier pause shifts reservations again
+        shift = until - max(now, self._paused_until)
+        self._paused_until = until
+        self._pause_shift += shift
+        self._tat = max(
+            max(self._tat, now) + shift, until + (self.burst - 1) * self._interval
+        )
+
+        self._pause_count += 1
+        logger.warning(f"Rate limiter '{self.name}' paused for {seconds:.1f}s")
+
+    def pause_for_retry_after(
+        self, headers: Mapping[str, str] | None, default: float = 0.0
+    ) -> float:
+        """Pause according to a response's ``Retry-After`` header.
+
+        Returns:
+            The pause duration applied, in seconds
+        """
+        seconds = parse_retry_after(headers.get("Retry-After")) if headers else None
+        if seconds is None:
+            seconds = default
+        self.pause(seconds)
+        return seconds
+
+    @property
+    def available_tokens(self) -> float:
+        """Tokens that could be acquired right now without waiting."""
+        now = self._clock()
+        if now < self._paused_until:
+            return 0.0
+        tokens = self.burst - max(0.0, self._tat - now) * self.rate
+        return max(0.0, min(float(self.burst), tokens))
+
+    @property
+    def waiters(self) -> int:
+        """Number of callers currently waiting for a token."""
+        return self._waiters
+
+    def wait_time(self, tokens: int = 1) -> float:
+        """Seconds a caller acquiring ``tokens`` now would have to wait."""
+        now = self._clock()
+        start = max(now, self._paused_until)
+        tat = max(self._tat, start)
+        allow_at = max(start, tat + (tokens - self.burst) * self._interval)
+        return max(0.0, allow_at - now)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get current limiter state and counters."""
+        return {
+            "name": self.name,
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "available_tokens": round(self.available_tokens, 3),
+            "wait_time_seconds": round(self.wait_time(), 3),
+            "waiters": self._waiters,
+            "paused_seconds_remaining": round(
+                max(0.0, self._paused_until - self._clock()), 3
+            ),
+            "total_acquired": self._total_acquired,
+            "total_delayed": self._total_delayed,
+            "total_wait_seconds": round(self._total_wait_seconds, 3),
+            "pause_count": self._pause_count,
+        }
+
+    async def __aenter__(self) -> "TokenBucketRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class AIMDConcurrencyLimiter:
+    """Async concurrency limit adapted by additive increase/multiplicative decrease.
+
+    Every completion within ``latency_target`` raises the limit by
+    ``increase / limit``, i.e. by about ``increase`` per window of completions.
+    A rate-limited or slow completion multiplies it by ``decrease``. Only one
+    decrease is applied per window: feedback from requests started before the
+    last decrease is ignored, since they were issued under the old limit.
+
+    Args:
+        initial: Starting concurrency limit
+        minimum: Lowest limit the decrease may reach
+        maximum: Highest limit the increase may reach
+        increase: Additive increase per window of successful completions
+        decrease: Multiplicative decrease factor on congestion
+        latency_target: Completions slower than this (seconds) count as
+            congestion; None disables latency feedback
+        name: Name used in logs and metrics
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target: float | None = None,
+        name: str = "default",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("limits must satisfy 1 <= minimum <= initial <= maximum")
+        if not 0.0 < decrease < 1.0:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.name = name
+        self._clock = clock
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = -math.inf
+
+        # Metrics
+        self._total_acquired = 0
+        self._rate_limited_count = 0
+        self._slow_count = 0
+        self._decrease_count = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """Wait for a free slot.
+
+        Returns:
+            Start time of the request, to be passed back to ``release``
+        """
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just before cancellation
+                    self._in_flight -= 1
+                    self._wake_waiters()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+
+        self._total_acquired += 1
+        return self._clock()
+
+    def release(
+        self, started_at: float, rate_limited: bool = False, failed: bool = False
+    ) -> None:
+        """Free a slot and adapt the limit to how the request went.
+
+        Args:
+            started_at: Value returned by ``acquire``
+            rate_limited: The provider rejected the request as rate limited
+            failed: The request failed for another reason (no feedback)
+        """
+        self._in_flight -= 1
+        latency = self._clock() - started_at
+
+        if rate_limited:
+            self._rate_limited_count += 1
+            self._decrease(started_at)
+        elif failed:
+            pass
+        elif self.latency_target is not None and latency > self.latency_target:
+            self._slow_count += 1
+            self._decrease(started_at)
+        else:
+            self._limit = min(
+                float(self.maximum), self._limit + self.increase / self._limit
+            )
+
+        self._wake_waiters()
+
+    def _decrease(self, started_at: float) -> None:
+        if started_at < self._last_decrease:
+            return
+
+        self._limit = max(float(self.minimum), self._limit * self.decrease)
+        self._last_decrease = self._clock()
+        self._decrease_count += 1
+        logger.info(
+            f"Concurrency limiter '{self.name}' decreased to {self.limit} "
+            f"({self._in_flight} in flight)"
+        )
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get current limiter state and counters."""
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiters": len(self._waiters),
+            "total_acquired": self._total_acquired,
+            "rate_limited_count": self._rate_limited_count,
+            "slow_count": self._slow_count,
+            "decrease_count": self._decrease_count,
+        }
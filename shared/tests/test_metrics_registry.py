@@ -0,0 +1,88 @@
+"""Tests for the shared typed metrics registry."""
+
+import pytest
+
+from shared.utils.metrics_registry import MetricFamily, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_counter_aggregates_per_label_set(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("http_requests_total", "Requests")
+
+        requests.inc(labels={"method": "GET", "status": "200"})
+        requests.inc(2, labels={"status": "200", "method": "GET"})
+        requests.inc(labels={"method": "POST", "status": "500"})
+
+        assert len(requests) == 2
+        assert requests.value({"method": "GET", "status": "200"}) == 3.0
+        with pytest.raises(ValueError):
+            requests.inc(-1)
+
+    def test_gauge_keeps_latest_value(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("queue_depth")
+
+        gauge.set(5)
+        gauge.set(2)
+        gauge.inc(1)
+
+        assert gauge.value() == 3
+
+    def test_type_conflict_is_rejected(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total")
+
+        assert registry.counter("jobs_total") is registry.get("jobs_total")
+        with pytest.raises(ValueError):
+            registry.gauge("jobs_total")
+
+    def test_exposition(self):
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors").inc(labels={"type": 'a"b'})
+        registry.gauge("up").set(1)
+        latency = registry.histogram("latency_seconds", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            latency.observe(value, {"path": "/"})
+
+        lines = registry.expose().splitlines()
+
+        assert "# TYPE errors_total counter" in lines
+        assert 'errors_total{type="a\\"b"} 1.0' in lines
+        assert "# TYPE up gauge" in lines
+        assert "up 1" in lines
+        assert "# TYPE latency_seconds histogram" in lines
+        assert 'latency_seconds_bucket{path="/",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{path="/",le="1.0"} 3' in lines
+        assert 'latency_seconds_bucket{path="/",le="+Inf"} 4' in lines
+        assert 'latency_seconds_sum{path="/"} 4.05' in lines
+        assert 'latency_seconds_count{path="/"} 4' in lines
+        assert latency.count({"path": "/"}) == 4
+
+    def test_empty_registry(self):
+        assert MetricsRegistry().expose() == ""
+
+    def test_metric_family_requires_series_methods(self):
+        with pytest.raises(TypeError):
+            MetricFamily("requests_total")
+
+        class Incomplete(MetricFamily):
+            def _new_series(self, key):
+                pass
+
+        with pytest.raises(TypeError):
+            Incomplete("requests_total")
+
+    def test_series_beyond_cap_fold_into_overflow(self):
+        registry = MetricsRegistry(max_series=2)
+        requests = registry.counter("http_requests_total")
+
+        for path in ("/a", "/b", "/c", "/d"):
+            requests.inc(labels={"path": path})
+        requests.inc(labels={"path": "/a"})
+
+        assert len(requests) == 3
+        assert requests.value({"path": "/a"}) == 2.0
+        assert requests.value({"path": "/c"}) == 0.0
+        assert requests.value({"overflow": "true"}) == 2.0
+        assert 'http_requests_total{overflow="true"} 2.0' in registry.expose()
@@ -0,0 +1,203 @@
+"""Tests for the shared token-bucket rate limiter."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from shared.utils.rate_limiter import (
+    AIMDConcurrencyLimiter,
+    TokenBucketRateLimiter,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep in virtual time; use run() to advance the clock."""
+        target = self.now + seconds
+        while self.now < target:
+            await asyncio.sleep(0)
+
+    async def run(self, *tasks: asyncio.Task, step: float = 0.01) -> None:
+        """Advance the clock in small steps until ``tasks`` are done."""
+        while not all(task.done() for task in tasks):
+            await asyncio.sleep(0)
+            self.now += step
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after("30") == 30.0
+        assert parse_retry_after(5) == 5.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(UTC) + timedelta(seconds=120)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 110 <= seconds <= 120
+
+    def test_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucketRateLimiter:
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=2, burst=3, clock=clock)
+
+        delays = [limiter._reserve(1) for _ in range(5)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3] == pytest.approx(0.5)
+        assert delays[4] == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=2, burst=3, clock=clock)
+
+        for _ in range(3):
+            assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.available_tokens == 0.0
+
+        clock.now += 1.0
+        assert limiter.available_tokens == pytest.approx(2.0)
+        assert limiter.try_acquire()
+
+    def test_pause_blocks_acquisition(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, burst=5, clock=clock)
+
+        limiter.pause_for_retry_after({"Retry-After": "4"})
+
+        assert limiter.available_tokens == 0.0
+        assert limiter.wait_time() == pytest.approx(4.0)
+        assert limiter._reserve(1) == pytest.approx(4.0)
+
+        metrics = limiter.get_metrics()
+        assert metrics["pause_count"] == 1
+        assert metrics["paused_seconds_remaining"] == pytest.approx(4.0)
+
+    @pytest.mark.asyncio
+    async def test_pause_keeps_queued_waiters_spaced(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(
+            rate=2, burst=1, clock=clock, sleep=clock.sleep
+        )
+        start = clock.now
+        fired: list[float] = []
+
+        async def worker() -> None:
+            await limiter.acquire()
+            fired.append(clock.now - start)
+
+        tasks = [asyncio.create_task(worker()) for _ in range(3)]
+        await asyncio.sleep(0)
+        # 429 after the first request: waiters are at 0.5s and 1.0s
+        clock.now += 0.1
+        limiter.pause(1.0)
+        tasks.append(asyncio.create_task(worker()))
+        await clock.run(*tasks)
+
+        assert fired[0] == 0.0
+        assert fired[1:] == pytest.approx([1.5, 2.0, 2.5], abs=0.02)
+
+    def test_bucket_resumes_with_one_token_after_pause(self):
+        clock = FakeClock()
+        limiter = TokenBucketRateLimiter(rate=10, burst=5, clock=clock)
+
+        limiter.pause(2.0)
+        clock.now += 2.0
+
+        delays = [limiter._reserve(1) for _ in range(3)]
+        assert delays == pytest.approx([0.0, 0.1, 0.2])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_are_served_in_order(self):
+        limiter = TokenBucketRateLimiter(rate=200, burst=1)
+        order: list[int] = []
+
+        async def worker(index: int) -> None:
+            await limiter.acquire()
+            order.append(index)
+
+        await asyncio.gather(*(worker(i) for i in range(10)))
+
+        assert order == list(range(10))
+        assert limiter.get_metrics()["total_acquired"] == 10
+        assert limiter.waiters == 0
+
+
+class TestAIMDConcurrencyLimiter:
+    @pytest.mark.asyncio
+    async def test_successes_increase_limit_additively(self):
+        clock = FakeClock()
+        limiter = AIMDConcurrencyLimiter(initial=4, maximum=6, clock=clock)
+
+        # One window of completions adds about one slot
+        for _ in range(4):
+            limiter.release(await limiter.acquire())
+        assert limiter.limit == 4
+        limiter.release(await limiter.acquire())
+        assert limiter.limit == 5
+
+        for _ in range(20):
+            limiter.release(await limiter.acquire())
+        assert limiter.limit == 6
+
+    @pytest.mark.asyncio
+    async def test_congestion_decreases_once_per_window(self):
+        clock = FakeClock()
+        limiter = AIMDConcurrencyLimiter(initial=8, latency_target=10.0, clock=clock)
+        started = [await limiter.acquire() for _ in range(3)]
+
+        clock.now += 1.0
+        limiter.release(started[0], rate_limited=True)
+        assert limiter.limit == 4
+        # Issued under the old limit, so no further decrease
+        clock.now += 20.0
+        limiter.release(started[1])
+        assert limiter.limit == 4
+
+        # A slow request issued after the decrease shrinks the window again
+        late = await limiter.acquire()
+        clock.now += 20.0
+        limiter.release(late)
+        limiter.release(started[2], failed=True)
+        assert limiter.limit == 2
+
+        metrics = limiter.get_metrics()
+        assert metrics["rate_limited_count"] == 1
+        assert metrics["slow_count"] == 2
+        assert metrics["decrease_count"] == 2
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_admitted_within_limit(self):
+        limiter = AIMDConcurrencyLimiter(initial=2, maximum=2)
+        active = peak = 0
+
+        async def worker() -> None:
+            nonlocal active, peak
+            started_at = await limiter.acquire()
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            limiter.release(started_at)
+
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.get_metrics()["total_acquired"] == 6
+        assert limiter.in_flight == 0